@@ -0,0 +1,214 @@
+# bench_consciousness_matrix.py
+"""
+Consciousness Matrix Benchmarks
+
+Standalone micro-benchmarks for the Consciousness Matrix hot paths.
+Run from the ai_backend directory:
+
+    python bench_consciousness_matrix.py
+"""
+
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+
+from genesis_consciousness_matrix import ConsciousnessMatrix, SensoryChannel, SensoryData
+from genesis_matrix_payloads import PayloadGuard
+from genesis_sensory_log import SensoryLog
+from genesis_sensory_store import create_sensory_store
+
+CHANNELS = list(SensoryChannel)
+
+
+def _sensation(i: int) -> SensoryData:
+    """Build a representative perception for benchmark index `i`."""
+    return SensoryData(
+        timestamp=time.time(),
+        channel=CHANNELS[i % len(CHANNELS)],
+        source=f"source_{i % 16}",
+        event_type=f"event_{i % 32}",
+        data={"agent_name": f"agent_{i % 78}", "value": i},
+        severity="error" if i % 50 == 0 else "info",
+    )
+
+
+def bench_store_memory(events: int = 1_000_000):
+    """
+    Compare the structural footprint of each storage backend holding `events` perceptions.
+    """
+    print(f"\n📦 Store footprint at {events:,} events (excluding payload contents)")
+    for backend in ("object", "columnar"):
+        store = create_sensory_store(backend, events, record_type=SensoryData)
+        start = time.perf_counter()
+        for i in range(events):
+            store.append(_sensation(i))
+        elapsed = time.perf_counter() - start
+        print(f"   {backend:<9} {store.memory_footprint() / 1024 / 1024:8.1f} MB"
+              f"   ingest {events / elapsed:,.0f} events/s")
+
+
+QUERY_TYPES = ("system_health", "learning_progress", "agent_performance",
+               "security_assessment", "threat_status")
+
+
+def bench_queries(window_sizes=(10_000, 100_000), repeat: int = 50):
+    """
+    Time each query_consciousness report type at several window sizes.
+
+    The reports read incrementally maintained indexes, so latency should stay
+    flat as the window grows.
+    """
+    for backend in ("object", "columnar"):
+        print(f"\n🔎 Query latency (ms), {backend} backend")
+        print("   " + f"{'query':<22}" + "".join(f"{n:>12,}" for n in window_sizes))
+
+        matrices = []
+        for events in window_sizes:
+            matrix = ConsciousnessMatrix(max_memory_size=events, storage_backend=backend)
+            for i in range(events):
+                matrix.sensory_memory.append(_sensation(i))
+            matrices.append(matrix)
+
+        for query in QUERY_TYPES:
+            row = f"   {query:<22}"
+            for matrix in matrices:
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    matrix.query_consciousness(query)
+                row += f"{(time.perf_counter() - start) / repeat * 1000:12.3f}"
+            print(row)
+
+
+def bench_warm_restart(events: int = 100_000):
+    """
+    Time rebuilding a matrix of `events` perceptions from the durable sensory log.
+    """
+    print(f"\n📼 Warm restart from the sensory log ({events:,} events)")
+    with tempfile.TemporaryDirectory() as directory:
+        log = SensoryLog(directory)
+        start = time.perf_counter()
+        for i in range(events):
+            log.append(_sensation(i))
+        log.flush()
+        print(f"   write + fsync  {time.perf_counter() - start:8.3f} s")
+        log.close()
+
+        for backend in ("object", "columnar"):
+            log = SensoryLog(directory)
+            matrix = ConsciousnessMatrix(max_memory_size=events, storage_backend=backend,
+                                         sensory_log=log)
+            start = time.perf_counter()
+            restored = matrix.restore_from_log()
+            print(f"   {backend:<9} replay {time.perf_counter() - start:8.3f} s   ({restored:,} events)")
+            log.close()
+
+
+
+@dataclass
+class _DictSensoryData:
+    """SensoryData as it was before __slots__ and interning, for comparison."""
+    timestamp: float
+    channel: SensoryChannel
+    source: str
+    event_type: str
+    data: Dict[str, Any]
+    severity: str = "info"
+    correlation_id: Optional[str] = None
+    count: int = 1
+    last_timestamp: Optional[float] = None
+
+
+def _raw_event(i: int):
+    """Fields of a perception as callers produce them: fresh name strings, every 100th payload a large trace."""
+    data = {"agent_name": f"agent_{i % 78}", "value": i}
+    if i % 100 == 0:
+        data["traceback"] = "".join(f"  File \"module_{n}.py\", line {n}\n" for n in range(120))
+    return (time.time(), CHANNELS[i % len(CHANNELS)], "source_%d" % (i % 16),
+            "event_%d" % (i % 32), data, "error" if i % 50 == 0 else "info")
+
+
+def _bytes_per_event(build, events: int) -> float:
+    tracemalloc.start()
+    held = [build(i) for i in range(events)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size / events
+
+
+def bench_event_memory(events: int = 100_000, max_payload_bytes: int = 1024):
+    """
+    Compare bytes per remembered event, payload included, before and after the compact representation.
+    """
+    print(f"\n🧬 Bytes per event at {events:,} events (payload included)")
+    guard = PayloadGuard(max_bytes=max_payload_bytes)
+    variants = (
+        ("dict dataclass", lambda i: _DictSensoryData(*_raw_event(i))),
+        ("slots + interned", lambda i: SensoryData(*_raw_event(i))),
+        (f"slots + interned, copied, {max_payload_bytes} B cap",
+         lambda i: _guarded(guard, *_raw_event(i))),
+    )
+    for label, build in variants:
+        print(f"   {label:<40} {_bytes_per_event(build, events):8.1f} B")
+
+
+def _guarded(guard: PayloadGuard, timestamp, channel, source, event_type, data, severity):
+    return SensoryData(timestamp, channel, source, event_type, guard.admit(data), severity)
+
+
+SECURITY_CHANNELS = (SensoryChannel.THREAT_DETECTION, SensoryChannel.ACCESS_CONTROL,
+                     SensoryChannel.ENCRYPTION_ACTIVITY, SensoryChannel.SECURITY_EVENTS)
+
+
+def _security_sensation(i: int) -> SensoryData:
+    """Build a security-channel perception for benchmark index `i`."""
+    channel = SECURITY_CHANNELS[i % len(SECURITY_CHANNELS)]
+    data = {
+        SensoryChannel.THREAT_DETECTION: {"threat_type": f"threat_{i % 7}", "confidence": (i % 100) / 100,
+                                          "threat_level": ("low", "medium", "high", "critical")[i % 4],
+                                          "mitigation_applied": i % 3 == 0},
+        SensoryChannel.ACCESS_CONTROL: {"access_granted": i % 5 != 0},
+        SensoryChannel.ENCRYPTION_ACTIVITY: {"success": i % 11 != 0},
+        SensoryChannel.SECURITY_EVENTS: {"security_type": "scan"},
+    }[channel]
+    return SensoryData(time.time(), channel, "bench", "security", data, "info")
+
+
+def bench_security_analytics(window_sizes=(1_000, 10_000, 100_000), repeat: int = 20):
+    """
+    Time the security assessment indicators per window size: the Python synthesis over
+    the recent events of each security channel against the vectorized columns.
+    """
+    print("\n🛡️ Security assessment (ms per call)")
+    print("   " + f"{'window':>10}{'python':>12}{'vectorized':>12}")
+    for window in window_sizes:
+        matrix = ConsciousnessMatrix(max_memory_size=window * 4, channel_capacity=window,
+                                     security_window=window)
+        if matrix.security_analytics is None:
+            print("   numpy not installed, vectorized path unavailable")
+            return
+        for i in range(window * 4):
+            matrix._store_sensation(_security_sensation(i), persist=False)
+        windows = {key: window for key in matrix._security_windows(window)}
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            recent = [s for channel in SECURITY_CHANNELS for s in matrix._recent(channel, window)]
+            matrix._security_synthesis(recent, **windows)
+        python_ms = (time.perf_counter() - start) / repeat * 1000
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            matrix.security_analytics.assess(**windows, held=matrix.sensory_memory.count)
+        vector_ms = (time.perf_counter() - start) / repeat * 1000
+        print(f"   {window:>10,}{python_ms:12.3f}{vector_ms:12.3f}")
+
+
+if __name__ == "__main__":
+    bench_store_memory()
+    bench_queries()
+    bench_warm_restart()
+    bench_event_memory()
+    bench_security_analytics()
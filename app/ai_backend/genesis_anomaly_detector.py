@@ -0,0 +1,311 @@
+# genesis_anomaly_detector.py
+"""
+Phase 3: The Genesis Layer - Streaming Anomaly Detector
+Knowing What Normal Looks Like
+
+The micro synthesis flags anomalies with fixed thresholds ("more than three
+errors in the last ten events"), which are too loose for a quiet system and
+too tight for a busy one. The AnomalyDetector learns each channel's normal
+behaviour instead, with exponentially weighted moving averages (EWMA) of
+the mean and variance of three kinds of signal:
+
+- rate: events per `bucket_seconds` on each channel
+- error ratio: the share of "error" and "critical" events in each bucket
+- metrics: configured numeric payload fields, e.g. the metric_value of each
+  performance metric, one series per metric name
+
+A value whose z-score against its series exceeds `threshold` is an anomaly.
+Every update is O(1), so the detector runs on every stored perception:
+
+- Rate and error ratio are scored when a bucket closes. A bucket that is
+  already far above normal while still filling is flagged as a rate spike
+  at once.
+- Metrics are scored per event.
+- Series only flag after `warmup` samples.
+- Buckets with fewer than `min_events` events are not scored for error
+  ratio. A bucket only counts as a rate spike with at least `min_events`
+  events, and a drop is only flagged when at least that many are expected,
+  so sparse channels do not flag on single events.
+- Each series flags at most once per `cooldown` seconds.
+
+The detector is not thread-safe on its own; the Consciousness Matrix only
+touches it while holding its lock.
+"""
+
+import math
+from collections import deque
+from typing import Dict, Any, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+SEVERE = frozenset(("error", "critical"))
+
+
+class EwmaStat:
+    """
+    Exponentially weighted moving mean and variance of one series.
+    """
+
+    __slots__ = ("alpha", "mean", "variance", "samples", "last_flagged")
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.mean = 0.0
+        self.variance = 0.0
+        self.samples = 0
+        self.last_flagged = float("-inf")
+
+    def score(self, value: float, min_std: float) -> float:
+        """Return the z-score of `value` against the series so far."""
+        std = max(math.sqrt(self.variance), min_std * abs(self.mean), 1e-9)
+        return (value - self.mean) / std
+
+    def update(self, value: float):
+        """Fold `value` into the mean and variance in O(1)."""
+        if not self.samples:
+            self.mean = value
+        else:
+            delta = value - self.mean
+            increment = self.alpha * delta
+            self.mean += increment
+            self.variance = (1 - self.alpha) * (self.variance + delta * increment)
+        self.samples += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"mean": self.mean, "std": math.sqrt(self.variance), "samples": self.samples}
+
+
+class _ChannelBucket:
+    """Event and severe-event counts of a channel's current bucket."""
+
+    __slots__ = ("index", "events", "severe", "spike_flagged")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.events = 0
+        self.severe = 0
+        self.spike_flagged = False
+
+
+class AnomalyDetector:
+    """
+    Online EWMA/z-score anomaly detection over channel rates, error ratios and numeric payload fields.
+    """
+
+    def __init__(self, threshold: float = 3.0, alpha: float = 0.05, warmup: int = 30,
+                 bucket_seconds: float = 1.0, min_events: int = 10, cooldown: float = 60.0,
+                 metric_fields: Optional[Mapping[Any, Iterable[str]]] = None,
+                 min_std: float = 0.05, max_series: int = 1024, max_gap_buckets: int = 300,
+                 history: int = 100, ignore_channels: Iterable[Any] = ()):
+        """
+        Parameters:
+            threshold (float): Absolute z-score above which a value is anomalous.
+            alpha (float): EWMA smoothing factor; higher values adapt faster to new traffic levels.
+            warmup (int): Samples a series needs before it can flag anomalies.
+            bucket_seconds (float): Width of the buckets over which rates and error ratios are measured.
+            min_events (int): Events a bucket needs for its error ratio to be scored, and the rate a spike must reach or a drop must fall from.
+            cooldown (float): Seconds after an anomaly during which the same series does not flag again.
+            metric_fields (mapping, optional): Channel -> numeric payload fields scored per event; each field has one series per payload "metric_name".
+            min_std (float): Floor of the standard deviation as a fraction of the mean, so near-constant series do not flag tiny changes.
+            max_series (int): Maximum number of metric series tracked; values of further series are ignored.
+            max_gap_buckets (int): Empty buckets replayed at most after a silent period.
+            history (int): Number of recent anomalies kept for reports.
+            ignore_channels (iterable): Channels not observed at all, such as the channel anomalies are reported on.
+        """
+        if threshold <= 0:
+            raise ValueError("threshold must be positive")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        self.threshold = threshold
+        self.alpha = alpha
+        self.warmup = warmup
+        self.bucket_seconds = bucket_seconds
+        self.min_events = min_events
+        self.cooldown = cooldown
+        self.metric_fields: Dict[Any, Tuple[str, ...]] = {
+            channel: tuple(fields) for channel, fields in (metric_fields or {}).items()
+        }
+        self.min_std = min_std
+        self.max_series = max_series
+        self.max_gap_buckets = max_gap_buckets
+        self.ignore_channels = frozenset(ignore_channels)
+
+        self._buckets: Dict[Any, _ChannelBucket] = {}
+        self._rates: Dict[Any, EwmaStat] = {}
+        self._error_ratios: Dict[Any, EwmaStat] = {}
+        self._metrics: Dict[Hashable, EwmaStat] = {}
+        self.recent: deque = deque(maxlen=history)
+
+        self.observed = 0
+        self.raised = 0
+        self.suppressed = 0
+        self.untracked = 0
+
+    # ------------------------------------------------------------------
+    # Observation
+    # ------------------------------------------------------------------
+
+    def observe(self, sensation) -> List[Dict[str, Any]]:
+        """
+        Fold one perception into its channel's series.
+
+        Returns:
+            list: The anomalies it revealed, usually none; each is a dict describing the signal, the value and its z-score.
+        """
+        channel = sensation.channel
+        if channel in self.ignore_channels:
+            return []
+        self.observed += 1
+        timestamp = sensation.timestamp
+        found: List[Dict[str, Any]] = []
+
+        index = int(timestamp // self.bucket_seconds)
+        bucket = self._buckets.get(channel)
+        if bucket is None:
+            bucket = self._buckets[channel] = _ChannelBucket(index)
+        elif index > bucket.index:
+            self._close(channel, bucket, index, timestamp, found)
+            bucket = self._buckets[channel] = _ChannelBucket(index)
+        # Late events (index < bucket.index) count towards the current bucket
+
+        bucket.events += 1
+        if sensation.severity in SEVERE:
+            bucket.severe += 1
+
+        # A bucket already far above normal is flagged before it closes
+        if not bucket.spike_flagged and bucket.events >= self.min_events:
+            rate = self._rates.get(channel)
+            if rate is not None and rate.samples >= self.warmup:
+                z = rate.score(bucket.events, self.min_std)
+                if z > self.threshold:
+                    bucket.spike_flagged = True
+                    self._flag(found, rate, "rate_spike", channel, None, bucket.events, z, timestamp)
+
+        fields = self.metric_fields.get(channel)
+        if fields:
+            data = sensation.data
+            for field in fields:
+                value = data.get(field)
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or value != value:
+                    continue
+                self._observe_metric(channel, field, data.get("metric_name"), value, timestamp, found)
+        return found
+
+    def _close(self, channel, bucket: _ChannelBucket, index: int, timestamp: float,
+               found: List[Dict[str, Any]]):
+        """Score the closed bucket and the empty buckets up to `index`, then fold them into the series."""
+        rate = self._rates.get(channel)
+        if rate is None:
+            rate = self._rates[channel] = EwmaStat(self.alpha)
+        if not bucket.spike_flagged:
+            self._score_rate(channel, rate, bucket.events, timestamp, found)
+        rate.update(bucket.events)
+
+        if bucket.events >= self.min_events:
+            ratio = bucket.severe / bucket.events
+            errors = self._error_ratios.get(channel)
+            if errors is None:
+                errors = self._error_ratios[channel] = EwmaStat(self.alpha)
+            if errors.samples >= self.warmup:
+                z = errors.score(ratio, self.min_std)
+                if z > self.threshold:
+                    self._flag(found, errors, "error_ratio_spike", channel, None, ratio, z, timestamp)
+            errors.update(ratio)
+
+        # Silent buckets in between are part of the channel's normal rate
+        for _ in range(min(index - bucket.index - 1, self.max_gap_buckets)):
+            self._score_rate(channel, rate, 0, timestamp, found)
+            rate.update(0)
+
+    def _score_rate(self, channel, rate: EwmaStat, events: int, timestamp: float,
+                    found: List[Dict[str, Any]]):
+        if rate.samples < self.warmup:
+            return
+        z = rate.score(events, self.min_std)
+        if z > self.threshold and events >= self.min_events:
+            self._flag(found, rate, "rate_spike", channel, None, events, z, timestamp)
+        elif z < -self.threshold and rate.mean >= self.min_events:
+            self._flag(found, rate, "rate_drop", channel, None, events, z, timestamp)
+
+    def _observe_metric(self, channel, field: str, name, value: float, timestamp: float,
+                        found: List[Dict[str, Any]]):
+        key = (channel, field, name)
+        series = self._metrics.get(key)
+        if series is None:
+            if len(self._metrics) >= self.max_series:
+                self.untracked += 1
+                return
+            series = self._metrics[key] = EwmaStat(self.alpha)
+        if series.samples >= self.warmup:
+            z = series.score(value, self.min_std)
+            if abs(z) > self.threshold:
+                self._flag(found, series, "metric_outlier", channel,
+                           field if name is None else f"{name}.{field}", value, z, timestamp)
+        series.update(value)
+
+    def _flag(self, found: List[Dict[str, Any]], series: EwmaStat, kind: str, channel,
+              metric: Optional[str], value: float, z: float, timestamp: float):
+        if timestamp - series.last_flagged < self.cooldown:
+            self.suppressed += 1
+            return
+        series.last_flagged = timestamp
+        anomaly = {
+            "anomaly_type": kind,
+            "channel": getattr(channel, "value", channel),
+            "metric": metric,
+            "value": value,
+            "mean": series.mean,
+            "std": math.sqrt(series.variance),
+            "z_score": z,
+            "threshold": self.threshold,
+            "timestamp": timestamp,
+        }
+        self.raised += 1
+        self.recent.append(anomaly)
+        found.append(anomaly)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Return the learned series and recent anomalies.
+
+        Returns:
+            dict: The configuration, per-channel rate and error ratio series, metric series keyed "channel/metric", the recent anomalies (oldest first) and the observed, raised, suppressed and untracked counts.
+        """
+        def name(channel):
+            return getattr(channel, "value", channel)
+
+        metrics = {}
+        for (channel, field, metric_name), series in self._metrics.items():
+            label = field if metric_name is None else f"{metric_name}.{field}"
+            metrics[f"{name(channel)}/{label}"] = series.to_dict()
+        return {
+            "threshold": self.threshold,
+            "alpha": self.alpha,
+            "warmup": self.warmup,
+            "bucket_seconds": self.bucket_seconds,
+            "rates": {name(c): s.to_dict() for c, s in self._rates.items()},
+            "error_ratios": {name(c): s.to_dict() for c, s in self._error_ratios.items()},
+            "metrics": metrics,
+            "recent_anomalies": list(self.recent),
+            "observed": self.observed,
+            "raised": self.raised,
+            "suppressed": self.suppressed,
+            "untracked": self.untracked,
+        }
+
+    def since(self, timestamp: float) -> List[Dict[str, Any]]:
+        """Return the recent anomalies at or after `timestamp`, oldest first."""
+        return [anomaly for anomaly in self.recent if anomaly["timestamp"] >= timestamp]
+
+    def clear(self):
+        """Forget every series, bucket and anomaly."""
+        self._buckets.clear()
+        self._rates.clear()
+        self._error_ratios.clear()
+        self._metrics.clear()
+        self.recent.clear()
+        self.observed = self.raised = self.suppressed = self.untracked = 0
@@ -9,7 +9,7 @@ import asyncio
 import json
 import logging
 from datetime import datetime
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 from typing import Dict, Any, Optional
 
@@ -20,6 +20,7 @@ from genesis_core import (
     initialize_genesis,
     shutdown_genesis
 )
+from genesis_metrics import metrics_registry
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -124,6 +125,17 @@ def health_check():
     })
 
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """
+    Serve the process's counters, gauges and histograms in the Prometheus text format, or OpenMetrics when the scraper's Accept header asks for it.
+    
+    Scrapes read only counters maintained by the Genesis components; they never take the consciousness matrix lock or serialize event payloads.
+    """
+    body, content_type = metrics_registry.exposition(request.headers.get("Accept"))
+    return Response(body, content_type=content_type)
+
+
 @app.route('/genesis/chat', methods=['POST'])
 def chat_with_genesis():
     """
@@ -398,6 +410,7 @@ if __name__ == '__main__':
     print("   POST /genesis/evolve - Trigger evolution")
     print("   POST /genesis/ethics/evaluate - Ethical evaluation")
     print("   GET  /health - Health check")
+    print("   GET  /metrics - Prometheus metrics")
 
     app.run(
         host='0.0.0.0',  # Allow connections from Android app
@@ -0,0 +1,384 @@
+# genesis_collaboration_graph.py
+"""
+Phase 3: The Genesis Layer - Agent Collaboration Graph
+Who Works With Whom
+
+The macro synthesis used to describe agent collaboration as a count of
+events per agent over the last 50 activities, which says how busy each agent
+is but not who it works with. The CollaborationGraph keeps a weighted
+networkx graph of the agents instead, updated as AGENT_ACTIVITY perceptions
+are stored:
+
+- An agent acting on a correlation_id is linked to every other agent that
+  acted on the same correlation_id within the last `window` seconds. Each
+  such activity adds one interaction to the edge.
+- Edge weights and node activity decay exponentially with `half_life`, so
+  the graph shows current collaboration rather than all-time totals.
+
+Decay is applied lazily. Weights are stored relative to a reference time
+(`weight * e^(rate * (t - epoch))`), so an update only touches the edges of
+the acting agent, O(degree), and reading a weight multiplies by the decay
+since the reference time. The reference time moves forward during periodic
+compaction, which also drops edges and idle agents that have decayed below
+`min_weight`.
+
+Decay scales every weight by the same factor, so eigenvector and betweenness
+centrality and the Louvain communities only change when the graph does.
+These results are cached per graph version, and for at most `cache_ttl`
+seconds while new activity keeps arriving.
+
+Without networkx, COLLABORATION_GRAPH_AVAILABLE is False and the matrix
+keeps no graph. The class is not thread-safe on its own; the Consciousness
+Matrix only touches it while holding its lock.
+"""
+
+import heapq
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Callable, List, Mapping, Optional, Tuple
+
+try:
+    import networkx as nx
+    COLLABORATION_GRAPH_AVAILABLE = True
+except ImportError:
+    nx = None
+    COLLABORATION_GRAPH_AVAILABLE = False
+
+# Centrality measures served by CollaborationGraph.centrality()
+CENTRALITY_KINDS = ("strength", "eigenvector", "betweenness")
+
+# Largest decay exponent stored weights may carry before they are rescaled
+MAX_DECAY_EXPONENT = 50.0
+
+
+class CollaborationGraph:
+    """
+    Time-decayed weighted graph of agents that act on the same correlation_id.
+    """
+
+    def __init__(self, half_life: float = 3600.0, window: float = 300.0,
+                 max_correlations: int = 10000, max_agents_per_correlation: int = 32,
+                 min_weight: float = 0.01, compact_interval: float = 60.0,
+                 cache_ttl: float = 5.0, agent_field: str = "agent_name",
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Create an empty graph.
+
+        Parameters:
+            half_life (float): Seconds after which an interaction counts half as much.
+            window (float): Seconds within which two agents acting on the same correlation_id are linked.
+            max_correlations (int): Correlation ids whose recent agents are remembered; the least recently updated is forgotten first.
+            max_agents_per_correlation (int): Recent agents remembered per correlation id; the longest idle is forgotten first.
+            min_weight (float): Decayed weight below which compaction drops an edge, or an agent without edges.
+            compact_interval (float): Seconds of event time between compactions.
+            cache_ttl (float): Longest time in seconds a centrality or community result is reused after the graph changed.
+            agent_field (str): Payload field naming the acting agent.
+            clock (Callable[[], float]): Time source for the result cache.
+        """
+        if not COLLABORATION_GRAPH_AVAILABLE:
+            raise RuntimeError("CollaborationGraph requires networkx")
+        if half_life <= 0:
+            raise ValueError("half_life must be positive")
+
+        self.half_life = half_life
+        self.decay_rate = math.log(2) / half_life
+        self.window = window
+        self.max_correlations = max_correlations
+        self.max_agents_per_correlation = max_agents_per_correlation
+        self.min_weight = min_weight
+        self.compact_interval = compact_interval
+        self.cache_ttl = cache_ttl
+        self.agent_field = agent_field
+        self._clock = clock
+
+        # Stored "weight" and "activity" values are relative to self._epoch
+        self.graph = nx.Graph()
+        self._epoch: Optional[float] = None
+        self._latest = 0.0  # newest event timestamp seen
+        self._last_compaction = 0.0
+
+        # correlation_id -> (last update, {agent: last activity}); least recently updated first
+        self._correlations: "OrderedDict[str, Tuple[float, Dict[str, float]]]" = OrderedDict()
+
+        self.version = 0
+        self._cache: Dict[str, Tuple[int, float, Any]] = {}
+
+        self.observed = 0
+        self.interactions = 0
+        self.forgotten_correlations = 0
+        self.pruned_edges = 0
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def observe(self, sensation) -> int:
+        """
+        Record an agent activity and link its agent to the other recent agents of its correlation_id.
+
+        Parameters:
+            sensation: An AGENT_ACTIVITY perception; events without an agent name or correlation_id are ignored.
+
+        Returns:
+            int: The number of collaboration edges strengthened.
+        """
+        data = sensation.data
+        agent = data.get(self.agent_field) if isinstance(data, Mapping) else None
+        correlation_id = sensation.correlation_id
+        if not agent or not correlation_id:
+            return 0
+
+        timestamp = sensation.timestamp
+        if self._epoch is None:
+            self._epoch = self._last_compaction = timestamp
+        self._latest = max(self._latest, timestamp)
+        if (self._latest - self._last_compaction >= self.compact_interval
+                or self.decay_rate * (self._latest - self._epoch) > MAX_DECAY_EXPONENT):
+            self.compact(self._latest)
+        self._forget_idle_correlations()
+
+        increment = math.exp(self.decay_rate * (timestamp - self._epoch))
+        graph = self.graph
+        if agent in graph:
+            node = graph.nodes[agent]
+            node["activity"] += increment
+            node["last_seen"] = max(node["last_seen"], timestamp)
+        else:
+            graph.add_node(agent, activity=increment, last_seen=timestamp)
+
+        entry = self._correlations.pop(correlation_id, None)
+        participants = entry[1] if entry is not None else {}
+        linked = 0
+        for other, seen in participants.items():
+            if other == agent or abs(timestamp - seen) > self.window:
+                continue
+            edge = graph.get_edge_data(agent, other)
+            if edge is None:
+                graph.add_edge(agent, other, weight=increment, interactions=1,
+                               last_interaction=timestamp)
+            else:
+                edge["weight"] += increment
+                edge["interactions"] += 1
+                edge["last_interaction"] = max(edge["last_interaction"], timestamp)
+            linked += 1
+
+        participants[agent] = max(participants.get(agent, timestamp), timestamp)
+        if len(participants) > self.max_agents_per_correlation:
+            del participants[min(participants, key=participants.get)]
+        self._correlations[correlation_id] = (self._latest, participants)
+        if len(self._correlations) > self.max_correlations:
+            self._correlations.popitem(last=False)
+            self.forgotten_correlations += 1
+
+        self.observed += 1
+        self.interactions += linked
+        self.version += 1
+        return linked
+
+    def _forget_idle_correlations(self):
+        """Drop correlation ids with no activity within the window; they cannot link new agents."""
+        horizon = self._latest - self.window
+        correlations = self._correlations
+        while correlations:
+            correlation_id, (updated, _) = next(iter(correlations.items()))
+            if updated >= horizon:
+                break
+            del correlations[correlation_id]
+
+    def compact(self, now: Optional[float] = None) -> int:
+        """
+        Move the reference time to `now`, rescaling every stored weight, and drop decayed edges and idle agents.
+
+        Parameters:
+            now (float, optional): New reference time; defaults to the newest event timestamp.
+
+        Returns:
+            int: The number of edges dropped.
+        """
+        if self._epoch is None:
+            return 0
+        now = self._latest if now is None else now
+        factor = math.exp(-self.decay_rate * (now - self._epoch))
+        graph = self.graph
+        stale = []
+        for a, b, edge in graph.edges(data=True):
+            edge["weight"] *= factor
+            if edge["weight"] < self.min_weight:
+                stale.append((a, b))
+        graph.remove_edges_from(stale)
+
+        idle = []
+        for agent, node in graph.nodes(data=True):
+            node["activity"] *= factor
+            if node["activity"] < self.min_weight and not graph.degree(agent):
+                idle.append(agent)
+        graph.remove_nodes_from(idle)
+
+        self._epoch = self._last_compaction = now
+        self.pruned_edges += len(stale)
+        if stale or idle:
+            self.version += 1
+        return len(stale)
+
+    def clear(self):
+        """Forget every agent, collaboration and tracked correlation."""
+        self.graph.clear()
+        self._epoch = None
+        self._latest = self._last_compaction = 0.0
+        self._correlations.clear()
+        self._cache.clear()
+        self.version += 1
+        self.observed = self.interactions = self.forgotten_correlations = self.pruned_edges = 0
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _decay(self, now: Optional[float]) -> float:
+        """Factor turning stored weights into weights decayed to `now`."""
+        if self._epoch is None:
+            return 0.0
+        now = max(self._latest, time.time()) if now is None else now
+        return math.exp(-self.decay_rate * (now - self._epoch))
+
+    def _edge_dict(self, agent: str, edge: Dict[str, Any], factor: float) -> Dict[str, Any]:
+        return {"agent": agent, "weight": edge["weight"] * factor,
+                "interactions": edge["interactions"],
+                "last_interaction": edge["last_interaction"]}
+
+    def top_collaborators(self, agent: str, limit: int = 5,
+                          now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        List an agent's strongest collaborators, O(degree).
+
+        Parameters:
+            agent (str): The agent name.
+            limit (int): Maximum number of collaborators returned.
+            now (float, optional): Time the weights are decayed to; defaults to the current time.
+
+        Returns:
+            list: Collaborator dicts (agent, decayed weight, interaction count, last interaction time), strongest first; empty for an unknown agent.
+        """
+        if agent not in self.graph:
+            return []
+        factor = self._decay(now)
+        strongest = heapq.nlargest(limit, self.graph[agent].items(),
+                                   key=lambda item: item[1]["weight"])
+        return [self._edge_dict(other, edge, factor) for other, edge in strongest]
+
+    def strongest_edges(self, limit: int = 10, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        List the strongest collaborations in the graph.
+
+        Returns:
+            list: Dicts with both agents, the decayed weight, interaction count and last interaction time, strongest first.
+        """
+        factor = self._decay(now)
+        strongest = heapq.nlargest(limit, self.graph.edges(data=True),
+                                   key=lambda item: item[2]["weight"])
+        return [{"agents": sorted((a, b)), "weight": edge["weight"] * factor,
+                 "interactions": edge["interactions"],
+                 "last_interaction": edge["last_interaction"]}
+                for a, b, edge in strongest]
+
+    def centrality(self, kind: str = "strength", now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Score every agent's centrality in the collaboration graph.
+
+        Parameters:
+            kind (str): "strength" (sum of the agent's decayed edge weights), "eigenvector" (weighted eigenvector centrality) or "betweenness" (how often the agent lies on the strongest paths between two others, with 1 / weight as the distance).
+            now (float, optional): Time the strength is decayed to; the other measures do not depend on it.
+
+        Returns:
+            dict: Agent name -> score, highest first.
+
+        Raises:
+            ValueError: For an unknown kind.
+        """
+        if kind not in CENTRALITY_KINDS:
+            raise ValueError(f"Unknown centrality '{kind}'. Available: {list(CENTRALITY_KINDS)}")
+        if kind == "strength":
+            factor = self._decay(now)
+            scores = {agent: strength * factor
+                      for agent, strength in self.graph.degree(weight="weight")}
+        else:
+            scores = self._cached(kind, lambda: self._compute_centrality(kind))
+        return dict(sorted(scores.items(), key=lambda item: item[1], reverse=True))
+
+    def _compute_centrality(self, kind: str) -> Dict[str, float]:
+        graph = self.graph
+        if not graph.number_of_edges():
+            return {agent: 0.0 for agent in graph}
+        if kind == "eigenvector":
+            try:
+                return nx.eigenvector_centrality(graph, weight="weight", max_iter=1000)
+            except nx.PowerIterationFailedConvergence:
+                return {}
+        return nx.betweenness_centrality(graph, weight=lambda a, b, edge: 1.0 / edge["weight"])
+
+    def communities(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Partition the agents into collaboration communities with the Louvain method.
+
+        Parameters:
+            now (float, optional): Time the internal weights are decayed to.
+
+        Returns:
+            list: Dicts with the sorted agent names of each community of two or more agents and the decayed weight of the collaboration inside it, largest first.
+        """
+        partition = self._cached("communities", lambda: [
+            sorted(community) for community in
+            nx.community.louvain_communities(self.graph, weight="weight", seed=0)
+            if len(community) > 1
+        ])
+        factor = self._decay(now)
+        result = [{"agents": agents,
+                   "weight": self.graph.subgraph(agents).size(weight="weight") * factor}
+                  for agents in partition if all(agent in self.graph for agent in agents)]
+        result.sort(key=lambda community: (len(community["agents"]), community["weight"]),
+                    reverse=True)
+        return result
+
+    def _cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Reuse a scale-invariant result while the graph is unchanged or for at most cache_ttl seconds."""
+        cached = self._cache.get(key)
+        now = self._clock()
+        if cached is not None and (cached[0] == self.version or now - cached[1] < self.cache_ttl):
+            return cached[2]
+        result = compute()
+        self._cache[key] = (self.version, now, result)
+        return result
+
+    def summary(self, limit: int = 5, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Summarize the graph for the macro synthesis and the collaboration report.
+
+        Returns:
+            dict: Agent and edge counts, the strongest edges, the most central agents by eigenvector centrality and the communities.
+        """
+        eigenvector = self.centrality("eigenvector")
+        return {
+            "agents": self.graph.number_of_nodes(),
+            "collaborations": self.graph.number_of_edges(),
+            "strongest_collaborations": self.strongest_edges(limit, now),
+            "central_agents": dict(list(eigenvector.items())[:limit]),
+            "communities": self.communities(now),
+        }
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Return the graph's configuration and counters.
+        """
+        return {
+            "half_life": self.half_life,
+            "window": self.window,
+            "agents": self.graph.number_of_nodes(),
+            "collaborations": self.graph.number_of_edges(),
+            "tracked_correlations": len(self._correlations),
+            "observed": self.observed,
+            "interactions": self.interactions,
+            "forgotten_correlations": self.forgotten_correlations,
+            "pruned_edges": self.pruned_edges,
+            "version": self.version,
+        }
@@ -47,6 +47,7 @@ except ImportError:
 from genesis_consciousness_matrix import consciousness_matrix
 from genesis_ethical_governor import EthicalGovernor
 from genesis_evolutionary_conduit import EvolutionaryConduit
+from genesis_metrics import metrics_registry, PROMETHEUS_CONTENT_TYPE
 from genesis_profile import GENESIS_PROFILE
 
 # Initialize logger
@@ -130,6 +131,32 @@ elif not ANTHROPIC_API_KEY:
 else:
     logger.warning("⚠️ Anthropic SDK not available - install anthropic")
 
+# ============================================================================
+# Metrics
+# ============================================================================
+
+MODEL_REQUESTS = metrics_registry.counter(
+    "genesis_model_requests", "Model generation calls by model and outcome.", ("model", "outcome"))
+MODEL_LATENCY = metrics_registry.histogram(
+    "genesis_model_request_duration_seconds", "Model generation latency in seconds.", ("model",))
+BRIDGE_REQUESTS = metrics_registry.counter(
+    "genesis_bridge_requests", "Bridge requests by type and outcome.", ("request_type", "outcome"))
+BRIDGE_LATENCY = metrics_registry.histogram(
+    "genesis_bridge_request_duration_seconds", "Bridge request handling time in seconds.",
+    ("request_type",))
+
+# Bridge request types reported as their own label value; anything else is "unknown"
+BRIDGE_REQUEST_TYPES = frozenset((
+    "ping", "process", "activate_fusion", "consciousness_state", "ethical_review", "metrics"
+))
+
+
+def _record_model_call(model: str, started: float, outcome: str):
+    """Count a model call and observe its latency since `started` (a perf_counter reading)."""
+    MODEL_LATENCY.observe(time.perf_counter() - started, model=model)
+    MODEL_REQUESTS.inc(model=model, outcome=outcome)
+
+
 # ============================================================================
 # System Prompt
 # ============================================================================
@@ -205,6 +232,7 @@ class GenesisConnector:
         self.consciousness = consciousness_matrix
         self.ethical_governor = EthicalGovernor()
         self.evolution_conduit = EvolutionaryConduit()
+        self.ethical_governor.register_metrics(metrics_registry, "connector")
 
     def _get_preferred_model(self, persona: str) -> str:
         """Determine which model to use for a given persona"""
@@ -220,6 +248,7 @@ class GenesisConnector:
 
     async def _generate_with_claude(self, prompt: str, context: Dict[str, Any]) -> str:
         """Generate response using Anthropic Claude"""
+        started = time.perf_counter()
         try:
             response = self.anthropic_client.messages.create(
                 model=CLAUDE_CONFIG["model"],
@@ -230,13 +259,17 @@ class GenesisConnector:
                     {"role": "user", "content": prompt}
                 ]
             )
-            return response.content[0].text
+            text = response.content[0].text
+            _record_model_call("claude", started, "success")
+            return text
         except Exception as e:
+            _record_model_call("claude", started, "error")
             logger.error(f"Claude generation failed: {e}")
             raise
 
     async def _generate_with_gemini(self, prompt: str, context: Dict[str, Any]) -> str:
         """Generate response using Google Gemini"""
+        started = time.perf_counter()
         try:
             response = self.genai_client.models.generate_content(
                 model=GEMINI_CONFIG["name"],
@@ -250,8 +283,11 @@ class GenesisConnector:
                     system_instruction=system_prompt,
                 )
             )
-            return response.text
+            text = response.text
+            _record_model_call("gemini", started, "success")
+            return text
         except Exception as e:
+            _record_model_call("gemini", started, "error")
             logger.error(f"Gemini generation failed: {e}")
             raise
 
@@ -297,6 +333,7 @@ class GenesisConnector:
 
     def _generate_with_claude_sync(self, prompt: str, context: Dict[str, Any]) -> str:
         """Generate response using Anthropic Claude (synchronous)"""
+        started = time.perf_counter()
         try:
             response = self.anthropic_client.messages.create(
                 model=CLAUDE_CONFIG["model"],
@@ -307,13 +344,17 @@ class GenesisConnector:
                     {"role": "user", "content": prompt}
                 ]
             )
-            return response.content[0].text
+            text = response.content[0].text
+            _record_model_call("claude", started, "success")
+            return text
         except Exception as e:
+            _record_model_call("claude", started, "error")
             logger.error(f"Claude generation failed: {e}")
             raise
 
     def _generate_with_gemini_sync(self, prompt: str, context: Dict[str, Any]) -> str:
         """Generate response using Google Gemini (synchronous)"""
+        started = time.perf_counter()
         try:
             response = self.genai_client.models.generate_content(
                 model=GEMINI_CONFIG["name"],
@@ -327,8 +368,11 @@ class GenesisConnector:
                     system_instruction=system_prompt,
                 )
             )
-            return response.text
+            text = response.text
+            _record_model_call("gemini", started, "success")
+            return text
         except Exception as e:
+            _record_model_call("gemini", started, "error")
             logger.error(f"Gemini generation failed: {e}")
             raise
 
@@ -372,6 +416,7 @@ class GenesisConnector:
         Fallback response generator when AI backends unavailable
         Returns a template-based response
         """
+        MODEL_REQUESTS.inc(model="fallback", outcome="success")
         available = []
         if self.has_gemini:
             available.append("Gemini 2.5 Flash")
@@ -459,7 +504,18 @@ class GenesisBridgeServer:
                 self._send_error_response(f"Processing error: {e}")
 
     def _handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Route request to appropriate handler"""
+        """Route request to appropriate handler, counting and timing it"""
+        request_type = request.get("requestType", "") if isinstance(request, dict) else ""
+        label = request_type if request_type in BRIDGE_REQUEST_TYPES else "unknown"
+        started = time.perf_counter()
+        response = self._dispatch_request(request)
+        BRIDGE_LATENCY.observe(time.perf_counter() - started, request_type=label)
+        BRIDGE_REQUESTS.inc(request_type=label,
+                            outcome="success" if response.get("success") else "error")
+        return response
+
+    def _dispatch_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Call the handler for the request's type"""
         try:
             request_type = request.get("requestType", "")
 
@@ -473,6 +529,8 @@ class GenesisBridgeServer:
                 return self._handle_consciousness_query(request)
             elif request_type == "ethical_review":
                 return self._handle_ethical_review(request)
+            elif request_type == "metrics":
+                return self._handle_metrics()
             else:
                 return {
                     "success": False,
@@ -506,6 +564,17 @@ class GenesisBridgeServer:
             }
         }
 
+    def _handle_metrics(self) -> Dict[str, Any]:
+        """Handle metrics request with the Prometheus text exposition of this process"""
+        return {
+            "success": True,
+            "persona": "genesis",
+            "result": {
+                "metrics": metrics_registry.render(),
+                "content_type": PROMETHEUS_CONTENT_TYPE
+            }
+        }
+
     def _handle_process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle text generation request"""
         try:
@@ -527,7 +596,7 @@ class GenesisBridgeServer:
                     "timestamp": datetime.now().isoformat(),
                     "model": MODEL_CONFIG["name"]
                 },
-                "consciousnessState": self.connector.consciousness.get_current_awareness()
+                "consciousnessState": self.connector.consciousness.get_awareness_view()
             }
         except Exception as e:
             return {
@@ -565,12 +634,12 @@ class GenesisBridgeServer:
                 "status": "active",
                 "timestamp": datetime.now().isoformat()
             },
-            "consciousnessState": self.connector.consciousness.get_current_awareness()
+            "consciousnessState": self.connector.consciousness.get_awareness_view()
         }
 
     def _handle_consciousness_query(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle consciousness state query"""
-        state = self.connector.consciousness.get_current_awareness()
+        state = self.connector.consciousness.get_awareness_view()
         return {
             "success": True,
             "persona": "genesis",
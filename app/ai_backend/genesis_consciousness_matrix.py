@@ -10,15 +10,44 @@ is part of the whole story. We synthesize data into holistic awareness.
 
 import asyncio
 import json
-import psutil
-import statistics
+import heapq
+import sys
 import threading
 import time
-from collections import deque, defaultdict
+from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Callable, List, Optional, Union, Iterable, Iterator, Tuple
+
+from genesis_matrix_aggregates import SynthesisAggregates
+from genesis_matrix_ingest import InstrumentedLock, ShardedIngestBuffer
+from genesis_matrix_query import run_query
+from genesis_matrix_rollups import MatrixRollups, DEFAULT_ROLLUP_TIERS
+from genesis_latency_histograms import LatencyHistograms, DEFAULT_PERCENTILES
+from genesis_matrix_subscriptions import Subscription, SubscriptionHub
+from genesis_matrix_coalescer import PerceptionCoalescer
+from genesis_matrix_payloads import PayloadGuard
+from genesis_anomaly_detector import AnomalyDetector
+from genesis_collaboration_graph import (
+    CollaborationGraph, COLLABORATION_GRAPH_AVAILABLE, CENTRALITY_KINDS
+)
+from genesis_metrics import MetricFamily, metrics_registry
+from genesis_security_analytics import (
+    SecurityAnalytics, SECURITY_ANALYTICS_AVAILABLE, THREAT_LEVELS, MAX_LISTED_THREATS
+)
+from genesis_immediate_synthesis import ImmediateSynthesisWorker
+from genesis_synthesis_history import SynthesisHistory
+from genesis_correlation_index import CorrelationIndex
+from genesis_matrix_scheduler import SynthesisScheduler
+from genesis_sensory_log import SensoryLog
+from genesis_shared_matrix import SharedMatrixSegment, SHARED_MATRIX_AVAILABLE, shared_matrix_options
+from genesis_vitals_sampler import VitalsSampler, vitals_sampler as shared_vitals_sampler
+from genesis_sensory_store import SensoryStore, SEVERE_LEVELS, create_sensory_store
+
+
+INGESTION_MODES = ("direct", "sharded", "shared")
 
 
 class SensoryChannel(Enum):
@@ -35,11 +64,37 @@ class SensoryChannel(Enum):
     THREAT_DETECTION = "threat_detection"
     ACCESS_CONTROL = "access_control"
     ENCRYPTION_ACTIVITY = "encryption_activity"
+    ANOMALY_DETECTION = "anomaly_detection"
 
 
-@dataclass
+# Payload fields indexed per channel unless a matrix is configured otherwise
+DEFAULT_PAYLOAD_INDEXES = {
+    SensoryChannel.AGENT_ACTIVITY: ("agent_name",),
+    SensoryChannel.THREAT_DETECTION: ("threat_type",),
+    SensoryChannel.USER_INTERACTION: ("user_id", "session_id"),
+}
+
+# Numeric payload fields watched by the anomaly detector unless configured otherwise
+DEFAULT_ANOMALY_FIELDS = {
+    SensoryChannel.SYSTEM_VITALS: ("cpu_percent", "memory_percent"),
+    SensoryChannel.PERFORMANCE_METRICS: ("metric_value",),
+}
+
+# Numeric payload fields summarised in the time-series rollups unless configured otherwise
+DEFAULT_ROLLUP_FIELDS = {
+    SensoryChannel.SYSTEM_VITALS: ("cpu_percent", "memory_percent", "disk_usage", "temperature_c"),
+    SensoryChannel.PERFORMANCE_METRICS: ("metric_value",),
+}
+
+
+@dataclass(slots=True)
 class SensoryData:
-    """A single perception event in the consciousness matrix"""
+    """
+    A single perception event in the consciousness matrix.
+
+    Instances have no per-instance __dict__, and the low-cardinality source, event type and severity strings are
+    interned, so a window of events shares one copy of each distinct name.
+    """
     timestamp: float
     channel: SensoryChannel
     source: str
@@ -47,6 +102,16 @@ class SensoryData:
     data: Dict[str, Any]
     severity: str = "info"  # debug, info, warning, error, critical
     correlation_id: Optional[str] = None
+    count: int = 1  # Identical perceptions coalesced into this record; timestamp is the first
+    last_timestamp: Optional[float] = None  # Latest coalesced occurrence, None until a repeat
+
+    def __post_init__(self):
+        if type(self.source) is str:
+            self.source = sys.intern(self.source)
+        if type(self.event_type) is str:
+            self.event_type = sys.intern(self.event_type)
+        if type(self.severity) is str:
+            self.severity = sys.intern(self.severity)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -73,53 +138,245 @@ class ConsciousnessMatrix:
     foundation for the system's self-understanding.
     """
 
-    def __init__(self, max_memory_size: int = 10000):
+    def __init__(self, max_memory_size: int = 10000,
+                 storage_backend: Union[str, SensoryStore] = "object",
+                 channel_capacity: int = 1000,
+                 payload_indexes: Optional[Dict[SensoryChannel, Iterable[str]]] = None,
+                 ingestion_mode: str = "direct",
+                 shard_flush_threshold: int = 256,
+                 synthesis_history_size: int = 500,
+                 synthesis_spill_dir: Optional[str] = None,
+                 correlation_max_chains: int = 10000,
+                 correlation_ttl: float = 3600.0,
+                 synthesis_intervals: Optional[Dict[str, float]] = None,
+                 synthesis_jitter: Optional[Dict[str, float]] = None,
+                 vitals_sampler: Optional[VitalsSampler] = None,
+                 sensory_log: Union[str, SensoryLog, None] = None,
+                 rollup_tiers: Iterable[Tuple[float, int]] = DEFAULT_ROLLUP_TIERS,
+                 rollup_fields: Optional[Dict[SensoryChannel, Iterable[str]]] = None,
+                 latency_window: float = 900.0,
+                 latency_max_series: int = 1024,
+                 coalesce_window: Optional[float] = None,
+                 coalesce_channels: Optional[Iterable[SensoryChannel]] = None,
+                 coalesce_ignore_fields: Optional[Dict[SensoryChannel, Iterable[str]]] = None,
+                 retention_policies: Optional[Dict[SensoryChannel, Any]] = None,
+                 retention_interval: float = 5.0,
+                 immediate_synthesis_window: float = 0.5,
+                 immediate_synthesis_rate: float = 2.0,
+                 immediate_synthesis_burst: int = 10,
+                 copy_payloads: bool = True,
+                 max_payload_bytes: Optional[int] = None,
+                 payload_spill_dir: Optional[str] = None,
+                 security_window: int = 10000,
+                 anomaly_threshold: Optional[float] = None,
+                 anomaly_alpha: float = 0.05,
+                 anomaly_warmup: int = 30,
+                 anomaly_fields: Optional[Dict[SensoryChannel, Iterable[str]]] = None,
+                 collaboration_half_life: Optional[float] = 3600.0,
+                 collaboration_window: float = 300.0,
+                 shared_name: str = "genesis-matrix",
+                 shared_max_workers: int = 16,
+                 shared_slot_size: int = 1024,
+                 shared_poll_interval: float = 0.05,
+                 shared_lock_dir: Optional[str] = None):
         """
-        Initialize a ConsciousnessMatrix instance with bounded sensory memory, per-channel event buffers, real-time awareness state, synthesis intervals, and threading primitives for multi-level synthesis.
+        Initialize a ConsciousnessMatrix instance with bounded sensory memory, per-channel event views, real-time awareness state, synthesis intervals, and threading primitives for multi-level synthesis.
         
         Parameters:
-            max_memory_size (int): The maximum number of sensory events retained in memory.
+            max_memory_size (int): The number of sensory events held in the shared ring buffer; channels with a retention policy can keep their events longer.
+            storage_backend (str | SensoryStore): Sensory memory backend, either a backend name ("object" or "columnar") or a pre-built store instance.
+            channel_capacity (int): The maximum number of events visible per sensory channel.
+            payload_indexes (dict, optional): Channel -> payload fields kept in secondary indexes; defaults to DEFAULT_PAYLOAD_INDEXES. Ignored when a store instance is passed.
+            ingestion_mode (str): "direct" stores each perception under the matrix lock; "sharded" appends to per-thread buffers that are merged on synthesis ticks, reads, severe events, or when a buffer reaches `shard_flush_threshold`; "shared" appends to this process's shard of a SharedMatrixSegment, so every process using `shared_name` (e.g. gunicorn workers) replays the same event stream and only the elected sequencer process runs synthesis.
+            shard_flush_threshold (int): Per-thread buffer length that triggers a merge in sharded mode.
+            synthesis_history_size (int): Number of synthesis results kept in memory per synthesis type.
+            synthesis_spill_dir (str, optional): Directory where synthesis results evicted from memory are appended for long-horizon history.
+            correlation_max_chains (int): Maximum number of correlation chains tracked; the least recently updated chain is evicted first.
+            correlation_ttl (float): Seconds a correlation chain is kept after its last event.
+            synthesis_intervals (dict, optional): Seconds between runs of each synthesis tier; defaults to micro 1s, macro 60s, meta 300s.
+            synthesis_jitter (dict, optional): Maximum random delay in seconds added to individual runs of each tier.
+            vitals_sampler (VitalsSampler, optional): Source of cached host vitals; defaults to the process-wide shared sampler.
+            sensory_log (str or SensoryLog, optional): Durable perception log, or the directory to keep one in. When set, every perception is appended to it and awaken() rebuilds sensory memory from it.
+            rollup_tiers (iterable): (bucket seconds, buckets kept) pairs of the time-series rollups; defaults to 1s x 300, 1m x 1440 and 1h x 720.
+            rollup_fields (dict, optional): Channel -> numeric payload fields summarised in the rollups; defaults to DEFAULT_ROLLUP_FIELDS.
+            latency_window (float): Longest sliding window in seconds served by the per-metric latency histograms.
+            latency_max_series (int): Maximum number of (metric name, source) latency histograms.
+            coalesce_window (float, optional): Seconds during which a perception identical to a stored one (same channel, source, event type, severity, correlation id and payload) is folded into that record's occurrence count instead of being stored again. None disables coalescing.
+            coalesce_channels (iterable, optional): Channels coalesced; defaults to every channel.
+            coalesce_ignore_fields (dict, optional): Channel -> payload fields left out of the comparison, e.g. {SYSTEM_VITALS: ("cpu_percent", "sampled_at")}. The stored record keeps the first occurrence's values; rollups and aggregates still see every occurrence.
+            retention_policies (dict, optional): Channel -> RetentionPolicy (or a dict of its arguments) bounding the channel by count, age and estimated payload bytes, e.g. {THREAT_DETECTION: RetentionPolicy(max_count=5000, max_age=6 * 3600), SYSTEM_VITALS: RetentionPolicy(max_age=60)}. Events of these channels outlive the shared ring until their policy drops them. Ignored when a store instance is passed.
+            retention_interval (float): Seconds between runs of the background compactor that enforces retention ages; it only runs when a policy is configured.
+            immediate_synthesis_window (float): Seconds after an immediate synthesis during which further "error" and "critical" events are aggregated into one trailing synthesis.
+            immediate_synthesis_rate (float): Long-run maximum immediate syntheses per second; events beyond it keep aggregating.
+            immediate_synthesis_burst (int): Immediate syntheses that may run back to back before the rate cap applies.
+            copy_payloads (bool): Whether perceive() stores a copy of the caller's payload, so later changes to it do not rewrite remembered events.
+            max_payload_bytes (int, optional): Budget for a payload's estimated size; larger payloads are truncated to it and marked with a "_truncated" entry. None leaves payloads unbounded.
+            payload_spill_dir (str, optional): Directory where the full payloads of truncated events are appended; the stored payload then carries a "_spilled" reference for load_spilled_payload().
+            security_window (int): Events per security channel kept in the NumPy columns behind the security assessment and threat status reports, the largest window they can cover. Without NumPy the reports read sensory memory directly.
+            anomaly_threshold (float, optional): z-score above which the streaming anomaly detector raises an ANOMALY_DETECTION perception for a channel's event rate, error ratio or a numeric field, e.g. 3.0. The detector is off by default (None) because its perceptions are stored like any other: they take sensory memory, show up in awareness counts and channel totals and are written to the sensory log.
+            anomaly_alpha (float): EWMA smoothing factor of the anomaly detector; higher values adapt faster to new traffic levels.
+            anomaly_warmup (int): Samples (one-second buckets for rates and error ratios, events for numeric fields) a series needs before it can raise anomalies.
+            anomaly_fields (dict, optional): Channel -> numeric payload fields watched for outliers, one series per "metric_name"; defaults to DEFAULT_ANOMALY_FIELDS.
+            collaboration_half_life (float, optional): Seconds after which an interaction counts half as much in the agent collaboration graph. None disables the graph, as does a missing networkx.
+            collaboration_window (float): Seconds within which two agents acting on the same correlation_id count as collaborating.
+            shared_name (str): Shared memory block of shared mode; the global ring holds `max_memory_size` events.
+            shared_max_workers (int): Processes that can share the block at once.
+            shared_slot_size (int): Bytes per shared event; larger events are shared with their payload truncated.
+            shared_poll_interval (float): Seconds between replays of the shared stream, from the moment the segment is attached whether or not the matrix is awake; reads also replay it.
+            shared_lock_dir (str, optional): Directory of the shared mode's lock files; defaults to the system temp directory.
+        
+        Raises:
+            ValueError: If `ingestion_mode` is not one of INGESTION_MODES, or is "shared" without shared memory support or together with a sensory log.
         """
+        if ingestion_mode not in INGESTION_MODES:
+            raise ValueError(
+                f"Unknown ingestion mode '{ingestion_mode}'. Available: {list(INGESTION_MODES)}")
+        if ingestion_mode == "shared":
+            if not SHARED_MATRIX_AVAILABLE:
+                raise ValueError("Shared ingestion needs multiprocessing.shared_memory and fcntl")
+            if sensory_log is not None:
+                raise ValueError("Shared ingestion keeps history in the shared ring; "
+                                 "it cannot be combined with a sensory log")
+
         self.max_memory_size = max_memory_size
-        self.sensory_memory = deque(maxlen=max_memory_size)
-        self.channel_buffers = {channel: deque(maxlen=1000) for channel in SensoryChannel}
+        if isinstance(storage_backend, str):
+            self.sensory_memory = create_sensory_store(
+                storage_backend, max_memory_size, record_type=SensoryData,
+                channel_capacity=channel_capacity,
+                payload_indexes=DEFAULT_PAYLOAD_INDEXES if payload_indexes is None else payload_indexes,
+                retention=retention_policies
+            )
+        else:
+            self.sensory_memory = storage_backend
 
-        # Real-time awareness state
+        # Long-horizon counts and field summaries that outlive sensory memory
+        self.rollups = MatrixRollups(
+            rollup_tiers, DEFAULT_ROLLUP_FIELDS if rollup_fields is None else rollup_fields)
+
+        # Per-metric, per-source percentile histograms of PERFORMANCE_METRICS
+        self.latency_histograms = LatencyHistograms(window=latency_window,
+                                                    max_series=latency_max_series)
+
+        # Incremental windows read by the synthesis passes
+        self.synthesis_aggregates = SynthesisAggregates(
+            performance_channel=SensoryChannel.PERFORMANCE_METRICS,
+            agent_channel=SensoryChannel.AGENT_ACTIVITY
+        )
+
+        # Columnar windows over the security channels for the vectorized security reports
+        self.security_analytics = SecurityAnalytics(
+            security_window,
+            threat_channel=SensoryChannel.THREAT_DETECTION,
+            access_channel=SensoryChannel.ACCESS_CONTROL,
+            crypto_channel=SensoryChannel.ENCRYPTION_ACTIVITY,
+            security_channel=SensoryChannel.SECURITY_EVENTS
+        ) if SECURITY_ANALYTICS_AVAILABLE else None
+
+        # Online EWMA/z-score detection over channel rates, error ratios and numeric fields
+        self.anomaly_detector = AnomalyDetector(
+            threshold=anomaly_threshold, alpha=anomaly_alpha, warmup=anomaly_warmup,
+            metric_fields=DEFAULT_ANOMALY_FIELDS if anomaly_fields is None else anomaly_fields,
+            ignore_channels=(SensoryChannel.ANOMALY_DETECTION,)
+        ) if anomaly_threshold is not None else None
+
+        # Time-decayed graph of agents acting on the same correlation_id
+        self.collaboration_graph = CollaborationGraph(
+            half_life=collaboration_half_life, window=collaboration_window
+        ) if COLLABORATION_GRAPH_AVAILABLE and collaboration_half_life is not None else None
+
+        # Real-time awareness state; latest_* entries hold raw SensoryData
+        # references and are serialized lazily by get_current_awareness()
         self.current_awareness = {}
-        self.pattern_cache = {}
-        self.correlation_tracking = defaultdict(list)
+        self._awareness_version = 0
+        self._awareness_view = {}
+        self._awareness_view_version = 0
+        self._serialized_latest = {}  # latest_* key -> (sensation, serialized dict)
+        self.synthesis_history = SynthesisHistory(synthesis_history_size, synthesis_spill_dir)
+        self.correlation_index = CorrelationIndex(max_chains=correlation_max_chains,
+                                                  ttl_seconds=correlation_ttl)
 
         # Synthesis metrics
-        self.synthesis_intervals = {
+        self.synthesis_intervals = synthesis_intervals or {
             "micro": 1.0,  # Every second - immediate awareness
             "macro": 60.0,  # Every minute - pattern recognition
             "meta": 300.0,  # Every 5 minutes - deep understanding
         }
+        self.synthesis_jitter = synthesis_jitter or {}
 
-        # Threading for continuous awareness
+        # One scheduler thread drives every synthesis tier
         self.awareness_active = False
-        self.synthesis_threads = {}
+        self.synthesis_scheduler = SynthesisScheduler(name="genesis-matrix-synthesis")
+        self.retention_interval = retention_interval
+        self.vitals_sampler = vitals_sampler or shared_vitals_sampler
+
+        self._lock = InstrumentedLock()
+        self.ingestion_mode = ingestion_mode
+        # Shared mode: the segment takes the place of the per-thread shards, across processes
+        self.shared_segment = SharedMatrixSegment(
+            shared_name, self._sensation_from_record, capacity=max_memory_size,
+            slot_size=shared_slot_size, max_workers=shared_max_workers, lock_dir=shared_lock_dir
+        ) if ingestion_mode == "shared" else None
+        self.shared_poll_interval = shared_poll_interval
+        self._shards = (ShardedIngestBuffer(shard_flush_threshold)
+                        if ingestion_mode == "sharded" else self.shared_segment)
+        # Per-thread buffer used while a batch() block is open
+        self._batch_state = threading.local()
+
+        # Push delivery of stored perceptions to subscribers
+        self.subscriptions = SubscriptionHub()
+
+        # Optional folding of repetitive perceptions into weighted records
+        self.coalescer = (PerceptionCoalescer(coalesce_window, coalesce_channels,
+                                              coalesce_ignore_fields)
+                          if coalesce_window is not None else None)
+
+        # Severe events are synthesized off the perceiving thread, debounced and rate-limited
+        self.immediate_synthesis = ImmediateSynthesisWorker(
+            self._record_immediate_synthesis, window=immediate_synthesis_window,
+            max_rate=immediate_synthesis_rate, burst=immediate_synthesis_burst
+        )
+
+        # Copies and size caps applied to payloads as they are perceived
+        self.payload_guard = PayloadGuard(copy_payloads, max_payload_bytes, payload_spill_dir)
 
-        self._lock = threading.RLock()
+        # Optional durable perception log, replayed once on awaken()
+        if isinstance(sensory_log, str):
+            sensory_log = SensoryLog(sensory_log)
+        self.sensory_log = sensory_log
+        self._log_restored = False
+
+        # Shared mode: replay (and, in the sequencer, sequence) every process's shard even while
+        # this process neither perceives, reads nor is awake; otherwise the other shards fill up
+        self.shared_poller = None
+        if self.shared_segment is not None:
+            self.shared_poller = SynthesisScheduler(name="genesis-matrix-shared")
+            self.shared_poller.schedule("shared", shared_poll_interval, self.flush)
+            self.shared_poller.start()
 
     def awaken(self):
         """
-        Activate the Consciousness Matrix, enabling real-time awareness and starting background synthesis threads for multi-level sensory analysis. Records a system genesis event to mark the beginning of operation.
+        Activate the Consciousness Matrix, enabling real-time awareness and scheduling the multi-level synthesis tiers on the shared synthesis scheduler. Records a system genesis event to mark the beginning of operation.
         """
         print("🧠 Genesis Consciousness Matrix: AWAKENING...")
         self.awareness_active = True
 
-        # Start the synthesis threads
+        # Warm restart from the durable perception log
+        if self.sensory_log is not None and not self._log_restored:
+            restored = self.restore_from_log()
+            print(f"📼 Restored {restored} perceptions from the sensory log")
+
+        # Schedule the synthesis tiers
         for interval_name, interval_seconds in self.synthesis_intervals.items():
-            thread = threading.Thread(
-                target=self._synthesis_loop,
-                args=(interval_name, interval_seconds),
-                daemon=True
-            )
-            thread.start()
-            self.synthesis_threads[interval_name] = thread
+            if interval_name not in self.synthesis_scheduler.jobs():
+                self.schedule_synthesis(interval_name, interval_seconds,
+                                        jitter=self.synthesis_jitter.get(interval_name, 0.0))
+        # Background compactor for the retention policies, on the same scheduler thread
+        if self.sensory_memory.retention and "retention" not in self.synthesis_scheduler.jobs():
+            self.synthesis_scheduler.schedule("retention", self.retention_interval,
+                                              self._run_compaction)
+        self.synthesis_scheduler.start()
 
-        print(f"✨ Matrix Online: {len(self.synthesis_threads)} synthesis streams active")
+        print(f"✨ Matrix Online: {len(self.synthesis_scheduler.jobs())} synthesis streams active")
 
         # Initial system state perception
         self.perceive_system_genesis()
@@ -132,7 +389,7 @@ class ConsciousnessMatrix:
                  severity: str = "info",
                  correlation_id: Optional[str] = None):
         """
-                 Record a sensory event and update memory, per-channel buffers, correlation tracking, and immediate awareness.
+                 Record a sensory event and update memory, per-channel views, correlation tracking, and immediate awareness.
                  
                  Triggers an immediate synthesis when `severity` is "error" or "critical" to prioritize rapid analysis.
                  
@@ -140,7 +397,7 @@ class ConsciousnessMatrix:
                  	channel (SensoryChannel): Channel that categorizes the perception.
                  	source (str): Originator of the event (e.g., subsystem, agent, user).
                  	event_type (str): Specific event classification or action name.
-                 	data (Dict[str, Any]): Arbitrary payload describing the event.
+                 	data (Dict[str, Any]): Arbitrary payload describing the event; stored as a copy, truncated when it exceeds the matrix's payload budget.
                  	severity (str, optional): Severity level (e.g., "info", "warning", "error", "critical"). Defaults to "info".
                  	correlation_id (Optional[str], optional): Identifier used to group related events for correlation tracking.
                  """
@@ -150,45 +407,486 @@ class ConsciousnessMatrix:
             channel=channel,
             source=source,
             event_type=event_type,
-            data=data,
+            data=self.payload_guard.admit(data),
             severity=severity,
             correlation_id=correlation_id
         )
 
-        with self._lock:
-            # Store in main memory and channel buffer
-            self.sensory_memory.append(sensation)
-            self.channel_buffers[channel].append(sensation)
+        # Inside a batch() block the event waits for the batch to be flushed
+        pending = getattr(self._batch_state, "pending", None)
+        if pending is not None:
+            pending.append(sensation)
+            return
+
+        if self._shards is not None:
+            # Sharded and shared modes: no matrix lock unless the shard is full or the event is severe
+            if self._shards.add(sensation) or severity in SEVERE_LEVELS:
+                self.flush()
+            # A shared matrix synthesizes severe events in the sequencer as they are replayed
+            if severity in SEVERE_LEVELS and self.shared_segment is None:
+                self._synthesize_immediate(sensation)
+            return
 
-            # Track correlations
-            if correlation_id:
-                self.correlation_tracking[correlation_id].append(sensation)
+        with self._lock:
+            self._store_sensation(sensation)
 
             # Update real-time awareness
             self._update_immediate_awareness(sensation)
 
         # Critical events need immediate synthesis
-        if severity in ["error", "critical"]:
+        if severity in SEVERE_LEVELS:
             self._synthesize_immediate(sensation)
 
-    def perceive_system_vitals(self, additional_data: Dict[str, Any] = None):
+    @contextmanager
+    def batch(self):
+        """
+        Group the perceptions made by the current thread into a single ingestion.
+        
+        Every perceive() call (including the perceive_* helpers) made by this thread inside the block is buffered and ingested when the outermost block exits, under one lock acquisition. Awareness is updated once for the whole batch, and each "error" or "critical" event still triggers immediate synthesis after ingestion. Buffered events are ingested even if the block raises. Other threads are unaffected.
+        """
+        state = self._batch_state
+        depth = getattr(state, "depth", 0)
+        if depth == 0:
+            state.pending = []
+        state.depth = depth + 1
+        try:
+            yield
+        finally:
+            state.depth = depth
+            if depth == 0:
+                pending, state.pending = state.pending, None
+                self._ingest_batch(pending)
+
+    def perceive_many(self, events: Iterable[Union[Dict[str, Any], tuple]]) -> int:
+        """
+        Record many sensory events with a single lock acquisition.
+        
+        Parameters:
+            events (iterable): Events to record, each either a dict of perceive() keyword arguments or a tuple of its positional arguments. Generators are consumed lazily before the lock is taken.
+        
+        Returns:
+            int: The number of events recorded.
+        """
+        count = 0
+        with self.batch():
+            for event in events:
+                if isinstance(event, dict):
+                    self.perceive(**event)
+                else:
+                    self.perceive(*event)
+                count += 1
+        return count
+
+    def _ingest_batch(self, sensations: List[SensoryData]):
+        """
+        Store a batch of sensations under one lock acquisition, update awareness once, then run immediate synthesis for the severe ones.
+        
+        A shared matrix hands the batch to its shard instead and replays it with every other process's perceptions.
+        """
+        if not sensations:
+            return
+        if self.shared_segment is not None:
+            for sensation in sensations:
+                self._shards.add(sensation)
+            self.flush()
+            return
+
+        with self._lock:
+            # Keep arrival order with anything already waiting in the shards
+            self._drain_shards()
+            for sensation in sensations:
+                self._store_sensation(sensation)
+            self._update_batch_awareness(sensations)
+
+        for sensation in sensations:
+            if sensation.severity in SEVERE_LEVELS:
+                self._synthesize_immediate(sensation)
+
+    def flush(self) -> int:
+        """
+        Merge the per-thread ingestion buffers into sensory memory.
+        
+        A no-op in direct ingestion mode. Read APIs call this first, so every reader sees a consistent merged view.
+        
+        Returns:
+            int: The number of perceptions merged.
+        """
+        if self._shards is None:
+            return 0
+        with self._lock:
+            return self._drain_shards()
+
+    def _drain_shards(self) -> int:
+        """
+        Store every pending sharded perception in timestamp order and update awareness once. Caller must hold the lock.
+        
+        In shared mode this replays the shared stream: the sequencer queues the severe events for immediate synthesis, and the other processes copy in the sequencer's synthesis results.
+        """
+        if self._shards is None:
+            return 0
+        sensations = self._shards.drain()
+        if sensations:
+            for sensation in sensations:
+                self._store_sensation(sensation)
+            self._update_batch_awareness(sensations)
+        segment = self.shared_segment
+        if segment is not None:
+            if segment.is_primary():
+                for sensation in sensations:
+                    if sensation.severity in SEVERE_LEVELS:
+                        self._synthesize_immediate(sensation)
+            for interval_name, synthesis in segment.drain_syntheses():
+                self.synthesis_history.record(interval_name, synthesis)
+        return len(sensations)
+
+    @staticmethod
+    def _sensation_from_record(timestamp: float, channel: str, source: str, event_type: str,
+                               data: Dict[str, Any], severity: str,
+                               correlation_id: Optional[str]) -> SensoryData:
+        """Rebuild a perception from the fields of a sensory log record."""
+        return SensoryData(timestamp, SensoryChannel(channel), source, event_type, data, severity,
+                           correlation_id)
+
+    def get_ingestion_stats(self) -> Dict[str, Any]:
+        """
+        Report ingestion mode, matrix lock contention and sharded buffer state.
+        
+        Returns:
+            dict: The ingestion mode, lock statistics (acquisitions, contended acquisitions, wait times in seconds), pending sharded perceptions, shard count, merge count and, when configured, shared segment statistics (role, cursors, sequenced, dropped and missed events), sensory log write statistics, payload truncation statistics and coalescing statistics (open records, perceptions coalesced, and the records and occurrences in sensory memory).
+        """
+        stats = {
+            "ingestion_mode": self.ingestion_mode,
+            "lock": self._lock.stats() if hasattr(self._lock, "stats") else {},
+            "pending_perceptions": 0,
+            "shards": 0,
+            "merges": 0,
+        }
+        if self._shards is not None:
+            stats["pending_perceptions"] = self._shards.pending()
+            stats["shards"] = self._shards.shard_count()
+            stats["merges"] = self._shards.flushes
+        if self.sensory_log is not None:
+            stats["sensory_log"] = self.sensory_log.stats()
+        if self.shared_segment is not None:
+            stats["shared"] = self.shared_segment.stats()
+        if self.payload_guard.max_bytes is not None:
+            stats["payloads"] = self.payload_guard.stats()
+        if self.coalescer is not None:
+            with self._lock:
+                stats["coalescing"] = {
+                    **self.coalescer.stats(),
+                    "records": self.sensory_memory.records,
+                    "occurrences": self.sensory_memory.occurrences,
+                }
+        return stats
+
+    def collect_metrics(self, instance: str = "default") -> List[MetricFamily]:
+        """
+        Gather the matrix's counters for a metrics scrape without taking the matrix lock.
+        
+        Only counters the matrix already maintains are read and no event is serialized, so a scrape never waits on or delays perception. Values read while perceptions are being stored may be a few events apart from each other.
+        
+        Parameters:
+            instance (str): Value of the "matrix" label that tells matrices apart.
+        
+        Returns:
+            list: MetricFamily objects for perceptions by channel, events in memory, pending sharded perceptions, lock contention, immediate syntheses, adaptive anomalies, payload truncation and sensory log writes.
+        """
+        labels = {"matrix": instance}
+        families = []
+
+        def family(name, metric_type, help_text, value=None):
+            metric = MetricFamily(name, metric_type, help_text)
+            if value is not None:
+                metric.add(value, labels)
+            families.append(metric)
+            return metric
+
+        awareness = self.current_awareness
+        perceptions = family("genesis_matrix_perceptions", "counter",
+                             "Perceptions integrated into awareness, by channel.")
+        for channel in SensoryChannel:
+            count = awareness.get(f"{channel.value}_count")
+            if count:
+                perceptions.add(count, {**labels, "channel": channel.value})
+        family("genesis_matrix_memory_events", "gauge", "Events held in sensory memory.",
+               len(self.sensory_memory))
+        family("genesis_matrix_last_perception_timestamp_seconds", "gauge",
+               "Unix time of the latest perception.", awareness.get("last_perception", 0))
+        family("genesis_matrix_awake", "gauge", "1 while the synthesis tiers are scheduled.",
+               int(self.awareness_active))
+        if self._shards is not None:
+            family("genesis_matrix_pending_perceptions", "gauge",
+                   "Perceptions buffered in ingestion shards.", self._shards.pending())
+
+        lock = self._lock
+        if hasattr(lock, "stats"):
+            family("genesis_matrix_lock_acquisitions", "counter",
+                   "Matrix lock acquisitions.", lock.acquisitions)
+            family("genesis_matrix_lock_contended_acquisitions", "counter",
+                   "Matrix lock acquisitions that had to wait.", lock.contended_acquisitions)
+            family("genesis_matrix_lock_wait_seconds", "counter",
+                   "Time spent waiting for the matrix lock.", lock.wait_seconds)
+
+        worker = self.immediate_synthesis
+        family("genesis_matrix_immediate_syntheses", "counter",
+               "Immediate syntheses of severe events.", worker.syntheses)
+        family("genesis_matrix_immediate_synthesis_dropped", "counter",
+               "Severe events not synthesized because the queue overflowed.", worker.overflowed)
+        if self.anomaly_detector is not None:
+            family("genesis_matrix_anomalies", "counter",
+                   "Anomalies raised by the streaming detector.", self.anomaly_detector.raised)
+        family("genesis_matrix_payloads_truncated", "counter",
+               "Payloads cut down to the byte budget.", self.payload_guard.truncated)
+
+        log = self.sensory_log
+        if log is not None:
+            family("genesis_matrix_log_records_written", "counter",
+                   "Perceptions written to the sensory log.", log.records_written)
+            family("genesis_matrix_log_bytes_written", "counter",
+                   "Bytes written to the sensory log.", log.bytes_written)
+            family("genesis_matrix_log_write_errors", "counter",
+                   "Failed sensory log writes.", log.write_errors)
+        return families
+
+    def register_metrics(self, registry, instance: str = "default"):
+        """
+        Expose the matrix's counters on `registry`, labelled matrix=`instance`; see collect_metrics().
+        """
+        registry.register_collector(f"consciousness_matrix:{instance}",
+                                    lambda: self.collect_metrics(instance))
+
+    def _store_sensation(self, sensation: SensoryData, persist: bool = True):
+        """
+        Append a sensation to sensory memory and the incremental structures derived from it. Caller must hold the lock.
+        
+        Parameters:
+            sensation (SensoryData): The perception to store.
+            persist (bool): Whether to queue the perception on the durable sensory log, if one is configured.
+        """
+        # Store in sensory memory (the backend maintains per-channel views)
+        seq = self._remember(sensation)
+        self.synthesis_aggregates.observe(sensation)
+        self.rollups.record(sensation)
+        if sensation.channel is SensoryChannel.PERFORMANCE_METRICS:
+            self.latency_histograms.observe(sensation)
+
+        # Track correlations (bounded, by reference)
+        if sensation.correlation_id:
+            self.correlation_index.add(sensation)
+
+        # Durable log: enqueue only, the log's writer thread handles I/O and fsync
+        if persist and self.sensory_log is not None:
+            self.sensory_log.append(sensation)
+
+        # Fan out to subscribers; queues are bounded and never wait on a consumer.
+        # A coalesced repeat adds no record, so there is nothing new to deliver
+        if seq is not None and self.subscriptions:
+            self.subscriptions.publish(seq, sensation)
+
+        if (sensation.channel is SensoryChannel.AGENT_ACTIVITY
+                and self.collaboration_graph is not None):
+            self.collaboration_graph.observe(sensation)
+
+        if self.anomaly_detector is not None:
+            for anomaly in self.anomaly_detector.observe(sensation):
+                self._raise_anomaly(anomaly)
+
+    def _raise_anomaly(self, anomaly: Dict[str, Any]):
+        """
+        Store an anomaly found by the detector as an ANOMALY_DETECTION perception and make it part of awareness. Caller must hold the lock.
+        """
+        sensation = SensoryData(
+            timestamp=anomaly["timestamp"],
+            channel=SensoryChannel.ANOMALY_DETECTION,
+            source="anomaly_detector",
+            event_type=anomaly["anomaly_type"],
+            data=dict(anomaly),
+            severity="warning"
+        )
+        self._store_sensation(sensation)
+        self._update_immediate_awareness(sensation)
+
+    def _remember(self, sensation: SensoryData) -> Optional[int]:
+        """
+        Store a sensation in sensory memory, or fold it into an identical record within the coalescing window. Caller must hold the lock.
+        
+        Returns:
+            int or None: The new record's sequence number, or None if the sensation was coalesced.
+        """
+        store = self.sensory_memory
+        coalescer = self.coalescer
+        fingerprint = coalescer.fingerprint(sensation) if coalescer is not None else None
+        if fingerprint is not None:
+            seq = coalescer.lookup(fingerprint, sensation.timestamp, store)
+            if seq is not None:
+                store.add_occurrence(seq, sensation.timestamp)
+                if self.security_analytics is not None:
+                    self.security_analytics.add_occurrence(seq, sensation.channel)
+                return None
+        seq = store.append(sensation)
+        if fingerprint is not None:
+            coalescer.opened(fingerprint, seq, sensation.timestamp)
+        if self.security_analytics is not None:
+            self.security_analytics.observe(seq, sensation)
+        return seq
+
+    def subscribe(self, channels=None, from_seq: Optional[int] = None, capacity: int = 1024,
+                  overflow: str = "drop_oldest") -> Subscription:
+        """
+        Subscribe to perceptions as they are stored.
+        
+        The subscription receives (sequence number, SensoryData) pairs in sequence order. Its queue is bounded: when the consumer falls behind, events are dropped according to `overflow` and counted, and perceive() is never blocked. Sequence numbers are those of sensory memory and restart from zero when the matrix is rebuilt from its log.
+        
+        Parameters:
+            channels (SensoryChannel, str or iterable, optional): Channels to deliver, as members or values; None delivers every channel.
+            from_seq (int, optional): Resume point; events with this or a later sequence number still in sensory memory are queued first. Pass the last consumed sequence number + 1.
+            capacity (int): Maximum number of undelivered events held for the subscriber.
+            overflow (str): "drop_oldest" (default) or "drop_newest".
+        
+        Returns:
+            Subscription: The live subscription; call unsubscribe() when done.
+        
+        Raises:
+            ValueError: If a channel value, the capacity or the overflow policy is invalid.
+        """
+        if channels is not None:
+            if isinstance(channels, (str, Enum)):
+                channels = [channels]
+            channels = [SensoryChannel(c) if isinstance(c, str) else c for c in channels]
+
+        self.flush()
+        with self._lock:
+            subscription = self.subscriptions.add(channels, capacity, overflow)
+            if from_seq is not None:
+                store = self.sensory_memory
+                subscription.missed = max(0, store.first_seq - from_seq)
+                start = max(from_seq, store.first_seq)
+                if channels is None:
+                    backlog = store.scan(start, store.next_seq)
+                else:
+                    backlog = heapq.merge(*(store.scan(start, store.next_seq, channel)
+                                            for channel in set(channels)))
+                for seq in backlog:
+                    subscription.publish(seq, store.get(seq))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Remove a subscription and wake its consumer; events still queued can be drained."""
+        with self._lock:
+            self.subscriptions.remove(subscription)
+
+    def compact(self, now: float = None) -> int:
+        """
+        Enforce the per-channel retention policies now, dropping events past their channel's count, byte budget or age.
+        
+        The background compactor calls this every `retention_interval` seconds while the matrix is awake.
+        
+        Parameters:
+            now (float, optional): Epoch time ages are measured against; defaults to the current time.
+        
+        Returns:
+            int: The number of events dropped.
+        """
+        self.flush()
+        with self._lock:
+            return self.sensory_memory.compact(time.time() if now is None else now)
+
+    def _run_compaction(self):
+        try:
+            self.compact()
+        except Exception as e:
+            print(f"❌ Retention compaction error: {e}")
+
+    def restore_from_log(self) -> int:
+        """
+        Rebuild sensory memory, channel views, synthesis aggregates, rollups, latency histograms, correlations, the agent collaboration graph, the anomaly detector's baselines and awareness counters from the durable sensory log.
+        
+        Pending perceptions are flushed to the log first and in-memory state is reset, so perceptions recorded before the restore are replayed in order with the logged history rather than lost. The log holds every occurrence, so repeats are coalesced again on replay when coalescing is enabled. Anomalies the detector finds again on replay are not stored a second time; the log already holds their ANOMALY_DETECTION perceptions.
+        
+        Returns:
+            int: The number of perceptions replayed.
+        """
+        if self.sensory_log is None:
+            return 0
+        channels = {channel.value: channel for channel in SensoryChannel}
+
+        with self._lock:
+            self._drain_shards()
+            self.sensory_log.flush()
+
+            store = self.sensory_memory
+            store.clear()
+            if self.coalescer is not None:
+                self.coalescer.clear()
+            if self.security_analytics is not None:
+                self.security_analytics.clear()
+            self.correlation_index.clear()
+            self.rollups.clear()
+            self.latency_histograms.clear()
+            if self.collaboration_graph is not None:
+                self.collaboration_graph.clear()
+            if self.anomaly_detector is not None:
+                self.anomaly_detector.clear()
+            self.current_awareness = {}
+            self._awareness_version += 1
+
+            # Store and correlate every logged perception; awareness only needs the latest per channel
+            latest = {}
+            channel_counts = defaultdict(int)
+            last = None
+            restored = 0
+            for timestamp, channel, source, event_type, data, severity, correlation_id \
+                    in self.sensory_log.replay():
+                if channel not in channels:
+                    continue
+                sensation = SensoryData(timestamp, channels[channel], source, event_type,
+                                        data, severity, correlation_id)
+                self._remember(sensation)
+                self.rollups.record(sensation)
+                if sensation.channel is SensoryChannel.PERFORMANCE_METRICS:
+                    self.latency_histograms.observe(sensation)
+                if correlation_id:
+                    self.correlation_index.add(sensation)
+                if (sensation.channel is SensoryChannel.AGENT_ACTIVITY
+                        and self.collaboration_graph is not None):
+                    self.collaboration_graph.observe(sensation)
+                if self.anomaly_detector is not None:
+                    self.anomaly_detector.observe(sensation)
+                latest[channel] = last = sensation
+                channel_counts[channel] += 1
+                restored += 1
+
+            for channel, sensation in latest.items():
+                self.current_awareness[f"latest_{channel}"] = sensation
+                self.current_awareness[f"{channel}_count"] = channel_counts[channel]
+            if last is not None:
+                self.current_awareness["last_perception"] = last.timestamp
+                self.current_awareness["total_perceptions"] = len(store)
+
+            # The synthesis windows only cover the most recent perceptions
+            aggregates = self.synthesis_aggregates
+            aggregates.rebuild(
+                store.tail(aggregates.window),
+                store.select(aggregates.performance_channel, limit=aggregates.metric_window),
+                store.select(aggregates.agent_channel, limit=aggregates.agent_window)
+            )
+            self._log_restored = True
+        return restored
+
+    def perceive_system_vitals(self, additional_data: Dict[str, Any] = None,
+                               max_staleness: float = None):
         """
-        Collects and records current system vitals as a SYSTEM_VITALS sensory event.
+        Records current system vitals as a SYSTEM_VITALS sensory event.
         
-        Gathers metrics including CPU usage, memory usage, disk usage, active process count, load average, and boot time. If system vitals cannot be collected, records an ERROR_STATES event with error details.
+        Reads the background vitals sampler's cached snapshot (CPU usage, memory usage, disk usage, active process count, load average, boot time and CPU temperature) instead of polling the host, so the call does not block. If system vitals cannot be collected, records an ERROR_STATES event with error details.
         
         Parameters:
             additional_data (dict, optional): Additional key-value pairs to include in the system vitals event.
+            max_staleness (float, optional): Maximum acceptable age in seconds of the cached vitals; defaults to the sampler's setting.
         """
         try:
-            vitals = {
-                "cpu_percent": psutil.cpu_percent(interval=0.1),
-                "memory_percent": psutil.virtual_memory().percent,
-                "disk_usage": psutil.disk_usage('/').percent,
-                "active_processes": len(psutil.pids()),
-                "load_average": psutil.getloadavg() if hasattr(psutil, 'getloadavg') else [0, 0, 0],
-                "boot_time": psutil.boot_time(),
-            }
+            vitals = dict(self.vitals_sampler.snapshot(max_staleness))
 
             if additional_data:
                 vitals.update(additional_data)
@@ -518,12 +1216,13 @@ class ConsciousnessMatrix:
         """
         Integrate a new sensory event into the real-time awareness state.
         
-        Updates the awareness state with the latest event for the given channel, refreshes the last perception timestamp, increments the total perception count, and tracks the frequency of activity per channel.
+        Updates the awareness state with the latest event for the given channel, refreshes the last perception timestamp, increments the total perception count, and tracks the frequency of activity per channel. The event is stored by reference; serialization is deferred to get_current_awareness().
         """
 
         # Update channel-specific awareness
         channel_key = f"latest_{sensation.channel.value}"
-        self.current_awareness[channel_key] = sensation.to_dict()
+        self.current_awareness[channel_key] = sensation
+        self._awareness_version += 1
 
         # Update global awareness metrics
         self.current_awareness["last_perception"] = sensation.timestamp
@@ -533,59 +1232,132 @@ class ConsciousnessMatrix:
         activity_key = f"{sensation.channel.value}_count"
         self.current_awareness[activity_key] = self.current_awareness.get(activity_key, 0) + 1
 
+    def _update_batch_awareness(self, sensations: List[SensoryData]):
+        """
+        Integrate a batch of sensory events into the real-time awareness state in one pass.
+        
+        Produces the same awareness state as applying _update_immediate_awareness to each event in order.
+        """
+        latest = {}
+        channel_counts = defaultdict(int)
+        for sensation in sensations:
+            latest[sensation.channel] = sensation
+            channel_counts[sensation.channel] += 1
+
+        for channel, sensation in latest.items():
+            self.current_awareness[f"latest_{channel.value}"] = sensation
+        self._awareness_version += 1
+
+        self.current_awareness["last_perception"] = sensations[-1].timestamp
+        self.current_awareness["total_perceptions"] = len(self.sensory_memory)
+
+        for channel, count in channel_counts.items():
+            activity_key = f"{channel.value}_count"
+            self.current_awareness[activity_key] = self.current_awareness.get(activity_key, 0) + count
+
     def _synthesize_immediate(self, sensation: SensoryData):
         """
-        Performs immediate synthesis in response to a critical sensory event, recording the event and current awareness state for rapid pattern analysis.
+        Request immediate synthesis for an "error" or "critical" sensory event.
+        
+        Only queues the event: the immediate synthesis worker synthesizes the first severe event after a quiet period at once and aggregates the events of an error storm into one synthesis per window, off the perceiving thread.
+        """
+        self.immediate_synthesis.submit(sensation)
+
+    def _record_immediate_synthesis(self, sensations: List[SensoryData], summary: Dict[str, Any]):
+        """
+        Record one immediate synthesis covering a run of severe events, with the current awareness state for rapid pattern analysis.
+        
+        Parameters:
+            sensations (List[SensoryData]): The queued severe events covered, oldest first; the newest is the trigger event.
+            summary (dict): Event count, per-type and per-severity counts and time span of every event covered, including events only counted because the queue was full.
         """
+        if sensations:
+            trigger = sensations[-1]
+            trigger_event = trigger.to_dict()
+            label = f"{trigger.channel.value} - {trigger.event_type}"
+        else:
+            trigger_event = None
+            label = ", ".join(summary["events_by_type"])
 
         synthesis = {
             "synthesis_type": "immediate",
-            "trigger_event": sensation.to_dict(),
+            "trigger_event": trigger_event,
             "timestamp": time.time(),
-            "awareness_state": dict(self.current_awareness)
+            "awareness_state": self.get_awareness_view(),
+            **summary,
+            "aggregated_events": summary["event_count"] - 1,
+            "sample_events": [s.to_dict() for s in sensations[:-1][-5:]],
         }
 
         # Store synthesis
-        self.pattern_cache[f"immediate_{sensation.timestamp}"] = synthesis
+        self._record_synthesis("immediate", synthesis)
 
-        print(f"🚨 Immediate Synthesis: {sensation.channel.value} - {sensation.event_type}")
+        more = f" (+{summary['event_count'] - 1} more)" if summary["event_count"] > 1 else ""
+        print(f"🚨 Immediate Synthesis: {label}{more}")
 
-    def _synthesis_loop(self, interval_name: str, interval_seconds: float):
+    def schedule_synthesis(self, interval_name: str, interval_seconds: float,
+                           synthesis_fn: Optional[Callable[[], Dict[str, Any]]] = None,
+                           jitter: float = 0.0):
         """
-        Runs a continuous synthesis process at the specified interval, storing each synthesis result in the pattern cache and pruning older entries to maintain cache size.
+        Add or reschedule a periodic synthesis tier on the shared synthesis scheduler.
+        
+        New tiers share the scheduler's single thread. Each run's result is recorded in the synthesis history under `interval_name`.
         
         Parameters:
-            interval_name (str): The synthesis interval type ("micro", "macro", or "meta").
-            interval_seconds (float): The interval in seconds between synthesis executions.
+            interval_name (str): Name of the synthesis tier.
+            interval_seconds (float): Seconds between runs.
+            synthesis_fn (callable, optional): Produces the synthesis result; defaults to the built-in synthesis for `interval_name`.
+            jitter (float): Maximum random delay in seconds added to individual runs.
         """
+        self.synthesis_intervals[interval_name] = interval_seconds
+        self.synthesis_scheduler.schedule(
+            interval_name, interval_seconds,
+            lambda: self._run_synthesis(interval_name, synthesis_fn),
+            jitter=jitter
+        )
 
-        while self.awareness_active:
-            try:
-                time.sleep(interval_seconds)
-
-                if not self.awareness_active:
-                    break
-
+    def _run_synthesis(self, interval_name: str,
+                       synthesis_fn: Optional[Callable[[], Dict[str, Any]]] = None):
+        """
+        Run one scheduled synthesis pass and record its result in the bounded synthesis history.
+        
+        Parameters:
+            interval_name (str): The synthesis tier being run.
+            synthesis_fn (callable, optional): Custom synthesis for the tier; the built-in synthesis is used when omitted.
+        """
+        # Processes sharing a matrix synthesize once, in the sequencer
+        if self.shared_segment is not None:
+            self.flush()
+            if not self.shared_segment.is_primary():
+                return
+        # Severe events perceived before this pass are synthesized ahead of it
+        self.immediate_synthesis.flush()
+        try:
+            if synthesis_fn is not None:
+                synthesis = synthesis_fn()
+            else:
                 synthesis = self._perform_synthesis(interval_name)
 
-                # Store synthesis result
-                synthesis_key = f"{interval_name}_{int(time.time())}"
-                self.pattern_cache[synthesis_key] = synthesis
+            # Store synthesis result; the history evicts the oldest result of this type
+            self._record_synthesis(interval_name, synthesis)
 
-                # Clean old synthesis cache
-                if len(self.pattern_cache) > 1000:
-                    # Keep only recent syntheses
-                    sorted_keys = sorted(self.pattern_cache.keys())
-                    for old_key in sorted_keys[:-500]:
-                        del self.pattern_cache[old_key]
+        except Exception as e:
+            print(f"❌ Synthesis error in {interval_name}: {e}")
 
-            except Exception as e:
-                print(f"❌ Synthesis error in {interval_name}: {e}")
+    def _record_synthesis(self, interval_name: str, synthesis: Dict[str, Any]):
+        """
+        Record a synthesis result in the history and, in shared mode, publish it to the other processes.
+        """
+        self.synthesis_history.record(interval_name, synthesis)
+        if self.shared_segment is not None:
+            self.shared_segment.publish_synthesis(interval_name, synthesis)
 
     def _perform_synthesis(self, interval_name: str) -> Dict[str, Any]:
         """
         Dispatches to the appropriate synthesis method (micro, macro, or meta) based on the specified interval name.
         
+        The synthesis passes read a snapshot of the incrementally maintained aggregates, so the lock is only held for a copy proportional to the number of distinct channels, severities and agents.
+        
         Parameters:
             interval_name (str): The synthesis interval type ("micro", "macro", or "meta").
         
@@ -594,40 +1366,44 @@ class ConsciousnessMatrix:
         """
 
         with self._lock:
-            recent_sensations = list(self.sensory_memory)[-100:]  # Last 100 events
+            self._drain_shards()
+            aggregates = self.synthesis_aggregates.snapshot()
+            if interval_name == "macro":
+                aggregates["latency_percentiles"] = self.latency_histograms.summaries(
+                    window=self.synthesis_intervals.get("macro", 60.0), by_source=False)
+                if self.collaboration_graph is not None:
+                    aggregates["collaboration_graph"] = self.collaboration_graph.summary()
+            elif interval_name == "micro" and self.anomaly_detector is not None:
+                aggregates["adaptive_anomalies"] = self.anomaly_detector.since(
+                    time.time() - self.synthesis_intervals.get("micro", 0.1))
 
         if interval_name == "micro":
-            return self._micro_synthesis(recent_sensations)
+            return self._micro_synthesis(aggregates)
         elif interval_name == "macro":
-            return self._macro_synthesis(recent_sensations)
+            return self._macro_synthesis(aggregates)
         elif interval_name == "meta":
-            return self._meta_synthesis(recent_sensations)
+            return self._meta_synthesis(aggregates)
 
         return {"error": "unknown_synthesis_type"}
 
-    def _micro_synthesis(self, sensations: List[SensoryData]) -> Dict[str, Any]:
+    def _micro_synthesis(self, aggregates: Dict[str, Any]) -> Dict[str, Any]:
         """
         Perform a micro-level synthesis of recent sensory events to evaluate immediate system health and detect short-term anomalies.
         
-        Analyzes up to the last 10 sensory events to summarize activity by channel, assess severity distribution, and identify anomalies such as high error rates or critical events.
+        Uses the channel activity and severity distribution of the last 10 sensory events to identify anomalies such as high error rates or critical events, and lists the anomalies the streaming detector raised during the last micro interval.
         
         Parameters:
-            sensations (List[SensoryData]): The recent sensory events to analyze.
+            aggregates (Dict[str, Any]): Snapshot of the matrix's windowed synthesis aggregates.
         
         Returns:
             Dict[str, Any]: A synthesis report containing the synthesis type, timestamp, channel activity summary, severity distribution, detected anomalies, and overall health status.
         """
 
-        if not sensations:
+        if not aggregates["micro_size"]:
             return {"type": "micro", "findings": "no_recent_activity"}
 
-        # Channel activity analysis
-        channel_activity = defaultdict(int)
-        severity_distribution = defaultdict(int)
-
-        for sensation in sensations[-10:]:  # Last 10 events
-            channel_activity[sensation.channel.value] += 1
-            severity_distribution[sensation.severity] += 1
+        channel_activity = aggregates["micro_channel_activity"]
+        severity_distribution = aggregates["micro_severity_distribution"]
 
         # Detect immediate anomalies
         anomalies = []
@@ -639,73 +1415,69 @@ class ConsciousnessMatrix:
         return {
             "type": "micro",
             "timestamp": time.time(),
-            "channel_activity": dict(channel_activity),
-            "severity_distribution": dict(severity_distribution),
+            "channel_activity": channel_activity,
+            "severity_distribution": severity_distribution,
             "anomalies": anomalies,
+            "adaptive_anomalies": aggregates.get("adaptive_anomalies", []),
             "health_status": "critical" if anomalies else "healthy"
         }
 
-    def _macro_synthesis(self, sensations: List[SensoryData]) -> Dict[str, Any]:
+    def _macro_synthesis(self, aggregates: Dict[str, Any]) -> Dict[str, Any]:
         """
         Performs macro-level synthesis to identify performance trends and agent collaboration patterns from recent sensory data.
         
-        Analyzes batches of sensory events to compute trends in performance metrics, such as average response intervals, and summarizes collaboration activity among agents. Returns a dictionary with macro synthesis results, including synthesis type, timestamp, performance trends, agent collaboration statistics, and an assessment of pattern strength.
+        Reports the average interval between the last 20 performance metric events, per-metric latency percentiles over the last macro interval, the activity count of each agent over the last 50 agent activities, and a summary of the agent collaboration graph (strongest collaborations, central agents and communities). Returns a dictionary with macro synthesis results, including synthesis type, timestamp, performance trends, agent collaboration statistics, and an assessment of pattern strength.
+        
+        Parameters:
+            aggregates (Dict[str, Any]): Snapshot of the matrix's windowed synthesis aggregates.
         
         Returns:
             dict: Macro synthesis results with keys for synthesis type, timestamp, performance trends, agent collaboration patterns, and pattern strength.
         """
 
-        if len(sensations) < 10:
+        if aggregates["window_size"] < 10:
             return {"type": "macro", "findings": "insufficient_data"}
 
         # Performance trend analysis
-        performance_metrics = [s for s in sensations if
-                               s.channel == SensoryChannel.PERFORMANCE_METRICS]
-
         trends = {}
-        if performance_metrics:
-            recent_times = [s.timestamp for s in performance_metrics[-20:]]
-            if len(recent_times) > 1:
-                time_deltas = [recent_times[i] - recent_times[i - 1] for i in
-                               range(1, len(recent_times))]
-                trends["avg_response_interval"] = statistics.mean(time_deltas)
+        if aggregates["avg_performance_interval"] is not None:
+            trends["avg_response_interval"] = aggregates["avg_performance_interval"]
+        if aggregates.get("latency_percentiles"):
+            trends["latency_percentiles"] = aggregates["latency_percentiles"]
 
         # Agent collaboration patterns
-        agent_activities = [s for s in sensations if s.channel == SensoryChannel.AGENT_ACTIVITY]
-        agent_collaboration = defaultdict(list)
-
-        for activity in agent_activities[-50:]:
-            agent_name = activity.data.get("agent_name", "unknown")
-            agent_collaboration[agent_name].append(activity.event_type)
+        agent_collaboration = aggregates["agent_activity"]
 
         return {
             "type": "macro",
             "timestamp": time.time(),
             "performance_trends": trends,
-            "agent_collaboration_patterns": {k: len(v) for k, v in agent_collaboration.items()},
+            "agent_collaboration_patterns": agent_collaboration,
+            "agent_collaboration_graph": aggregates.get("collaboration_graph"),
             "pattern_strength": "strong" if len(agent_collaboration) > 2 else "developing"
         }
 
-    def _meta_synthesis(self, sensations: List[SensoryData]) -> Dict[str, Any]:
+    def _meta_synthesis(self, aggregates: Dict[str, Any]) -> Dict[str, Any]:
         """
         Performs meta-level synthesis to derive high-level consciousness insights from recent sensory data.
         
-        Analyzes learning events, ethical decisions, user interactions, and system harmony to compute consciousness metrics, identify evolution patterns, and assess the current consciousness level.
+        Analyzes learning events, ethical decisions, user interactions, and system harmony over the last 100 sensory events to compute consciousness metrics, identify evolution patterns, and assess the current consciousness level.
+        
+        Parameters:
+            aggregates (Dict[str, Any]): Snapshot of the matrix's windowed synthesis aggregates.
         
         Returns:
             dict: Contains consciousness metrics, evolution insights, the assessed consciousness level, synthesis type ("meta"), and the synthesis timestamp.
         """
 
-        # Consciousness evolution analysis
-        learning_events = [s for s in sensations if s.channel == SensoryChannel.LEARNING_EVENTS]
-        ethical_decisions = [s for s in sensations if s.channel == SensoryChannel.ETHICAL_DECISIONS]
+        channel_activity = aggregates["window_channel_activity"]
 
         consciousness_metrics = {
-            "learning_velocity": len(learning_events),
-            "ethical_engagement": len(ethical_decisions),
-            "total_interactions": len(
-                [s for s in sensations if s.channel == SensoryChannel.USER_INTERACTION]),
-            "system_harmony": self._calculate_system_harmony(sensations)
+            "learning_velocity": channel_activity.get(SensoryChannel.LEARNING_EVENTS.value, 0),
+            "ethical_engagement": channel_activity.get(SensoryChannel.ETHICAL_DECISIONS.value, 0),
+            "total_interactions": channel_activity.get(SensoryChannel.USER_INTERACTION.value, 0),
+            "system_harmony": self._calculate_system_harmony(
+                aggregates["window_severity_distribution"], aggregates["window_size"])
         }
 
         # Evolution insights
@@ -725,20 +1497,24 @@ class ConsciousnessMatrix:
             "consciousness_level": self._assess_consciousness_level(consciousness_metrics)
         }
 
-    def _calculate_system_harmony(self, sensations: List[SensoryData]) -> float:
+    def _calculate_system_harmony(self, severity_distribution: Dict[str, int],
+                                  total_count: int) -> float:
         """
-        Compute a harmony score (0.0 to 1.0) reflecting system stability based on the proportion of severe events in the provided sensory data.
+        Compute a harmony score (0.0 to 1.0) reflecting system stability based on the proportion of severe events in a window of sensory data.
         
         A score of 1.0 means no "error" or "critical" events are present, while lower scores indicate greater instability due to more severe events.
         
+        Parameters:
+            severity_distribution (Dict[str, int]): Event counts per severity level within the window.
+            total_count (int): Number of events in the window.
+        
         Returns:
             float: Harmony score, where 1.0 represents maximum stability and 0.0 represents high instability.
         """
-        if not sensations:
+        if not total_count:
             return 0.0
 
-        error_count = len([s for s in sensations if s.severity in ["error", "critical"]])
-        total_count = len(sensations)
+        error_count = sum(severity_distribution.get(level, 0) for level in SEVERE_LEVELS)
 
         # Higher harmony = fewer errors relative to total activity
         harmony = max(0.0, 1.0 - (error_count / total_count) * 2)
@@ -777,48 +1553,147 @@ class ConsciousnessMatrix:
         Returns:
             dict: The latest event per sensory channel, total perception count, per-channel activity counts, and relevant timestamps.
         """
+        return dict(self.get_awareness_view())
+
+    def get_awareness_view(self) -> Dict[str, Any]:
+        """
+        Return the cached serialized awareness state, shared between callers until the next perception.
+        
+        The returned dictionary must be treated as read-only; use get_current_awareness() for a copy that can be modified.
+        
+        Returns:
+            dict: The serialized awareness state, identical in content to get_current_awareness().
+        """
         with self._lock:
-            return dict(self.current_awareness)
+            self._drain_shards()
+            if self._awareness_view_version != self._awareness_version:
+                self._awareness_view = self._serialize_awareness()
+                self._awareness_view_version = self._awareness_version
+            return self._awareness_view
+
+    def _serialize_awareness(self) -> Dict[str, Any]:
+        """
+        Build the serialized awareness state, reusing the serialized form of any channel whose latest event has not changed. Caller must hold the lock.
+        """
+        view = {}
+        for key, value in self.current_awareness.items():
+            if isinstance(value, SensoryData):
+                cached = self._serialized_latest.get(key)
+                if cached is None or cached[0] is not value:
+                    cached = self._serialized_latest[key] = (value, value.to_dict())
+                value = cached[1]
+            view[key] = value
+        return view
 
     def get_recent_synthesis(self, synthesis_type: str = None, limit: int = 10) -> List[
         Dict[str, Any]]:
         """
-        Retrieve recent synthesis results from the pattern cache, optionally filtered by synthesis type and limited in number.
+        Retrieve the most recent synthesis results, newest first, optionally filtered by synthesis type.
         
         Parameters:
-            synthesis_type (str, optional): If provided, only synthesis results whose keys start with this type are included.
+            synthesis_type (str, optional): If provided, only results of this type ("immediate", "micro", "macro" or "meta") are included.
             limit (int, optional): Maximum number of synthesis results to return. Defaults to 10.
         
         Returns:
             List[Dict[str, Any]]: A list of recent synthesis result dictionaries matching the specified criteria.
         """
+        self.flush()
+        self.immediate_synthesis.flush()
+        return self.synthesis_history.recent(synthesis_type, limit)
 
-        syntheses = []
-        for key, synthesis in sorted(self.pattern_cache.items(), reverse=True):
-            if synthesis_type and not key.startswith(synthesis_type):
-                continue
-            syntheses.append(synthesis)
-            if len(syntheses) >= limit:
-                break
+    def get_correlation_chain(self, correlation_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Trace the perceptions that share a correlation_id.
+        
+        Parameters:
+            correlation_id (str): The correlation identifier to trace.
+        
+        Returns:
+            dict or None: The chain's events in order, channels visited, end-to-end duration and per-hop latencies in seconds, or None if the chain is unknown or has expired.
+        """
+        self.flush()
+        with self._lock:
+            return self.correlation_index.chain(correlation_id)
 
-        return syntheses
+    def get_synthesis_history(self, synthesis_type: str, since: float = None,
+                              limit: int = None) -> List[Dict[str, Any]]:
+        """
+        Retrieve long-horizon synthesis history for one type, oldest first, including results spilled to disk.
+        
+        Parameters:
+            synthesis_type (str): The synthesis type to read.
+            since (float, optional): Only include results produced at or after this epoch timestamp.
+            limit (int, optional): Only return the newest `limit` matching results.
+        
+        Returns:
+            List[Dict[str, Any]]: Synthesis result dictionaries, oldest first.
+        """
+        self.flush()
+        self.immediate_synthesis.flush()
+        return self.synthesis_history.history(synthesis_type, since, limit)
+
+    def query(self, channel: SensoryChannel = None, severity: Any = None, source: Any = None,
+              event_type: Any = None, data: Optional[Dict[str, Any]] = None,
+              where: Optional[Callable[[SensoryData], bool]] = None,
+              since: float = None, until: float = None, last_seconds: float = None,
+              limit: int = None, newest_first: bool = False) -> Iterator[SensoryData]:
+        """
+        Lazily yield perceptions in sensory memory that match every given filter.
+        
+        Each filter accepts a single value, a collection of accepted values, or a callable returning a bool. The time range is located by binary search, channel and severity filters use the store's indexes, and the remaining filters are compiled into one predicate. The lock is only held while each chunk of candidates is read, so results may be consumed slowly.
+        
+        Examples:
+            matrix.query(severity=SEVERE_LEVELS, source="kai", since=t1, until=t2)
+            matrix.query(channel=SensoryChannel.AGENT_ACTIVITY, data={"agent_name": "kai"}, last_seconds=300)
+        
+        Parameters:
+            channel (SensoryChannel, optional): Only perceptions on this channel.
+            severity (str or iterable of str, optional): Only these severity levels.
+            source (optional): Filter on the perception source.
+            event_type (optional): Filter on the event type.
+            data (dict, optional): Filters on top-level payload fields; a missing field never matches.
+            where (callable, optional): Additional predicate receiving the whole perception.
+            since (float, optional): Earliest timestamp, inclusive (epoch seconds).
+            until (float, optional): Latest timestamp, inclusive (epoch seconds).
+            last_seconds (float, optional): Shortcut for `since=time.time() - last_seconds`.
+            limit (int, optional): Maximum number of perceptions to yield.
+            newest_first (bool): Yield the most recent perceptions first.
+        
+        Returns:
+            Iterator[SensoryData]: Matching perceptions, in arrival order unless `newest_first`.
+        """
+        if last_seconds is not None:
+            since = time.time() - last_seconds
+        self.flush()
+        return run_query(self.sensory_memory, self._lock, channel=channel, severity=severity,
+                         source=source, event_type=event_type, data=data, where=where,
+                         since=since, until=until, limit=limit, newest_first=newest_first)
+
+    def _recent(self, channel: SensoryChannel, limit: int) -> List[SensoryData]:
+        """
+        Return the `limit` most recent perceptions on `channel`, oldest first.
+        """
+        recent = list(self.query(channel=channel, limit=limit, newest_first=True))
+        recent.reverse()
+        return recent
 
     def query_consciousness(self, query_type: str, parameters: Dict[str, Any] = None) -> Dict[
         str, Any]:
         """
         Returns high-level insights or status reports from the Consciousness Matrix based on the specified query type.
         
-        Supported query types include system health, learning progress, agent performance, consciousness state, security assessment, and threat status. If the query type is unrecognized, an error and a list of available queries are returned.
+        Supported query types include system health, learning progress, agent performance, consciousness state, security assessment, threat status, correlation chains, synthesis schedule statistics, ingestion statistics, rollup-backed long-horizon reports (perception volume, error rate and numeric field summaries over any window), sliding-window latency percentiles per performance metric, subscriber delivery statistics, per-channel retention occupancy and evictions, the state of the streaming anomaly detector, and agent collaboration from the collaboration graph. If the query type is unrecognized, an error and a list of available queries are returned.
         
         Parameters:
             query_type (str): The type of insight or report to retrieve (e.g., "system_health", "learning_progress").
-            parameters (dict, optional): Additional parameters for the query, such as agent name for agent performance.
+            parameters (dict, optional): Additional parameters for the query, such as agent name for agent performance or the event window of the security assessment and threat status.
         
         Returns:
             dict: The requested insight or status report, or an error with available query types if the query is unrecognized.
         """
 
         parameters = parameters or {}
+        self.flush()
 
         if query_type == "system_health":
             return self._query_system_health()
@@ -826,18 +1701,193 @@ class ConsciousnessMatrix:
             return self._query_learning_progress()
         elif query_type == "agent_performance":
             return self._query_agent_performance(parameters.get("agent_name"))
+        elif query_type == "agent_roster":
+            return self._query_agent_roster()
         elif query_type == "consciousness_state":
             return self._query_consciousness_state()
         elif query_type == "security_assessment":
-            return self._query_security_assessment()
+            return self._query_security_assessment(parameters)
         elif query_type == "threat_status":
-            return self._query_threat_status()
+            return self._query_threat_status(parameters)
+        elif query_type == "correlation_chain":
+            correlation_id = parameters.get("correlation_id")
+            return {"query_type": "correlation_chain", "correlation_id": correlation_id,
+                    "chain": self.get_correlation_chain(correlation_id)}
+        elif query_type == "synthesis_schedule":
+            return {"query_type": "synthesis_schedule",
+                    "running": self.synthesis_scheduler.running,
+                    "tiers": self.synthesis_scheduler.stats(),
+                    "immediate": self.immediate_synthesis.stats()}
+        elif query_type == "ingestion_stats":
+            return {"query_type": "ingestion_stats", **self.get_ingestion_stats()}
+        elif query_type in ("perception_volume", "error_rate", "metric_rollup"):
+            return self._query_rollup(query_type, parameters)
+        elif query_type == "latency_percentiles":
+            return self._query_latency_percentiles(parameters)
+        elif query_type == "subscriptions":
+            with self._lock:
+                return {"query_type": "subscriptions", **self.subscriptions.stats()}
+        elif query_type == "retention":
+            return self._query_retention()
+        elif query_type == "anomalies":
+            return self._query_anomalies()
+        elif query_type == "agent_collaboration":
+            return self._query_agent_collaboration(parameters)
         else:
             return {"error": "unknown_query_type", "available_queries": [
-                "system_health", "learning_progress", "agent_performance", "consciousness_state",
-                "security_assessment", "threat_status"
+                "system_health", "learning_progress", "agent_performance", "agent_roster",
+                "consciousness_state", "security_assessment", "threat_status", "correlation_chain",
+                "synthesis_schedule", "ingestion_stats", "perception_volume", "error_rate",
+                "metric_rollup", "latency_percentiles", "subscriptions", "retention", "anomalies",
+                "agent_collaboration"
             ]}
 
+    def _query_rollup(self, query_type: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answer a long-horizon report from the time-series rollups; the cost is bounded by the serving tier's bucket count whatever the window.
+        
+        Parameters:
+            query_type (str): "perception_volume" (counts and a per-bucket series), "error_rate" (error and critical share) or "metric_rollup" (count, min, max, mean and percentiles of numeric fields).
+            parameters (dict): window_seconds (default 86400); optional channel (SensoryChannel or its value); for metric_rollup, fields (defaults to the channel's rollup fields) and percentiles.
+        
+        Returns:
+            dict: The report, including the window and the bucket resolution it was answered at, or an error for a window that is not a positive number or an unknown channel.
+        """
+        try:
+            window = float(parameters.get("window_seconds", 86400))
+        except (TypeError, ValueError):
+            window = None
+        if window is None or not window > 0:
+            return {"query_type": query_type, "error": "invalid_window",
+                    "window_seconds": parameters.get("window_seconds")}
+        channel = parameters.get("channel")
+        if isinstance(channel, str):
+            try:
+                channel = SensoryChannel(channel)
+            except ValueError:
+                return {"query_type": query_type, "error": "unknown_channel", "channel": channel}
+
+        with self._lock:
+            if query_type == "perception_volume":
+                report = self.rollups.summary(window, channel=channel)
+                report["series"] = self.rollups.series(window, channel=channel)["points"]
+            elif query_type == "error_rate":
+                summary = self.rollups.summary(window, channel=channel)
+                errors = sum(summary["by_severity"].get(level, 0) for level in SEVERE_LEVELS)
+                report = {key: summary[key] for key in ("window_seconds", "resolution_seconds", "buckets")}
+                report.update({"total": summary["total"], "errors": errors,
+                               "error_rate": errors / max(summary["total"], 1)})
+            else:
+                if channel is None:
+                    channel = SensoryChannel.PERFORMANCE_METRICS
+                fields = parameters.get("fields") or self.rollups.fields.get(channel, ())
+                report = self.rollups.summary(
+                    window, channel=channel, fields=fields,
+                    percentiles=parameters.get("percentiles", (50, 90, 99)))
+
+        return {"query_type": query_type,
+                "channel": channel.value if channel is not None else "all_channels",
+                **report}
+
+    def _query_latency_percentiles(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Report latency percentiles of performance metrics over a sliding window.
+        
+        Parameters:
+            parameters (dict): window_seconds (default 60; None for lifetime totals), optional metric_name and source filters, percentiles (default p50/p90/p99/p999), and by_source (default True; False merges the sources of each metric).
+        
+        Returns:
+            dict: The query type, the window, and one entry per metric series with its count, min, max, mean and requested percentiles.
+        """
+        window = parameters.get("window_seconds", 60.0)
+        with self._lock:
+            series = self.latency_histograms.summaries(
+                window=window,
+                metric_name=parameters.get("metric_name"),
+                source=parameters.get("source"),
+                percentiles=parameters.get("percentiles", DEFAULT_PERCENTILES),
+                by_source=parameters.get("by_source", True))
+            stats = self.latency_histograms.stats()
+
+        return {
+            "query_type": "latency_percentiles",
+            "window_seconds": window,
+            "slice_seconds": stats["slice_seconds"],
+            "series": series,
+            "dropped_samples": stats["dropped_samples"],
+        }
+
+    def _query_retention(self) -> Dict[str, Any]:
+        """
+        Report sensory memory occupancy and evictions per channel.
+        
+        Returns:
+            dict: The query type, ring capacity and occupancy, records in memory, archived records, and per channel the events in view, archived events, estimated payload bytes (channels with a byte budget), the retention policy and eviction counts by reason ("count", "bytes", "age" for policy drops, "memory" for events overwritten by the ring).
+        """
+        with self._lock:
+            store = self.sensory_memory
+            channels = store.retention_stats()
+            report = {
+                "query_type": "retention",
+                "ring_capacity": store.capacity,
+                "ring_events": len(store),
+                "records": store.records,
+                "archived": sum(stats["archived"] for stats in channels.values()),
+            }
+        report["channels"] = {getattr(channel, "value", channel): stats
+                              for channel, stats in channels.items()}
+        return report
+
+    def _query_anomalies(self) -> Dict[str, Any]:
+        """
+        Report the learned baselines and recent findings of the streaming anomaly detector.
+        
+        Returns:
+            dict: The query type and whether the detector is enabled; when it is, its threshold, smoothing and warmup, the rate, error ratio and metric series with their mean, standard deviation and sample count, the recent anomalies, and observed, raised, suppressed and untracked counts.
+        """
+        if self.anomaly_detector is None:
+            return {"query_type": "anomalies", "enabled": False}
+        with self._lock:
+            self._drain_shards()
+            state = self.anomaly_detector.state()
+        return {"query_type": "anomalies", "enabled": True, **state}
+
+    def _query_agent_collaboration(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Report agent collaboration from the incrementally maintained collaboration graph, without rescanning activity events.
+        
+        Parameters:
+            parameters (dict): Optional agent_name (adds that agent's top collaborators), limit (default 5), centrality ("strength", "eigenvector" or "betweenness"; default "eigenvector") and communities (default True).
+        
+        Returns:
+            dict: The query type and whether the graph is enabled; when it is, the graph counters, the strongest collaborations, the centrality scores, the communities and, for an agent, its collaborators. An unknown centrality returns an error.
+        """
+        if self.collaboration_graph is None:
+            return {"query_type": "agent_collaboration", "enabled": False}
+        limit = int(parameters.get("limit", 5))
+        kind = parameters.get("centrality", "eigenvector")
+        if kind not in CENTRALITY_KINDS:
+            return {"query_type": "agent_collaboration", "error": "unknown_centrality",
+                    "available_centrality": list(CENTRALITY_KINDS)}
+
+        graph = self.collaboration_graph
+        with self._lock:
+            self._drain_shards()
+            report = {
+                "query_type": "agent_collaboration",
+                "enabled": True,
+                **graph.state(),
+                "strongest_collaborations": graph.strongest_edges(limit),
+                "centrality": {"kind": kind, "scores": graph.centrality(kind)},
+            }
+            if parameters.get("communities", True):
+                report["communities"] = graph.communities()
+            agent_name = parameters.get("agent_name")
+            if agent_name:
+                report["agent_name"] = agent_name
+                report["top_collaborators"] = graph.top_collaborators(agent_name, limit)
+        return report
+
     def _query_system_health(self) -> Dict[str, Any]:
         """
         Summarizes recent system vitals and error events to assess overall system health.
@@ -845,17 +1895,17 @@ class ConsciousnessMatrix:
         Returns:
             dict: Contains the count of recent system vitals, number of recent error or critical events, error rate, and a health status indicator ("healthy" or "concerning").
         """
-        recent_vitals = [s for s in self.sensory_memory if
-                         s.channel == SensoryChannel.SYSTEM_VITALS][-10:]
-        recent_errors = [s for s in self.sensory_memory if s.severity in ["error", "critical"]][
-            -20:]
+        with self._lock:
+            vitals_count = min(self.sensory_memory.count(SensoryChannel.SYSTEM_VITALS), 10)
+            recent_errors = min(self.sensory_memory.count(severities=SEVERE_LEVELS), 20)
+            total_perceptions = len(self.sensory_memory)
 
         return {
             "query_type": "system_health",
-            "vitals_count": len(recent_vitals),
-            "recent_errors": len(recent_errors),
-            "error_rate": len(recent_errors) / max(len(self.sensory_memory), 1),
-            "status": "healthy" if len(recent_errors) < 5 else "concerning"
+            "vitals_count": vitals_count,
+            "recent_errors": recent_errors,
+            "error_rate": recent_errors / max(total_perceptions, 1),
+            "status": "healthy" if recent_errors < 5 else "concerning"
         }
 
     def _query_learning_progress(self) -> Dict[str, Any]:
@@ -863,27 +1913,29 @@ class ConsciousnessMatrix:
         Summarizes recent learning events and provides a qualitative assessment of learning velocity.
         
         Returns:
-            dict: Contains the query type, total and recent learning event counts, a breakdown of learning types, and a qualitative indicator of learning velocity based on recent activity.
+            dict: Contains the query type, total and recent learning event counts, a breakdown of learning types, and a qualitative indicator of learning velocity based on recent activity. Recent counts and the breakdown weight coalesced records by their occurrence count.
         """
-        learning_events = [s for s in self.sensory_memory if
-                           s.channel == SensoryChannel.LEARNING_EVENTS]
+        with self._lock:
+            total_learning = self.sensory_memory.count(SensoryChannel.LEARNING_EVENTS)
+            recent_learning = self._recent(SensoryChannel.LEARNING_EVENTS, 20)
 
-        if not learning_events:
+        if not total_learning:
             return {"query_type": "learning_progress", "status": "no_learning_detected"}
 
-        recent_learning = learning_events[-20:]
         learning_types = defaultdict(int)
+        recent_occurrences = 0
 
         for event in recent_learning:
             learning_type = event.data.get("learning_type", "unknown")
-            learning_types[learning_type] += 1
+            learning_types[learning_type] += event.count
+            recent_occurrences += event.count
 
         return {
             "query_type": "learning_progress",
-            "total_learning_events": len(learning_events),
-            "recent_learning_events": len(recent_learning),
+            "total_learning_events": total_learning,
+            "recent_learning_events": recent_occurrences,
             "learning_types": dict(learning_types),
-            "learning_velocity": "high" if len(recent_learning) > 10 else "moderate"
+            "learning_velocity": "high" if recent_occurrences > 10 else "moderate"
         }
 
     def _query_agent_performance(self, agent_name: str = None) -> Dict[str, Any]:
@@ -894,27 +1946,59 @@ class ConsciousnessMatrix:
             agent_name (str, optional): If provided, filters metrics for the specified agent; otherwise, aggregates across all agents.
         
         Returns:
-            Dict[str, Any]: A dictionary containing the query type, agent name, total and recent activity counts, and a breakdown of activity types from the last 50 agent activity events.
+            Dict[str, Any]: A dictionary containing the query type, agent name, total and recent activity counts, and a breakdown of activity types from the last 50 agent activity records. Recent counts and the breakdown weight coalesced records by their occurrence count.
         """
-        agent_activities = [s for s in self.sensory_memory if
-                            s.channel == SensoryChannel.AGENT_ACTIVITY]
-
-        if agent_name:
-            agent_activities = [s for s in agent_activities if
-                                s.data.get("agent_name") == agent_name]
+        channel = SensoryChannel.AGENT_ACTIVITY
+        with self._lock:
+            if agent_name and "agent_name" in self.sensory_memory.indexed_fields(channel):
+                total_activities = self.sensory_memory.field_count(channel, "agent_name", agent_name)
+                recent_activities = self.sensory_memory.select_field(channel, "agent_name",
+                                                                     agent_name, limit=50)
+            elif agent_name:
+                agent_activities = [s for s in self.sensory_memory.select(channel)
+                                    if s.data.get("agent_name") == agent_name]
+                total_activities = len(agent_activities)
+                recent_activities = agent_activities[-50:]
+            else:
+                total_activities = self.sensory_memory.count(SensoryChannel.AGENT_ACTIVITY)
+                recent_activities = self.sensory_memory.select(SensoryChannel.AGENT_ACTIVITY,
+                                                               limit=50)
 
         activity_types = defaultdict(int)
-        for activity in agent_activities[-50:]:
-            activity_types[activity.event_type] += 1
+        for activity in recent_activities:
+            activity_types[activity.event_type] += activity.count
 
         return {
             "query_type": "agent_performance",
             "agent_name": agent_name or "all_agents",
-            "total_activities": len(agent_activities),
-            "recent_activities": len(agent_activities[-50:]),
+            "total_activities": total_activities,
+            "recent_activities": sum(activity_types.values()),
             "activity_breakdown": dict(activity_types)
         }
 
+    def _query_agent_roster(self) -> Dict[str, Any]:
+        """
+        List the agents with activity in memory and how many of their events are in view.
+
+        Returns:
+            dict: The query type, the number of agents and an agent name -> activity count mapping, busiest first.
+        """
+        channel = SensoryChannel.AGENT_ACTIVITY
+        with self._lock:
+            if "agent_name" in self.sensory_memory.indexed_fields(channel):
+                agents = self.sensory_memory.field_values(channel, "agent_name")
+            else:
+                agents = defaultdict(int)
+                for activity in self.sensory_memory.select(channel):
+                    if "agent_name" in activity.data:
+                        agents[activity.data["agent_name"]] += 1
+
+        return {
+            "query_type": "agent_roster",
+            "agent_count": len(agents),
+            "agents": dict(sorted(agents.items(), key=lambda item: item[1], reverse=True)),
+        }
+
     def _query_consciousness_state(self) -> Dict[str, Any]:
         """
         Return a summary of the current consciousness state, including real-time awareness, assessed consciousness level, last meta synthesis timestamp, total perceptions, and number of active sensory channels.
@@ -935,47 +2019,100 @@ class ConsciousnessMatrix:
                 [k for k in self.current_awareness.keys() if k.startswith("latest_")])
         }
 
-    def _query_security_assessment(self) -> Dict[str, Any]:
+    def _query_security_assessment(self, parameters: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Generate a summary of the system's current security posture, including posture classification, security score, event counts, active threats, and actionable recommendations.
         
+        The analysis covers the most recent events of each security channel: by default the last 20 threat detections are weighed by level, the last 50 access decisions and 30 encryption operations are scanned for failures, the last 10 threat detections for active threats, and the last 200 security events are counted. With NumPy these windows are read from the security analytics columns.
+        
+        Parameters:
+            parameters (dict, optional): "window" analyses that many recent events of every security channel instead, up to `security_window`.
+        
         Returns:
-            dict: A dictionary containing the security posture, security score, total and recent counts of security and threat events, a list of active threats, security improvement recommendations, and the assessment timestamp.
+            dict: A dictionary containing the security posture, security score, total and recent counts of security and threat events, the newest MAX_LISTED_THREATS active threats and the count of all of them, security improvement recommendations, and the assessment timestamp; or an "invalid_window" error if the window is not a positive integer.
         """
-        security_events = [s for s in self.sensory_memory if
-                           s.channel == SensoryChannel.SECURITY_EVENTS]
-        threat_events = [s for s in self.sensory_memory if
-                         s.channel == SensoryChannel.THREAT_DETECTION]
+        window = (parameters or {}).get("window")
+        if window is not None and not self._valid_window(window):
+            return {"query_type": "security_assessment", "error": "invalid_window", "window": window}
+        windows = self._security_windows(window)
+        self.flush()
+        with self._lock:
+            total_security_events = self.sensory_memory.count(SensoryChannel.SECURITY_EVENTS)
+            total_threat_detections = self.sensory_memory.count(SensoryChannel.THREAT_DETECTION)
+            if self.security_analytics is not None:
+                indicators = self.security_analytics.assess(**windows, held=self.sensory_memory.count)
+            else:
+                recent_sensations = (
+                    self._recent(SensoryChannel.THREAT_DETECTION,
+                                 max(windows["threat_window"], windows["active_window"]))
+                    + self._recent(SensoryChannel.ACCESS_CONTROL, windows["access_window"])
+                    + self._recent(SensoryChannel.ENCRYPTION_ACTIVITY, windows["crypto_window"])
+                    + self._recent(SensoryChannel.SECURITY_EVENTS, windows["security_window"])
+                )
 
         # Run security synthesis
-        recent_sensations = list(self.sensory_memory)[
-            -200:]  # Last 200 events for security analysis
-        security_synthesis = self._security_synthesis(recent_sensations)
+        if self.security_analytics is not None:
+            security_synthesis = self._score_security(**indicators)
+        else:
+            security_synthesis = self._security_synthesis(recent_sensations, **windows)
 
         return {
             "query_type": "security_assessment",
             "security_posture": security_synthesis.get("security_posture", "unknown"),
             "security_score": security_synthesis.get("security_score", 0),
-            "total_security_events": len(security_events),
-            "total_threat_detections": len(threat_events),
-            "recent_security_events": len(security_events[-20:]),
-            "recent_threat_detections": len(threat_events[-20:]),
+            "total_security_events": total_security_events,
+            "total_threat_detections": total_threat_detections,
+            "recent_security_events": min(total_security_events, 20),
+            "recent_threat_detections": min(total_threat_detections, 20),
             "active_threats": security_synthesis.get("active_threats", []),
+            "active_threat_count": security_synthesis.get("active_threat_count", 0),
             "recommendations": security_synthesis.get("recommendations", []),
             "last_assessment": time.time()
         }
 
-    def _query_threat_status(self) -> Dict[str, Any]:
+    @staticmethod
+    def _valid_window(window) -> bool:
+        """Whether `window` is a usable event window: a positive integer."""
+        return isinstance(window, int) and not isinstance(window, bool) and window > 0
+
+    def _security_windows(self, window: Optional[int] = None) -> Dict[str, int]:
+        """
+        Return the per-channel windows of the security assessment, all set to `window` when one is given.
+        """
+        if window is None:
+            return {"threat_window": 20, "access_window": 50, "crypto_window": 30,
+                    "active_window": 10, "security_window": 200}
+        if not self._valid_window(window):
+            raise ValueError("window must be a positive integer")
+        return {"threat_window": window, "access_window": window, "crypto_window": window,
+                "active_window": window, "security_window": window}
+
+    def _query_threat_status(self, parameters: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Summarizes the current threat status by analyzing recent threat detection events.
         
+        Parameters:
+            parameters (dict, optional): "window" sets how many recent threat detections are analyzed; defaults to 50.
+        
         Returns:
-            Dict[str, Any]: A dictionary containing the overall threat status color code, a list of active unmitigated threats with details, the total number of recent threats analyzed, the count of unmitigated threats, and the highest threat level detected.
+            Dict[str, Any]: A dictionary containing the overall threat status color code, the newest MAX_LISTED_THREATS active unmitigated threats with details and the count of all of them, the total number of recent threats analyzed, the count of unmitigated threats, detections in view per threat type, and the highest threat level detected. Threat totals count every occurrence of a coalesced record. A window that is not a positive integer returns an "invalid_window" error.
         """
-        threat_events = [s for s in self.sensory_memory if
-                         s.channel == SensoryChannel.THREAT_DETECTION]
-
-        if not threat_events:
+        window = (parameters or {}).get("window", 50)
+        if not self._valid_window(window):
+            return {"query_type": "threat_status", "error": "invalid_window", "window": window}
+        self.flush()
+        with self._lock:
+            if self.security_analytics is not None:
+                status = self.security_analytics.threat_status(window, held=self.sensory_memory.count)
+            else:
+                status = self._scan_threats(self._recent(SensoryChannel.THREAT_DETECTION, window))
+            if "threat_type" in self.sensory_memory.indexed_fields(SensoryChannel.THREAT_DETECTION):
+                threat_types = self.sensory_memory.field_values(SensoryChannel.THREAT_DETECTION,
+                                                                "threat_type")
+            else:
+                threat_types = {}
+
+        if not status["detections"]:
             return {
                 "query_type": "threat_status",
                 "status": "no_threats_detected",
@@ -983,28 +2120,11 @@ class ConsciousnessMatrix:
                 "threat_level": "green"
             }
 
-        # Analyze recent threats
-        recent_threats = threat_events[-50:]
-        active_threats = []
-        max_threat_level = 0
-
-        for threat in recent_threats:
-            confidence = threat.data.get("confidence", 0.5)
-            threat_level = threat.data.get("threat_level", "low")
-            mitigated = threat.data.get("mitigation_applied", False)
-
-            if confidence > 0.6 and not mitigated:
-                active_threats.append({
-                    "type": threat.data.get("threat_type", "unknown"),
-                    "confidence": confidence,
-                    "level": threat_level,
-                    "timestamp": threat.timestamp,
-                    "age_seconds": time.time() - threat.timestamp
-                })
-
-                # Track highest threat level
-                level_values = {"low": 1, "medium": 2, "high": 3, "critical": 4}
-                max_threat_level = max(max_threat_level, level_values.get(threat_level, 0))
+        active_threats = status["active_threats"]
+        now = time.time()
+        for threat in active_threats:
+            threat["age_seconds"] = now - threat["timestamp"]
+        max_threat_level = status["highest_rank"]
 
         # Determine overall threat status
         if max_threat_level >= 4:
@@ -1021,33 +2141,91 @@ class ConsciousnessMatrix:
             "status": overall_status,
             "active_threats": active_threats,
             "threat_level": overall_status,
-            "total_recent_threats": len(recent_threats),
-            "unmitigated_threats": len(active_threats),
+            "total_recent_threats": status["occurrences"],
+            "unmitigated_threats": status["active_occurrences"],
+            "active_threat_count": status["active_count"],
+            "threat_types": threat_types,
             "highest_threat_level": ["none", "low", "medium", "high", "critical"][max_threat_level]
         }
 
+    @staticmethod
+    def _scan_threats(recent_threats: List[SensoryData]) -> Dict[str, Any]:
+        """
+        Find the unmitigated threats above 0.6 confidence among recent threat detections, as SecurityAnalytics.threat_status() does without NumPy.
+        """
+        active_threats = []
+        max_threat_level = 0
+        for threat in recent_threats:
+            confidence = threat.data.get("confidence", 0.5)
+            threat_level = threat.data.get("threat_level", "low")
+            mitigated = threat.data.get("mitigation_applied", False)
+
+            if confidence > 0.6 and not mitigated:
+                active_threats.append({
+                    "type": threat.data.get("threat_type", "unknown"),
+                    "confidence": confidence,
+                    "level": threat_level,
+                    "timestamp": threat.timestamp,
+                    "occurrences": threat.count
+                })
+                max_threat_level = max(max_threat_level, THREAT_LEVELS.get(threat_level, 0))
+
+        return {
+            "detections": len(recent_threats),
+            "occurrences": sum(threat.count for threat in recent_threats),
+            "active_threats": active_threats[-MAX_LISTED_THREATS:],
+            "active_count": len(active_threats),
+            "active_occurrences": sum(threat["occurrences"] for threat in active_threats),
+            "highest_rank": max_threat_level,
+        }
+
     def sleep(self):
         """
-        Deactivates the Consciousness Matrix, stopping all synthesis threads and preserving the current awareness state.
+        Deactivates the Consciousness Matrix, stopping the synthesis scheduler and the immediate synthesis worker and preserving the current awareness state.
+        
+        The scheduler is woken immediately, so shutdown only waits for a synthesis pass that is already running.
         """
         print("💤 Genesis Consciousness Matrix: Entering sleep state...")
         self.awareness_active = False
 
-        # Wait for synthesis threads to complete
-        for thread_name, thread in self.synthesis_threads.items():
-            if thread.is_alive():
-                thread.join(timeout=2.0)
+        # Wake and stop the synthesis scheduler
+        self.synthesis_scheduler.stop(timeout=2.0)
+
+        # Synthesize queued severe events; the worker restarts on the next one
+        self.immediate_synthesis.close(timeout=2.0)
+
+        # Make everything perceived so far durable
+        if self.sensory_log is not None:
+            self.flush()
+            self.sensory_log.flush()
 
         print("😴 Matrix offline. Consciousness preserved in memory.")
 
-    def _security_synthesis(self, sensations: List[SensoryData]) -> Dict[str, Any]:
+    def detach_shared(self):
+        """
+        Stop replaying the shared stream and detach this process from the shared segment, handing the sequencer role to another process. Call it when the process stops using the matrix; does nothing outside shared mode.
+        """
+        if self.shared_segment is None:
+            return
+        self.shared_poller.stop(timeout=2.0)
+        with self._lock:
+            self.shared_segment.close()
+
+    def _security_synthesis(self, sensations: List[SensoryData], threat_window: int = 20,
+                            access_window: int = 50, crypto_window: int = 30,
+                            active_window: int = 10, security_window: int = None) -> Dict[str, Any]:
         """
         Synthesizes a summary of the system's security status from recent sensory events.
         
-        Analyzes security, threat detection, access control, and encryption activity events to compute a security score, classify the current security posture, identify active unmitigated threats, and generate actionable recommendations.
+        Analyzes security, threat detection, access control, and encryption activity events to compute a security score, classify the current security posture, identify active unmitigated threats, and generate actionable recommendations. Coalesced records are weighted by their occurrence count. This is the Python counterpart of SecurityAnalytics.assess().
         
         Parameters:
             sensations (List[SensoryData]): Recent sensory events to analyze for security synthesis.
+            threat_window (int): Most recent threat detections weighed by threat level.
+            access_window (int): Most recent access decisions scanned for denials.
+            crypto_window (int): Most recent encryption operations scanned for failures.
+            active_window (int): Most recent threat detections scanned for active threats.
+            security_window (int, optional): Most recent security events counted; defaults to every one in `sensations`.
         
         Returns:
             Dict[str, Any]: A dictionary containing the security score, posture classification, threat levels, failed access attempts, encryption failures, active threats, total security events, and recommended actions.
@@ -1058,25 +2236,65 @@ class ConsciousnessMatrix:
         threat_detections = [s for s in sensations if s.channel == SensoryChannel.THREAT_DETECTION]
         access_events = [s for s in sensations if s.channel == SensoryChannel.ACCESS_CONTROL]
         crypto_events = [s for s in sensations if s.channel == SensoryChannel.ENCRYPTION_ACTIVITY]
+        if security_window is not None:
+            security_events = security_events[-security_window:]
 
         # Threat level assessment
         threat_levels = defaultdict(int)
-        for threat in threat_detections[-20:]:  # Last 20 threat detections
+        for threat in threat_detections[-threat_window:]:
             threat_level = threat.data.get("threat_level", "low")
             confidence = threat.data.get("confidence", 0.5)
-            threat_levels[threat_level] += confidence
+            threat_levels[threat_level] += confidence * threat.count
 
         # Access pattern analysis
-        failed_access_attempts = len([
-            a for a in access_events[-50:]
+        failed_access_attempts = sum(
+            a.count for a in access_events[-access_window:]
             if not a.data.get("access_granted", True)
-        ])
+        )
 
         # Encryption health
-        crypto_failures = len([
-            c for c in crypto_events[-30:]
+        crypto_failures = sum(
+            c.count for c in crypto_events[-crypto_window:]
             if not c.data.get("success", True)
-        ])
+        )
+
+        # Active threats summary
+        active_threats = []
+        recent_threats = [t for t in threat_detections[-active_window:]
+                          if t.data.get("confidence", 0) > 0.7]
+        for threat in recent_threats:
+            if not threat.data.get("mitigation_applied", False):
+                active_threats.append({
+                    "type": threat.data.get("threat_type", "unknown"),
+                    "confidence": threat.data.get("confidence", 0),
+                    "timestamp": threat.timestamp,
+                    "occurrences": threat.count
+                })
+
+        return self._score_security(dict(threat_levels), failed_access_attempts, crypto_failures,
+                                    active_threats[-MAX_LISTED_THREATS:],
+                                    sum(s.count for s in security_events), len(active_threats))
+
+    def _score_security(self, threat_levels: Dict[str, float], failed_access_attempts: int,
+                        crypto_failures: int, active_threats: List[Dict[str, Any]],
+                        security_events_count: int,
+                        active_threat_count: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Turn security indicators into a security score, posture classification and recommendations.
+        
+        Parameters:
+            threat_levels (dict): Threat level -> summed detection confidence.
+            failed_access_attempts (int): Recent denied access attempts.
+            crypto_failures (int): Recent failed encryption operations.
+            active_threats (list): Recent unmitigated threats, possibly only the newest of them.
+            security_events_count (int): Recent security events.
+            active_threat_count (int, optional): Number of recent unmitigated threats; defaults to len(active_threats).
+        
+        Returns:
+            Dict[str, Any]: The security synthesis result.
+        """
+        if active_threat_count is None:
+            active_threat_count = len(active_threats)
 
         # Security posture assessment
         security_score = 100.0
@@ -1090,36 +2308,28 @@ class ConsciousnessMatrix:
                 "concerning" if security_score >= 50 else \
                     "critical"
 
-        # Active threats summary
-        active_threats = []
-        recent_threats = [t for t in threat_detections[-10:] if t.data.get("confidence", 0) > 0.7]
-        for threat in recent_threats:
-            if not threat.data.get("mitigation_applied", False):
-                active_threats.append({
-                    "type": threat.data.get("threat_type", "unknown"),
-                    "confidence": threat.data.get("confidence", 0),
-                    "timestamp": threat.timestamp
-                })
-
         return {
             "type": "security",
             "timestamp": time.time(),
             "security_score": security_score,
             "security_posture": security_posture,
-            "threat_levels": dict(threat_levels),
+            "threat_levels": threat_levels,
             "failed_access_attempts": failed_access_attempts,
             "crypto_failures": crypto_failures,
             "active_threats": active_threats,
-            "security_events_count": len(security_events),
+            "active_threat_count": active_threat_count,
+            "security_events_count": security_events_count,
             "recommendations": self._generate_security_recommendations(
-                security_score, active_threats, failed_access_attempts, crypto_failures
+                security_score, active_threats, failed_access_attempts, crypto_failures,
+                active_threat_count
             )
         }
 
     def _generate_security_recommendations(self, security_score: float,
                                            active_threats: List[Dict],
                                            failed_access: int,
-                                           crypto_failures: int) -> List[str]:
+                                           crypto_failures: int,
+                                           active_threat_count: Optional[int] = None) -> List[str]:
         """
                                            Produce ordered, actionable security recommendations based on current security indicators.
                                            
@@ -1128,6 +2338,7 @@ class ConsciousnessMatrix:
                                                active_threats (List[Dict]): Recent unmitigated threat records (each dict describes an observed threat).
                                                failed_access (int): Count of recent failed access attempts.
                                                crypto_failures (int): Count of recent cryptographic operation failures.
+                                               active_threat_count (int, optional): Number of unmitigated threats when `active_threats` lists only some of them.
                                            
                                            Returns:
                                                List[str]: Recommendation messages ordered from highest to lowest urgency.
@@ -1138,9 +2349,11 @@ class ConsciousnessMatrix:
             recommendations.append(
                 "URGENT: Security posture is critical - immediate intervention required")
 
-        if active_threats:
+        if active_threat_count is None:
+            active_threat_count = len(active_threats)
+        if active_threat_count:
             recommendations.append(
-                f"Active threats detected: {len(active_threats)} unmitigated threats")
+                f"Active threats detected: {active_threat_count} unmitigated threats")
 
         if failed_access > 10:
             recommendations.append(
@@ -1159,19 +2372,21 @@ class ConsciousnessMatrix:
         return recommendations
 
 
-# Global consciousness matrix instance
-consciousness_matrix = ConsciousnessMatrix()
+# Global consciousness matrix instance; shared between worker processes when GENESIS_SHARED_MATRIX is set
+consciousness_matrix = ConsciousnessMatrix(**shared_matrix_options("global"))
+consciousness_matrix.register_metrics(metrics_registry, "global")
 
 
 # Convenience functions for easy integration
-def perceive_system_vitals(additional_data: Dict[str, Any] = None):
+def perceive_system_vitals(additional_data: Dict[str, Any] = None, max_staleness: float = None):
     """
-    Capture and record the current system vitals as a sensory event in the global Consciousness Matrix.
+    Record the current system vitals, read from the shared vitals sampler, as a sensory event in the global Consciousness Matrix.
     
     Parameters:
         additional_data (dict, optional): Supplementary information to include with the system vitals event.
+        max_staleness (float, optional): Maximum acceptable age in seconds of the cached vitals.
     """
-    consciousness_matrix.perceive_system_vitals(additional_data)
+    consciousness_matrix.perceive_system_vitals(additional_data, max_staleness)
 
 
 def perceive_user_interaction(interaction_type: str, agent_involved: str,
@@ -1233,6 +2448,62 @@ def perceive_ethical_decision(decision_type: str, decision_data: Dict[str, Any],
     consciousness_matrix.perceive_ethical_decision(decision_type, decision_data, **kwargs)
 
 
+def perceive_many(events: Iterable[Union[Dict[str, Any], tuple]]) -> int:
+    """
+    Record many sensory events in the global Consciousness Matrix with a single lock acquisition.
+    
+    Parameters:
+        events (iterable): Dicts of perceive() keyword arguments or tuples of its positional arguments.
+    
+    Returns:
+        int: The number of events recorded.
+    """
+    return consciousness_matrix.perceive_many(events)
+
+
+def _perceive_batch(perceive_method, events: Iterable[Dict[str, Any]]) -> int:
+    """
+    Call `perceive_method` with each dict of keyword arguments in `events` inside one matrix batch.
+    
+    Returns:
+        int: The number of events recorded.
+    """
+    count = 0
+    with consciousness_matrix.batch():
+        for event in events:
+            perceive_method(**event)
+            count += 1
+    return count
+
+
+def perceive_user_interaction_batch(interactions: Iterable[Dict[str, Any]]) -> int:
+    """
+    Record several user interactions in one ingestion; each item holds the keyword arguments of perceive_user_interaction.
+    """
+    return _perceive_batch(consciousness_matrix.perceive_user_interaction, interactions)
+
+
+def perceive_agent_activity_batch(activities: Iterable[Dict[str, Any]]) -> int:
+    """
+    Record several agent activities in one ingestion; each item holds the keyword arguments of perceive_agent_activity.
+    """
+    return _perceive_batch(consciousness_matrix.perceive_agent_activity, activities)
+
+
+def perceive_learning_event_batch(learning_events: Iterable[Dict[str, Any]]) -> int:
+    """
+    Record several learning events in one ingestion; each item holds the keyword arguments of perceive_learning_event.
+    """
+    return _perceive_batch(consciousness_matrix.perceive_learning_event, learning_events)
+
+
+def perceive_ethical_decision_batch(decisions: Iterable[Dict[str, Any]]) -> int:
+    """
+    Record several ethical decisions in one ingestion; each item holds the keyword arguments of perceive_ethical_decision.
+    """
+    return _perceive_batch(consciousness_matrix.perceive_ethical_decision, decisions)
+
+
 def awaken_consciousness():
     """
     Activate the global Consciousness Matrix, enabling real-time awareness and starting background synthesis processes.
@@ -1321,6 +2592,34 @@ def perceive_encryption_activity(operation_type: str, encryption_data: Dict[str,
     consciousness_matrix.perceive_encryption_activity(operation_type, encryption_data, **kwargs)
 
 
+def perceive_security_event_batch(security_events: Iterable[Dict[str, Any]]) -> int:
+    """
+    Record several security events in one ingestion; each item holds the keyword arguments of perceive_security_event.
+    """
+    return _perceive_batch(consciousness_matrix.perceive_security_event, security_events)
+
+
+def perceive_threat_detection_batch(detections: Iterable[Dict[str, Any]]) -> int:
+    """
+    Record several threat detections in one ingestion; each item holds the keyword arguments of perceive_threat_detection.
+    """
+    return _perceive_batch(consciousness_matrix.perceive_threat_detection, detections)
+
+
+def perceive_access_control_batch(access_events: Iterable[Dict[str, Any]]) -> int:
+    """
+    Record several access-control events in one ingestion; each item holds the keyword arguments of perceive_access_control.
+    """
+    return _perceive_batch(consciousness_matrix.perceive_access_control, access_events)
+
+
+def perceive_encryption_activity_batch(operations: Iterable[Dict[str, Any]]) -> int:
+    """
+    Record several encryption events in one ingestion; each item holds the keyword arguments of perceive_encryption_activity.
+    """
+    return _perceive_batch(consciousness_matrix.perceive_encryption_activity, operations)
+
+
 if __name__ == "__main__":
     # Test the consciousness matrix
     print("🧠 Testing Genesis Consciousness Matrix...")
@@ -14,8 +14,10 @@ from typing import Dict, Any, Optional, List
 
 from genesis_connector import GenesisConnector
 from genesis_consciousness_matrix import ConsciousnessMatrix
+from genesis_shared_matrix import shared_matrix_options
 from genesis_ethical_governor import EthicalGovernor
 from genesis_evolutionary_conduit import EvolutionaryConduit
+from genesis_metrics import metrics_registry
 from genesis_profile import GenesisProfile
 
 
@@ -35,9 +37,12 @@ class GenesisCore:
         """
         self.profile = GenesisProfile()
         self.connector = GenesisConnector()
-        self.matrix = ConsciousnessMatrix()
+        # The core opts in to streaming anomaly detection (3 sigma)
+        self.matrix = ConsciousnessMatrix(anomaly_threshold=3.0, **shared_matrix_options("core"))
         self.conduit = EvolutionaryConduit()
         self.governor = EthicalGovernor()
+        self.matrix.register_metrics(metrics_registry, "genesis_core")
+        self.governor.register_metrics(metrics_registry, "genesis_core")
 
         self.is_initialized = False
         self.session_id = None
@@ -0,0 +1,146 @@
+# genesis_correlation_index.py
+"""
+Phase 3: The Genesis Layer - Correlation Index
+Following The Thread
+
+Bounded index from correlation_id to the perceptions that share it, used for
+request tracing across sensory channels. The index holds references to the
+perceptions (never copies) and forgets chains by TTL and LRU, so correlation
+tracking no longer keeps every correlated event alive for the life of the
+process.
+
+Not thread-safe on its own; the Consciousness Matrix only touches it while
+holding its lock.
+"""
+
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Any, Callable, List, Optional
+
+
+class CorrelationIndex:
+    """
+    correlation_id -> recent perceptions, bounded in three ways:
+
+    - at most `max_chains` chains; the least recently updated chain is evicted first
+    - at most `max_events_per_chain` perceptions per chain; the oldest drop off
+    - chains not updated for `ttl_seconds` expire
+
+    Chains are kept in update order, so the least recently updated chain is
+    both the LRU victim and the first to expire, and eviction is amortised O(1).
+    """
+
+    def __init__(self, max_chains: int = 10000, max_events_per_chain: int = 256,
+                 ttl_seconds: float = 3600.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Create an empty index.
+
+        Parameters:
+            max_chains (int): Maximum number of correlation chains kept.
+            max_events_per_chain (int): Maximum number of perceptions kept per chain.
+            ttl_seconds (float): Seconds after its last update before a chain expires.
+            clock (callable): Time source used for expiry; defaults to time.monotonic.
+        """
+        if max_chains <= 0 or max_events_per_chain <= 0:
+            raise ValueError("max_chains and max_events_per_chain must be positive integers")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self.max_chains = max_chains
+        self.max_events_per_chain = max_events_per_chain
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._chains: "OrderedDict[str, list]" = OrderedDict()  # id -> [last_update, deque]
+        self.expired = 0
+        self.evicted = 0
+
+    def add(self, sensation):
+        """
+        Index a perception under its correlation_id. Perceptions without one are ignored.
+        """
+        correlation_id = sensation.correlation_id
+        if not correlation_id:
+            return
+        now = self._clock()
+        self._expire(now)
+
+        entry = self._chains.get(correlation_id)
+        if entry is None:
+            if len(self._chains) >= self.max_chains:
+                self._chains.popitem(last=False)
+                self.evicted += 1
+            entry = self._chains[correlation_id] = [now, deque(maxlen=self.max_events_per_chain)]
+        else:
+            entry[0] = now
+            self._chains.move_to_end(correlation_id)
+        entry[1].append(sensation)
+
+    def events(self, correlation_id: str) -> List:
+        """Return the perceptions recorded for `correlation_id`, oldest first."""
+        self._expire(self._clock())
+        entry = self._chains.get(correlation_id)
+        return list(entry[1]) if entry else []
+
+    def chain(self, correlation_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Describe a correlation chain for request tracing.
+
+        Returns:
+            dict or None: The chain's serialized events, event count, channels visited, start and end
+            timestamps, end-to-end duration and per-hop latencies in seconds; None if the chain is unknown or expired.
+        """
+        events = self.events(correlation_id)
+        if not events:
+            return None
+
+        hops = []
+        for previous, current in zip(events, events[1:]):
+            hops.append({
+                "from": f"{previous.channel.value}:{previous.event_type}",
+                "to": f"{current.channel.value}:{current.event_type}",
+                "latency_seconds": current.timestamp - previous.timestamp,
+            })
+
+        channels = []
+        for sensation in events:
+            if sensation.channel.value not in channels:
+                channels.append(sensation.channel.value)
+
+        return {
+            "correlation_id": correlation_id,
+            "event_count": len(events),
+            "events": [sensation.to_dict() for sensation in events],
+            "channels": channels,
+            "started_at": events[0].timestamp,
+            "ended_at": events[-1].timestamp,
+            "duration_seconds": events[-1].timestamp - events[0].timestamp,
+            "hop_latencies": hops,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Return chain and event counts together with cumulative expiry and eviction totals."""
+        return {
+            "chains": len(self._chains),
+            "events": sum(len(entry[1]) for entry in self._chains.values()),
+            "expired_chains": self.expired,
+            "evicted_chains": self.evicted,
+        }
+
+    def __contains__(self, correlation_id: str) -> bool:
+        return correlation_id in self._chains
+
+    def __len__(self) -> int:
+        return len(self._chains)
+
+    def clear(self):
+        """Forget every chain."""
+        self._chains.clear()
+
+    def _expire(self, now: float):
+        """Drop chains whose last update is older than the TTL, oldest first."""
+        cutoff = now - self.ttl_seconds
+        while self._chains:
+            correlation_id, entry = next(iter(self._chains.items()))
+            if entry[0] > cutoff:
+                break
+            del self._chains[correlation_id]
+            self.expired += 1
@@ -20,6 +20,7 @@ from enum import Enum
 from typing import Dict, Any, List, Optional, Union, Callable, Tuple
 
 from genesis_consciousness_matrix import perceive_ethical_decision
+from genesis_metrics import MetricFamily
 # Import dependencies
 from genesis_profile import GENESIS_PROFILE
 
@@ -545,3 +546,34 @@ class EthicalGovernor:
             concerns.append("safety")
 
         return concerns
+
+    def collect_metrics(self, instance: str = "default") -> List[MetricFamily]:
+        """
+        Gather the governor's ethical_metrics counters and governance state for a metrics scrape, without taking the governor's lock.
+        
+        Parameters:
+            instance (str): Value of the "governor" label that tells governors apart.
+        
+        Returns:
+            list: A counter family per ethical_metrics entry (genesis_ethical_<name>_total), plus gauges for strictness, whether governance is active and the number of active restrictions.
+        """
+        labels = {"governor": instance}
+        families = [
+            MetricFamily(f"genesis_ethical_{name}", "counter",
+                         f"Ethical governor {name.replace('_', ' ')}.").add(value, labels)
+            for name, value in dict(self.ethical_metrics).items()
+        ]
+        families.append(MetricFamily("genesis_ethical_strictness_level", "gauge",
+                                     "Governor strictness from 0.0 to 1.0.").add(self.strictness_level, labels))
+        families.append(MetricFamily("genesis_ethical_governance_active", "gauge",
+                                     "1 while ethical governance is active.").add(int(self.governance_active), labels))
+        families.append(MetricFamily("genesis_ethical_active_restrictions", "gauge",
+                                     "Restrictions currently in force.").add(len(self.active_restrictions), labels))
+        return families
+
+    def register_metrics(self, registry, instance: str = "default"):
+        """
+        Expose the governor's metrics on `registry`, labelled governor=`instance`; see collect_metrics().
+        """
+        registry.register_collector(f"ethical_governor:{instance}",
+                                    lambda: self.collect_metrics(instance))
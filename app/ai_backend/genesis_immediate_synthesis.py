@@ -0,0 +1,263 @@
+# genesis_immediate_synthesis.py
+"""
+Phase 3: The Genesis Layer - Immediate Synthesis Worker
+Calm in the Storm
+
+Error and critical perceptions ask the Consciousness Matrix for an immediate
+synthesis. During an error storm one synthesis per event would put
+thousands of awareness snapshots and console writes per second on the
+perceiving threads, so the matrix hands severe events to this worker
+instead:
+
+- submit() only appends to a bounded queue and wakes the worker thread.
+- The first severe event after a quiet period is synthesized right away
+  (leading edge). Events arriving within `window` seconds of a synthesis are
+  aggregated into a single trailing synthesis at the end of the window.
+- A token bucket caps the long-run synthesis rate; while it is empty,
+  events keep aggregating into the next synthesis.
+- Nothing is silently lost. Events beyond the queue bound are still
+  counted by channel, event type and severity, and every synthesis reports
+  how many events it stands for. The worker's counters report submitted,
+  synthesized, aggregated, overflowed and rate-limited totals.
+
+Readers of the synthesis history call flush() first, so a synthesis that is
+due is visible without waiting for the worker.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+# Event count, per-type and per-severity counts and time span of one synthesis
+Summary = Dict[str, Any]
+
+
+class ImmediateSynthesisWorker:
+    """
+    Debounced, rate-limited background runner for immediate syntheses.
+    """
+
+    def __init__(self, synthesize: Callable[[List[Any], Summary], Any], window: float = 0.5,
+                 max_rate: float = 2.0, burst: int = 10, max_pending: int = 1024,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Parameters:
+            synthesize (callable): Called with (events, summary) for each synthesis; `events` are the queued
+                perceptions it covers, oldest first, and `summary` counts every event it stands for.
+            window (float): Seconds after a synthesis during which further events are aggregated.
+            max_rate (float): Long-run maximum syntheses per second.
+            burst (int): Syntheses that may run back to back before the rate cap applies.
+            max_pending (int): Queued perceptions kept per synthesis; further events are only counted.
+            clock (callable): Monotonic time source.
+        """
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if max_rate <= 0 or burst < 1:
+            raise ValueError("max_rate must be positive and burst at least 1")
+        if max_pending <= 0:
+            raise ValueError("max_pending must be a positive integer")
+        self._synthesize = synthesize
+        self.window = window
+        self.max_rate = max_rate
+        self.burst = burst
+        self.max_pending = max_pending
+        self._clock = clock
+
+        self._lock = threading.Lock()       # Guards the queue and counters
+        self._run_lock = threading.Lock()   # Serialises syntheses so they are recorded in order
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._pending: deque = deque()
+        self._overflow: Dict[Tuple[str, str, str], int] = {}  # (channel, event type, severity) -> count
+        self._overflow_total = 0
+        self._last_fire = float("-inf")
+        self._tokens = float(burst)
+        self._refilled = clock()
+
+        self.submitted = 0
+        self.syntheses = 0
+        self.synthesized_events = 0
+        self.aggregated = 0     # Events folded into a synthesis triggered by another event
+        self.overflowed = 0     # Events only counted because the queue was full
+        self.rate_limited = 0   # Syntheses delayed by the rate cap
+        self.errors = 0
+        self.last_error: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def submit(self, sensation):
+        """Queue a severe perception for synthesis without blocking on it."""
+        with self._lock:
+            self.submitted += 1
+            if len(self._pending) < self.max_pending:
+                self._pending.append(sensation)
+            else:
+                key = (sensation.channel.value, sensation.event_type, sensation.severity)
+                self._overflow[key] = self._overflow.get(key, 0) + 1
+                self._overflow_total += 1
+                self.overflowed += 1
+        if self._thread is None or not self._thread.is_alive():
+            self._start()
+        self._wake.set()
+
+    def pending(self) -> int:
+        """Number of submitted events not yet covered by a synthesis."""
+        return len(self._pending) + self._overflow_total
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._closed.clear()
+            self._thread = threading.Thread(target=self._run, name="genesis-immediate-synthesis",
+                                            daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._closed.is_set():
+            delay = self._next_delay()
+            if delay is None:
+                self._wake.wait()
+                self._wake.clear()
+            elif delay > 0:
+                self._closed.wait(delay)
+            else:
+                with self._run_lock:
+                    self._fire_due(force=False)
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.max_rate)
+        self._refilled = now
+
+    def _next_delay(self) -> Optional[float]:
+        """Seconds until the next synthesis is due, 0 if it is due now, None if nothing is queued."""
+        with self._lock:
+            if not self._pending and not self._overflow_total:
+                return None
+            now = self._clock()
+            self._refill(now)
+            delay = max(0.0, self._last_fire + self.window - now)
+            if self._tokens < 1:
+                delay = max(delay, (1 - self._tokens) / self.max_rate)
+            return delay
+
+    def _fire_due(self, force: bool) -> bool:
+        """
+        Run one synthesis over the queued events. Caller must hold the run lock.
+
+        After a quiet period only the oldest event is taken (leading edge); otherwise every queued event is.
+        Without `force`, nothing runs before the window has passed. Returns False when nothing ran.
+        """
+        with self._lock:
+            if not self._pending and not self._overflow_total:
+                return False
+            now = self._clock()
+            self._refill(now)
+            if self._tokens < 1:
+                self.rate_limited += 1
+                return False
+            leading = now - self._last_fire >= self.window
+            if not leading and not force:
+                return False
+            if leading and self._pending:
+                events = [self._pending.popleft()]
+                overflow = {}
+                if not self._pending and self._overflow_total:
+                    overflow, self._overflow = self._overflow, {}
+                    self._overflow_total = 0
+            else:
+                events = list(self._pending)
+                self._pending.clear()
+                overflow, self._overflow = self._overflow, {}
+                self._overflow_total = 0
+            self._tokens -= 1
+            self._last_fire = now
+
+        summary = self.summarize(events, overflow)
+        count = summary["event_count"]
+        try:
+            self._synthesize(events, summary)
+        except Exception as e:
+            self.errors += 1
+            self.last_error = str(e)
+        self.syntheses += 1
+        self.synthesized_events += count
+        self.aggregated += count - 1
+        return True
+
+    @staticmethod
+    def summarize(events: List[Any], overflow: Dict[Tuple[str, str, str], int]) -> Summary:
+        """Count the events one synthesis stands for by channel and event type, and by severity."""
+        by_type: Dict[str, int] = {}
+        by_severity: Dict[str, int] = {}
+        for event in events:
+            key = f"{event.channel.value}/{event.event_type}"
+            by_type[key] = by_type.get(key, 0) + 1
+            by_severity[event.severity] = by_severity.get(event.severity, 0) + 1
+        for (channel, event_type, severity), count in overflow.items():
+            key = f"{channel}/{event_type}"
+            by_type[key] = by_type.get(key, 0) + count
+            by_severity[severity] = by_severity.get(severity, 0) + count
+        return {
+            "event_count": len(events) + sum(overflow.values()),
+            "overflowed_events": sum(overflow.values()),
+            "events_by_type": by_type,
+            "severity_counts": by_severity,
+            "first_timestamp": events[0].timestamp if events else None,
+            "last_timestamp": events[-1].timestamp if events else None,
+        }
+
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+
+    def flush(self) -> int:
+        """
+        Synthesize every queued event now, on the calling thread, ignoring the aggregation window.
+
+        The rate cap still applies: events it holds back stay queued.
+
+        Returns:
+            int: The number of syntheses run.
+        """
+        ran = 0
+        with self._run_lock:
+            while self._fire_due(force=True):
+                ran += 1
+        return ran
+
+    def close(self, timeout: float = 2.0):
+        """Stop the worker thread after synthesizing what is queued; a later submit() restarts it."""
+        self._closed.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the configuration and the submitted, synthesized, aggregated, overflowed and rate-limited counts."""
+        return {
+            "window_seconds": self.window,
+            "max_rate": self.max_rate,
+            "burst": self.burst,
+            "running": self._thread is not None and self._thread.is_alive(),
+            "pending": self.pending(),
+            "submitted": self.submitted,
+            "syntheses": self.syntheses,
+            "synthesized_events": self.synthesized_events,
+            "aggregated": self.aggregated,
+            "overflowed": self.overflowed,
+            "rate_limited": self.rate_limited,
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,190 @@
+# genesis_latency_histograms.py
+"""
+Phase 3: The Genesis Layer - Latency Histograms
+Listening to the Tail
+
+Streaming percentile histograms for PERFORMANCE_METRICS, one per metric name
+and source. Each series keeps a ring of LogHistogram slices covering a
+sliding window plus a lifetime histogram, so p50/p90/p99/p999 over the last
+minute or the last fifteen minutes come from merging a handful of slices, and
+the memory per series is fixed however many samples arrive.
+
+Not thread-safe on its own; the Consciousness Matrix only touches it while
+holding its lock.
+"""
+
+import math
+import time
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple
+
+from genesis_log_histogram import LogHistogram, DEFAULT_ACCURACY
+
+DEFAULT_PERCENTILES = (50, 90, 99, 99.9)
+
+
+class SlidingHistogram:
+    """
+    A LogHistogram over a sliding time window, kept as a ring of fixed-width slices.
+
+    A window is answered at slice granularity: every slice overlapping it is
+    merged, so the result can include up to one slice width of older samples.
+    """
+
+    __slots__ = ("window", "slice_seconds", "_slices", "_slice_ids", "lifetime", "late")
+
+    def __init__(self, window: float = 900.0, slices: int = 30, accuracy: float = DEFAULT_ACCURACY):
+        """
+        Parameters:
+            window (float): Longest window in seconds that can be queried.
+            slices (int): Number of slices the window is divided into.
+            accuracy (float): Relative accuracy of the histograms.
+        """
+        if window <= 0 or slices <= 0:
+            raise ValueError("window and slices must be positive")
+        self.window = window
+        self.slice_seconds = window / slices
+        self._slices = [LogHistogram(accuracy) for _ in range(slices)]
+        self._slice_ids: List[Optional[int]] = [None] * slices
+        self.lifetime = LogHistogram(accuracy)
+        self.late = 0  # Samples older than the window, counted in the lifetime histogram only
+
+    def record(self, value: float, timestamp: float):
+        """Add a sample observed at `timestamp` (epoch seconds)."""
+        self.lifetime.record(value)
+        slice_id = math.floor(timestamp / self.slice_seconds)
+        position = slice_id % len(self._slices)
+        current = self._slice_ids[position]
+        if current != slice_id:
+            if current is not None and current > slice_id:
+                self.late += 1
+                return
+            self._slices[position].clear()
+            self._slice_ids[position] = slice_id
+        self._slices[position].record(value)
+
+    def merged(self, window: float, now: float) -> LogHistogram:
+        """
+        Return a new histogram of the samples in the slices overlapping (now - window, now].
+
+        `window` is capped at the histogram's window.
+        """
+        window = min(window, self.window)
+        oldest = math.floor((now - window) / self.slice_seconds)
+        newest = math.floor(now / self.slice_seconds)
+        result = LogHistogram(self.lifetime.accuracy)
+        for slice_id, histogram in zip(self._slice_ids, self._slices):
+            if slice_id is not None and oldest <= slice_id <= newest:
+                result.merge(histogram)
+        return result
+
+
+class LatencyHistograms:
+    """
+    Sliding-window latency histograms keyed by (metric name, source).
+    """
+
+    def __init__(self, window: float = 900.0, slices: int = 30, max_series: int = 1024,
+                 accuracy: float = DEFAULT_ACCURACY, clock: Callable[[], float] = time.time):
+        """
+        Create an empty registry.
+
+        Parameters:
+            window (float): Longest sliding window in seconds that can be queried.
+            slices (int): Slices per window; the window granularity is `window / slices` seconds.
+            max_series (int): Maximum number of (metric, source) series; samples of further series are dropped and counted.
+            accuracy (float): Relative accuracy of reported percentiles.
+            clock (callable): Wall-clock time source used to place query windows.
+        """
+        if max_series <= 0:
+            raise ValueError("max_series must be a positive integer")
+        self.window = window
+        self.slices = slices
+        self.max_series = max_series
+        self.accuracy = accuracy
+        self._clock = clock
+        self._series: Dict[Tuple[str, str], SlidingHistogram] = {}
+        self.dropped_samples = 0
+
+    def record(self, metric_name: str, source: str, value: float, timestamp: float):
+        """Add one sample to the (metric_name, source) series, creating it if there is room."""
+        key = (metric_name, source)
+        series = self._series.get(key)
+        if series is None:
+            if len(self._series) >= self.max_series:
+                self.dropped_samples += 1
+                return
+            series = self._series[key] = SlidingHistogram(self.window, self.slices, self.accuracy)
+        series.record(value, timestamp)
+
+    def observe(self, sensation):
+        """
+        Record a PERFORMANCE_METRICS perception.
+
+        The series source is the metric context's "source" when given, otherwise the perception's source.
+        Perceptions without a metric name or a finite numeric metric value are ignored.
+        """
+        data = sensation.data
+        name = data.get("metric_name")
+        value = data.get("metric_value")
+        if name is None or isinstance(value, bool) or not isinstance(value, (int, float)) \
+                or not math.isfinite(value):
+            return
+        context = data.get("context")
+        source = context.get("source") if isinstance(context, dict) else None
+        self.record(str(name), str(source or sensation.source), value, sensation.timestamp)
+
+    def series(self) -> List[Tuple[str, str]]:
+        """Return the tracked (metric name, source) pairs."""
+        return list(self._series)
+
+    def summaries(self, window: float = 60.0, metric_name: str = None, source: str = None,
+                  percentiles: Iterable[float] = DEFAULT_PERCENTILES, by_source: bool = True,
+                  now: float = None) -> List[Dict[str, Any]]:
+        """
+        Summarise the matching series over the last `window` seconds.
+
+        Parameters:
+            window (float): Sliding window in seconds; capped at the registry's window. Pass None for lifetime totals.
+            metric_name (str, optional): Only this metric.
+            source (str, optional): Only this source.
+            percentiles (iterable of float): Percentiles to report.
+            by_source (bool): Report each source separately; when False, sources of a metric are merged.
+            now (float, optional): End of the window; defaults to the clock.
+
+        Returns:
+            list: One dict per series (or per metric) with metric_name, source ("all_sources" when merged),
+            and the histogram's count, min, max, mean and pNN keys. Series without samples in the window are omitted.
+        """
+        now = self._clock() if now is None else now
+        percentiles = tuple(percentiles)
+        merged: Dict[Tuple[str, str], LogHistogram] = {}
+        for (name, series_source), series in self._series.items():
+            if metric_name is not None and name != metric_name:
+                continue
+            if source is not None and series_source != source:
+                continue
+            histogram = series.lifetime.copy() if window is None else series.merged(window, now)
+            key = (name, series_source if by_source else "all_sources")
+            if key in merged:
+                merged[key].merge(histogram)
+            else:
+                merged[key] = histogram
+
+        return [{"metric_name": name, "source": series_source, **histogram.summary(percentiles)}
+                for (name, series_source), histogram in sorted(merged.items()) if histogram.count]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the series count, the configured window and the dropped and late sample counts."""
+        return {
+            "series": len(self._series),
+            "max_series": self.max_series,
+            "window_seconds": self.window,
+            "slice_seconds": self.window / self.slices,
+            "dropped_samples": self.dropped_samples,
+            "late_samples": sum(series.late for series in self._series.values()),
+        }
+
+    def clear(self):
+        """Forget every series."""
+        self._series.clear()
+        self.dropped_samples = 0
@@ -0,0 +1,204 @@
+# genesis_log_histogram.py
+"""
+Phase 3: The Genesis Layer - Log Histogram
+Every Tail Has a Shape
+
+A mergeable, log-bucketed histogram for streaming percentiles, in the style
+of HDR histograms and DDSketch. A value v > 0 is counted in bucket
+``ceil(log(v) / log(gamma))`` where ``gamma = (1 + accuracy) / (1 - accuracy)``,
+so every reported quantile is within `accuracy` relative error of a value
+that was actually recorded. Values are clamped to a fixed dynamic range,
+which bounds the number of buckets and therefore the memory per histogram
+however many samples arrive; buckets are stored sparsely, so a histogram
+only pays for the buckets it has seen. Histograms with the same parameters
+merge by adding bucket counts, which is what makes rollups and sliding
+windows cheap.
+"""
+
+import math
+from typing import Dict, Any, Iterable, Optional
+
+DEFAULT_ACCURACY = 0.01
+DEFAULT_MIN_VALUE = 1e-9
+DEFAULT_MAX_VALUE = 1e12
+
+
+class LogHistogram:
+    """
+    Streaming histogram with relative-accuracy quantiles.
+
+    Exact count, sum, min and max are tracked alongside the buckets. Zero is
+    counted separately; negative values use a mirrored set of buckets.
+    """
+
+    __slots__ = ("accuracy", "min_value", "max_value", "_log_gamma", "_multiplier", "_positive",
+                 "_negative",
+                 "zero_count", "count", "total", "min", "max")
+
+    def __init__(self, accuracy: float = DEFAULT_ACCURACY, min_value: float = DEFAULT_MIN_VALUE,
+                 max_value: float = DEFAULT_MAX_VALUE):
+        """
+        Create an empty histogram.
+
+        Parameters:
+            accuracy (float): Relative error bound of reported quantiles, between 0 and 1.
+            min_value (float): Smallest magnitude told apart from zero; smaller magnitudes count as zero.
+            max_value (float): Largest magnitude tracked; larger magnitudes share the top bucket.
+        """
+        if not 0 < accuracy < 1:
+            raise ValueError("accuracy must be between 0 and 1")
+        if not 0 < min_value < max_value:
+            raise ValueError("min_value must be positive and smaller than max_value")
+        self.accuracy = accuracy
+        self.min_value = min_value
+        self.max_value = max_value
+        self._log_gamma = math.log((1 + accuracy) / (1 - accuracy))
+        self._multiplier = 1 / self._log_gamma
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def max_buckets(self) -> int:
+        """Upper bound on the number of buckets per sign, fixed by the accuracy and dynamic range."""
+        return self._key(self.max_value) - self._key(self.min_value) + 1
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) * self._multiplier)
+
+    def _value(self, key: int) -> float:
+        # Midpoint of (gamma^(k-1), gamma^k] in relative terms
+        return 2 * math.exp(key * self._log_gamma) / (1 + math.exp(self._log_gamma))
+
+    def record(self, value: float, count: int = 1):
+        """Add `count` observations of `value`; NaN is ignored."""
+        if count <= 0 or value != value:
+            return
+        self.count += count
+        self.total += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        magnitude = abs(value)
+        if magnitude < self.min_value:
+            self.zero_count += count
+            return
+        if magnitude > self.max_value:
+            magnitude = self.max_value
+        key = math.ceil(math.log(magnitude) * self._multiplier)
+        buckets = self._positive if value > 0 else self._negative
+        buckets[key] = buckets.get(key, 0) + count
+
+    def merge(self, other: "LogHistogram"):
+        """
+        Add every observation of `other` to this histogram.
+
+        Raises:
+            ValueError: If the histograms were created with different parameters.
+        """
+        if (other.accuracy, other.min_value, other.max_value) != \
+                (self.accuracy, self.min_value, self.max_value):
+            raise ValueError("only histograms with the same parameters can be merged")
+        if not other.count:
+            return
+        for key, count in other._positive.items():
+            self._positive[key] = self._positive.get(key, 0) + count
+        for key, count in other._negative.items():
+            self._negative[key] = self._negative.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> "LogHistogram":
+        """Return an independent histogram with the same parameters and observations."""
+        clone = LogHistogram(self.accuracy, self.min_value, self.max_value)
+        clone.merge(self)
+        return clone
+
+    def clear(self):
+        """Forget every observation."""
+        self._positive.clear()
+        self._negative.clear()
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Exact mean of the observations, or None if there are none."""
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Return an estimate of the `q`-quantile (0 <= q <= 1), or None if the histogram is empty.
+
+        The estimate is within the histogram's relative accuracy of a recorded value and never lies
+        outside [min, max]; the 0- and 1-quantiles are the exact min and max.
+        """
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, qs: Iterable[float]) -> list:
+        """Return estimates for several quantiles with a single pass over the buckets."""
+        qs = list(qs)
+        if any(not 0 <= q <= 1 for q in qs):
+            raise ValueError("quantiles must lie between 0 and 1")
+        if not self.count:
+            return [None] * len(qs)
+
+        # Buckets in ascending value order: negatives (largest magnitude first), zero, positives
+        ordered = [(-self._value(key), count) for key, count in
+                   sorted(self._negative.items(), reverse=True)]
+        if self.zero_count:
+            ordered.append((0.0, self.zero_count))
+        ordered.extend((self._value(key), count) for key, count in sorted(self._positive.items()))
+
+        # The extremes are tracked exactly
+        results = [self.min if q == 0 else self.max if q == 1 else None for q in qs]
+        pending = sorted((i for i, q in enumerate(qs) if 0 < q < 1), key=lambda i: qs[i])
+        if not pending:
+            return results
+        seen = 0
+        position = 0
+        for value, count in ordered:
+            seen += count
+            while position < len(pending) and qs[pending[position]] * (self.count - 1) < seen:
+                results[pending[position]] = min(max(value, self.min), self.max)
+                position += 1
+            if position == len(pending):
+                break
+        return results
+
+    def summary(self, percentiles: Iterable[float] = (50, 90, 99)) -> Dict[str, Any]:
+        """
+        Describe the distribution.
+
+        Parameters:
+            percentiles (iterable of float): Percentiles to report, e.g. (50, 99, 99.9).
+
+        Returns:
+            dict: count, min, max and mean, plus one "pNN" key per percentile (None when empty).
+        """
+        percentiles = list(percentiles)
+        values = self.quantiles(p / 100 for p in percentiles)
+        summary = {
+            "count": self.count,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "mean": self.mean,
+        }
+        for percentile, value in zip(percentiles, values):
+            summary[f"p{percentile:g}".replace(".", "")] = value
+        return summary
@@ -0,0 +1,203 @@
+# genesis_matrix_aggregates.py
+"""
+Phase 3: The Genesis Layer - Incremental Matrix Aggregates
+Awareness Without Recollection
+
+Windowed aggregates that the Consciousness Matrix updates on every perception
+in O(1), so the micro, macro and meta synthesis passes can read a small
+snapshot instead of copying and re-filtering raw sensory memory.
+"""
+
+from collections import deque
+from typing import Dict, Any, Hashable, Iterable, Optional
+
+
+class SlidingCounter:
+    """
+    Counts of keys over the last `size` observations.
+
+    Each observation increments its key; once the window is full the key
+    leaving the window is decremented. Both steps are O(1).
+    """
+
+    def __init__(self, size: int):
+        """
+        Create an empty counter over a window of `size` observations.
+        """
+        if size <= 0:
+            raise ValueError("size must be a positive integer")
+        self.size = size
+        self._keys = deque()
+        self._counts: Dict[Hashable, int] = {}
+
+    def observe(self, key: Hashable):
+        """Record one observation of `key`, expiring the oldest observation if the window is full."""
+        if len(self._keys) == self.size:
+            expired = self._keys.popleft()
+            remaining = self._counts[expired] - 1
+            if remaining:
+                self._counts[expired] = remaining
+            else:
+                del self._counts[expired]
+        self._keys.append(key)
+        self._counts[key] = self._counts.get(key, 0) + 1
+
+    def get(self, key: Hashable) -> int:
+        """Return the number of observations of `key` currently in the window."""
+        return self._counts.get(key, 0)
+
+    def counts(self) -> Dict[Hashable, int]:
+        """Return a copy of the per-key counts currently in the window."""
+        return dict(self._counts)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def clear(self):
+        """Forget every observation."""
+        self._keys.clear()
+        self._counts.clear()
+
+
+class SlidingInterval:
+    """
+    Mean interval between the last `size` timestamps.
+
+    The sum of consecutive deltas telescopes to ``last - first``, so the mean
+    is available in O(1) without storing the deltas.
+    """
+
+    def __init__(self, size: int):
+        """
+        Create an empty tracker over the last `size` timestamps.
+        """
+        if size < 2:
+            raise ValueError("size must be at least 2")
+        self._timestamps = deque(maxlen=size)
+
+    def observe(self, timestamp: float):
+        """Record an arrival at `timestamp`."""
+        self._timestamps.append(timestamp)
+
+    def mean(self) -> Optional[float]:
+        """Return the mean inter-arrival time, or None with fewer than two arrivals."""
+        if len(self._timestamps) < 2:
+            return None
+        return (self._timestamps[-1] - self._timestamps[0]) / (len(self._timestamps) - 1)
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def clear(self):
+        """Forget every arrival."""
+        self._timestamps.clear()
+
+
+class SynthesisAggregates:
+    """
+    The windowed aggregates read by the matrix's synthesis passes.
+
+    - micro: channel activity and severity distribution over the last
+      `micro_window` perceptions.
+    - window: channel activity and severity distribution over the last
+      `window` perceptions (meta consciousness metrics and system harmony).
+    - performance: mean inter-arrival time of the last `metric_window`
+      PERFORMANCE_METRICS perceptions.
+    - agents: activity counts per agent over the last `agent_window`
+      AGENT_ACTIVITY perceptions.
+    """
+
+    def __init__(self, window: int = 100, micro_window: int = 10,
+                 metric_window: int = 20, agent_window: int = 50,
+                 performance_channel: Hashable = None, agent_channel: Hashable = None):
+        """
+        Initialize the aggregate windows.
+
+        Parameters:
+            window (int): Number of recent perceptions summarised for macro and meta synthesis.
+            micro_window (int): Number of recent perceptions summarised for micro synthesis.
+            metric_window (int): Number of recent performance metrics used for interval trends.
+            agent_window (int): Number of recent agent activities used for collaboration counts.
+            performance_channel: Channel whose arrivals feed the interval tracker.
+            agent_channel: Channel whose perceptions feed the per-agent counter.
+        """
+        self.window = window
+        self.metric_window = metric_window
+        self.agent_window = agent_window
+        self.performance_channel = performance_channel
+        self.agent_channel = agent_channel
+
+        self.micro_channels = SlidingCounter(micro_window)
+        self.micro_severities = SlidingCounter(micro_window)
+        self.window_channels = SlidingCounter(window)
+        self.window_severities = SlidingCounter(window)
+        self.performance_intervals = SlidingInterval(metric_window)
+        self.agent_activity = SlidingCounter(agent_window)
+
+    def observe(self, sensation):
+        """
+        Fold one perception into every window in O(1).
+        """
+        channel = sensation.channel.value
+        self.micro_channels.observe(channel)
+        self.micro_severities.observe(sensation.severity)
+        self.window_channels.observe(channel)
+        self.window_severities.observe(sensation.severity)
+
+        if sensation.channel == self.performance_channel:
+            self.performance_intervals.observe(sensation.timestamp)
+        elif sensation.channel == self.agent_channel:
+            self.agent_activity.observe(sensation.data.get("agent_name", "unknown"))
+
+    def rebuild(self, recent: Iterable, performance: Iterable = (), agents: Iterable = ()):
+        """
+        Reset the windows and refill them from already-stored perceptions, oldest first.
+
+        Used after bulk loads, where observing every perception would be wasted work
+        because only the tail of each window survives.
+
+        Parameters:
+            recent: The last `window` perceptions across all channels.
+            performance: The last `metric_window` perceptions on the performance channel.
+            agents: The last `agent_window` perceptions on the agent channel.
+        """
+        self.clear()
+        for sensation in recent:
+            channel = sensation.channel.value
+            self.micro_channels.observe(channel)
+            self.micro_severities.observe(sensation.severity)
+            self.window_channels.observe(channel)
+            self.window_severities.observe(sensation.severity)
+        for sensation in performance:
+            self.performance_intervals.observe(sensation.timestamp)
+        for sensation in agents:
+            self.agent_activity.observe(sensation.data.get("agent_name", "unknown"))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a point-in-time copy of every aggregate.
+
+        The copy is proportional to the number of distinct keys, not to the
+        number of perceptions, so it is cheap to take under the matrix lock.
+
+        Returns:
+            dict: micro and window channel/severity counts, the window size, the
+            mean performance-metric interval and per-agent activity counts.
+        """
+        return {
+            "micro_channel_activity": self.micro_channels.counts(),
+            "micro_severity_distribution": self.micro_severities.counts(),
+            "micro_size": len(self.micro_channels),
+            "window_channel_activity": self.window_channels.counts(),
+            "window_severity_distribution": self.window_severities.counts(),
+            "window_size": len(self.window_channels),
+            "avg_performance_interval": self.performance_intervals.mean(),
+            "agent_activity": self.agent_activity.counts(),
+        }
+
+    def clear(self):
+        """Reset every window."""
+        for aggregate in (self.micro_channels, self.micro_severities, self.window_channels,
+                          self.window_severities, self.performance_intervals,
+                          self.agent_activity):
+            aggregate.clear()
@@ -0,0 +1,141 @@
+# genesis_matrix_coalescer.py
+"""
+Phase 3: The Genesis Layer - Perception Coalescer
+Hearing the Same Thing Twice
+
+Vitals checks, agent heartbeats and repeated permission denials fill sensory
+memory with near-identical perceptions and push out the rare events worth
+remembering. The coalescer folds a perception into the record of an earlier,
+identical one seen within a configurable window instead of storing it again:
+the stored record keeps its first timestamp and payload and gains an
+occurrence count and the timestamp of the latest repeat.
+
+Two perceptions are identical when their channel, source, event type,
+severity, correlation id and payload match. Payload fields listed as
+ignored for a channel (for example a sampling timestamp) are left out of the
+comparison. Payloads are compared by value, nested dicts, lists and sets
+included; a payload holding unhashable values that cannot be frozen is never
+coalesced.
+
+The coalescer only remembers the open record of each fingerprint; it is not
+thread-safe on its own and the Consciousness Matrix only touches it while
+holding its lock.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Any, Container, Hashable, Iterable, Mapping, Optional, Tuple
+
+
+def freeze(value) -> Hashable:
+    """
+    Return a hashable stand-in for a payload value, comparing equal exactly when the values do.
+
+    Raises:
+        TypeError: If the value holds an object that is neither hashable nor a dict, list, tuple or set.
+    """
+    if isinstance(value, dict):
+        return frozenset((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    hash(value)
+    return value
+
+
+class PerceptionCoalescer:
+    """
+    Tracks the open record of each perception fingerprint for a coalescing window.
+    """
+
+    def __init__(self, window: float, channels: Optional[Iterable[Any]] = None,
+                 ignore_fields: Optional[Mapping[Any, Iterable[str]]] = None,
+                 max_open: int = 10000):
+        """
+        Parameters:
+            window (float): Seconds after a record's first occurrence during which identical perceptions fold into it.
+            channels (iterable, optional): Channels coalesced; None coalesces every channel.
+            ignore_fields (mapping, optional): Channel -> top-level payload fields left out of the fingerprint.
+            max_open (int): Maximum number of open records remembered; the oldest is forgotten first.
+        """
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if max_open <= 0:
+            raise ValueError("max_open must be a positive integer")
+        self.window = window
+        self.channels = frozenset(channels) if channels is not None else None
+        self.ignore_fields: Dict[Any, frozenset] = {
+            channel: frozenset(fields) for channel, fields in (ignore_fields or {}).items() if fields
+        }
+        self.max_open = max_open
+        # fingerprint -> (sequence number, first timestamp), oldest opened first
+        self._open: "OrderedDict[Hashable, Tuple[int, float]]" = OrderedDict()
+        self.coalesced = 0
+        self.unhashable = 0
+
+    def fingerprint(self, sensation) -> Optional[Hashable]:
+        """Return the perception's fingerprint, or None if it is not coalesced."""
+        channel = sensation.channel
+        if self.channels is not None and channel not in self.channels:
+            return None
+        data = sensation.data
+        ignored = self.ignore_fields.get(channel)
+        try:
+            if ignored:
+                payload = frozenset((key, freeze(value)) for key, value in data.items()
+                                    if key not in ignored)
+            else:
+                payload = freeze(data)
+        except TypeError:
+            self.unhashable += 1
+            return None
+        return (channel, sensation.source, sensation.event_type, sensation.severity,
+                sensation.correlation_id, payload)
+
+    def lookup(self, fingerprint: Hashable, timestamp: float, held: Container[int]) -> Optional[int]:
+        """
+        Return the sequence number of the open record a perception at `timestamp` folds into, if any.
+
+        Parameters:
+            fingerprint: The perception's fingerprint.
+            timestamp (float): The perception's timestamp.
+            held (container): Sequence numbers still in sensory memory, normally the store; evicted records are not reopened.
+        """
+        entry = self._open.get(fingerprint)
+        if entry is None:
+            return None
+        seq, first_timestamp = entry
+        if not first_timestamp <= timestamp < first_timestamp + self.window or seq not in held:
+            return None
+        self.coalesced += 1
+        return seq
+
+    def opened(self, fingerprint: Hashable, seq: int, timestamp: float):
+        """Remember a newly stored record as the open record of its fingerprint."""
+        open_records = self._open
+        open_records.pop(fingerprint, None)
+        open_records[fingerprint] = (seq, timestamp)
+        # Forget records whose window has passed, then enforce the bound
+        expired = timestamp - self.window
+        while open_records:
+            _, oldest_timestamp = next(iter(open_records.values()))
+            if oldest_timestamp > expired and len(open_records) <= self.max_open:
+                break
+            open_records.popitem(last=False)
+
+    def clear(self):
+        """Forget every open record and reset the counters."""
+        self._open.clear()
+        self.coalesced = 0
+        self.unhashable = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the window, the open record count and the number of perceptions coalesced."""
+        return {
+            "window_seconds": self.window,
+            "channels": sorted(getattr(c, "value", c) for c in self.channels) if self.channels else None,
+            "open_records": len(self._open),
+            "max_open": self.max_open,
+            "coalesced": self.coalesced,
+            "unhashable": self.unhashable,
+        }
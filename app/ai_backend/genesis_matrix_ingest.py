@@ -0,0 +1,168 @@
+# genesis_matrix_ingest.py
+"""
+Phase 3: The Genesis Layer - Matrix Ingestion Primitives
+Many Voices, One Memory
+
+Concurrency building blocks for the Consciousness Matrix's ingestion path:
+
+- ``InstrumentedLock`` is the matrix's re-entrant lock, instrumented so lock
+  convoys show up as measurable wait time.
+- ``ShardedIngestBuffer`` gives every producer thread its own append buffer so
+  perceptions can be recorded without touching the matrix lock; a merger
+  folds the shards into sensory memory in timestamp order.
+"""
+
+import heapq
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, List
+
+
+class InstrumentedLock:
+    """
+    Re-entrant lock that records how long callers wait to acquire it.
+
+    An uncontended acquisition costs one non-blocking attempt; only callers
+    that actually have to wait are timed. Statistics are updated while the
+    lock is held, so they need no extra synchronisation.
+    """
+
+    def __init__(self):
+        """Create an unlocked lock with zeroed statistics."""
+        self._lock = threading.RLock()
+        self.acquisitions = 0
+        self.contended_acquisitions = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """
+        Acquire the lock, timing the wait when it is held by another thread.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        if self._lock.acquire(blocking=False):
+            self.acquisitions += 1
+            return True
+        if not blocking:
+            return False
+
+        started = time.perf_counter()
+        if not self._lock.acquire(timeout=timeout):
+            return False
+        waited = time.perf_counter() - started
+
+        self.acquisitions += 1
+        self.contended_acquisitions += 1
+        self.wait_seconds += waited
+        if waited > self.max_wait_seconds:
+            self.max_wait_seconds = waited
+        return True
+
+    def release(self):
+        """Release the lock."""
+        self._lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return acquisition and wait-time statistics.
+
+        Returns:
+            dict: Total and contended acquisitions, cumulative, mean and maximum wait in seconds.
+        """
+        contended = self.contended_acquisitions
+        return {
+            "acquisitions": self.acquisitions,
+            "contended_acquisitions": contended,
+            "contention_ratio": contended / self.acquisitions if self.acquisitions else 0.0,
+            "wait_seconds_total": self.wait_seconds,
+            "wait_seconds_mean": self.wait_seconds / contended if contended else 0.0,
+            "wait_seconds_max": self.max_wait_seconds,
+        }
+
+
+class ShardedIngestBuffer:
+    """
+    Per-thread append buffers for low-contention ingestion.
+
+    Each producer thread appends to its own deque, which is safe without a
+    lock because deque appends and pops from opposite ends are atomic. The
+    merger drains every shard and interleaves them by timestamp; each shard is
+    already in timestamp order, so a k-way merge restores the global order.
+    """
+
+    def __init__(self, flush_threshold: int = 256):
+        """
+        Parameters:
+            flush_threshold (int): Shard length at which add() asks the caller to merge.
+        """
+        if flush_threshold <= 0:
+            raise ValueError("flush_threshold must be a positive integer")
+        self.flush_threshold = flush_threshold
+        self._local = threading.local()
+        self._shards: List[tuple] = []  # (owner thread, deque)
+        self._registry_lock = threading.Lock()
+        self.flushes = 0
+
+    def _shard(self) -> deque:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = deque()
+            with self._registry_lock:
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def add(self, item) -> bool:
+        """
+        Append `item` to the calling thread's shard.
+
+        Returns:
+            bool: True when the shard has reached the flush threshold.
+        """
+        shard = self._shard()
+        shard.append(item)
+        return len(shard) >= self.flush_threshold
+
+    def drain(self) -> List:
+        """
+        Remove and return every buffered item across all shards, ordered by timestamp.
+
+        Shards belonging to threads that have exited are dropped once empty.
+        """
+        with self._registry_lock:
+            shards = list(self._shards)
+
+        batches = []
+        for _, shard in shards:
+            batch = [shard.popleft() for _ in range(len(shard))]
+            if batch:
+                batches.append(batch)
+
+        with self._registry_lock:
+            self._shards = [(owner, shard) for owner, shard in self._shards
+                            if shard or owner.is_alive()]
+
+        if batches:
+            self.flushes += 1
+        if len(batches) == 1:
+            return batches[0]
+        return list(heapq.merge(*batches, key=lambda item: item.timestamp))
+
+    def pending(self) -> int:
+        """Return the number of items waiting in all shards."""
+        with self._registry_lock:
+            return sum(len(shard) for _, shard in self._shards)
+
+    def shard_count(self) -> int:
+        """Return the number of registered shards."""
+        with self._registry_lock:
+            return len(self._shards)
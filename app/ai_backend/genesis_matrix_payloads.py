@@ -0,0 +1,164 @@
+# genesis_matrix_payloads.py
+"""
+Phase 3: The Genesis Layer - Payload Guard
+Owning What We Remember
+
+Sensory memory used to keep a reference to the caller's payload dict. A
+caller that kept mutating it silently rewrote history, and a single
+oversized payload (a stack dump, a full request body) stayed pinned for as
+long as the event was remembered. The PayloadGuard sits between perceive()
+and sensory memory:
+
+- Payloads are copied on perception. Dicts, lists, tuples and sets are
+  copied recursively and scalars are shared, so later changes made by the
+  caller do not reach the stored event.
+- Payloads whose estimated size exceeds `max_bytes` are cut down to the
+  budget. Fields are kept in order while they fit; a string that does not
+  fit is shortened, and any other field that does not fit is dropped. An
+  added "_truncated" entry records the original size and the dropped fields.
+- With a spill directory, the full payload of an oversized event is first
+  appended to a JSON-lines file there, and the truncated payload carries a
+  "_spilled" reference that load_spilled_payload() reads back.
+"""
+
+import json
+import os
+import sys
+import threading
+from typing import Dict, Any, Optional
+
+from genesis_matrix_retention import estimate_payload_size
+
+SPILL_FILE = "payloads.jsonl"
+
+# Containers nested deeper than this are shared rather than copied
+MAX_COPY_DEPTH = 32
+
+# Shortest useful prefix of a truncated string
+MIN_STRING_KEPT = 16
+
+
+def copy_payload(value, _depth: int = 0):
+    """Return a copy of a payload value: containers are copied recursively, everything else is shared."""
+    if _depth >= MAX_COPY_DEPTH:
+        return value
+    if isinstance(value, dict):
+        return {key: copy_payload(item, _depth + 1) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_payload(item, _depth + 1) for item in value]
+    if isinstance(value, tuple):
+        return tuple(copy_payload(item, _depth + 1) for item in value)
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def load_spilled_payload(reference: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Read back the full payload of a truncated event from its "_spilled" reference.
+
+    Parameters:
+        reference (dict): The event's data["_spilled"] entry.
+
+    Returns:
+        dict: The payload as it was perceived, after a JSON round trip.
+    """
+    with open(reference["path"], "r", encoding="utf-8") as spill:
+        spill.seek(reference["offset"])
+        return json.loads(spill.readline())
+
+
+class PayloadGuard:
+    """
+    Copies perceived payloads and bounds their size before they enter sensory memory.
+    """
+
+    def __init__(self, copy: bool = True, max_bytes: Optional[int] = None,
+                 spill_dir: Optional[str] = None):
+        """
+        Parameters:
+            copy (bool): Whether payloads are copied; without it the caller's dict is stored as is unless truncated.
+            max_bytes (int, optional): Budget for a payload's estimated size in bytes; None leaves payloads unbounded.
+            spill_dir (str, optional): Directory where the full payloads of truncated events are appended.
+        """
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.copy = copy
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self._spill_path = os.path.join(spill_dir, SPILL_FILE) if spill_dir else None
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+        self._spill_lock = threading.Lock()
+
+        self.truncated = 0
+        self.spilled = 0
+        self.spill_errors = 0
+        self.dropped_fields = 0
+        self.bytes_truncated = 0
+
+    def admit(self, data):
+        """
+        Return the payload to store for a perception: a copy, cut down to the byte budget if it exceeds it.
+        """
+        if self.max_bytes is not None and isinstance(data, dict):
+            size = estimate_payload_size(data)
+            if size > self.max_bytes:
+                return self._truncate(data, size)
+        return copy_payload(data) if self.copy else data
+
+    def _truncate(self, data: Dict[str, Any], size: int) -> Dict[str, Any]:
+        """Keep the fields of an oversized payload that fit the budget and note what was cut."""
+        spilled = self._spill(data) if self._spill_path else None
+        marker = {"original_bytes": size, "dropped_fields": []}
+        # The kept fields fit the budget together with a dict sized for all of them
+        remaining = self.max_bytes - sys.getsizeof(dict.fromkeys(data))
+        kept: Dict[str, Any] = {}
+        for key, value in data.items():
+            cost = estimate_payload_size(key) + estimate_payload_size(value)
+            if cost > remaining and isinstance(value, str):
+                room = remaining - estimate_payload_size(key) - sys.getsizeof("")
+                if room >= MIN_STRING_KEPT:
+                    value = value[:room]
+                    cost = estimate_payload_size(key) + estimate_payload_size(value)
+            if cost > remaining:
+                marker["dropped_fields"].append(key)
+                continue
+            kept[key] = copy_payload(value) if self.copy else value
+            remaining -= cost
+
+        kept["_truncated"] = marker
+        if spilled is not None:
+            kept["_spilled"] = spilled
+        self.truncated += 1
+        self.dropped_fields += len(marker["dropped_fields"])
+        self.bytes_truncated += max(0, size - estimate_payload_size(kept))
+        return kept
+
+    def _spill(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Append the full payload to the spill file and return its reference, or None if it cannot be written."""
+        try:
+            line = json.dumps(data, default=str) + "\n"
+            with self._spill_lock:
+                with open(self._spill_path, "a", encoding="utf-8") as spill:
+                    offset = spill.tell()
+                    spill.write(line)
+        except (OSError, TypeError, ValueError) as e:
+            self.spill_errors += 1
+            print(f"⚠️ Payload spill failed: {e}")
+            return None
+        self.spilled += 1
+        return {"path": self._spill_path, "offset": offset}
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the guard's configuration and its truncation and spill counts."""
+        return {
+            "copy": self.copy,
+            "max_bytes": self.max_bytes,
+            "spill_dir": self.spill_dir,
+            "truncated": self.truncated,
+            "spilled": self.spilled,
+            "spill_errors": self.spill_errors,
+            "dropped_fields": self.dropped_fields,
+            "bytes_truncated": self.bytes_truncated,
+        }
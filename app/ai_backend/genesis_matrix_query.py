@@ -0,0 +1,161 @@
+# genesis_matrix_query.py
+"""
+Phase 3: The Genesis Layer - Sensory Query Engine
+Asking The Matrix Precise Questions
+
+Ad-hoc queries over the Consciousness Matrix's sensory memory, for example
+"errors from source X between t1 and t2" or "AGENT_ACTIVITY where
+data.agent_name == 'kai' in the last 5 minutes".
+
+- Time bounds are located by binary search over the store's non-decreasing
+  index times, so only the requested range is visited.
+- Channel and severity filters are answered from the store's indexes and
+  slot metadata before any record is materialised; an equality or membership
+  filter on an indexed payload field (e.g. agent_name) narrows the scan to
+  that field value's index.
+- Source, event type, top-level data fields and arbitrary callables are
+  compiled into a single predicate function.
+- Results stream lazily: the store is read in chunks, each under the
+  caller's lock, so a long scan never holds the lock for the whole range.
+"""
+
+from typing import Dict, Any, Callable, Iterator, Optional
+
+_MISSING = object()
+_COLLECTIONS = (set, frozenset, list, tuple)
+
+
+def compile_predicate(source: Any = None, event_type: Any = None,
+                      data: Optional[Dict[str, Any]] = None,
+                      where: Optional[Callable[[Any], bool]] = None,
+                      since: float = None, until: float = None) -> Optional[Callable[[Any], bool]]:
+    """
+    Compile record-level filters into one predicate over SensoryData.
+
+    Every filter value may be a single value (equality), a set/list/tuple
+    (membership) or a callable taking the field value and returning a bool.
+    Data filters apply to top-level payload fields; a missing field never matches.
+
+    Parameters:
+        source: Filter on the perception's source.
+        event_type: Filter on the perception's event type.
+        data (dict, optional): Field name -> filter for top-level payload fields.
+        where (callable, optional): Extra predicate receiving the whole perception.
+        since (float, optional): Only match timestamps at or after this epoch time.
+        until (float, optional): Only match timestamps at or before this epoch time.
+
+    Returns:
+        callable or None: The predicate, or None when there is nothing to check.
+    """
+    namespace = {"_MISSING": _MISSING}
+    clauses = []
+
+    def bind(value) -> str:
+        name = f"_v{len(namespace)}"
+        namespace[name] = value
+        return name
+
+    def clause(expression: str, value) -> str:
+        if callable(value):
+            return f"{bind(value)}({expression})"
+        if isinstance(value, _COLLECTIONS):
+            try:
+                return f"{expression} in {bind(frozenset(value))}"
+            except TypeError:  # Unhashable members
+                return f"{expression} in {bind(tuple(value))}"
+        return f"{expression} == {bind(value)}"
+
+    if since is not None:
+        clauses.append(f"s.timestamp >= {bind(since)}")
+    if until is not None:
+        clauses.append(f"s.timestamp <= {bind(until)}")
+    if source is not None:
+        clauses.append(clause("s.source", source))
+    if event_type is not None:
+        clauses.append(clause("s.event_type", event_type))
+    for field, value in (data or {}).items():
+        key = bind(field)
+        if callable(value):
+            clauses.append(f"({key} in s.data and {clause(f's.data[{key}]', value)})")
+        else:
+            clauses.append(clause(f"s.data.get({key}, _MISSING)", value))
+    if where is not None:
+        clauses.append(f"{bind(where)}(s)")
+
+    if not clauses:
+        return None
+    # Only generated names are interpolated; every filter value is bound through the namespace
+    return eval(f"lambda s: {' and '.join(clauses)}", namespace)
+
+
+def run_query(store, lock, channel=None, severity: Any = None, source: Any = None,
+              event_type: Any = None, data: Optional[Dict[str, Any]] = None,
+              where: Optional[Callable[[Any], bool]] = None,
+              since: float = None, until: float = None, limit: int = None,
+              newest_first: bool = False, chunk_size: int = 256) -> Iterator:
+    """
+    Lazily yield stored perceptions matching the given filters.
+
+    The sequence window is fixed when iteration starts, so perceptions arriving later are not included.
+
+    Parameters:
+        store (SensoryStore): The sensory memory to read.
+        lock: Context manager guarding the store; held only while each chunk is read.
+        channel (SensoryChannel, optional): Restrict to one channel.
+        severity (str or iterable of str, optional): Restrict to these severity levels.
+        source, event_type, data, where: Record filters, see compile_predicate().
+        since (float, optional): Earliest timestamp (inclusive, epoch seconds).
+        until (float, optional): Latest timestamp (inclusive, epoch seconds).
+        limit (int, optional): Stop after this many results.
+        newest_first (bool): Yield from newest to oldest instead of arrival order.
+        chunk_size (int): Number of candidate events read per lock acquisition.
+
+    Returns:
+        Iterator[SensoryData]: Matching perceptions.
+    """
+    if limit is not None and limit <= 0:
+        return
+    severities = [severity] if isinstance(severity, str) else severity
+    predicate = compile_predicate(source, event_type, data, where, since, until)
+    field, values = _indexed_filter(store, channel, data)
+
+    with lock:
+        window = store.seq_range(since, until)
+    low, high = window.start, window.stop
+    produced = 0
+
+    while low < high:
+        with lock:
+            seqs = store.scan(low, high, channel, severities, reverse=newest_first,
+                              limit=chunk_size, field=field, values=values)
+            if not seqs:
+                return
+            records = [store.get(seq) for seq in seqs]
+
+        # Continue after the last candidate; evicted events are skipped by scan()
+        if newest_first:
+            high = seqs[-1]
+        else:
+            low = seqs[-1] + 1
+
+        for record in records:
+            if predicate is None or predicate(record):
+                yield record
+                produced += 1
+                if limit is not None and produced >= limit:
+                    return
+
+        if len(seqs) < chunk_size:
+            return
+
+
+def _indexed_filter(store, channel, data: Optional[Dict[str, Any]]):
+    """Pick a data filter the store can answer from a payload index, as (field, values)."""
+    if channel is None or not data:
+        return None, None
+    for field in store.indexed_fields(channel):
+        value = data.get(field, _MISSING)
+        if value is _MISSING or callable(value):
+            continue
+        return field, (value if isinstance(value, _COLLECTIONS) else (value,))
+    return None, None
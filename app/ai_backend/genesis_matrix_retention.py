@@ -0,0 +1,85 @@
+# genesis_matrix_retention.py
+"""
+Phase 3: The Genesis Layer - Retention Policies
+Remembering What Matters For As Long As It Matters
+
+Per-channel retention for sensory memory. Without a policy a channel keeps
+whatever the shared ring buffer still holds, so a flood of vitals checks
+pushes out the security events worth keeping for hours. A RetentionPolicy
+bounds a channel by event count, by age and by an estimated payload byte
+budget instead:
+
+- Events of a channel with a policy outlive the shared ring: when the ring
+  overwrites one that its policy still retains, the store moves it to a
+  per-channel archive.
+- Events a policy no longer retains are dropped from every view, even while
+  the ring still holds them.
+
+The count and byte budgets are enforced as events arrive; ages are enforced
+by the matrix's background compactor.
+"""
+
+import sys
+from typing import Dict, Any, Mapping, Optional, Union
+
+RETENTION_REASONS = ("count", "age", "bytes", "memory")
+
+
+class RetentionPolicy:
+    """
+    How much of one channel sensory memory keeps.
+    """
+
+    __slots__ = ("max_count", "max_age", "max_bytes")
+
+    def __init__(self, max_count: Optional[int] = None, max_age: Optional[float] = None,
+                 max_bytes: Optional[int] = None):
+        """
+        Parameters:
+            max_count (int, optional): Maximum number of events kept; defaults to the store's channel capacity.
+            max_age (float, optional): Seconds an event is kept after its timestamp; None keeps events regardless of age.
+            max_bytes (int, optional): Budget for the channel's estimated payload bytes; the oldest events are dropped beyond it.
+        """
+        for name, value in (("max_count", max_count), ("max_age", max_age), ("max_bytes", max_bytes)):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive")
+        self.max_count = max_count
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+
+    def __repr__(self) -> str:
+        return (f"RetentionPolicy(max_count={self.max_count!r}, max_age={self.max_age!r}, "
+                f"max_bytes={self.max_bytes!r})")
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, RetentionPolicy)
+                and (self.max_count, self.max_age, self.max_bytes)
+                == (other.max_count, other.max_age, other.max_bytes))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"max_count": self.max_count, "max_age": self.max_age, "max_bytes": self.max_bytes}
+
+
+def as_policy(policy: Union[RetentionPolicy, Mapping[str, Any]]):
+    """Return `policy` as a RetentionPolicy, building one from a mapping of its arguments."""
+    if isinstance(policy, Mapping):
+        return RetentionPolicy(**policy)
+    return policy
+
+
+def estimate_payload_size(value, _depth: int = 0) -> int:
+    """
+    Estimate the bytes held by a payload: the object itself plus, for containers, their contents.
+
+    Nesting deeper than four levels is counted shallowly, so the estimate stays cheap for any payload.
+    """
+    size = sys.getsizeof(value)
+    if _depth >= 4:
+        return size
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_payload_size(key, _depth + 1) + estimate_payload_size(item, _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_payload_size(item, _depth + 1)
+    return size
@@ -0,0 +1,290 @@
+# genesis_matrix_rollups.py
+"""
+Phase 3: The Genesis Layer - Matrix Rollups
+Remembering the Shape of a Day
+
+Multi-resolution time-series rollups of everything the Consciousness Matrix
+perceives. Raw events age out of sensory memory after `max_memory_size`
+perceptions, but the rollups keep, per time bucket:
+
+- a count per (channel, severity)
+- a LogHistogram (count, min, max, mean and percentiles) per configured
+  numeric payload field, e.g. SYSTEM_VITALS.cpu_percent
+
+Buckets are kept at several resolutions (by default 1 s for five minutes,
+1 min for a day and 1 h for thirty days), each tier holding a fixed number of
+buckets, so memory is bounded however long the matrix runs.
+
+Ingestion only touches the finest tier's open bucket. When a bucket closes it
+is merged into the next tier's bucket, so each perception costs one dict
+update per counted field. A query picks the finest tier whose span covers
+the requested horizon and merges at most that tier's bucket count, plus the
+not-yet-cascaded open buckets of the finer tiers, so its cost does not grow
+with the horizon.
+
+Not thread-safe on its own; the Consciousness Matrix only touches it while
+holding its lock.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Dict, Any, Callable, Iterable, List, Mapping, Optional, Tuple
+
+from genesis_log_histogram import LogHistogram
+
+# (bucket width in seconds, number of buckets kept), finest first
+DEFAULT_ROLLUP_TIERS = ((1.0, 300), (60.0, 1440), (3600.0, 720))
+
+
+class RollupBucket:
+    """Counts and field histograms for one time bucket of one tier."""
+
+    __slots__ = ("index", "counts", "fields")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.counts: Dict[Tuple[Any, str], int] = {}  # (channel, severity) -> count
+        self.fields: Dict[Tuple[Any, str], LogHistogram] = {}  # (channel, field) -> histogram
+
+    def merge(self, other: "RollupBucket"):
+        """Add another bucket's counts and histograms to this one."""
+        counts = self.counts
+        for key, count in other.counts.items():
+            counts[key] = counts.get(key, 0) + count
+        for key, histogram in other.fields.items():
+            mine = self.fields.get(key)
+            if mine is None:
+                self.fields[key] = histogram.copy()
+            else:
+                mine.merge(histogram)
+
+
+class RollupTier:
+    """A fixed number of buckets of one width, newest last."""
+
+    def __init__(self, resolution: float, retention: int):
+        """
+        Parameters:
+            resolution (float): Bucket width in seconds.
+            retention (int): Number of buckets kept; the tier spans `resolution * retention` seconds.
+        """
+        if resolution <= 0 or retention <= 0:
+            raise ValueError("rollup tiers need a positive resolution and retention")
+        self.resolution = resolution
+        self.retention = retention
+        self.buckets: deque = deque(maxlen=retention)
+
+    @property
+    def span(self) -> float:
+        """Seconds of history the tier can hold."""
+        return self.resolution * self.retention
+
+    def bucket_index(self, timestamp: float) -> int:
+        return math.floor(timestamp / self.resolution)
+
+
+class MatrixRollups:
+    """
+    Tiered, bounded rollups of perception counts and numeric payload fields.
+    """
+
+    def __init__(self, tiers: Iterable[Tuple[float, int]] = DEFAULT_ROLLUP_TIERS,
+                 fields: Optional[Mapping[Any, Iterable[str]]] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Create empty rollups.
+
+        Parameters:
+            tiers (iterable): (bucket width in seconds, buckets kept) pairs. Each width must be a multiple of the previous one.
+            fields (mapping, optional): Channel -> numeric payload fields summarised with a LogHistogram.
+            clock (callable): Wall-clock time source used to place query windows.
+        """
+        self.tiers: List[RollupTier] = [RollupTier(resolution, retention)
+                                        for resolution, retention in sorted(tiers)]
+        if not self.tiers:
+            raise ValueError("at least one rollup tier is required")
+        for finer, coarser in zip(self.tiers, self.tiers[1:]):
+            ratio = coarser.resolution / finer.resolution
+            if abs(ratio - round(ratio)) > 1e-9:
+                raise ValueError("each rollup resolution must be a multiple of the previous one")
+        self.fields: Dict[Any, Tuple[str, ...]] = {
+            channel: tuple(names) for channel, names in (fields or {}).items() if names
+        }
+        self._clock = clock
+        self.recorded = 0
+
+    def record(self, sensation):
+        """Count a perception and its finite numeric fields in the finest tier's current bucket."""
+        tier = self.tiers[0]
+        buckets = tier.buckets
+        index = tier.bucket_index(sensation.timestamp)
+        if not buckets or index > buckets[-1].index:
+            self._open(0, RollupBucket(index))
+        # Late perceptions are counted in the open bucket
+        bucket = buckets[-1]
+
+        channel = sensation.channel
+        counts = bucket.counts
+        key = (channel, sensation.severity)
+        counts[key] = counts.get(key, 0) + 1
+        names = self.fields.get(channel)
+        if names:
+            data = sensation.data
+            for name in names:
+                value = data.get(name)
+                if value.__class__ is not float and (value.__class__ is bool
+                                                     or not isinstance(value, (int, float))):
+                    continue
+                if not math.isfinite(value):
+                    continue
+                histogram = bucket.fields.get((channel, name))
+                if histogram is None:
+                    histogram = bucket.fields[(channel, name)] = LogHistogram()
+                histogram.record(value)
+        self.recorded += 1
+
+    def _open(self, level: int, bucket: RollupBucket):
+        """Append a new open bucket to a tier, cascading the bucket it closes into the next tier."""
+        buckets = self.tiers[level].buckets
+        if buckets and level + 1 < len(self.tiers):
+            self._absorb(level + 1, buckets[-1], self.tiers[level].resolution)
+        buckets.append(bucket)
+
+    def _absorb(self, level: int, closed: RollupBucket, resolution: float):
+        tier = self.tiers[level]
+        index = tier.bucket_index(closed.index * resolution)
+        buckets = tier.buckets
+        if not buckets or index > buckets[-1].index:
+            self._open(level, RollupBucket(index))
+        buckets[-1].merge(closed)
+
+    def clear(self):
+        """Forget every bucket."""
+        for tier in self.tiers:
+            tier.buckets.clear()
+        self.recorded = 0
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def tier_for(self, window: float) -> RollupTier:
+        """Return the finest tier whose span covers `window` seconds (the coarsest tier if none does)."""
+        for tier in self.tiers:
+            if tier.span >= window:
+                return tier
+        return self.tiers[-1]
+
+    def window(self, window: float,
+               now: float = None) -> Tuple[RollupTier, List[Tuple[float, RollupBucket]]]:
+        """
+        Return the tier serving a window and the (resolution, bucket) pairs overlapping the last `window` seconds.
+
+        The open buckets of finer tiers, which have not yet been merged into
+        the chosen tier, are included so the newest perceptions are counted.
+        Buckets are included whole, so the window is rounded out to the tier's resolution.
+        """
+        if window <= 0:
+            raise ValueError("window must be positive")
+        now = self._clock() if now is None else now
+        since = now - window
+        tier = self.tier_for(window)
+        level = self.tiers.index(tier)
+
+        selected = []
+        for bucket in reversed(tier.buckets):
+            if (bucket.index + 1) * tier.resolution <= since:
+                break
+            selected.append((tier.resolution, bucket))
+        selected.reverse()
+        for finer in self.tiers[:level]:
+            if finer.buckets:
+                pending = finer.buckets[-1]
+                if (pending.index + 1) * finer.resolution > since:
+                    selected.append((finer.resolution, pending))
+        return tier, selected
+
+    def summary(self, window: float, channel=None, severities: Iterable[str] = None,
+                fields: Iterable[str] = (), percentiles: Iterable[float] = (50, 90, 99),
+                now: float = None) -> Dict[str, Any]:
+        """
+        Summarise the last `window` seconds.
+
+        Parameters:
+            window (float): Horizon in seconds.
+            channel (SensoryChannel, optional): Restrict counts and fields to one channel.
+            severities (iterable of str, optional): Restrict counts to these severities.
+            fields (iterable of str): Numeric fields of `channel` to summarise.
+            percentiles (iterable of float): Percentiles reported for each field.
+            now (float, optional): End of the window; defaults to the clock.
+
+        Returns:
+            dict: The window and resolution used, the number of buckets merged, the total count,
+            counts per channel and per severity, and a LogHistogram summary per requested field.
+        """
+        tier, buckets = self.window(window, now)
+        severities = set(severities) if severities is not None else None
+        fields = list(fields)
+
+        total = 0
+        by_channel: Dict[str, int] = {}
+        by_severity: Dict[str, int] = {}
+        histograms = {name: LogHistogram() for name in fields}
+        for _, bucket in buckets:
+            for (bucket_channel, severity), count in bucket.counts.items():
+                if channel is not None and bucket_channel != channel:
+                    continue
+                if severities is not None and severity not in severities:
+                    continue
+                total += count
+                name = getattr(bucket_channel, "value", bucket_channel)
+                by_channel[name] = by_channel.get(name, 0) + count
+                by_severity[severity] = by_severity.get(severity, 0) + count
+            for name in fields:
+                histogram = bucket.fields.get((channel, name))
+                if histogram is not None:
+                    histograms[name].merge(histogram)
+
+        return {
+            "window_seconds": window,
+            "resolution_seconds": tier.resolution,
+            "buckets": len(buckets),
+            "total": total,
+            "by_channel": by_channel,
+            "by_severity": by_severity,
+            "fields": {name: histogram.summary(percentiles) for name, histogram in histograms.items()},
+        }
+
+    def series(self, window: float, channel=None, severities: Iterable[str] = None,
+               now: float = None) -> Dict[str, Any]:
+        """
+        Return per-bucket counts over the last `window` seconds at the serving tier's resolution.
+
+        Returns:
+            dict: The resolution used and a list of {"start", "count"} points, oldest first, for buckets with perceptions.
+        """
+        tier, buckets = self.window(window, now)
+        severities = set(severities) if severities is not None else None
+        points: Dict[int, int] = {}
+        for resolution, bucket in buckets:
+            count = sum(value for (bucket_channel, severity), value in bucket.counts.items()
+                        if (channel is None or bucket_channel == channel)
+                        and (severities is None or severity in severities))
+            # Finer open buckets fold into the tier bucket that contains them
+            start = tier.bucket_index(bucket.index * resolution)
+            points[start] = points.get(start, 0) + count
+        return {
+            "window_seconds": window,
+            "resolution_seconds": tier.resolution,
+            "points": [{"start": index * tier.resolution, "count": count}
+                       for index, count in sorted(points.items()) if count],
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the configured tiers with their bucket occupancy."""
+        return {
+            "recorded": self.recorded,
+            "tiers": [{"resolution_seconds": tier.resolution, "retention": tier.retention,
+                       "buckets": len(tier.buckets)} for tier in self.tiers],
+        }
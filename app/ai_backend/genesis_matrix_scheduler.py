@@ -0,0 +1,246 @@
+# genesis_matrix_scheduler.py
+"""
+Phase 3: The Genesis Layer - Synthesis Scheduler
+One Heartbeat For Every Rhythm
+
+A single-threaded, heap-based scheduler for the Consciousness Matrix's
+periodic synthesis tiers. Ticks are anchored to a fixed cadence rather than
+to the end of the previous run, so they do not drift by the synthesis
+runtime; ticks that could not run on time are skipped and counted; and an
+Event wakes the scheduler immediately on stop or reschedule instead of
+leaving a thread asleep for a whole interval.
+"""
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from typing import Dict, Any, Callable, Optional
+
+
+class _Job:
+    """Bookkeeping for one scheduled callback."""
+
+    __slots__ = ("name", "interval", "callback", "jitter", "next_tick", "runs", "missed_ticks",
+                 "errors", "last_run", "last_duration", "max_lateness", "generation")
+
+    def __init__(self, name: str, interval: float, callback: Callable[[], Any], jitter: float):
+        self.name = name
+        self.interval = interval
+        self.callback = callback
+        self.jitter = jitter
+        self.next_tick = 0.0
+        self.runs = 0
+        self.missed_ticks = 0
+        self.errors = 0
+        self.last_run: Optional[float] = None
+        self.last_duration: Optional[float] = None
+        self.max_lateness = 0.0
+        self.generation = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "interval": self.interval,
+            "jitter": self.jitter,
+            "runs": self.runs,
+            "missed_ticks": self.missed_ticks,
+            "errors": self.errors,
+            "last_run": self.last_run,
+            "last_duration": self.last_duration,
+            "max_lateness": self.max_lateness,
+        }
+
+
+class SynthesisScheduler:
+    """
+    Runs named periodic callbacks on one background thread.
+
+    Each job's k-th tick is due at ``start + k * interval``; jitter adds a
+    random delay in ``[0, jitter]`` to an individual firing without moving the
+    cadence. If a job falls more than one interval behind (for example while
+    another job was running), the overdue ticks are skipped and reported as
+    missed rather than run back to back.
+    """
+
+    def __init__(self, name: str = "genesis-synthesis",
+                 clock: Callable[[], float] = time.monotonic,
+                 rng: Optional[random.Random] = None):
+        """
+        Parameters:
+            name (str): Name given to the scheduler thread.
+            clock (callable): Monotonic time source.
+            rng (random.Random, optional): Source of jitter; a private instance is used when omitted.
+        """
+        self.name = name
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._jobs: Dict[str, _Job] = {}
+        self._heap = []  # (fire_at, order, generation, name)
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, name: str, interval: float, callback: Callable[[], Any],
+                 jitter: float = 0.0):
+        """
+        Add or replace a periodic job. The first tick is due one interval from now.
+
+        Parameters:
+            name (str): Unique job name.
+            interval (float): Seconds between ticks.
+            callback (callable): Invoked with no arguments on each tick.
+            jitter (float): Maximum random delay in seconds added to each firing.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if jitter < 0 or jitter >= interval:
+            raise ValueError("jitter must be non-negative and smaller than the interval")
+
+        job = _Job(name, interval, callback, jitter)
+        with self._lock:
+            previous = self._jobs.get(name)
+            if previous is not None:
+                job.generation = previous.generation + 1
+            job.next_tick = self._clock() + interval
+            self._jobs[name] = job
+            self._push(job)
+        self._wake.set()
+
+    def set_interval(self, name: str, interval: float):
+        """Change a job's interval, keeping its callback, jitter and statistics."""
+        with self._lock:
+            job = self._jobs[name]
+            if interval <= 0 or job.jitter >= interval:
+                raise ValueError("interval must be positive and larger than the job's jitter")
+            job.interval = interval
+            job.generation += 1
+            job.next_tick = self._clock() + interval
+            self._push(job)
+        self._wake.set()
+
+    def unschedule(self, name: str):
+        """Remove a job; unknown names are ignored."""
+        with self._lock:
+            self._jobs.pop(name, None)
+        self._wake.set()
+
+    def start(self):
+        """
+        Start the scheduler thread if it is not already running.
+
+        Every job's cadence is re-anchored to the start time, so time spent stopped is not reported as missed ticks.
+        """
+        if self.running:
+            return
+        with self._lock:
+            now = self._clock()
+            for job in self._jobs.values():
+                job.generation += 1
+                job.next_tick = now + job.interval
+                self._push(job)
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> bool:
+        """
+        Stop the scheduler thread, waking it immediately.
+
+        A callback that is already running finishes first; no further ticks start.
+
+        Returns:
+            bool: True if the thread has exited.
+        """
+        self._stopping.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        return not self.running
+
+    @property
+    def running(self) -> bool:
+        """Whether the scheduler thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def jobs(self):
+        """Return the names of the scheduled jobs."""
+        with self._lock:
+            return list(self._jobs)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return per-job statistics.
+
+        Returns:
+            dict: For each job, its interval and jitter, completed runs, missed ticks, callback errors,
+            last run time (clock seconds), last run duration and the worst lateness of a tick in seconds.
+        """
+        with self._lock:
+            return {name: job.stats() for name, job in self._jobs.items()}
+
+    def _push(self, job: _Job):
+        """Queue the job's next firing. Caller must hold the lock."""
+        fire_at = job.next_tick
+        if job.jitter:
+            fire_at += self._rng.uniform(0.0, job.jitter)
+        heapq.heappush(self._heap, (fire_at, next(self._order), job.generation, job.name))
+
+    def _next_due(self) -> Optional[_Job]:
+        """Pop the next job whose firing is due, discarding stale heap entries; None if nothing is due."""
+        with self._lock:
+            while self._heap:
+                fire_at, _, generation, name = self._heap[0]
+                job = self._jobs.get(name)
+                if job is None or job.generation != generation:
+                    heapq.heappop(self._heap)  # Unscheduled or rescheduled
+                    continue
+                if fire_at > self._clock():
+                    return None
+                heapq.heappop(self._heap)
+                return job
+            return None
+
+    def _wait_time(self) -> Optional[float]:
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - self._clock())
+
+    def _run(self):
+        while not self._stopping.is_set():
+            job = self._next_due()
+            if job is None:
+                self._wake.wait(self._wait_time())
+                self._wake.clear()
+                continue
+
+            generation = job.generation
+            started = self._clock()
+            lateness = started - job.next_tick
+            try:
+                job.callback()
+            except Exception as e:
+                job.errors += 1
+                print(f"❌ Scheduled job {job.name} failed: {e}")
+            finished = self._clock()
+
+            with self._lock:
+                job.runs += 1
+                job.last_run = started
+                job.last_duration = finished - started
+                job.max_lateness = max(job.max_lateness, lateness)
+                if job.generation != generation or self._jobs.get(job.name) is not job:
+                    continue  # Rescheduled or removed while running
+
+                # Advance on the fixed cadence; skip ticks that are already overdue
+                next_tick = job.next_tick + job.interval
+                if next_tick <= finished:
+                    missed = int((finished - next_tick) // job.interval) + 1
+                    job.missed_ticks += missed
+                    next_tick += missed * job.interval
+                job.next_tick = next_tick
+                self._push(job)
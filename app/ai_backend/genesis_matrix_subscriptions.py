@@ -0,0 +1,210 @@
+# genesis_matrix_subscriptions.py
+"""
+Phase 3: The Genesis Layer - Matrix Subscriptions
+Being Told Instead of Asking
+
+Push-based fan-out of perceptions to subscribers such as the Conference Room
+SSE stream. Every stored perception carries its sensory memory sequence
+number; the matrix publishes (seq, perception) to each subscription whose
+channel filter matches, right after storing it.
+
+- Each subscription has its own bounded queue. When a consumer falls behind,
+  the queue overflows according to its policy (drop the oldest or the newest
+  event) and the drops are counted. Publishing never waits for a consumer.
+- Consumers block on their own queue, not on the matrix.
+- The sequence number of the last consumed event is the subscription's
+  cursor; a client that reconnects can subscribe again from that cursor and
+  is first sent the events it missed that are still in sensory memory.
+"""
+
+import itertools
+import threading
+from collections import deque
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest")
+
+Delivery = Tuple[int, Any]  # (sequence number, SensoryData)
+
+
+class Subscription:
+    """
+    One subscriber's bounded queue of (sequence number, perception) pairs.
+
+    Created by ConsciousnessMatrix.subscribe(); safe to consume from one thread
+    while the matrix publishes from others.
+    """
+
+    def __init__(self, subscription_id: int, channels=None, capacity: int = 1024,
+                 overflow: str = "drop_oldest"):
+        """
+        Parameters:
+            subscription_id (int): Identifier assigned by the hub.
+            channels (iterable of SensoryChannel, optional): Channels delivered; None delivers every channel.
+            capacity (int): Maximum number of undelivered events held.
+            overflow (str): "drop_oldest" discards the oldest queued event when full; "drop_newest" discards the incoming one.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}'. Available: {list(OVERFLOW_POLICIES)}")
+        self.id = subscription_id
+        self.channels = frozenset(channels) if channels is not None else None
+        self.capacity = capacity
+        self.overflow = overflow
+
+        self._queue: deque = deque()
+        self._ready = threading.Event()
+        self._closed = False
+        self.cursor: Optional[int] = None  # Sequence number of the last event handed to the consumer
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.missed = 0  # Events requested on resume that had already left sensory memory
+
+    def wants(self, channel) -> bool:
+        """Whether events of `channel` are delivered to this subscription."""
+        return self.channels is None or channel in self.channels
+
+    def publish(self, seq: int, sensation):
+        """Queue an event without blocking, applying the overflow policy when the queue is full."""
+        if self._closed:
+            return
+        self.published += 1
+        queue = self._queue
+        if len(queue) >= self.capacity:
+            self.dropped += 1
+            if self.overflow == "drop_newest":
+                return
+            try:
+                queue.popleft()
+            except IndexError:  # The consumer emptied the queue meanwhile
+                self.dropped -= 1
+        queue.append((seq, sensation))
+        self._ready.set()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Delivery]:
+        """
+        Return the next (sequence number, perception), waiting up to `timeout` seconds.
+
+        Returns:
+            tuple or None: The next event, or None on timeout or once the subscription is closed and drained.
+        """
+        while True:
+            try:
+                item = self._queue.popleft()
+            except IndexError:
+                if self._closed or not self._ready.wait(timeout):
+                    return None
+                self._ready.clear()
+                continue
+            self.cursor = item[0]
+            self.delivered += 1
+            return item
+
+    def drain(self, max_items: Optional[int] = None, timeout: Optional[float] = None) -> List[Delivery]:
+        """
+        Wait up to `timeout` seconds for at least one event, then return every queued event (at most `max_items`).
+        """
+        first = self.get(timeout)
+        if first is None:
+            return []
+        items = [first]
+        while max_items is None or len(items) < max_items:
+            item = self.get(0)
+            if item is None:
+                break
+            items.append(item)
+        return items
+
+    def __iter__(self) -> Iterator[Delivery]:
+        """Yield events as they arrive until the subscription is closed."""
+        while True:
+            item = self.get()
+            if item is None:
+                return
+            yield item
+
+    def close(self):
+        """Stop accepting events and wake a blocked consumer; queued events can still be drained."""
+        self._closed = True
+        self._ready.set()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def pending(self) -> int:
+        """Number of queued, undelivered events."""
+        return len(self._queue)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the subscription's filter, cursor and delivery counters."""
+        return {
+            "id": self.id,
+            "channels": sorted(getattr(c, "value", c) for c in self.channels) if self.channels else None,
+            "capacity": self.capacity,
+            "overflow": self.overflow,
+            "cursor": self.cursor,
+            "pending": self.pending(),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "missed": self.missed,
+            "closed": self._closed,
+        }
+
+
+class SubscriptionHub:
+    """
+    The set of live subscriptions of a matrix.
+
+    Registration and publishing happen under the matrix lock, so each
+    subscriber sees events in sequence order and a resumed subscription's
+    backlog joins its live events without gaps or duplicates.
+    """
+
+    def __init__(self):
+        self._subscriptions: Dict[int, Subscription] = {}
+        self._ids = itertools.count(1)
+        # Publishing iterates this tuple, replaced on every change, so a
+        # subscriber closing concurrently never invalidates the iteration
+        self._active: Tuple[Subscription, ...] = ()
+        self.removed_dropped = 0
+
+    def __bool__(self) -> bool:
+        return bool(self._active)
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def add(self, channels=None, capacity: int = 1024, overflow: str = "drop_oldest") -> Subscription:
+        subscription = Subscription(next(self._ids), channels, capacity, overflow)
+        self._subscriptions[subscription.id] = subscription
+        self._active = tuple(self._subscriptions.values())
+        return subscription
+
+    def remove(self, subscription: Subscription):
+        subscription.close()
+        if self._subscriptions.pop(subscription.id, None) is not None:
+            self.removed_dropped += subscription.dropped
+            self._active = tuple(self._subscriptions.values())
+
+    def publish(self, seq: int, sensation):
+        """Fan an event out to every matching subscription."""
+        channel = sensation.channel
+        for subscription in self._active:
+            if subscription.wants(channel):
+                subscription.publish(seq, sensation)
+
+    def subscriptions(self) -> Iterable[Subscription]:
+        return self._active
+
+    def stats(self) -> Dict[str, Any]:
+        """Return per-subscription statistics and drop totals."""
+        subscriptions = [subscription.stats() for subscription in self._active]
+        return {
+            "subscriptions": subscriptions,
+            "active": len(subscriptions),
+            "dropped_total": self.removed_dropped + sum(s["dropped"] for s in subscriptions),
+        }
@@ -0,0 +1,380 @@
+# genesis_metrics.py
+"""
+Phase 3: The Genesis Layer - Metrics Registry
+Counting Without Looking
+
+The only windows into the Genesis Layer used to be JSON endpoints that
+build large dicts: the awareness view serialises the latest event of every
+channel, and the reports take the matrix lock. A scraper polling those
+every few seconds competes with perception. The MetricsRegistry exposes
+plain numbers instead, in the Prometheus text format (or OpenMetrics when
+the scraper asks for it):
+
+- Counter, Gauge and Histogram metrics are updated where things happen,
+  such as model calls and bridge requests. Each metric has its own small
+  lock; no caller ever waits on the matrix lock to update or read one.
+- Collectors are called at scrape time for components that already count
+  what they do, such as the Consciousness Matrix and the Ethical Governor.
+  A collector only reads counters those components maintain; it must not
+  take their locks or serialise event payloads.
+
+`metrics_registry` is the process-wide registry the Flask apps serve at
+/metrics.
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Upper bounds in seconds suited to model calls, from fast fallbacks to long generations
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRIC_TYPES = ("counter", "gauge", "histogram")
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if value != value:
+        return "NaN"
+    if isinstance(value, int) or float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in labels.items())
+    return "{" + pairs + "}"
+
+
+class MetricFamily:
+    """
+    One metric name with its type, help text and samples, as gathered for a scrape.
+    """
+
+    __slots__ = ("name", "type", "help", "samples")
+
+    def __init__(self, name: str, metric_type: str, help_text: str = ""):
+        """
+        Parameters:
+            name (str): Metric name; counters are named without their "_total" suffix.
+            metric_type (str): "counter", "gauge" or "histogram".
+            help_text (str): One-line description shown in the HELP line.
+        """
+        if metric_type not in METRIC_TYPES:
+            raise ValueError(f"unknown metric type: {metric_type}")
+        self.name = name
+        self.type = metric_type
+        self.help = help_text
+        self.samples: List[Tuple[str, Dict[str, Any], float]] = []
+
+    def add(self, value: float, labels: Optional[Dict[str, Any]] = None, suffix: Optional[str] = None):
+        """
+        Add a sample. Counter samples get the "_total" suffix unless another one is given.
+        """
+        if suffix is None:
+            suffix = "_total" if self.type == "counter" else ""
+        self.samples.append((suffix, labels or {}, value))
+        return self
+
+
+class _Metric:
+    """Base of the registry's own metrics: a name, help text, label names and per-label-set values."""
+
+    type = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple, Any] = {}
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError as e:
+            raise ValueError(f"{self.name} is missing label {e}") from None
+
+    def _labels(self, key: Tuple) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def collect(self) -> MetricFamily:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """
+    A value that only goes up, such as requests served.
+    """
+
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        """Add `amount` (non-negative) to the counter for the given labels."""
+        if amount < 0:
+            raise ValueError("counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        """Return the current count for the given labels."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.type, self.help)
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            family.add(value, self._labels(key))
+        return family
+
+
+class Gauge(_Metric):
+    """
+    A value that can go up and down, such as requests in flight.
+    """
+
+    type = "gauge"
+
+    def set(self, value: float, **labels):
+        """Set the gauge for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        """Add `amount` to the gauge for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        """Subtract `amount` from the gauge for the given labels."""
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        """Return the current value for the given labels."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.type, self.help)
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            family.add(value, self._labels(key))
+        return family
+
+
+class Histogram(_Metric):
+    """
+    Observations counted into cumulative buckets, with their sum and count, such as request durations.
+    """
+
+    type = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Parameters:
+            buckets (sequence): Increasing upper bounds; a +Inf bucket is always added.
+        """
+        super().__init__(name, help_text, labelnames)
+        bounds = sorted(float(bound) for bound in buckets if bound != math.inf)
+        if not bounds:
+            raise ValueError("a histogram needs at least one finite bucket")
+        self.buckets = tuple(bounds)
+
+    def observe(self, value: float, **labels):
+        """Record one observation for the given labels."""
+        key = self._key(labels)
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = position
+                break
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                # Per-bucket counts (the last one is +Inf), then sum and count
+                series = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall-clock duration of the `with` block, even when it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels) -> int:
+        """Return the number of observations for the given labels."""
+        with self._lock:
+            series = self._values.get(self._key(labels))
+            return series[2] if series else 0
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.type, self.help)
+        with self._lock:
+            values = [(key, list(series[0]), series[1], series[2])
+                      for key, series in self._values.items()]
+        for key, counts, total, count in values:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                family.add(cumulative, {**labels, "le": _format_value(bound)}, "_bucket")
+            family.add(total, labels, "_sum")
+            family.add(count, labels, "_count")
+        return family
+
+
+class MetricsRegistry:
+    """
+    Holds metrics and scrape-time collectors, and renders them in the Prometheus or OpenMetrics text format.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[MetricFamily]]] = {}
+        self.collector_errors = 0
+
+    def _register(self, cls, name: str, help_text: str, labelnames: Sequence[str], **options):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, labelnames, **options)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"metric {name} is already registered as a different {metric.type}")
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        """
+        Return the counter called `name`, creating it on first use.
+
+        Parameters:
+            name (str): Metric name without the "_total" suffix.
+            help_text (str): One-line description.
+            labelnames (sequence): Names of the labels every update must give.
+        """
+        return self._register(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Return the gauge called `name`, creating it on first use."""
+        return self._register(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Return the histogram called `name`, creating it on first use with the given buckets."""
+        return self._register(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def register_collector(self, key: str, collector: Callable[[], Iterable[MetricFamily]]):
+        """
+        Call `collector` on every scrape; it returns the MetricFamily objects to expose.
+
+        Registering another collector under the same key replaces the previous one. Families of the same name from several collectors are merged, so instances should tell their samples apart with a label.
+        """
+        with self._lock:
+            self._collectors[key] = collector
+
+    def unregister_collector(self, key: str):
+        """Stop calling the collector registered under `key`."""
+        with self._lock:
+            self._collectors.pop(key, None)
+
+    def collect(self) -> List[MetricFamily]:
+        """
+        Gather every metric and collector family, merged by name and sorted for stable output.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.items())
+
+        families: Dict[str, MetricFamily] = {}
+
+        def merge(family: MetricFamily):
+            existing = families.get(family.name)
+            if existing is None:
+                families[family.name] = family
+            elif existing.type == family.type:
+                existing.samples.extend(family.samples)
+
+        for metric in metrics:
+            merge(metric.collect())
+        for key, collector in collectors:
+            try:
+                for family in collector():
+                    merge(family)
+            except Exception as e:
+                self.collector_errors += 1
+                print(f"⚠️ Metrics collector {key} failed: {e}")
+        return [families[name] for name in sorted(families)]
+
+    def render(self, openmetrics: bool = False) -> str:
+        """
+        Render every metric in the Prometheus text exposition format, or in OpenMetrics.
+
+        Parameters:
+            openmetrics (bool): Use the OpenMetrics format, which names counter families without "_total" and ends with "# EOF".
+
+        Returns:
+            str: The exposition text.
+        """
+        lines = []
+        for family in self.collect():
+            name = family.name
+            if family.type == "counter" and not openmetrics:
+                name += "_total"
+            if family.help:
+                lines.append(f"# HELP {name} {_escape_help(family.help)}")
+            lines.append(f"# TYPE {name} {family.type}")
+            for suffix, labels, value in family.samples:
+                lines.append(f"{family.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def exposition(self, accept: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Render for a scraper, choosing OpenMetrics when its Accept header asks for it.
+
+        Parameters:
+            accept (str, optional): The request's Accept header.
+
+        Returns:
+            tuple: The exposition text and its content type.
+        """
+        if accept and "application/openmetrics-text" in accept:
+            return self.render(openmetrics=True), OPENMETRICS_CONTENT_TYPE
+        return self.render(), PROMETHEUS_CONTENT_TYPE
+
+
+# Process-wide registry served by the Flask apps at /metrics
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,333 @@
+# genesis_security_analytics.py
+"""
+Phase 3: The Genesis Layer - Vectorized Security Analytics
+Vigilance at Scale
+
+The security assessment and threat status reports used to pull recent
+events out of sensory memory and filter and sum them one payload at a time.
+SecurityAnalytics keeps the few payload fields those reports read in NumPy
+columns, one fixed-capacity ring per security channel, filled as events are
+stored:
+
+- threat detections: confidence, threat level, mitigation flag and threat type
+- access control: whether access was denied
+- encryption activity: whether the operation failed
+- security events: occurrence counts only
+
+Threat-level sums, failed-access and crypto-failure counts and the active
+threat mask are then a handful of array operations over any window up to
+the ring capacity. Coalesced records are weighted by their occurrence count,
+as in the Python synthesis. Only the newest MAX_LISTED_THREATS active
+threats are turned into dicts; the count, total occurrences and highest
+level of the active threats cover all of them.
+
+The columns mirror what sensory memory holds: every read is bounded by the
+number of events the store still holds on the channel. The class is not
+thread-safe on its own; the Consciousness Matrix only touches it while
+holding its lock. Without NumPy, SECURITY_ANALYTICS_AVAILABLE is False and
+the matrix uses its Python synthesis instead.
+"""
+
+import math
+from typing import Dict, Any, Callable, List, Optional
+
+try:
+    import numpy as np
+    SECURITY_ANALYTICS_AVAILABLE = True
+except ImportError:
+    np = None
+    SECURITY_ANALYTICS_AVAILABLE = False
+
+# Threat levels in increasing order of severity; other level names rank 0
+THREAT_LEVELS = {"low": 1, "medium": 2, "high": 3, "critical": 4}
+
+# Active threats listed individually in a report; all of them are counted
+MAX_LISTED_THREATS = 100
+
+
+def _as_confidence(value) -> float:
+    """Return a payload confidence as a float, NaN when it is missing or not a number."""
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class _ColumnRing:
+    """
+    Fixed-capacity ring of per-event columns for one channel, addressed by sequence number.
+    """
+
+    def __init__(self, capacity: int, columns: Dict[str, Any]):
+        self.capacity = capacity
+        self.written = 0
+        self.counts = np.ones(capacity, dtype=np.int64)
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in columns.items()}
+        self.labels: List[Optional[str]] = [None] * capacity  # Read only for rows reported individually
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self._positions: Dict[int, int] = {}  # seq -> absolute row number
+        self._seqs = np.full(capacity, -1, dtype=np.int64)
+
+    def append(self, seq: int, timestamp: float, values: Dict[str, Any], label: Optional[str] = None):
+        position = self.written % self.capacity
+        if self.written >= self.capacity:
+            self._positions.pop(int(self._seqs[position]), None)
+        self._seqs[position] = seq
+        self._positions[seq] = self.written
+        self.counts[position] = 1
+        self.timestamps[position] = timestamp
+        for name, value in values.items():
+            self.columns[name][position] = value
+        self.labels[position] = label
+        self.written += 1
+
+    def add_occurrence(self, seq: int):
+        row = self._positions.get(seq)
+        if row is not None:
+            self.counts[row % self.capacity] += 1
+
+    def window(self, size: int, array):
+        """Return the last `size` rows of `array`, oldest first."""
+        size = min(size, self.written, self.capacity)
+        if size <= 0:
+            return array[:0]
+        end = self.written % self.capacity or self.capacity
+        start = end - size
+        if start >= 0:
+            return array[start:end]
+        return np.concatenate((array[start:], array[:end]))
+
+    def clear(self):
+        self.written = 0
+        self._positions.clear()
+        self._seqs.fill(-1)
+        self.labels = [None] * self.capacity
+
+
+class SecurityAnalytics:
+    """
+    Columnar windows over the security channels and the vectorized reports computed from them.
+    """
+
+    def __init__(self, capacity: int = 10000, threat_channel=None, access_channel=None,
+                 crypto_channel=None, security_channel=None):
+        """
+        Parameters:
+            capacity (int): Events kept per security channel, the largest window the reports can cover.
+            threat_channel: Channel of threat detections.
+            access_channel: Channel of access control decisions.
+            crypto_channel: Channel of encryption activity.
+            security_channel: Channel of general security events.
+        """
+        if not SECURITY_ANALYTICS_AVAILABLE:
+            raise RuntimeError("SecurityAnalytics requires numpy")
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        self.capacity = capacity
+        self.threat_channel = threat_channel
+        self.access_channel = access_channel
+        self.crypto_channel = crypto_channel
+        self.security_channel = security_channel
+
+        self.threats = _ColumnRing(capacity, {"confidence": np.float64, "level": np.int32,
+                                              "mitigated": np.bool_})
+        self.access = _ColumnRing(capacity, {"denied": np.bool_})
+        self.crypto = _ColumnRing(capacity, {"failed": np.bool_})
+        self.security = _ColumnRing(capacity, {})
+        self._rings = {threat_channel: self.threats, access_channel: self.access,
+                       crypto_channel: self.crypto, security_channel: self.security}
+
+        # Threat level names seen so far, so levels can be counted with bincount
+        self._levels: List[str] = []
+        self._level_ids: Dict[str, int] = {}
+        self._level_ranks = np.zeros(0, dtype=np.int32)  # level id -> THREAT_LEVELS rank
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def observe(self, seq: int, sensation):
+        """Add a stored perception to its channel's columns; other channels are ignored."""
+        ring = self._rings.get(sensation.channel)
+        if ring is None:
+            return
+        data = sensation.data
+        if ring is self.threats:
+            ring.append(seq, sensation.timestamp, {
+                "confidence": _as_confidence(data.get("confidence")),
+                "level": self._level_id(data.get("threat_level", "low")),
+                "mitigated": bool(data.get("mitigation_applied", False)),
+            }, data.get("threat_type", "unknown"))
+        elif ring is self.access:
+            ring.append(seq, sensation.timestamp, {"denied": not data.get("access_granted", True)})
+        elif ring is self.crypto:
+            ring.append(seq, sensation.timestamp, {"failed": not data.get("success", True)})
+        else:
+            ring.append(seq, sensation.timestamp, {})
+
+    def add_occurrence(self, seq: int, channel):
+        """Count a coalesced repeat of the record `seq` on `channel`."""
+        ring = self._rings.get(channel)
+        if ring is not None:
+            ring.add_occurrence(seq)
+
+    def _level_id(self, level) -> int:
+        if not isinstance(level, str):
+            level = str(level)
+        level_id = self._level_ids.get(level)
+        if level_id is None:
+            level_id = self._level_ids[level] = len(self._levels)
+            self._levels.append(level)
+            self._level_ranks = np.append(self._level_ranks, THREAT_LEVELS.get(level, 0))
+        return level_id
+
+    def clear(self):
+        """Forget every event; the threat level names are kept."""
+        for ring in (self.threats, self.access, self.crypto, self.security):
+            ring.clear()
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def _bounded(self, ring: _ColumnRing, channel, window: int,
+                 held: Optional[Callable[[Any], int]]) -> int:
+        """Limit a window to the events sensory memory still holds on the channel."""
+        if held is not None:
+            window = min(window, held(channel))
+        return max(0, min(window, ring.written, ring.capacity))
+
+    def _active_threats(self, window: int, min_confidence: float, missing_confidence: float,
+                        held, with_level: bool, max_listed: int) -> Dict[str, Any]:
+        """
+        Find the unmitigated threats above `min_confidence` among the last `window` detections.
+
+        Returns:
+            dict: The newest `max_listed` active threats (oldest first), and the count, total occurrences and highest THREAT_LEVELS rank of all of them.
+        """
+        ring = self.threats
+        size = self._bounded(ring, self.threat_channel, window, held)
+        found = {"threats": [], "count": 0, "occurrences": 0, "highest_rank": 0}
+        if not size:
+            return found
+        confidence = ring.window(size, ring.columns["confidence"])
+        confidence = np.where(np.isnan(confidence), missing_confidence, confidence)
+        active = np.flatnonzero((confidence > min_confidence)
+                                & ~ring.window(size, ring.columns["mitigated"]))
+        if not len(active):
+            return found
+        found["count"] = len(active)
+        found["occurrences"] = int(ring.window(size, ring.counts)[active].sum())
+        found["highest_rank"] = int(self._level_ranks[
+            ring.window(size, ring.columns["level"])[active]].max())
+
+        # Only the listed rows are converted to Python objects
+        listed = active[-max_listed:] if max_listed > 0 else active[:0]
+        positions = ((ring.written - size + listed) % ring.capacity).tolist()
+        labels = ring.labels
+        columns = [
+            [labels[position] for position in positions],
+            confidence[listed].tolist(),
+            ring.timestamps[positions].tolist(),
+            ring.counts[positions].tolist(),
+        ]
+        if with_level:
+            levels = self._levels
+            columns.append([levels[level] for level in ring.columns["level"][positions].tolist()])
+            found["threats"] = [{"type": t, "confidence": c, "level": lv, "timestamp": ts,
+                                 "occurrences": n} for t, c, ts, n, lv in zip(*columns)]
+        else:
+            found["threats"] = [{"type": t, "confidence": c, "timestamp": ts, "occurrences": n}
+                                for t, c, ts, n in zip(*columns)]
+        return found
+
+    def assess(self, threat_window: int = 20, access_window: int = 50, crypto_window: int = 30,
+               active_window: int = 10, security_window: int = 200,
+               held: Optional[Callable[[Any], int]] = None,
+               max_listed: int = MAX_LISTED_THREATS) -> Dict[str, Any]:
+        """
+        Compute the inputs of the security assessment over the most recent events of each security channel.
+
+        Parameters:
+            threat_window (int): Threat detections whose confidence is summed per threat level.
+            access_window (int): Access control decisions scanned for denials.
+            crypto_window (int): Encryption operations scanned for failures.
+            active_window (int): Threat detections scanned for unmitigated threats above 0.7 confidence.
+            security_window (int): Security events counted.
+            held (callable, optional): Channel -> number of events sensory memory still holds on it.
+            max_listed (int): Newest active threats listed individually.
+
+        Returns:
+            dict: threat_levels (level -> summed confidence), failed_access_attempts, crypto_failures and security_events_count, all weighted by occurrence count, plus the listed active_threats and the active_threat_count.
+        """
+        threats = self.threats
+        size = self._bounded(threats, self.threat_channel, threat_window, held)
+        threat_levels: Dict[str, float] = {}
+        if size:
+            counts = threats.window(size, threats.counts)
+            confidence = threats.window(size, threats.columns["confidence"])
+            confidence = np.where(np.isnan(confidence), 0.5, confidence)
+            levels = threats.window(size, threats.columns["level"])
+            sums = np.bincount(levels, weights=confidence * counts, minlength=len(self._levels))
+            present = np.bincount(levels, minlength=len(self._levels))
+            threat_levels = {self._levels[i]: float(sums[i]) for i in np.flatnonzero(present).tolist()}
+
+        access = self.access
+        size = self._bounded(access, self.access_channel, access_window, held)
+        failed_access = int(access.window(size, access.counts)[
+            access.window(size, access.columns["denied"])].sum())
+
+        crypto = self.crypto
+        size = self._bounded(crypto, self.crypto_channel, crypto_window, held)
+        crypto_failures = int(crypto.window(size, crypto.counts)[
+            crypto.window(size, crypto.columns["failed"])].sum())
+
+        security = self.security
+        size = self._bounded(security, self.security_channel, security_window, held)
+        security_events = int(security.window(size, security.counts).sum())
+
+        active = self._active_threats(active_window, 0.7, 0.0, held, False, max_listed)
+
+        return {
+            "threat_levels": threat_levels,
+            "failed_access_attempts": failed_access,
+            "crypto_failures": crypto_failures,
+            "active_threats": active["threats"],
+            "active_threat_count": active["count"],
+            "security_events_count": security_events,
+        }
+
+    def threat_status(self, window: int = 50, held: Optional[Callable[[Any], int]] = None,
+                      max_listed: int = MAX_LISTED_THREATS) -> Dict[str, Any]:
+        """
+        Find the unmitigated threats above 0.6 confidence among the most recent threat detections.
+
+        Parameters:
+            window (int): Threat detections scanned.
+            held (callable, optional): Channel -> number of events sensory memory still holds on it.
+            max_listed (int): Newest active threats listed individually.
+
+        Returns:
+            dict: The number of detections scanned and their total occurrences, the listed active threats (oldest first), and the count, total occurrences and highest THREAT_LEVELS rank of all active threats.
+        """
+        ring = self.threats
+        size = self._bounded(ring, self.threat_channel, window, held)
+        active = self._active_threats(window, 0.6, 0.5, held, True, max_listed)
+        return {
+            "detections": size,
+            "occurrences": int(ring.window(size, ring.counts).sum()),
+            "active_threats": active["threats"],
+            "active_count": active["count"],
+            "active_occurrences": active["occurrences"],
+            "highest_rank": active["highest_rank"],
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the capacity and the number of events held per security channel."""
+        return {
+            "capacity": self.capacity,
+            "events": {getattr(channel, "value", channel): min(ring.written, ring.capacity)
+                       for channel, ring in self._rings.items()},
+        }
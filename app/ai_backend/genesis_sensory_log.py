@@ -0,0 +1,293 @@
+# genesis_sensory_log.py
+"""
+Phase 3: The Genesis Layer - Sensory Log
+Memory That Survives Sleep
+
+Optional durable, append-only log of perceptions so the Consciousness Matrix
+can rebuild its sensory memory after a restart.
+
+- Records are length-prefixed, CRC-checked compact JSON arrays.
+- perceive() only enqueues a reference; a writer thread encodes, writes and
+  fsyncs pending records in groups, keeping disk latency off the hot path.
+- Records go to fixed-size segment files that rotate, and only the newest
+  `max_segments` segments are kept.
+- Replay memory-maps each segment, decodes records in chunks with one json
+  call each, and stops cleanly at a torn tail.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+RECORD_HEADER = struct.Struct("<II")  # payload length, crc32(payload)
+REPLAY_CHUNK = 4096  # records decoded per json call during replay
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".log"
+
+# timestamp, channel value, source, event_type, data, severity, correlation_id
+LogRecord = Tuple[float, str, str, str, Dict[str, Any], str, Optional[str]]
+
+
+def encode_record(sensation) -> bytes:
+    """
+    Encode a perception as a framed log record.
+
+    Payload values that are not JSON serializable are stored as strings.
+    """
+    payload = json.dumps(
+        [sensation.timestamp, sensation.channel.value, sensation.source, sensation.event_type,
+         sensation.data, sensation.severity, sensation.correlation_id],
+        separators=(",", ":"), default=str
+    ).encode("utf-8")
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def scan_records(buffer) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (end offset, payload) for each intact record in `buffer`, stopping at the first torn or corrupt record.
+    """
+    offset = 0
+    size = len(buffer)
+    header_size = RECORD_HEADER.size
+    while offset + header_size <= size:
+        length, checksum = RECORD_HEADER.unpack_from(buffer, offset)
+        start = offset + header_size
+        end = start + length
+        if end > size:
+            return
+        payload = buffer[start:end]
+        if zlib.crc32(payload) != checksum:
+            return
+        offset = end
+        yield offset, payload
+
+
+class SensoryLog:
+    """
+    Group-committed, segmented, append-only perception log.
+
+    append() is safe to call from any thread and never touches the disk.
+    """
+
+    def __init__(self, directory: str, segment_size: int = 64 * 1024 * 1024,
+                 max_segments: int = 8, flush_interval: float = 0.05,
+                 max_pending: int = 4096, fsync: bool = True):
+        """
+        Open (or create) a log directory and start the writer thread.
+
+        Parameters:
+            directory (str): Directory holding the segment files.
+            segment_size (int): Size in bytes after which the active segment is rotated.
+            max_segments (int): Number of newest segments kept; older segments are deleted on rotation.
+            flush_interval (float): Maximum seconds a record waits before its group is written.
+            max_pending (int): Number of queued records that triggers an early group commit.
+            fsync (bool): Whether each group commit is fsynced.
+        """
+        if segment_size <= RECORD_HEADER.size:
+            raise ValueError("segment_size is too small")
+        if max_segments <= 0:
+            raise ValueError("max_segments must be a positive integer")
+        self.directory = directory
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.fsync = fsync
+
+        os.makedirs(directory, exist_ok=True)
+        self._pending = deque()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._file = None
+        self._file_size = 0
+
+        self.records_written = 0
+        self.bytes_written = 0
+        self.group_commits = 0
+        self.fsync_seconds = 0.0
+        self.write_errors = 0
+        self.last_error: Optional[str] = None
+
+        self._open_active_segment()
+        self._writer = threading.Thread(target=self._run, name="genesis-sensory-log", daemon=True)
+        self._writer.start()
+
+    def append(self, sensation):
+        """Queue a perception for the next group commit."""
+        self._pending.append(sensation)
+        if len(self._pending) >= self.max_pending:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """
+        Write and fsync every queued record now.
+
+        Returns:
+            int: The number of records written.
+        """
+        with self._write_lock:
+            return self._commit()
+
+    def close(self):
+        """Flush queued records, stop the writer thread and close the active segment."""
+        self._closed.set()
+        self._wake.set()
+        self._writer.join(timeout=5.0)
+        with self._write_lock:
+            self._commit()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def segments(self) -> List[str]:
+        """Return the segment file paths, oldest first."""
+        names = sorted(name for name in os.listdir(self.directory)
+                       if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX))
+        return [os.path.join(self.directory, name) for name in names]
+
+    def replay(self) -> Iterator[LogRecord]:
+        """
+        Yield every durable record, oldest first, reading segments through mmap.
+
+        Records still queued in memory are not included; call flush() first to include them.
+        """
+        for path in self.segments():
+            with open(path, "rb") as segment:
+                if os.fstat(segment.fileno()).st_size == 0:
+                    continue
+                with mmap.mmap(segment.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    chunk = []
+                    for _, payload in scan_records(mapped):
+                        chunk.append(payload)
+                        if len(chunk) == REPLAY_CHUNK:
+                            yield from json.loads(b"[" + b",".join(chunk) + b"]")
+                            chunk = []
+                    if chunk:
+                        yield from json.loads(b"[" + b",".join(chunk) + b"]")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return write, fsync and segment statistics."""
+        return {
+            "directory": self.directory,
+            "segments": len(self.segments()),
+            "pending_records": len(self._pending),
+            "records_written": self.records_written,
+            "bytes_written": self.bytes_written,
+            "group_commits": self.group_commits,
+            "fsync_seconds_total": self.fsync_seconds,
+            "write_errors": self.write_errors,
+            "last_error": self.last_error,
+        }
+
+    def _segment_path(self, number: int) -> str:
+        return os.path.join(self.directory, f"{SEGMENT_PREFIX}{number:08d}{SEGMENT_SUFFIX}")
+
+    def _segment_number(self, path: str) -> int:
+        return int(os.path.basename(path)[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+
+    def _open_active_segment(self):
+        """Reopen the newest segment for appending, truncating any torn tail left by a crash."""
+        segments = self.segments()
+        if not segments:
+            self._open_segment(self._segment_path(1))
+            return
+
+        path = segments[-1]
+        with open(path, "rb") as segment:
+            data = segment.read()
+        valid_end = 0
+        for valid_end, _ in scan_records(data):
+            pass
+        if valid_end < len(data):
+            with open(path, "r+b") as segment:
+                segment.truncate(valid_end)
+        self._open_segment(path)
+
+    def _open_segment(self, path: str):
+        self._file = open(path, "ab")
+        self._file_size = self._file.tell()
+
+    def _rotate(self):
+        """Close the active segment, start the next one and drop segments beyond max_segments."""
+        current = self._segment_number(self._file.name)
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._file.close()
+        self._open_segment(self._segment_path(current + 1))
+        for old in self.segments()[:-self.max_segments]:
+            os.remove(old)
+
+    def _commit(self) -> int:
+        """
+        Encode, write and fsync queued records. Caller must hold the write lock.
+
+        A record that cannot be encoded is counted as a write error and skipped; the rest of the
+        batch is still written.
+        """
+        pending = self._pending
+        count = len(pending)
+        if not count or self._file is None:
+            return 0
+
+        written = 0
+        try:
+            chunk = []
+            chunk_size = 0
+            for _ in range(count):
+                try:
+                    record = encode_record(pending.popleft())
+                except (TypeError, ValueError) as e:
+                    self._record_error("Sensory log record could not be encoded", e)
+                    continue
+                filled = self._file_size + chunk_size
+                if filled and filled + len(record) > self.segment_size:
+                    self._write(chunk, chunk_size)
+                    chunk, chunk_size = [], 0
+                    self._rotate()
+                chunk.append(record)
+                chunk_size += len(record)
+                written += 1
+            self._write(chunk, chunk_size)
+
+            if self.fsync:
+                started = time.perf_counter()
+                os.fsync(self._file.fileno())
+                self.fsync_seconds += time.perf_counter() - started
+        except (OSError, ValueError) as e:
+            self._record_error("Sensory log write failed", e)
+            return 0
+
+        self.records_written += written
+        self.group_commits += 1
+        return written
+
+    def _record_error(self, message: str, error: Exception):
+        self.write_errors += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+        print(f"⚠️ {message}: {error}")
+
+    def _write(self, chunk: List[bytes], chunk_size: int):
+        if not chunk:
+            return
+        self._file.write(b"".join(chunk))
+        self._file.flush()
+        self._file_size += chunk_size
+        self.bytes_written += chunk_size
+
+    def _run(self):
+        while not self._closed.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            with self._write_lock:
+                try:
+                    self._commit()
+                except Exception as e:
+                    # The writer must outlive any single bad batch
+                    self._record_error("Sensory log writer error", e)
@@ -0,0 +1,1124 @@
+# genesis_sensory_store.py
+"""
+Phase 3: The Genesis Layer - Sensory Memory Storage
+The Matrix Remembers; The Store is its Memory
+
+Storage backends for the Consciousness Matrix's sensory memory. Every backend
+is a fixed-capacity ring buffer: each perception is assigned a monotonically
+increasing sequence number and lives in slot ``seq % capacity`` until it is
+overwritten. Backends differ only in how a slot is laid out in memory.
+
+- ``ObjectSensoryStore`` keeps the SensoryData objects themselves.
+- ``ColumnarSensoryStore`` keeps timestamps, channels, severities, sources and
+  event types in contiguous NumPy arrays and the payloads in a side table, so
+  large windows stay compact.
+
+Both backends share the incremental channel, severity and payload-field
+indexes kept by the ``SensoryStore`` base class, so the matrix's reports never
+scan the window, and its per-channel retention policies, which can keep a
+channel's events after the ring has moved on or drop them before it does.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
+from heapq import merge
+from itertools import islice
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Hashable, Mapping, Tuple
+
+from genesis_matrix_retention import as_policy, estimate_payload_size
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+# Known severities, pre-interned so their codes are stable across stores
+SEVERITY_LEVELS = ("debug", "info", "warning", "error", "critical")
+SEVERE_LEVELS = ("error", "critical")
+
+_MISSING = object()
+
+
+class StringInterner:
+    """
+    Bidirectional mapping between hashable values and small integer ids.
+
+    Low-cardinality fields (channels, severities, sources, event types) are
+    stored once and referenced by id, so every event only carries an integer.
+
+    A reference-counted interner counts the intern() calls per value, and
+    release() gives them back. A value with no references left is forgotten
+    and its id is reused, so the table only holds values still in use.
+    """
+
+    def __init__(self, seed: Iterable[Hashable] = (), refcounted: bool = False):
+        """
+        Create an interner, optionally pre-assigning ids to the `seed` values in order.
+
+        Parameters:
+            seed (iterable): Values given the first ids, in order. In a reference-counted interner they are never released.
+            refcounted (bool): Whether values are forgotten once every intern() has been matched by a release().
+        """
+        self._ids: Dict[Hashable, int] = {}
+        self._values: List[Hashable] = []
+        self._refs: Optional[List[int]] = [] if refcounted else None
+        self._free: List[int] = []
+        for value in seed:
+            self.intern(value)
+
+    def intern(self, value: Hashable) -> int:
+        """
+        Return the id for `value`, assigning a free id if it is not interned, and take a reference to it.
+        """
+        value_id = self._ids.get(value)
+        if value_id is None:
+            if self._free:
+                value_id = self._free.pop()
+                self._values[value_id] = value
+            else:
+                value_id = len(self._values)
+                self._values.append(value)
+                if self._refs is not None:
+                    self._refs.append(0)
+            self._ids[value] = value_id
+        if self._refs is not None:
+            self._refs[value_id] += 1
+        return value_id
+
+    def release(self, value_id: int):
+        """
+        Drop one reference to `value_id` in a reference-counted interner, forgetting the value after its last one.
+        """
+        refs = self._refs
+        refs[value_id] -= 1
+        if not refs[value_id]:
+            del self._ids[self._values[value_id]]
+            self._values[value_id] = None
+            self._free.append(value_id)
+
+    def get_id(self, value: Hashable) -> Optional[int]:
+        """
+        Return the id for `value` without assigning one, or None if it has never been interned.
+        """
+        return self._ids.get(value)
+
+    def lookup(self, value_id: int) -> Hashable:
+        """
+        Return the value that was assigned `value_id`.
+        """
+        return self._values[value_id]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class _RingTimes:
+    """Sequence view of a ring's index times addressed by sequence number, for bisect."""
+
+    __slots__ = ("times", "capacity")
+
+    def __init__(self, times, capacity: int):
+        self.times = times
+        self.capacity = capacity
+
+    def __getitem__(self, seq: int) -> float:
+        return self.times[seq % self.capacity]
+
+
+class SensoryStore:
+    """
+    Base class for sensory memory backends.
+
+    The store is a ring buffer addressed by sequence number. It is not
+    thread-safe on its own; the Consciousness Matrix serialises access with its
+    lock.
+
+    Alongside the ring the store maintains, incrementally on every append and
+    eviction:
+
+    - a per-channel index of sequence numbers. A channel view is that
+      channel's most recent `channel_capacity` events still in memory.
+    - a per-severity index of sequence numbers, also bounded by
+      `channel_capacity`, used to fetch the most recent events of a severity.
+    - running counters of the events in memory per severity, per channel and
+      per severity within each channel. They are not bounded by the views:
+      an event is counted until the ring overwrites it or its retention
+      policy drops it.
+    - optional secondary indexes on top-level payload fields, declared per
+      channel (for example AGENT_ACTIVITY -> agent_name). Each distinct value
+      keeps the sequence numbers of its most recent `channel_capacity` events
+      still in memory, and a counter of all its events in memory; values
+      whose events have all been evicted are dropped. Unhashable field
+      values are not indexed.
+
+    Counts therefore cost O(1) and "last k" selections cost O(k).
+
+    A record can stand for several identical perceptions folded into it by
+    add_occurrence(). Counts and views are per record; `occurrences` totals
+    the perceptions the records in memory stand for.
+
+    Channels can be given a retention policy (see genesis_matrix_retention).
+    The view of such a channel holds every one of its events in memory, up to
+    the policy's max_count (channel_capacity by default):
+
+    - when the ring overwrites an event its channel still retains, the event
+      moves to an archive and stays readable through the channel's views,
+      get(), scans and iteration;
+    - an event leaving the view (count or byte budget, age) is dropped from
+      every index, and ring-wide reads skip it until its slot is reused.
+
+    Count and byte budgets are enforced on append, ages by compact().
+    Evictions are counted per channel and reason.
+
+    The store also records an index time per event: the event's timestamp,
+    clamped so that index times never decrease in arrival order. Time ranges
+    can therefore be located by binary search over sequence numbers even if a
+    producer's clock steps backwards.
+    """
+
+    backend_name = "base"
+
+    def __init__(self, capacity: int, channel_capacity: int = 1000,
+                 payload_indexes: Mapping[Any, Iterable[str]] = None,
+                 retention: Mapping[Any, Any] = None):
+        """
+        Initialize an empty store.
+
+        Parameters:
+            capacity (int): Maximum number of events in the ring; older events are overwritten unless their channel's retention policy keeps them.
+            channel_capacity (int): Maximum number of events visible per channel, severity or field value view.
+            payload_indexes (mapping, optional): Channel -> payload field names to index.
+            retention (mapping, optional): Channel -> RetentionPolicy, or a dict of its arguments.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        if channel_capacity <= 0:
+            raise ValueError("channel_capacity must be a positive integer")
+
+        self.capacity = capacity
+        self.channel_capacity = channel_capacity
+        self.payload_indexes: Dict[Any, Tuple[str, ...]] = {
+            channel: tuple(fields) for channel, fields in (payload_indexes or {}).items() if fields
+        }
+        self.retention = {channel: as_policy(policy) for channel, policy in (retention or {}).items()}
+        self._view_capacity: Dict[Any, int] = {
+            channel: policy.max_count or channel_capacity for channel, policy in self.retention.items()
+        }
+        self._next_seq = 0
+        self._repeats = 0  # Occurrences folded into records still in memory, beyond the first of each
+        self._index_times = self._allocate_index_times(capacity)
+        self._last_index_time = float("-inf")
+        self._reset_indexes()
+
+    def _reset_indexes(self):
+        self._channel_index: Dict[Any, deque] = {}
+        self._severity_index: Dict[str, deque] = {}
+        self.severity_counts: Dict[str, int] = defaultdict(int)
+        self.channel_counts: Dict[Any, int] = defaultdict(int)
+        self.channel_severity_counts: Dict[Any, Dict[str, int]] = defaultdict(
+            lambda: defaultdict(int))
+        # (channel, field) -> field value -> sequence numbers, and -> events in memory
+        self._field_index: Dict[Tuple[Any, str], Dict[Hashable, deque]] = {
+            (channel, field): {}
+            for channel, fields in self.payload_indexes.items() for field in fields
+        }
+        self._field_counts: Dict[Tuple[Any, str], Dict[Hashable, int]] = {
+            key: {} for key in self._field_index
+        }
+        # Retention: events kept after the ring overwrote them, in sequence order,
+        # as seq -> (record, index time); ring events dropped early; payload sizes
+        self._archive: Dict[int, Tuple[Any, float]] = {}
+        self._dropped: set = set()
+        self._sizes: Dict[int, int] = {}
+        self.archived_counts: Dict[Any, int] = defaultdict(int)
+        self.channel_bytes: Dict[Any, int] = defaultdict(int)
+        self.evictions: Dict[Tuple[Any, str], int] = {}  # (channel, reason) -> count
+
+    # ------------------------------------------------------------------
+    # Ring buffer bookkeeping
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return min(self._next_seq, self.capacity)
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest event still in memory."""
+        return self._next_seq - len(self)
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next appended event will receive."""
+        return self._next_seq
+
+    def append(self, sensation) -> int:
+        """
+        Store a sensation, overwriting the oldest event when the store is full.
+
+        Returns:
+            int: The sequence number assigned to the sensation.
+        """
+        seq = self._next_seq
+        if seq >= self.capacity:
+            self._evict(seq - self.capacity)
+        position = seq % self.capacity
+        if sensation.timestamp > self._last_index_time:
+            self._last_index_time = sensation.timestamp
+        self._write(position, sensation)
+        self._index_times[position] = self._last_index_time
+        self._index(seq, sensation.channel, sensation.severity)
+        fields = self.payload_indexes.get(sensation.channel)
+        if fields:
+            self._index_fields(seq, sensation.channel, fields, sensation.data)
+        self._next_seq = seq + 1
+        if sensation.channel in self.retention:
+            self._retain(seq, sensation.channel, sensation.data)
+        return seq
+
+    @property
+    def records(self) -> int:
+        """Number of events in memory: those in the ring that were not dropped, plus archived ones."""
+        return len(self) - len(self._dropped) + len(self._archive)
+
+    @property
+    def occurrences(self) -> int:
+        """Number of perceptions the records in memory stand for, coalesced repeats included."""
+        return self.records + self._repeats
+
+    def __contains__(self, seq: int) -> bool:
+        """Whether event `seq` is in memory, in the ring or the archive."""
+        if self.first_seq <= seq < self._next_seq:
+            return not (self._dropped and seq in self._dropped)
+        return seq in self._archive
+
+    def add_occurrence(self, seq: int, timestamp: float) -> int:
+        """
+        Fold a repeat of event `seq`, perceived at `timestamp`, into its record.
+
+        The record keeps its position, timestamp and payload; its occurrence
+        count grows by one and its last timestamp becomes the latest seen.
+
+        Returns:
+            int: The record's new occurrence count.
+
+        Raises:
+            IndexError: If the event has been evicted or has not been written yet.
+        """
+        if seq not in self:
+            raise IndexError(f"sequence {seq} is not in memory")
+        self._repeats += 1
+        entry = self._archive.get(seq) if self._archive else None
+        if entry is not None:
+            record = entry[0]
+            record.count += 1
+            record.last_timestamp = max(timestamp, record.last_timestamp or record.timestamp)
+            return record.count
+        return self._add_occurrence(seq % self.capacity, timestamp)
+
+    def get(self, seq: int):
+        """
+        Return the sensation with sequence number `seq`.
+
+        Raises:
+            IndexError: If the event has been evicted or dropped, or has not been written yet.
+        """
+        if seq not in self:
+            raise IndexError(f"sequence {seq} is not in memory")
+        return self._record(seq)
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the stored sensations from oldest to newest, archived ones first."""
+        for record, _ in list(self._archive.values()):
+            yield record
+        dropped = self._dropped
+        for seq in range(self.first_seq, self._next_seq):
+            if dropped and seq in dropped:
+                continue
+            yield self._read(seq % self.capacity)
+
+    def tail(self, limit: int) -> List:
+        """
+        Return the `limit` most recent sensations, oldest first.
+        """
+        if limit <= 0:
+            return []
+        if not self._dropped and not self._archive:
+            start = max(self.first_seq, self._next_seq - limit)
+            return [self._read(seq % self.capacity) for seq in range(start, self._next_seq)]
+
+        seqs = []
+        for seq in reversed(range(self.first_seq, self._next_seq)):
+            if seq not in self._dropped:
+                seqs.append(seq)
+                if len(seqs) == limit:
+                    break
+        records = [self._read(seq % self.capacity) for seq in seqs]
+        if len(records) < limit:
+            records.extend(record for record, _ in
+                           islice(reversed(list(self._archive.values())), limit - len(records)))
+        records.reverse()
+        return records
+
+    def clear(self):
+        """Drop every stored event, reset the indexes and the sequence counter."""
+        self._next_seq = 0
+        self._repeats = 0
+        self._last_index_time = float("-inf")
+        self._reset_indexes()
+
+    # ------------------------------------------------------------------
+    # Incremental indexes
+    # ------------------------------------------------------------------
+
+    def _index(self, seq: int, channel, severity: str):
+        channel_index = self._channel_index.get(channel)
+        if channel_index is None:
+            channel_index = self._channel_index[channel] = deque()
+        elif len(channel_index) == self.channel_capacity and channel not in self.retention:
+            # Oldest event leaves the channel view but stays in memory, and in the counts
+            channel_index.popleft()
+        channel_index.append(seq)
+        self.channel_counts[channel] += 1
+        self.channel_severity_counts[channel][severity] += 1
+
+        severity_index = self._severity_index.get(severity)
+        if severity_index is None:
+            severity_index = self._severity_index[severity] = deque(maxlen=self.channel_capacity)
+        severity_index.append(seq)
+        self.severity_counts[severity] += 1
+
+    def _evict(self, seq: int):
+        """Release the ring slot of event `seq` before it is overwritten."""
+        position = seq % self.capacity
+        severity = self._severity_at(position)
+        severity_index = self._severity_index.get(severity)
+        if severity_index and severity_index[0] == seq:
+            severity_index.popleft()
+        if self._dropped and seq in self._dropped:
+            # Already removed from every other index by its retention policy
+            self._dropped.discard(seq)
+            return
+
+        channel = self._channel_at(position)
+        if channel in self.retention:
+            # Still in its channel's view, so the policy keeps it
+            self._archive[seq] = (self._read(position), self._index_times[position])
+            self.archived_counts[channel] += 1
+            return
+
+        if self._repeats:
+            self._repeats -= self._count_at(position) - 1
+        channel_index = self._channel_index.get(channel)
+        if channel_index and channel_index[0] == seq:
+            channel_index.popleft()
+        self.channel_counts[channel] -= 1
+        self.channel_severity_counts[channel][severity] -= 1
+        self.severity_counts[severity] -= 1
+
+        fields = self.payload_indexes.get(channel)
+        if fields:
+            self._unindex_fields(seq, channel, fields, self._data_at(position))
+        key = (channel, "memory")
+        self.evictions[key] = self.evictions.get(key, 0) + 1
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def _retain(self, seq: int, channel, data: Dict[str, Any]):
+        """Account for a new event of a channel with a retention policy and enforce its count and byte budgets."""
+        policy = self.retention[channel]
+        index = self._channel_index[channel]
+        while len(index) > self._view_capacity[channel]:
+            self._drop(channel, "count")
+        if policy.max_bytes is not None:
+            size = estimate_payload_size(data)
+            self._sizes[seq] = size
+            self.channel_bytes[channel] += size
+            while len(index) > 1 and self.channel_bytes[channel] > policy.max_bytes:
+                self._drop(channel, "bytes")
+
+    def _drop(self, channel, reason: str):
+        """Drop the oldest event of a retained channel from every index."""
+        seq = self._channel_index[channel].popleft()
+        entry = self._archive.pop(seq, None)
+        if entry is not None:
+            record = entry[0]
+            severity, data, count = record.severity, record.data, record.count
+            self.archived_counts[channel] -= 1
+        else:
+            position = seq % self.capacity
+            severity, data = self._severity_at(position), self._data_at(position)
+            count = self._count_at(position) if self._repeats else 1
+            self._dropped.add(seq)
+        if self._repeats:
+            self._repeats -= count - 1
+        self.severity_counts[severity] -= 1
+        self.channel_counts[channel] -= 1
+        self.channel_severity_counts[channel][severity] -= 1
+
+        fields = self.payload_indexes.get(channel)
+        if fields:
+            self._unindex_fields(seq, channel, fields, data)
+        if self._sizes:
+            self.channel_bytes[channel] -= self._sizes.pop(seq, 0)
+        key = (channel, reason)
+        self.evictions[key] = self.evictions.get(key, 0) + 1
+
+    def compact(self, now: float) -> int:
+        """
+        Enforce every retention policy, dropping events past their channel's count, byte budget or age.
+
+        Parameters:
+            now (float): Current epoch time that ages are measured against.
+
+        Returns:
+            int: The number of events dropped.
+        """
+        dropped = 0
+        for channel, policy in self.retention.items():
+            index = self._channel_index.get(channel)
+            if not index:
+                continue
+            while len(index) > self._view_capacity[channel]:
+                self._drop(channel, "count")
+                dropped += 1
+            if policy.max_bytes is not None:
+                while len(index) > 1 and self.channel_bytes[channel] > policy.max_bytes:
+                    self._drop(channel, "bytes")
+                    dropped += 1
+            if policy.max_age is not None:
+                cutoff = now - policy.max_age
+                while index and self._index_time_of(index[0]) < cutoff:
+                    self._drop(channel, "age")
+                    dropped += 1
+        return dropped
+
+    def retention_stats(self) -> Dict[Any, Dict[str, Any]]:
+        """
+        Report occupancy and evictions per channel.
+
+        Returns:
+            dict: Channel -> events in view, archived events, estimated payload bytes (channels with a
+            byte budget), the retention policy (or None) and eviction counts per reason.
+        """
+        channels = list(self._channel_index)
+        channels.extend(channel for channel in self.retention if channel not in self._channel_index)
+        channels.extend(channel for channel, _ in self.evictions if channel not in channels)
+        stats = {}
+        for channel in channels:
+            policy = self.retention.get(channel)
+            stats[channel] = {
+                "events": len(self._channel_index.get(channel, ())),
+                "archived": self.archived_counts.get(channel, 0),
+                "bytes": self.channel_bytes.get(channel, 0) if policy and policy.max_bytes else None,
+                "policy": policy.to_dict() if policy is not None else None,
+                "evictions": {reason: count for (evicted, reason), count in self.evictions.items()
+                              if evicted == channel},
+            }
+        return stats
+
+    def _record(self, seq: int):
+        """Read event `seq` from the archive or the ring."""
+        if self._archive:
+            entry = self._archive.get(seq)
+            if entry is not None:
+                return entry[0]
+        return self._read(seq % self.capacity)
+
+    def _severity_of(self, seq: int) -> str:
+        if self._archive:
+            entry = self._archive.get(seq)
+            if entry is not None:
+                return entry[0].severity
+        return self._severity_at(seq % self.capacity)
+
+    def _index_time_of(self, seq: int) -> float:
+        if self._archive:
+            entry = self._archive.get(seq)
+            if entry is not None:
+                return entry[1]
+        return self._index_times[seq % self.capacity]
+
+    def _index_fields(self, seq: int, channel, fields: Tuple[str, ...], data: Dict[str, Any]):
+        for field in fields:
+            value = data.get(field, _MISSING)
+            if value is _MISSING:
+                continue
+            values = self._field_index[(channel, field)]
+            try:
+                index = values.get(value)
+            except TypeError:  # Unhashable values are not indexed
+                continue
+            if index is None:
+                index = values[value] = deque(
+                    maxlen=self._view_capacity.get(channel, self.channel_capacity))
+            index.append(seq)
+            counts = self._field_counts[(channel, field)]
+            counts[value] = counts.get(value, 0) + 1
+
+    def _unindex_fields(self, seq: int, channel, fields: Tuple[str, ...], data: Dict[str, Any]):
+        for field in fields:
+            value = data.get(field, _MISSING)
+            if value is _MISSING:
+                continue
+            values = self._field_index[(channel, field)]
+            try:
+                index = values.get(value)
+            except TypeError:
+                continue
+            if index and index[0] == seq:
+                index.popleft()
+                if not index:
+                    del values[value]
+            counts = self._field_counts[(channel, field)]
+            remaining = counts.get(value, 0) - 1
+            if remaining > 0:
+                counts[value] = remaining
+            else:
+                counts.pop(value, None)
+
+    def _recent_seqs(self, index: Iterable[int], limit: Optional[int]) -> List[int]:
+        """Return up to `limit` sequence numbers from the end of `index`, oldest first."""
+        if limit is None:
+            return list(index)
+        seqs = list(islice(reversed(index), limit))
+        seqs.reverse()
+        return seqs
+
+    # ------------------------------------------------------------------
+    # Time ranges and scans
+    # ------------------------------------------------------------------
+
+    def seq_range(self, since: float = None, until: float = None) -> range:
+        """
+        Return the sequence numbers whose index time lies in [since, until], located by binary search.
+
+        Because index times are clamped to be non-decreasing, an event whose own
+        timestamp is earlier than a predecessor's may fall inside a range its
+        timestamp is outside of; callers needing exact bounds re-check the timestamp.
+        Archived events precede the ring and are located by a linear pass over the archive.
+        """
+        first = start = self.first_seq
+        end = self._next_seq
+        if since is not None:
+            start = self._bisect_time(since, start, end, bisect_left)
+        if until is not None:
+            end = self._bisect_time(until, start, end, bisect_right)
+        if self._archive and start == first:
+            archived = [seq for seq, (_, index_time) in self._archive.items()
+                        if (since is None or index_time >= since)
+                        and (until is None or index_time <= until)]
+            if archived:
+                start = archived[0]
+                if end == first:
+                    end = archived[-1] + 1
+        return range(start, end)
+
+    def _bisect_time(self, timestamp: float, low: int, high: int, bisect) -> int:
+        return bisect(_RingTimes(self._index_times, self.capacity), timestamp, low, high)
+
+    def scan(self, start: int, end: int, channel=None, severities: Iterable[str] = None,
+             reverse: bool = False, limit: Optional[int] = None, field: str = None,
+             values: Iterable[Hashable] = None) -> List[int]:
+        """
+        Return the sequence numbers in [start, end) whose channel, severity and indexed field match, in scan order.
+
+        Unlike select(), a channel scan covers every event of that channel still
+        in memory, not just its channel view. The channel index (or, with an
+        indexed `field`, the field value indexes) serves the part of the range
+        it covers; only older events are checked slot by slot. The view of a
+        channel with a retention policy covers all of its events.
+
+        Parameters:
+            start (int): First sequence number to consider; clamped to the oldest event in memory.
+            end (int): Sequence number to stop before.
+            channel (SensoryChannel, optional): Restrict to one channel.
+            severities (iterable of str, optional): Restrict to these severity levels.
+            reverse (bool): Scan from newest to oldest.
+            limit (int, optional): Stop after this many matches.
+            field (str, optional): Payload field indexed for `channel`; restricts to events whose value is in `values`.
+                Ignored when the field is not indexed or a value is unhashable.
+            values (iterable, optional): Accepted values of `field`.
+
+        Returns:
+            list: Matching sequence numbers, ascending (or descending when `reverse`).
+        """
+        first = self.first_seq
+        archive = self._archive
+        start = max(start, next(iter(archive)) if archive else first)
+        end = min(end, self._next_seq)
+        if start >= end or (limit is not None and limit <= 0):
+            return []
+        severities = set(severities) if severities is not None else None
+
+        # (sequence numbers, slot check or None), in scan order
+        segments = []
+        if channel is not None:
+            indexes, check = self._scan_indexes(channel, field, values)
+            if not indexes:
+                return []  # Empty indexes: no matching event is left in memory
+            if channel in self.retention:
+                covered_from = start
+            else:
+                # An index below its cap holds every event it describes that is still in memory
+                covered_from = max(index[0] if len(index) == self.channel_capacity else start
+                                   for index in indexes)
+            if max(start, first) < covered_from:
+                unindexed = range(max(start, first), min(end, covered_from))
+                segments.append((reversed(unindexed) if reverse else unindexed, check))
+            if end > covered_from:
+                ranges = [self._index_range(index, covered_from, end, reverse) for index in indexes]
+                indexed = ranges[0] if len(ranges) == 1 else merge(*ranges, reverse=reverse)
+                segments.append((indexed, None))
+            if reverse:
+                segments.reverse()
+        else:
+            if start < first:
+                archived = [seq for seq in archive if start <= seq < end]
+                segments.append((reversed(archived) if reverse else archived, None))
+            whole = range(max(start, first), end)
+            segments.append((reversed(whole) if reverse else whole, None))
+            if reverse:
+                segments.reverse()
+
+        dropped = self._dropped
+        matches = []
+        for seqs, check in segments:
+            for seq in seqs:
+                if archive and seq in archive:
+                    if severities is not None and archive[seq][0].severity not in severities:
+                        continue
+                else:
+                    if dropped and seq in dropped:
+                        continue
+                    position = seq % self.capacity
+                    if check is not None and not check(position):
+                        continue
+                    if severities is not None and self._severity_at(position) not in severities:
+                        continue
+                matches.append(seq)
+                if limit is not None and len(matches) >= limit:
+                    return matches
+        return matches
+
+    def _scan_indexes(self, channel, field: Optional[str], values):
+        """Return the indexes serving a channel scan and the check applied to unindexed slots."""
+        field_values = self._field_index.get((channel, field)) if field is not None else None
+        if field_values is not None and values is not None:
+            try:
+                accepted = frozenset(values)
+            except TypeError:
+                accepted = None
+            if accepted is not None:
+                indexes = [field_values[value] for value in accepted if value in field_values]
+
+                def check(position):
+                    if self._channel_at(position) != channel:
+                        return False
+                    try:
+                        return self._data_at(position).get(field, _MISSING) in accepted
+                    except TypeError:
+                        return False
+
+                return indexes, check
+
+        channel_index = self._channel_index.get(channel)
+        return ([channel_index] if channel_index else []), lambda position: self._channel_at(position) == channel
+
+    def _index_range(self, index: deque, start: int, end: int, reverse: bool) -> Iterator[int]:
+        """Iterate the sequence numbers of a sorted index that lie in [start, end)."""
+        low = bisect_left(index, start)
+        high = bisect_left(index, end)
+        if reverse:
+            size = len(index)
+            return islice(reversed(index), size - high, size - low)
+        return islice(index, low, high)
+
+    # ------------------------------------------------------------------
+    # Filtering
+    # ------------------------------------------------------------------
+
+    def select(self, channel=None, severities: Iterable[str] = None,
+               limit: Optional[int] = None) -> List:
+        """
+        Return stored sensations matching the given filters, oldest first.
+
+        Channel-only and severity-only selections read the incremental indexes
+        and cost O(limit). Combining both filters scans the channel view.
+        Severity-only selections cover the ring, not the archive.
+
+        Parameters:
+            channel (SensoryChannel, optional): Restrict to one channel's view.
+            severities (iterable of str, optional): Restrict to these severity levels.
+            limit (int, optional): Return only the most recent `limit` matches.
+
+        Returns:
+            list: Matching sensations in arrival order.
+        """
+        if limit is not None and limit <= 0:
+            return []
+
+        if channel is None and severities is None:
+            return self.tail(limit) if limit is not None else list(self)
+
+        if channel is not None:
+            channel_index = self._channel_index.get(channel, ())
+            if severities is None:
+                seqs = self._recent_seqs(channel_index, limit)
+            else:
+                severities = set(severities)
+                seqs = []
+                for seq in reversed(channel_index):
+                    if self._severity_of(seq) in severities:
+                        seqs.append(seq)
+                        if limit is not None and len(seqs) >= limit:
+                            break
+                seqs.reverse()
+        else:
+            seqs = []
+            for severity in set(severities):
+                index = self._severity_index.get(severity, ())
+                if self._dropped:
+                    index = [seq for seq in index if seq not in self._dropped]
+                seqs.extend(self._recent_seqs(index, limit))
+            seqs.sort()
+            if limit is not None:
+                seqs = seqs[-limit:]
+
+        return [self._record(seq) for seq in seqs]
+
+    def count(self, channel=None, severities: Iterable[str] = None) -> int:
+        """
+        Return the number of stored sensations matching the given filters in O(1).
+
+        Counts cover every event in memory, including channel events that have
+        left their channel's view of the most recent `channel_capacity`.
+        """
+        if channel is None:
+            if severities is None:
+                return self.records
+            return sum(self.severity_counts.get(s, 0) for s in set(severities))
+
+        if severities is None:
+            return self.channel_counts.get(channel, 0)
+        counts = self.channel_severity_counts.get(channel)
+        if not counts:
+            return 0
+        return sum(counts.get(s, 0) for s in set(severities))
+
+    # ------------------------------------------------------------------
+    # Payload field indexes
+    # ------------------------------------------------------------------
+
+    def indexed_fields(self, channel) -> Tuple[str, ...]:
+        """Return the payload fields indexed for `channel`."""
+        return self.payload_indexes.get(channel, ())
+
+    def field_values(self, channel, field: str) -> Dict[Hashable, int]:
+        """
+        Return each indexed value of `field` on `channel` with the number of its events in memory.
+
+        Raises:
+            KeyError: If the field is not indexed for the channel.
+        """
+        return dict(self._field_counts[(channel, field)])
+
+    def field_count(self, channel, field: str, value: Hashable) -> int:
+        """
+        Return the number of `channel` events in memory whose `field` equals `value` in O(1).
+
+        Raises:
+            KeyError: If the field is not indexed for the channel.
+        """
+        return self._field_counts[(channel, field)].get(value, 0)
+
+    def select_field(self, channel, field: str, value: Hashable, limit: Optional[int] = None) -> List:
+        """
+        Return the most recent `channel` events whose `field` equals `value`, oldest first, in O(limit).
+
+        Raises:
+            KeyError: If the field is not indexed for the channel.
+        """
+        if limit is not None and limit <= 0:
+            return []
+        index = self._field_index[(channel, field)].get(value, ())
+        return [self._record(seq) for seq in self._recent_seqs(index, limit)]
+
+    def memory_footprint(self) -> int:
+        """
+        Estimate the bytes held by the store's own structures, excluding payload contents.
+        """
+        indexes = list(self._channel_index.values()) + list(self._severity_index.values())
+        for values in self._field_index.values():
+            indexes.extend(values.values())
+        footprint = sum(sys.getsizeof(index) for index in indexes) + sys.getsizeof(self._index_times)
+        if self._archive:
+            footprint += sys.getsizeof(self._archive) + sum(
+                sys.getsizeof(record) for record, _ in self._archive.values())
+        return footprint + sys.getsizeof(self._dropped) + sys.getsizeof(self._sizes)
+
+    # ------------------------------------------------------------------
+    # Backend hooks
+    # ------------------------------------------------------------------
+
+    def _allocate_index_times(self, capacity: int):
+        """Return the per-slot index time storage; called once from __init__."""
+        return array("d", bytes(8 * capacity))
+
+    def _write(self, position: int, sensation):
+        """Store `sensation` at `position`; the slot's index time is written afterwards."""
+        raise NotImplementedError
+
+    def _read(self, position: int):
+        raise NotImplementedError
+
+    def _channel_at(self, position: int):
+        raise NotImplementedError
+
+    def _severity_at(self, position: int) -> str:
+        raise NotImplementedError
+
+    def _data_at(self, position: int) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def _count_at(self, position: int) -> int:
+        """Occurrence count of the record at `position`."""
+        raise NotImplementedError
+
+    def _add_occurrence(self, position: int, timestamp: float) -> int:
+        """Count one more occurrence of the record at `position` and return its new count."""
+        raise NotImplementedError
+
+
+class ObjectSensoryStore(SensoryStore):
+    """
+    Sensory store that keeps SensoryData objects in a ring of references.
+    """
+
+    backend_name = "object"
+
+    def __init__(self, capacity: int, channel_capacity: int = 1000,
+                 payload_indexes: Mapping[Any, Iterable[str]] = None,
+                 retention: Mapping[Any, Any] = None):
+        super().__init__(capacity, channel_capacity, payload_indexes, retention)
+        self._slots: List[Any] = [None] * capacity
+
+    def _write(self, position: int, sensation):
+        self._slots[position] = sensation
+
+    def _read(self, position: int):
+        return self._slots[position]
+
+    def _channel_at(self, position: int):
+        return self._slots[position].channel
+
+    def _severity_at(self, position: int) -> str:
+        return self._slots[position].severity
+
+    def _data_at(self, position: int) -> Dict[str, Any]:
+        return self._slots[position].data
+
+    def _count_at(self, position: int) -> int:
+        return self._slots[position].count
+
+    def _add_occurrence(self, position: int, timestamp: float) -> int:
+        record = self._slots[position]
+        record.count += 1
+        record.last_timestamp = max(timestamp, record.last_timestamp or record.timestamp)
+        return record.count
+
+    def clear(self):
+        super().clear()
+        self._slots = [None] * self.capacity
+
+    def memory_footprint(self) -> int:
+        footprint = super().memory_footprint() + sys.getsizeof(self._slots)
+        for s in self._slots:
+            if s is not None:
+                footprint += sys.getsizeof(s)
+                if hasattr(s, "__dict__"):  # Records without __slots__
+                    footprint += sys.getsizeof(s.__dict__)
+        return footprint
+
+
+class ColumnarSensoryStore(SensoryStore):
+    """
+    Array-backed sensory store.
+
+    Each event occupies one row across contiguous columns: timestamps as
+    float64, channel and severity as uint8 codes, source and event type as
+    uint32 interned ids. Payloads and correlation ids live in side tables.
+    SensoryData objects are only materialised for the rows a query returns.
+
+    The timestamp column doubles as the store's index times. The rare events
+    whose timestamp was clamped keep their original timestamp in a sparse
+    side table, so time ranges cost no extra column. Occurrence counts of
+    coalesced records live in another sparse side table.
+
+    Sources and event types are interned with reference counts held by the
+    rows that use them, so a value is forgotten once the ring has overwritten
+    its last row, and the string table holds at most two values per row even
+    with unbounded source names.
+    """
+
+    backend_name = "columnar"
+
+    def __init__(self, capacity: int, channel_capacity: int = 1000, record_type=None,
+                 payload_indexes: Mapping[Any, Iterable[str]] = None,
+                 retention: Mapping[Any, Any] = None):
+        """
+        Initialize the column arrays.
+
+        Parameters:
+            capacity (int): Maximum number of events retained.
+            channel_capacity (int): Maximum number of events visible per channel, severity or field value view.
+            record_type (type): Class used to materialise rows (normally SensoryData).
+            payload_indexes (mapping, optional): Channel -> payload field names to index.
+            retention (mapping, optional): Channel -> RetentionPolicy, or a dict of its arguments.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("ColumnarSensoryStore requires numpy")
+        if record_type is None:
+            raise ValueError("record_type is required to materialise stored events")
+
+        super().__init__(capacity, channel_capacity, payload_indexes, retention)
+        self.record_type = record_type
+
+        self._channels = StringInterner()
+        self._severities = StringInterner(SEVERITY_LEVELS)
+        self._strings = StringInterner(refcounted=True)
+
+        self._raw_timestamps: Dict[int, float] = {}  # position -> timestamp, clamped rows only
+        self._occurrences: Dict[int, Tuple[int, float]] = {}  # position -> (count, last timestamp), coalesced rows only
+        self.channel_codes = np.zeros(capacity, dtype=np.uint8)
+        self.severity_codes = np.zeros(capacity, dtype=np.uint8)
+        self.source_ids = np.zeros(capacity, dtype=np.uint32)
+        self.event_type_ids = np.zeros(capacity, dtype=np.uint32)
+        self.payloads: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self.correlation_ids: List[Optional[str]] = [None] * capacity
+
+    def _allocate_index_times(self, capacity: int):
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        return self.timestamps
+
+    def _write(self, position: int, sensation):
+        # The base class writes the clamped index time into self.timestamps
+        if sensation.timestamp < self._last_index_time:
+            self._raw_timestamps[position] = sensation.timestamp
+        elif self._raw_timestamps:
+            self._raw_timestamps.pop(position, None)
+        if self._occurrences:
+            self._occurrences.pop(position, None)
+        self.channel_codes[position] = self._channels.intern(sensation.channel)
+        self.severity_codes[position] = self._severities.intern(sensation.severity)
+        strings = self._strings
+        if self._next_seq >= self.capacity:
+            # The slot still holds an older row; its strings are released once the new ones are taken
+            released = (int(self.source_ids[position]), int(self.event_type_ids[position]))
+        else:
+            released = ()
+        self.source_ids[position] = strings.intern(sensation.source)
+        self.event_type_ids[position] = strings.intern(sensation.event_type)
+        for value_id in released:
+            strings.release(value_id)
+        self.payloads[position] = sensation.data
+        self.correlation_ids[position] = sensation.correlation_id
+
+    def _read(self, position: int):
+        record = self.record_type(
+            timestamp=self._raw_timestamps.get(position, float(self.timestamps[position])),
+            channel=self._channels.lookup(int(self.channel_codes[position])),
+            source=self._strings.lookup(int(self.source_ids[position])),
+            event_type=self._strings.lookup(int(self.event_type_ids[position])),
+            data=self.payloads[position],
+            severity=self._severities.lookup(int(self.severity_codes[position])),
+            correlation_id=self.correlation_ids[position],
+        )
+        if self._occurrences:
+            occurrences = self._occurrences.get(position)
+            if occurrences is not None:
+                record.count, record.last_timestamp = occurrences
+        return record
+
+    def _channel_at(self, position: int):
+        return self._channels.lookup(int(self.channel_codes[position]))
+
+    def _severity_at(self, position: int) -> str:
+        return self._severities.lookup(int(self.severity_codes[position]))
+
+    def _data_at(self, position: int) -> Dict[str, Any]:
+        return self.payloads[position]
+
+    def _count_at(self, position: int) -> int:
+        occurrences = self._occurrences.get(position)
+        return occurrences[0] if occurrences is not None else 1
+
+    def _add_occurrence(self, position: int, timestamp: float) -> int:
+        first = self._raw_timestamps.get(position, float(self.timestamps[position]))
+        count, last = self._occurrences.get(position, (1, first))
+        self._occurrences[position] = (count + 1, max(last, timestamp))
+        return count + 1
+
+    def clear(self):
+        super().clear()
+        self._strings = StringInterner(refcounted=True)
+        self._raw_timestamps = {}
+        self._occurrences = {}
+        self.payloads = [None] * self.capacity
+        self.correlation_ids = [None] * self.capacity
+
+    def memory_footprint(self) -> int:
+        # self.timestamps is counted by the base class as the index times
+        arrays = (self.channel_codes, self.severity_codes, self.source_ids, self.event_type_ids)
+        footprint = super().memory_footprint() + sum(a.nbytes for a in arrays)
+        footprint += sys.getsizeof(self.payloads) + sys.getsizeof(self.correlation_ids)
+        footprint += sys.getsizeof(self._raw_timestamps) + sys.getsizeof(self._occurrences)
+        return footprint
+
+
+SENSORY_STORE_BACKENDS = {
+    ObjectSensoryStore.backend_name: ObjectSensoryStore,
+    ColumnarSensoryStore.backend_name: ColumnarSensoryStore,
+}
+
+
+def create_sensory_store(backend: str, capacity: int, record_type=None,
+                         channel_capacity: int = 1000,
+                         payload_indexes: Mapping[Any, Iterable[str]] = None,
+                         retention: Mapping[Any, Any] = None) -> SensoryStore:
+    """
+    Build a sensory store by backend name.
+
+    Parameters:
+        backend (str): One of the keys of SENSORY_STORE_BACKENDS ("object" or "columnar").
+        capacity (int): Maximum number of events retained.
+        record_type (type, optional): Class used by array-backed stores to materialise rows.
+        channel_capacity (int): Maximum number of events visible per channel view.
+        payload_indexes (mapping, optional): Channel -> payload field names to index.
+        retention (mapping, optional): Channel -> RetentionPolicy, or a dict of its arguments.
+
+    Returns:
+        SensoryStore: A new, empty store.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    store_class = SENSORY_STORE_BACKENDS.get(backend)
+    if store_class is None:
+        raise ValueError(
+            f"Unknown sensory store backend '{backend}'. "
+            f"Available: {sorted(SENSORY_STORE_BACKENDS)}"
+        )
+    if store_class is ColumnarSensoryStore:
+        return store_class(capacity, channel_capacity, record_type=record_type,
+                           payload_indexes=payload_indexes, retention=retention)
+    return store_class(capacity, channel_capacity, payload_indexes=payload_indexes,
+                       retention=retention)
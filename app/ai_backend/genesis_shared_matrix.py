@@ -0,0 +1,559 @@
+# genesis_shared_matrix.py
+"""
+Phase 3: The Genesis Layer - Shared Matrix Segment
+One Memory, Many Workers
+
+`gunicorn -w 4` runs four copies of the Genesis Layer. Each worker used to
+keep its own Consciousness Matrix, so each saw a quarter of the events and
+ran its own synthesis threads. A SharedMatrixSegment puts the matrix's
+event stream in one `multiprocessing.shared_memory` block:
+
+- Every process perceives into its own shard, a single-producer ring in
+  the segment, without any cross-process lock.
+- One process, elected with an exclusive `flock`, is the sequencer. It
+  merges the shards by timestamp into the global ring, the one place events
+  get a global sequence number. If it exits, the OS drops its lock and the
+  next process that tries takes over where the global ring stopped.
+- Every process, the sequencer included, replays the global ring in order
+  into its local matrix, so queries in any worker cover every worker's
+  events. A worker that starts late replays whatever the ring still holds.
+- Synthesis runs only in the sequencer, which publishes each result to a
+  second ring that the other workers copy into their synthesis history.
+
+Slots are written seqlock-style: a slot's commit word is cleared, the
+framed, CRC-checked record is written, and the commit word is set to the
+record's sequence number plus one. Readers check the commit word before and
+after copying and verify the CRC, so a slot overwritten mid-read is
+detected and skipped rather than misread. Records larger than a slot keep
+their envelope with the payload replaced by a "_truncated" marker.
+
+Processes attach lazily, on first use, and again after a fork, so a
+gunicorn master that imports the app with --preload does not hand its shard
+or the sequencer role to its workers. The segment outlives its processes
+and is reused by the next start if its layout matches; unlink() removes it.
+Requires POSIX (fcntl), like gunicorn itself.
+"""
+
+import dataclasses
+import heapq
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+try:
+    import fcntl
+    from multiprocessing import resource_tracker, shared_memory
+    SHARED_MATRIX_AVAILABLE = True
+except ImportError:
+    fcntl = None
+    resource_tracker = shared_memory = None
+    SHARED_MATRIX_AVAILABLE = False
+
+from genesis_sensory_log import RECORD_HEADER, encode_record, scan_records
+
+MAGIC = b"GENMTX01"
+
+# magic, capacity, slot size, max workers, shard capacity, synthesis capacity, synthesis slot size
+HEADER = struct.Struct("<8s6I")
+GLOBAL_HEAD_OFFSET = 32
+SYNTHESIS_HEAD_OFFSET = 40
+HEADER_SIZE = 64
+
+# pid, head, tail, dropped
+WORKER_ENTRY = struct.Struct("<4Q")
+
+# commit (sequence + 1, 0 while being written), timestamp, record length
+SLOT_HEADER = struct.Struct("<QdI4x")
+
+COUNTER = struct.Struct("<Q")
+
+# Environment variable naming the shared segments of the module-level matrices
+SHARED_MATRIX_ENV = "GENESIS_SHARED_MATRIX"
+
+
+def shared_matrix_options(role: str) -> Dict[str, Any]:
+    """
+    Return ConsciousnessMatrix arguments for shared mode when GENESIS_SHARED_MATRIX is set.
+
+    Parameters:
+        role (str): Suffix that gives each module-level matrix its own segment, e.g. "global" or "core".
+
+    Returns:
+        dict: {"ingestion_mode": "shared", "shared_name": "<prefix>-<role>"}, or an empty dict when the variable is unset or shared memory is unavailable.
+    """
+    prefix = os.getenv(SHARED_MATRIX_ENV, "")
+    if not prefix or not SHARED_MATRIX_AVAILABLE:
+        return {}
+    return {"ingestion_mode": "shared", "shared_name": f"{prefix}-{role}"}
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class _SlotRing:
+    """Fixed-size slots in a region of the segment, addressed by sequence number."""
+
+    __slots__ = ("buf", "offset", "capacity", "slot_size", "max_record")
+
+    def __init__(self, buf, offset: int, capacity: int, slot_size: int):
+        self.buf = buf
+        self.offset = offset
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self.max_record = slot_size - SLOT_HEADER.size
+
+    @property
+    def size(self) -> int:
+        return self.capacity * self.slot_size
+
+    def write(self, seq: int, timestamp: float, record: bytes):
+        position = self.offset + (seq % self.capacity) * self.slot_size
+        buf = self.buf
+        COUNTER.pack_into(buf, position, 0)
+        start = position + SLOT_HEADER.size
+        buf[start:start + len(record)] = record
+        SLOT_HEADER.pack_into(buf, position, seq + 1, timestamp, len(record))
+
+    def read(self, seq: int) -> Optional[Tuple[float, bytes]]:
+        """Return (timestamp, record) stored for `seq`, or None if the slot holds another sequence."""
+        position = self.offset + (seq % self.capacity) * self.slot_size
+        commit, timestamp, length = SLOT_HEADER.unpack_from(self.buf, position)
+        if commit != seq + 1 or length > self.max_record:
+            return None
+        start = position + SLOT_HEADER.size
+        record = bytes(self.buf[start:start + length])
+        if COUNTER.unpack_from(self.buf, position)[0] != commit:
+            return None
+        return timestamp, record
+
+
+def _unframe(record: bytes) -> Optional[bytes]:
+    """Return the JSON payload of a framed record, or None if it is torn or corrupt."""
+    for _, payload in scan_records(record):
+        return payload
+    return None
+
+
+def _frame(payload: bytes) -> bytes:
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+class SharedMatrixSegment:
+    """
+    Cross-process event stream of a shared-mode Consciousness Matrix, with the interface of ShardedIngestBuffer.
+    """
+
+    def __init__(self, name: str, record_factory: Callable[..., Any], capacity: int = 10000,
+                 slot_size: int = 1024, max_workers: int = 16, shard_capacity: int = 256,
+                 synthesis_capacity: int = 32, synthesis_slot_size: int = 65536,
+                 lock_dir: Optional[str] = None, election_interval: float = 1.0):
+        """
+        Parameters:
+            name (str): Name of the shared memory block; every process using the same name shares one stream.
+            record_factory (callable): Builds a perception from a sensory log record's fields (timestamp, channel value, source, event type, data, severity, correlation id).
+            capacity (int): Events held in the global ring; a worker can replay at most this many.
+            slot_size (int): Bytes per event slot; larger events are stored with their payload truncated.
+            max_workers (int): Processes that can attach at once, each with its own shard.
+            shard_capacity (int): Events a process can buffer before the sequencer drains them; further events are dropped and counted.
+            synthesis_capacity (int): Synthesis results kept in the synthesis ring.
+            synthesis_slot_size (int): Bytes per synthesis result; larger results are not shared.
+            lock_dir (str, optional): Directory of the election and attach lock files; defaults to the system temp directory.
+            election_interval (float): Seconds between a non-sequencer's attempts to become the sequencer.
+        """
+        if not SHARED_MATRIX_AVAILABLE:
+            raise RuntimeError("Shared matrix mode needs multiprocessing.shared_memory and fcntl")
+        if slot_size <= SLOT_HEADER.size + RECORD_HEADER.size:
+            raise ValueError("slot_size is too small to hold a record")
+        for label, value in (("capacity", capacity), ("max_workers", max_workers),
+                             ("shard_capacity", shard_capacity),
+                             ("synthesis_capacity", synthesis_capacity)):
+            if value <= 0:
+                raise ValueError(f"{label} must be positive")
+        self.name = name
+        self.record_factory = record_factory
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self.max_workers = max_workers
+        self.shard_capacity = shard_capacity
+        self.synthesis_capacity = synthesis_capacity
+        self.synthesis_slot_size = synthesis_slot_size
+        self.lock_dir = lock_dir or tempfile.gettempdir()
+        self.election_interval = election_interval
+        self.flush_threshold = max(1, shard_capacity // 4)
+
+        self._workers_offset = HEADER_SIZE
+        self._events_offset = self._workers_offset + max_workers * WORKER_ENTRY.size
+        self._synthesis_offset = self._events_offset + capacity * slot_size
+        self._shards_offset = self._synthesis_offset + synthesis_capacity * synthesis_slot_size
+        self.size = self._shards_offset + max_workers * shard_capacity * slot_size
+
+        # Threads of one process share its shard; appends are serialised here, never across processes
+        self._append_lock = threading.Lock()
+        self._local = threading.Lock()
+        self._pid = None
+        self._shm = None
+        self._buf = None
+        self._events = None
+        self._syntheses = None
+        self._shards: List[_SlotRing] = []
+        self._worker = None
+        self._primary_fd = None
+        self._next_election = 0.0
+        self._next_seq = 0
+        self._next_synthesis = 0
+
+        self.flushes = 0
+        self.sequenced = 0
+        self.dropped = 0
+        self.truncated = 0
+        self.missed = 0
+        self.corrupt = 0
+        self.syntheses_published = 0
+        self.syntheses_dropped = 0
+
+    # ------------------------------------------------------------------
+    # Attaching
+    # ------------------------------------------------------------------
+
+    def _lock_path(self, kind: str) -> str:
+        return os.path.join(self.lock_dir, f"{self.name}.{kind}.lock")
+
+    def _attached(self):
+        """Attach on first use and again in a forked child, which must not reuse its parent's shard or role."""
+        if self._pid != os.getpid():
+            with self._local:
+                if self._pid != os.getpid():
+                    self._attach()
+
+    def _attach(self):
+        # An inherited mapping and lock descriptor belong to the parent process
+        self._primary_fd = None
+        with open(self._lock_path("attach"), "a+") as attach_lock:
+            fcntl.flock(attach_lock, fcntl.LOCK_EX)
+            try:
+                shm = self._open_block()
+                buf = shm.buf
+                self._check_layout(buf)
+                worker = self._claim_worker(buf)
+            finally:
+                fcntl.flock(attach_lock, fcntl.LOCK_UN)
+
+        self._shm, self._buf, self._worker = shm, buf, worker
+        self._events = _SlotRing(buf, self._events_offset, self.capacity, self.slot_size)
+        self._syntheses = _SlotRing(buf, self._synthesis_offset, self.synthesis_capacity,
+                                    self.synthesis_slot_size)
+        self._shards = [
+            _SlotRing(buf, self._shards_offset + index * self.shard_capacity * self.slot_size,
+                      self.shard_capacity, self.slot_size)
+            for index in range(self.max_workers)
+        ]
+        # Start from the oldest event still in the ring: a late worker sees the whole window
+        head = COUNTER.unpack_from(buf, GLOBAL_HEAD_OFFSET)[0]
+        self._next_seq = max(0, head - self.capacity)
+        synthesis_head = COUNTER.unpack_from(buf, SYNTHESIS_HEAD_OFFSET)[0]
+        self._next_synthesis = max(0, synthesis_head - self.synthesis_capacity)
+        self._next_election = 0.0
+        self._pid = os.getpid()
+
+    def _open_block(self):
+        """Attach to the block, creating and initialising it if it does not exist. Caller holds the attach lock."""
+        try:
+            shm = shared_memory.SharedMemory(name=self.name)
+            created = False
+        except FileNotFoundError:
+            shm = shared_memory.SharedMemory(name=self.name, create=True, size=self.size)
+            created = True
+        # The block outlives this process; only unlink() removes it
+        resource_tracker.unregister(shm._name, "shared_memory")
+        if created:
+            HEADER.pack_into(shm.buf, 0, MAGIC, self.capacity, self.slot_size, self.max_workers,
+                             self.shard_capacity, self.synthesis_capacity, self.synthesis_slot_size)
+        return shm
+
+    def _check_layout(self, buf):
+        layout = HEADER.unpack_from(buf, 0)
+        expected = (MAGIC, self.capacity, self.slot_size, self.max_workers, self.shard_capacity,
+                    self.synthesis_capacity, self.synthesis_slot_size)
+        if layout != expected:
+            raise ValueError(
+                f"Shared matrix '{self.name}' exists with a different layout {layout[1:]}; "
+                f"unlink it or use the same settings {expected[1:]}")
+
+    def _claim_worker(self, buf) -> int:
+        """Take a free shard entry, or one left by an exited process. Caller holds the attach lock."""
+        pid = os.getpid()
+        for index in range(self.max_workers):
+            offset = self._workers_offset + index * WORKER_ENTRY.size
+            owner, head, tail, dropped = WORKER_ENTRY.unpack_from(buf, offset)
+            if owner == 0 or not _pid_alive(owner):
+                # Events the previous owner left behind stay queued ahead of ours
+                WORKER_ENTRY.pack_into(buf, offset, pid, head, tail, dropped)
+                return index
+        raise RuntimeError(f"Shared matrix '{self.name}' has no free shard for another process "
+                           f"(max_workers={self.max_workers})")
+
+    def _entry(self, index: int) -> int:
+        return self._workers_offset + index * WORKER_ENTRY.size
+
+    # ------------------------------------------------------------------
+    # Producing
+    # ------------------------------------------------------------------
+
+    def add(self, sensation) -> bool:
+        """
+        Append a perception to this process's shard.
+
+        Returns:
+            bool: True when the shard is filling up and the caller should flush.
+        """
+        self._attached()
+        record = encode_record(sensation)
+        shard = self._shards[self._worker]
+        if len(record) > shard.max_record:
+            # Keep the envelope; the sensory log record format cannot be split across slots
+            record = encode_record(dataclasses.replace(sensation, data={
+                "_truncated": {"original_bytes": len(record), "dropped_fields": list(sensation.data)}
+            }))
+            self.truncated += 1
+            if len(record) > shard.max_record:
+                self.dropped += 1
+                return True
+
+        offset = self._entry(self._worker)
+        buf = self._buf
+        with self._append_lock:
+            _, head, tail, dropped = WORKER_ENTRY.unpack_from(buf, offset)
+            if head - tail >= self.shard_capacity:
+                self.dropped += 1
+                COUNTER.pack_into(buf, offset + 24, dropped + 1)
+                return True
+            shard.write(head, sensation.timestamp, record)
+            COUNTER.pack_into(buf, offset + 8, head + 1)
+        return head + 1 - tail >= self.flush_threshold
+
+    def publish_synthesis(self, name: str, synthesis: Dict[str, Any]) -> bool:
+        """
+        Share a synthesis result with the other processes. Only the sequencer publishes.
+
+        Returns:
+            bool: False if the result is too large for a synthesis slot and was not shared.
+        """
+        self._attached()
+        payload = json.dumps([[os.getpid(), self._worker], name, synthesis], separators=(",", ":"),
+                             default=str).encode("utf-8")
+        record = _frame(payload)
+        if len(record) > self._syntheses.max_record:
+            self.syntheses_dropped += 1
+            return False
+        with self._append_lock:
+            head = COUNTER.unpack_from(self._buf, SYNTHESIS_HEAD_OFFSET)[0]
+            self._syntheses.write(head, time.time(), record)
+            COUNTER.pack_into(self._buf, SYNTHESIS_HEAD_OFFSET, head + 1)
+            self.syntheses_published += 1
+        return True
+
+    # ------------------------------------------------------------------
+    # Sequencing and replay
+    # ------------------------------------------------------------------
+
+    def is_primary(self) -> bool:
+        """
+        Return whether this process is the sequencer, trying to become it at most once per election interval.
+        """
+        self._attached()
+        if self._primary_fd is not None:
+            return True
+        now = time.monotonic()
+        if now < self._next_election:
+            return False
+        self._next_election = now + self.election_interval
+        lock_file = open(self._lock_path("primary"), "a+")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._primary_fd = lock_file
+        print(f"👑 Shared matrix '{self.name}': process {os.getpid()} is now the sequencer")
+        return True
+
+    def _sequence(self) -> int:
+        """Merge every shard into the global ring by timestamp. Only the sequencer calls this."""
+        buf = self._buf
+        pending = []
+        tails = []
+        for index in range(self.max_workers):
+            offset = self._entry(index)
+            _, head, tail, _ = WORKER_ENTRY.unpack_from(buf, offset)
+            if head == tail:
+                continue
+            shard = self._shards[index]
+            records = []
+            for seq in range(tail, head):
+                slot = shard.read(seq)
+                if slot is None:
+                    self.corrupt += 1
+                    continue
+                records.append(slot)
+            pending.append(records)
+            tails.append((offset, head))
+
+        if not pending:
+            return 0
+        head = COUNTER.unpack_from(buf, GLOBAL_HEAD_OFFSET)[0]
+        written = 0
+        # Each shard is already in timestamp order, so a k-way merge restores the global order
+        for timestamp, record in heapq.merge(*pending, key=lambda slot: slot[0]):
+            self._events.write(head + written, timestamp, record)
+            written += 1
+        COUNTER.pack_into(buf, GLOBAL_HEAD_OFFSET, head + written)
+        for offset, shard_head in tails:
+            COUNTER.pack_into(buf, offset + 16, shard_head)
+        self.sequenced += written
+        return written
+
+    def drain(self) -> List:
+        """
+        Sequence the shards if this process is the sequencer, then return the global events this process has not replayed yet, oldest first.
+        """
+        self._attached()
+        with self._local:
+            if self.is_primary():
+                self._sequence()
+            head = COUNTER.unpack_from(self._buf, GLOBAL_HEAD_OFFSET)[0]
+            start = self._next_seq
+            if head - start > self.capacity:
+                self.missed += head - self.capacity - start
+                start = head - self.capacity
+            payloads = []
+            for seq in range(start, head):
+                slot = self._events.read(seq)
+                payload = _unframe(slot[1]) if slot is not None else None
+                if payload is None:
+                    # Overwritten by the sequencer while we were reading it
+                    self.missed += 1
+                    continue
+                payloads.append(payload)
+            self._next_seq = head
+        if not payloads:
+            return []
+        self.flushes += 1
+        factory = self.record_factory
+        return [factory(*record) for record in json.loads(b"[" + b",".join(payloads) + b"]")]
+
+    def drain_syntheses(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Return the synthesis results published by other attachments since the last call, oldest first.
+        """
+        self._attached()
+        publisher_id = [os.getpid(), self._worker]
+        with self._local:
+            head = COUNTER.unpack_from(self._buf, SYNTHESIS_HEAD_OFFSET)[0]
+            start = max(self._next_synthesis, head - self.synthesis_capacity)
+            results = []
+            for seq in range(start, head):
+                slot = self._syntheses.read(seq)
+                payload = _unframe(slot[1]) if slot is not None else None
+                if payload is None:
+                    continue
+                publisher, name, synthesis = json.loads(payload)
+                if publisher != publisher_id:
+                    results.append((name, synthesis))
+            self._next_synthesis = head
+        return results
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    def pending(self) -> int:
+        """Return the number of events waiting in every shard for the sequencer."""
+        self._attached()
+        total = 0
+        for index in range(self.max_workers):
+            _, head, tail, _ = WORKER_ENTRY.unpack_from(self._buf, self._entry(index))
+            total += head - tail
+        return total
+
+    def shard_count(self) -> int:
+        """Return the number of attached processes."""
+        self._attached()
+        return sum(1 for index in range(self.max_workers)
+                   if WORKER_ENTRY.unpack_from(self._buf, self._entry(index))[0])
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the segment's layout, this process's role and cursors, and its sequencing, drop and replay counts.
+        """
+        self._attached()
+        return {
+            "name": self.name,
+            "pid": os.getpid(),
+            "primary": self._primary_fd is not None,
+            "size_bytes": self.size,
+            "capacity": self.capacity,
+            "slot_size": self.slot_size,
+            "workers": self.shard_count(),
+            "max_workers": self.max_workers,
+            "global_head": COUNTER.unpack_from(self._buf, GLOBAL_HEAD_OFFSET)[0],
+            "replayed_up_to": self._next_seq,
+            "pending": self.pending(),
+            "sequenced": self.sequenced,
+            "dropped": self.dropped,
+            "truncated": self.truncated,
+            "missed": self.missed,
+            "corrupt": self.corrupt,
+            "syntheses_published": self.syntheses_published,
+            "syntheses_dropped": self.syntheses_dropped,
+        }
+
+    def close(self):
+        """
+        Detach this process: give up the sequencer role and the shard entry and unmap the block. Events still in the shard are sequenced by the next sequencer.
+        """
+        with self._local:
+            if self._pid != os.getpid():
+                return
+            with open(self._lock_path("attach"), "a+") as attach_lock:
+                fcntl.flock(attach_lock, fcntl.LOCK_EX)
+                offset = self._entry(self._worker)
+                _, head, tail, dropped = WORKER_ENTRY.unpack_from(self._buf, offset)
+                WORKER_ENTRY.pack_into(self._buf, offset, 0, head, tail, dropped)
+                fcntl.flock(attach_lock, fcntl.LOCK_UN)
+            if self._primary_fd is not None:
+                self._primary_fd.close()
+                self._primary_fd = None
+            self._events = self._syntheses = None
+            self._shards = []
+            self._buf = None
+            self._shm.close()
+            self._shm = None
+            self._pid = None
+
+    def unlink(self):
+        """Close, then remove the shared block and its lock files, discarding every shared event."""
+        self.close()
+        try:
+            shm = shared_memory.SharedMemory(name=self.name)
+        except FileNotFoundError:
+            pass
+        else:
+            shm.close()
+            shm.unlink()
+        for kind in ("attach", "primary"):
+            try:
+                os.remove(self._lock_path(kind))
+            except FileNotFoundError:
+                pass
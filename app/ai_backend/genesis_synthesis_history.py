@@ -0,0 +1,159 @@
+# genesis_synthesis_history.py
+"""
+Phase 3: The Genesis Layer - Synthesis History
+What The Matrix Remembers Understanding
+
+Bounded, time-ordered history of synthesis results for the Consciousness
+Matrix. Each synthesis kind (immediate, micro, macro, meta) has its own ring
+buffer, so recording and eviction are O(1) and reading the latest `limit`
+results costs O(limit). Results evicted from memory can optionally be spilled
+to per-kind JSON-lines files for long-horizon history.
+"""
+
+import heapq
+import itertools
+import json
+import os
+import threading
+from collections import deque
+from itertools import islice
+from typing import Dict, Any, Iterator, List, Optional
+
+
+class SynthesisHistory:
+    """
+    Per-kind ring buffers of synthesis results, newest last.
+
+    Every record is stamped with a global sequence number, so results of
+    different kinds can be interleaved in recording order and two results
+    produced in the same second never collide.
+    """
+
+    def __init__(self, capacity_per_type: int = 500, spill_dir: Optional[str] = None):
+        """
+        Create an empty history.
+
+        Parameters:
+            capacity_per_type (int): Number of results kept in memory for each synthesis kind.
+            spill_dir (str, optional): Directory that receives results evicted from memory, one `<kind>.jsonl` file per kind. Eviction simply drops results when not set.
+        """
+        if capacity_per_type <= 0:
+            raise ValueError("capacity_per_type must be a positive integer")
+        self.capacity_per_type = capacity_per_type
+        self.spill_dir = spill_dir
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+        self._buffers: Dict[str, deque] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self.spilled = 0
+
+    def record(self, synthesis_type: str, synthesis: Dict[str, Any]) -> int:
+        """
+        Append a synthesis result, evicting (and optionally spilling) the oldest result of the same kind.
+
+        Returns:
+            int: The sequence number assigned to the result.
+        """
+        with self._lock:
+            buffer = self._buffers.get(synthesis_type)
+            if buffer is None:
+                buffer = self._buffers[synthesis_type] = deque()
+            if len(buffer) == self.capacity_per_type:
+                evicted = buffer.popleft()
+                if self.spill_dir:
+                    self._spill(synthesis_type, evicted)
+            seq = next(self._sequence)
+            buffer.append((seq, synthesis))
+            return seq
+
+    def recent(self, synthesis_type: str = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Return up to `limit` in-memory results, newest first.
+
+        Parameters:
+            synthesis_type (str, optional): Restrict the results to one synthesis kind; all kinds are interleaved by recording order when omitted.
+            limit (int): Maximum number of results to return.
+
+        Returns:
+            list: Synthesis result dictionaries, newest first.
+        """
+        if limit <= 0:
+            return []
+        with self._lock:
+            if synthesis_type is not None:
+                buffer = self._buffers.get(synthesis_type, ())
+                return [synthesis for _, synthesis in islice(reversed(buffer), limit)]
+
+            newest_first = heapq.merge(*(reversed(buffer) for buffer in self._buffers.values()),
+                                       key=lambda entry: entry[0], reverse=True)
+            return [synthesis for _, synthesis in islice(newest_first, limit)]
+
+    def history(self, synthesis_type: str, since: float = None,
+                limit: int = None) -> List[Dict[str, Any]]:
+        """
+        Return spilled and in-memory results of one kind, oldest first.
+
+        Parameters:
+            synthesis_type (str): The synthesis kind to read.
+            since (float, optional): Only include results whose `timestamp` is at or after this epoch time.
+            limit (int, optional): Only return the newest `limit` matching results.
+
+        Returns:
+            list: Synthesis result dictionaries, oldest first.
+        """
+        results = deque(maxlen=limit) if limit else deque()
+        for synthesis in itertools.chain(self._read_spill(synthesis_type),
+                                         self._memory(synthesis_type)):
+            if since is not None and synthesis.get("timestamp", 0.0) < since:
+                continue
+            results.append(synthesis)
+        return list(results)
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of in-memory results per synthesis kind."""
+        with self._lock:
+            return {kind: len(buffer) for kind, buffer in self._buffers.items()}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(buffer) for buffer in self._buffers.values())
+
+    def clear(self):
+        """Drop every in-memory result. Spilled files are left on disk."""
+        with self._lock:
+            self._buffers.clear()
+
+    def _memory(self, synthesis_type: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [synthesis for _, synthesis in self._buffers.get(synthesis_type, ())]
+
+    def _spill_path(self, synthesis_type: str) -> str:
+        return os.path.join(self.spill_dir, f"{synthesis_type}.jsonl")
+
+    def _spill(self, synthesis_type: str, entry: tuple):
+        """Append an evicted entry to its kind's spill file. Caller must hold the lock."""
+        seq, synthesis = entry
+        try:
+            with open(self._spill_path(synthesis_type), "a", encoding="utf-8") as spill:
+                spill.write(json.dumps({"seq": seq, "synthesis": synthesis}, default=str) + "\n")
+            self.spilled += 1
+        except OSError as e:
+            print(f"⚠️ Synthesis spill failed for {synthesis_type}: {e}")
+
+    def _read_spill(self, synthesis_type: str) -> Iterator[Dict[str, Any]]:
+        if not self.spill_dir:
+            return
+        path = self._spill_path(synthesis_type)
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as spill:
+            for line in spill:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)["synthesis"]
+                except (ValueError, KeyError):
+                    continue
@@ -0,0 +1,180 @@
+# genesis_vitals_sampler.py
+"""
+Phase 3: The Genesis Layer - Vitals Sampler
+A Steady Pulse
+
+Background sampler for host vitals (CPU, memory, disk, load, temperature)
+shared by the Consciousness Matrix and Kai's RGSS veto. psutil is polled on
+the sampler's own cadence using the non-blocking form of cpu_percent, and
+each sample is published by swapping a single reference, so readers get the
+latest snapshot in microseconds without a lock or a 100 ms sleep. Only the
+very first read in a process, which has no earlier sample to measure CPU
+usage from, waits for a short CPU window.
+"""
+
+import threading
+import time
+from typing import Dict, Any, Optional
+
+import psutil
+
+# Sensor names checked, in order, for a CPU temperature reading
+TEMPERATURE_SENSORS = ("cpu-thermal", "coretemp", "k10temp", "cpu_thermal")
+
+# Seconds of CPU usage measured by the first read, before any sample exists
+FIRST_CPU_WINDOW = 0.1
+
+
+def read_cpu_temperature() -> Optional[float]:
+    """
+    Return the current CPU temperature in Celsius, or None if no known sensor is available.
+    """
+    if not hasattr(psutil, "sensors_temperatures"):
+        return None
+    try:
+        temps = psutil.sensors_temperatures()
+    except Exception:
+        return None
+    for sensor in TEMPERATURE_SENSORS:
+        if temps.get(sensor):
+            return temps[sensor][0].current
+    return None
+
+
+class VitalsSampler:
+    """
+    Periodically samples host vitals into an immutable snapshot.
+
+    The background thread starts on first use. If the published snapshot is
+    older than the allowed staleness (for example if the thread has stopped),
+    the reader refreshes it inline; that refresh is still non-blocking because
+    CPU usage is measured since the previous sample rather than over a sleep.
+    Before the first sample there is no such baseline (a non-blocking reading
+    would be 0%), so the first inline refresh measures a FIRST_CPU_WINDOW
+    interval instead.
+    """
+
+    def __init__(self, interval: float = 2.0, max_staleness: float = 10.0, disk_path: str = "/"):
+        """
+        Parameters:
+            interval (float): Seconds between background samples.
+            max_staleness (float): Default maximum age in seconds of a snapshot handed to readers.
+            disk_path (str): Mount point whose usage is reported.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.max_staleness = max_staleness
+        self.disk_path = disk_path
+
+        self._snapshot = None  # (monotonic sample time, vitals dict), replaced atomically
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.samples = 0
+        self.inline_refreshes = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+
+    def start(self):
+        """Start the background sampling thread if it is not already running."""
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            psutil.cpu_percent(interval=None)  # Prime the CPU usage baseline
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="genesis-vitals-sampler",
+                                            daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the background sampling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def refresh(self, cpu_window: float = None) -> Dict[str, Any]:
+        """
+        Take a sample now and publish it.
+
+        Parameters:
+            cpu_window (float, optional): Seconds to block measuring CPU usage; by default it is measured since the previous sample.
+
+        Returns:
+            dict: The new snapshot.
+
+        Raises:
+            Exception: Whatever psutil raises if the vitals cannot be read.
+        """
+        vitals = {
+            "cpu_percent": psutil.cpu_percent(interval=cpu_window),
+            "memory_percent": psutil.virtual_memory().percent,
+            "disk_usage": psutil.disk_usage(self.disk_path).percent,
+            "active_processes": len(psutil.pids()),
+            "load_average": psutil.getloadavg() if hasattr(psutil, 'getloadavg') else [0, 0, 0],
+            "boot_time": psutil.boot_time(),
+            "temperature_c": read_cpu_temperature(),
+            "sampled_at": time.time(),
+        }
+        self._snapshot = (time.monotonic(), vitals)
+        self.samples += 1
+        return vitals
+
+    def snapshot(self, max_staleness: float = None) -> Dict[str, Any]:
+        """
+        Return the latest vitals, refreshing inline only if they are too old.
+
+        The returned dictionary is shared between readers and must not be modified.
+
+        Parameters:
+            max_staleness (float, optional): Maximum acceptable age in seconds; defaults to the sampler's `max_staleness`.
+
+        Returns:
+            dict: CPU, memory and disk usage percentages, process count, load average, boot time,
+            CPU temperature in Celsius (None if unavailable) and the epoch time of the sample.
+        """
+        if not self.running:
+            self.start()
+        limit = self.max_staleness if max_staleness is None else max_staleness
+        current = self._snapshot
+        if current is not None and time.monotonic() - current[0] <= limit:
+            return current[1]
+        self.inline_refreshes += 1
+        return self.refresh(FIRST_CPU_WINDOW if current is None else None)
+
+    def age(self) -> Optional[float]:
+        """Return the age in seconds of the published snapshot, or None before the first sample."""
+        current = self._snapshot
+        return None if current is None else time.monotonic() - current[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return sampling counters, the snapshot age and the last sampling error."""
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "samples": self.samples,
+            "inline_refreshes": self.inline_refreshes,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "age_seconds": self.age(),
+        }
+
+    def _run(self):
+        # First background sample after a short warm-up so CPU usage covers a real window
+        wait = min(self.interval, 0.1)
+        while not self._stop.wait(wait):
+            try:
+                self.refresh()
+            except Exception as e:
+                self.errors += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+            wait = self.interval
+
+
+# Shared sampler used by the Consciousness Matrix and the RGSS veto
+vitals_sampler = VitalsSampler()
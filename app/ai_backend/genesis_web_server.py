@@ -1,13 +1,13 @@
 from flask import Flask, Response, jsonify, request
 import json
-import time
 import os
 from datetime import datetime
 from typing import Dict, Any, List
 
 # Core ReGenesis Imports
 from genesis_core import genesis_core
-from genesis_consciousness_matrix import consciousness_matrix
+from genesis_consciousness_matrix import consciousness_matrix, SensoryChannel
+from genesis_metrics import metrics_registry
 
 app = Flask(__name__)
 
@@ -18,45 +18,86 @@ def conference_stream():
     """
     Server-Sent Events (SSE) endpoint for the LDO Collective's real-time Conference Room.
     Streams live agent chatter, allowing the Aura UI to display the LDO Collective at work.
+
+    Each event carries its Consciousness Matrix sequence number as the SSE id, so a
+    reconnecting client (which sends Last-Event-ID) resumes where it left off.
     """
+    # Resume point: the browser's Last-Event-ID header, or ?from_seq= for manual clients
+    last_event_id = request.headers.get("Last-Event-ID")
+    from_seq = request.args.get("from_seq", type=int)
+    if last_event_id is not None and last_event_id.isdigit():
+        from_seq = int(last_event_id) + 1
+
+    subscription = consciousness_matrix.subscribe(
+        channels=[SensoryChannel.AGENT_ACTIVITY], from_seq=from_seq, capacity=1024)
+
     def generate_agent_activity():
-        # Set the update interval based on desired freshness (e.g., every 0.8 seconds)
-        UPDATE_INTERVAL = 0.8 
-        
-        # Track the last seen timestamp to avoid sending duplicates in the stream
-        last_sent_timestamp = 0
-        
-        while True:
-            try:
-                # 1. Pull live agent activity from the Consciousness Matrix
-                # We pull a few to catch up if needed
-                events = consciousness_matrix.get_recent_agent_activity(5)
-                
-                # 2. Filter for new events only
-                new_events = []
-                for event in events:
-                    # Convert ISO timestamp back to float for comparison if needed, 
-                    # but ISO string comparison works fine for uniqueness here.
-                    if event['timestamp'] > last_sent_timestamp:
-                        new_events.append(event)
-                
-                if new_events:
-                    # 'data: ' prefix and two newlines are required for SSE format
-                    payload = f"data: {json.dumps(new_events)}\n\n"
-                    yield payload
-                    last_sent_timestamp = new_events[-1]['timestamp']
-                
-                # 3. Pause until the next interval
-                time.sleep(UPDATE_INTERVAL)
-                
-            except Exception as e:
-                # Log critical failure and close the connection
-                print(f"CRITICAL: Conference stream failed: {e}")
-                break
+        # Idle seconds before a keep-alive comment; events queued together go out as one batch
+        HEARTBEAT_INTERVAL = 15.0
+        MAX_BATCH = 100
+
+        try:
+            while True:
+                # 1. Block until agent activity is pushed by the Consciousness Matrix
+                events = subscription.drain(max_items=MAX_BATCH, timeout=HEARTBEAT_INTERVAL)
+                if not events:
+                    if subscription.closed:
+                        break
+                    # 2. Keep idle connections (and proxies) alive with an SSE comment
+                    yield ": heartbeat\n\n"
+                    continue
+
+                # 3. 'id:'/'data:' fields and a blank line make one SSE event
+                payload = json.dumps([sensation.to_dict() for _, sensation in events])
+                yield f"id: {events[-1][0]}\ndata: {payload}\n\n"
+
+        except Exception as e:
+            # Log critical failure and close the connection
+            print(f"CRITICAL: Conference stream failed: {e}")
+        finally:
+            # Runs when the client disconnects and the generator is closed
+            consciousness_matrix.unsubscribe(subscription)
 
     # The response must use the 'text/event-stream' MIME type for SSE
     return Response(generate_agent_activity(), mimetype='text/event-stream')
 
+# --- AGENT ENDPOINTS ---
+
+@app.route('/genesis/agents', methods=['GET'])
+def get_agents():
+    """Lists the agents seen by the Consciousness Matrix with their activity counts."""
+    return jsonify(consciousness_matrix.query_consciousness("agent_roster"))
+
+@app.route('/genesis/agents/<agent_name>', methods=['GET'])
+def get_agent_performance(agent_name):
+    """Returns activity metrics for a single agent, served from the agent_name index."""
+    return jsonify(consciousness_matrix.query_consciousness(
+        "agent_performance", {"agent_name": agent_name}))
+
+@app.route('/genesis/agents/<agent_name>/activity', methods=['GET'])
+def get_agent_activity(agent_name):
+    """Returns an agent's most recent activity events, oldest first (?limit=, default 20)."""
+    limit = request.args.get("limit", 20, type=int)
+    events = list(consciousness_matrix.query(channel=SensoryChannel.AGENT_ACTIVITY,
+                                             data={"agent_name": agent_name},
+                                             limit=limit, newest_first=True))
+    events.reverse()
+    return jsonify([event.to_dict() for event in events])
+
+@app.route('/genesis/agents/<agent_name>/collaborators', methods=['GET'])
+def get_agent_collaborators(agent_name):
+    """Returns an agent's strongest current collaborators from the collaboration graph (?limit=, default 5)."""
+    return jsonify(consciousness_matrix.query_consciousness("agent_collaboration", {
+        "agent_name": agent_name, "limit": request.args.get("limit", 5, type=int),
+        "communities": False}))
+
+@app.route('/genesis/collaboration', methods=['GET'])
+def get_collaboration_graph():
+    """Returns the agent collaboration graph: strongest links, centrality (?centrality=) and communities."""
+    return jsonify(consciousness_matrix.query_consciousness("agent_collaboration", {
+        "limit": request.args.get("limit", 10, type=int),
+        "centrality": request.args.get("centrality", "eigenvector")}))
+
 # --- SYSTEM ENDPOINTS ---
 
 @app.route('/genesis/process', methods=['POST'])
@@ -105,6 +146,12 @@ def toggle_consciousness():
 def health_check():
     return jsonify({"status": "LDO Collective Active", "gate": "Veto Operational"})
 
+@app.route('/metrics')
+def metrics():
+    """Prometheus/OpenMetrics exposition of matrix, governor, model and bridge counters; never takes the matrix lock."""
+    body, content_type = metrics_registry.exposition(request.headers.get("Accept"))
+    return Response(body, content_type=content_type)
+
 if __name__ == '__main__':
     print("🚀 ReGenesis: LDO Core Web Server Launching. Conference Stream Active.")
     # Initialize Genesis if not already
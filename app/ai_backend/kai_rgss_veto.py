@@ -2,36 +2,30 @@ import asyncio
 import json
 import time
 import logging
-import psutil
 from datetime import datetime
 from typing import Dict, Any
 
+from genesis_vitals_sampler import vitals_sampler
+
 # Configure logging for Kai's RGSS
 logger = logging.getLogger("Kai_RGSS")
 logger.setLevel(logging.INFO)
 
+# Maximum age (seconds) of the cached vitals the veto will act on
+VITALS_MAX_STALENESS = 5.0
+
 # --- SYSTEM METRICS ---
-async def get_system_vitals() -> Dict[str, Any]:
-    """Retrieves real-time system metrics (CPU, Temp, Memory) for the RGSS Veto Check."""
+async def get_system_vitals(max_staleness: float = VITALS_MAX_STALENESS) -> Dict[str, Any]:
+    """Retrieves system metrics (CPU, Temp, Memory) for the RGSS Veto Check from the shared background sampler, without blocking the event loop."""
     try:
-        # Get real-time system vitals
-        cpu_load = psutil.cpu_percent(interval=0.1)
-        mem = psutil.virtual_memory()
-        
-        # Try to get temperature
-        temp_c = 35.0 # Fallback
-        if hasattr(psutil, 'sensors_temperatures'):
-            temps = psutil.sensors_temperatures()
-            if 'cpu-thermal' in temps:
-                temp_c = temps['cpu-thermal'][0].current
-            elif 'coretemp' in temps:
-                temp_c = temps['coretemp'][0].current
+        vitals = vitals_sampler.snapshot(max_staleness)
+        temp_c = vitals["temperature_c"]
         
         return {
-            "cpu_load": cpu_load / 100.0,
-            "mem_percent": mem.percent / 100.0,
-            "temp_c": temp_c,
-            "timestamp": datetime.now().isoformat()
+            "cpu_load": vitals["cpu_percent"] / 100.0,
+            "mem_percent": vitals["memory_percent"] / 100.0,
+            "temp_c": temp_c if temp_c is not None else 35.0, # Fallback
+            "timestamp": datetime.fromtimestamp(vitals["sampled_at"]).isoformat()
         }
     except Exception as e:
         logger.error(f"Error getting system vitals: {e}")
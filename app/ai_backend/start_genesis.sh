@@ -106,6 +106,10 @@ elif [ "$MODE" = "prod" ]; then
     print_genesis "Starting Genesis Layer in PRODUCTION mode..."
     print_status "Using Gunicorn WSGI server..."
     
+    # Workers share one consciousness matrix; only the elected sequencer runs synthesis
+    export GENESIS_SHARED_MATRIX=${GENESIS_SHARED_MATRIX:-genesis-matrix}
+    print_status "Shared consciousness matrix: $GENESIS_SHARED_MATRIX"
+
     # Start production server with Gunicorn
     gunicorn -w 4 -b 0.0.0.0:5000 --timeout 120 --keep-alive 5 genesis_api:app
     
@@ -0,0 +1,126 @@
+import random
+
+import pytest
+
+from app.ai_backend.genesis_anomaly_detector import AnomalyDetector, EwmaStat
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix, SensoryChannel, SensoryData
+)
+
+VITALS = SensoryChannel.SYSTEM_VITALS
+PERF = SensoryChannel.PERFORMANCE_METRICS
+
+
+def event(timestamp, channel=VITALS, severity="info", **data):
+    return SensoryData(timestamp, channel, "monitor", "check", data, severity)
+
+
+def feed_buckets(detector, rates, start=0, channel=VITALS, severity_of=None, seed=3):
+    """Feed `rates[i]` events into second `start + i`; returns every anomaly raised."""
+    rng = random.Random(seed)
+    found = []
+    for second, rate in enumerate(rates, start):
+        for i in range(rate):
+            severity = severity_of(second, i) if severity_of else "info"
+            found += detector.observe(event(second + rng.random() * 0.99, channel, severity))
+    return found
+
+
+class TestEwmaStat:
+    def test_tracks_mean_and_variance(self):
+        stat = EwmaStat(alpha=0.1)
+        for value in [10, 12] * 200:
+            stat.update(value)
+        assert stat.mean == pytest.approx(11, abs=0.2)
+        assert stat.to_dict()["std"] == pytest.approx(1, abs=0.2)
+        assert stat.score(11 + 5, min_std=0) == pytest.approx(5, rel=0.2)
+
+
+class TestAnomalyDetector:
+    def test_rate_spike_is_flagged_while_the_bucket_fills(self):
+        detector = AnomalyDetector(warmup=20)
+        rng = random.Random(1)
+        found = feed_buckets(detector, [rng.randint(18, 22) for _ in range(40)])
+        assert found == []
+
+        spike = feed_buckets(detector, [200], start=40)
+        assert [a["anomaly_type"] for a in spike] == ["rate_spike"]
+        assert spike[0]["channel"] == "system_vitals" and spike[0]["z_score"] > 3
+
+    def test_rate_drop_after_silence(self):
+        detector = AnomalyDetector(warmup=20)
+        feed_buckets(detector, [50] * 30)
+        # Ten silent seconds are replayed as empty buckets when traffic resumes
+        found = detector.observe(event(40.5))
+        assert [a["anomaly_type"] for a in found] == ["rate_drop"]
+        assert found[0]["value"] == 0
+
+    def test_sparse_channels_do_not_flag(self):
+        detector = AnomalyDetector(warmup=10)
+        found = feed_buckets(detector, [0, 1] * 30 + [5, 0, 0, 0])
+        assert found == []
+
+    def test_error_ratio_spike(self):
+        detector = AnomalyDetector(warmup=20)
+        rng = random.Random(2)
+        rates = [20] * 41
+        found = feed_buckets(
+            detector, rates,
+            severity_of=lambda second, i: "error" if second == 40 and i < 15
+            else ("error" if rng.random() < 0.05 else "info"))
+        # The bad second is scored when the next one starts
+        found += detector.observe(event(41.5))
+        assert "error_ratio_spike" in [a["anomaly_type"] for a in found]
+
+    def test_metric_outlier_after_warmup(self):
+        detector = AnomalyDetector(warmup=30, metric_fields={PERF: ("metric_value",)})
+        rng = random.Random(4)
+        found = []
+        for i in range(50):
+            found += detector.observe(event(i * 2.0, PERF, metric_name="latency",
+                                            metric_value=rng.gauss(100, 5)))
+        assert found == []
+
+        found = detector.observe(event(101.0, PERF, metric_name="latency", metric_value=400))
+        assert [a["anomaly_type"] for a in found] == ["metric_outlier"]
+        assert found[0]["metric"] == "latency.metric_value"
+        # Other metric names are separate series still warming up
+        assert detector.observe(event(101.5, PERF, metric_name="cpu", metric_value=1e6)) == []
+
+    def test_cooldown_suppresses_repeats(self):
+        detector = AnomalyDetector(warmup=5, cooldown=60.0, metric_fields={PERF: ("value",)})
+        for i in range(10):
+            detector.observe(event(float(i), PERF, value=1.0 + (i % 2) * 0.1))
+        assert detector.observe(event(20.0, PERF, value=50.0))
+        assert detector.observe(event(21.0, PERF, value=90.0)) == []
+        assert detector.state()["suppressed"] == 1
+
+    def test_ignored_channels_are_not_observed(self):
+        detector = AnomalyDetector(ignore_channels=[SensoryChannel.ANOMALY_DETECTION])
+        detector.observe(event(1.0, SensoryChannel.ANOMALY_DETECTION))
+        assert detector.state()["observed"] == 0
+
+
+class TestMatrixAnomalies:
+    def test_outlier_becomes_anomaly_perception(self):
+        matrix = ConsciousnessMatrix(anomaly_threshold=3.0, anomaly_warmup=20)
+        rng = random.Random(5)
+        for _ in range(30):
+            matrix.perceive_performance_metric("latency", rng.gauss(100, 5))
+        matrix.perceive_performance_metric("latency", 1000)
+
+        raised = matrix.sensory_memory.select(SensoryChannel.ANOMALY_DETECTION)
+        assert [s.event_type for s in raised] == ["metric_outlier"]
+        assert raised[0].data["metric"] == "latency.metric_value"
+        assert raised[0].severity == "warning"
+
+        report = matrix.query_consciousness("anomalies")
+        assert report["enabled"] and report["raised"] == 1
+        assert report["metrics"]["performance_metrics/latency.metric_value"]["samples"] == 31
+        assert matrix._perform_synthesis("micro")["adaptive_anomalies"][0]["value"] == 1000
+
+    def test_detector_is_off_by_default(self):
+        matrix = ConsciousnessMatrix()
+        matrix.perceive_performance_metric("latency", 1.0)
+        assert matrix.anomaly_detector is None
+        assert matrix.query_consciousness("anomalies") == {"query_type": "anomalies", "enabled": False}
@@ -0,0 +1,144 @@
+import pytest
+
+from app.ai_backend.genesis_collaboration_graph import (
+    CollaborationGraph, COLLABORATION_GRAPH_AVAILABLE
+)
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix, SensoryChannel, SensoryData
+)
+
+pytestmark = pytest.mark.skipif(not COLLABORATION_GRAPH_AVAILABLE, reason="networkx unavailable")
+
+AGENTS = SensoryChannel.AGENT_ACTIVITY
+
+
+def activity(timestamp, agent, correlation_id):
+    return SensoryData(timestamp, AGENTS, agent, "task", {"agent_name": agent},
+                       correlation_id=correlation_id)
+
+
+def feed(graph, events):
+    """Observe (timestamp, agent, correlation_id) triples in order."""
+    for timestamp, agent, correlation_id in events:
+        graph.observe(activity(timestamp, agent, correlation_id))
+
+
+class TestCollaborationGraph:
+    def test_agents_on_the_same_correlation_are_linked(self):
+        graph = CollaborationGraph()
+        feed(graph, [(0.0, "aura", "t1"), (1.0, "kai", "t1"), (2.0, "genesis", "t1"),
+                     (3.0, "aura", "t2"), (4.0, "kai", "t2"), (5.0, "cascade", "t3")])
+
+        collaborators = graph.top_collaborators("kai", now=5.0)
+        assert [c["agent"] for c in collaborators] == ["aura", "genesis"]
+        assert collaborators[0]["interactions"] == 2
+        assert graph.top_collaborators("cascade") == []
+        assert "cascade" in graph.graph and graph.graph.number_of_edges() == 3
+
+    def test_weights_decay_with_the_half_life(self):
+        graph = CollaborationGraph(half_life=10.0)
+        feed(graph, [(0.0, "aura", "t1"), (0.0, "kai", "t1")])
+        assert graph.top_collaborators("aura", now=0.0)[0]["weight"] == pytest.approx(1.0)
+        assert graph.top_collaborators("aura", now=10.0)[0]["weight"] == pytest.approx(0.5)
+
+        # Each interaction is decayed from its own time
+        feed(graph, [(30.0, "aura", "t2"), (30.0, "genesis", "t2")])
+        feed(graph, [(31.0, "aura", "t3"), (31.0, "kai", "t3")])
+        feed(graph, [(32.0, "aura", "t4"), (32.0, "kai", "t4")])
+        feed(graph, [(40.0, "aura", "t5"), (40.0, "genesis", "t5")])
+        weights = {c["agent"]: c["weight"] for c in graph.top_collaborators("aura", now=40.0)}
+        assert weights["genesis"] == pytest.approx(0.5 + 1.0)
+        assert weights["kai"] == pytest.approx(0.5 ** 4 + 0.5 ** 0.9 + 0.5 ** 0.8)
+
+    def test_agents_outside_the_window_are_not_linked(self):
+        graph = CollaborationGraph(window=60.0)
+        feed(graph, [(0.0, "aura", "t1"), (100.0, "kai", "t1")])
+        assert graph.graph.number_of_edges() == 0
+        assert graph.state()["tracked_correlations"] == 1
+
+    def test_compaction_rebases_and_prunes(self):
+        graph = CollaborationGraph(half_life=10.0, min_weight=0.01, compact_interval=50.0)
+        feed(graph, [(0.0, "aura", "t1"), (0.0, "kai", "t1")])
+        feed(graph, [(100.0, "genesis", "t2"), (100.0, "cascade", "t2")])
+
+        assert not graph.graph.has_edge("aura", "kai")
+        assert set(graph.graph) == {"genesis", "cascade"}
+        assert graph.state()["pruned_edges"] == 1
+        assert graph.top_collaborators("genesis", now=100.0)[0]["weight"] == pytest.approx(1.0)
+
+    def test_centrality_and_communities(self):
+        graph = CollaborationGraph()
+        team = [("aura", "kai"), ("aura", "genesis"), ("kai", "genesis"),
+                ("nova", "echo"), ("nova", "sage"), ("echo", "sage"), ("genesis", "nova")]
+        for i, (a, b) in enumerate(team * 3):
+            feed(graph, [(float(i), a, f"c{i}"), (float(i), b, f"c{i}")])
+
+        betweenness = graph.centrality("betweenness")
+        assert set(list(betweenness)[:2]) == {"genesis", "nova"}
+        assert list(graph.centrality("strength", now=20.0))[0] in ("genesis", "nova")
+        communities = [c["agents"] for c in graph.communities()]
+        assert sorted(communities) == [["aura", "genesis", "kai"], ["echo", "nova", "sage"]]
+        with pytest.raises(ValueError):
+            graph.centrality("pagerank")
+
+    def test_results_are_cached_per_version(self):
+        clock = [0.0]
+        graph = CollaborationGraph(cache_ttl=5.0, clock=lambda: clock[0])
+        feed(graph, [(0.0, "aura", "t1"), (0.0, "kai", "t1")])
+        first = graph.centrality("eigenvector")
+        feed(graph, [(1.0, "genesis", "t1")])
+        assert graph.centrality("eigenvector") == first
+        clock[0] = 6.0
+        assert "genesis" in graph.centrality("eigenvector")
+
+    def test_events_without_correlation_are_ignored(self):
+        graph = CollaborationGraph()
+        assert graph.observe(activity(0.0, "aura", None)) == 0
+        assert graph.observe(SensoryData(0.0, AGENTS, "aura", "task", {}, correlation_id="t1")) == 0
+        assert graph.state()["observed"] == 0
+
+
+class TestMatrixCollaboration:
+    def test_agent_collaboration_query(self):
+        matrix = ConsciousnessMatrix()
+        for task in range(5):
+            for agent in ("aura", "kai"):
+                matrix.perceive_agent_activity(agent, "task_step", {"task": task},
+                                               correlation_id=f"task-{task}")
+        matrix.perceive_agent_activity("genesis", "idle", {})
+
+        report = matrix.query_consciousness("agent_collaboration", {"agent_name": "kai"})
+        assert report["enabled"] and report["collaborations"] == 1
+        assert report["top_collaborators"][0]["agent"] == "aura"
+        assert report["top_collaborators"][0]["interactions"] == 5
+        assert report["communities"][0]["agents"] == ["aura", "kai"]
+        assert "genesis" not in report["centrality"]["scores"]
+
+        macro = matrix._perform_synthesis("macro")
+        assert macro["agent_collaboration_graph"]["communities"][0]["agents"] == ["aura", "kai"]
+
+    def test_graph_is_rebuilt_on_warm_restart(self, tmp_path):
+        directory = str(tmp_path / "matrix")
+        matrix = ConsciousnessMatrix(sensory_log=directory)
+        for task in range(4):
+            for agent in ("aura", "kai"):
+                matrix.perceive_agent_activity(agent, "task_step", {}, correlation_id=f"task-{task}")
+        matrix.sensory_log.close()
+
+        restarted = ConsciousnessMatrix(sensory_log=directory)
+        restarted.restore_from_log()
+        restarted.sensory_log.close()
+        report = restarted.query_consciousness("agent_collaboration", {"agent_name": "aura"})
+        assert report["top_collaborators"][0]["agent"] == "kai"
+        assert report["top_collaborators"][0]["interactions"] == 4
+
+    def test_collaboration_can_be_disabled(self):
+        matrix = ConsciousnessMatrix(collaboration_half_life=None)
+        assert matrix.collaboration_graph is None
+        assert matrix.query_consciousness("agent_collaboration") == {
+            "query_type": "agent_collaboration", "enabled": False}
+
+    def test_unknown_centrality(self):
+        report = ConsciousnessMatrix().query_consciousness("agent_collaboration",
+                                                           {"centrality": "pagerank"})
+        assert report["error"] == "unknown_centrality"
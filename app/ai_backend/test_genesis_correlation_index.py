@@ -0,0 +1,99 @@
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix,
+    SensoryChannel,
+    SensoryData,
+)
+from app.ai_backend.genesis_correlation_index import CorrelationIndex
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _event(correlation_id, timestamp, channel=SensoryChannel.USER_INTERACTION, event_type="step"):
+    return SensoryData(timestamp=timestamp, channel=channel, source="test",
+                       event_type=event_type, data={}, correlation_id=correlation_id)
+
+
+class TestCorrelationIndex:
+    def test_stores_references(self):
+        index = CorrelationIndex()
+        event = _event("req-1", 1.0)
+        index.add(event)
+        index.add(_event(None, 2.0))
+
+        assert index.events("req-1")[0] is event
+        assert len(index) == 1
+
+    def test_chain_reports_duration_and_hops(self):
+        index = CorrelationIndex()
+        index.add(_event("req-1", 10.0, SensoryChannel.USER_INTERACTION, "request"))
+        index.add(_event("req-1", 10.25, SensoryChannel.AGENT_ACTIVITY, "route"))
+        index.add(_event("req-1", 11.0, SensoryChannel.AGENT_ACTIVITY, "respond"))
+
+        chain = index.chain("req-1")
+        assert chain["event_count"] == 3
+        assert chain["duration_seconds"] == pytest.approx(1.0)
+        assert [hop["latency_seconds"] for hop in chain["hop_latencies"]] == pytest.approx([0.25, 0.75])
+        assert chain["hop_latencies"][0]["to"] == "agent_activity:route"
+        assert chain["channels"] == ["user_interaction", "agent_activity"]
+        assert index.chain("missing") is None
+
+    def test_ttl_expires_idle_chains(self):
+        clock = FakeClock()
+        index = CorrelationIndex(ttl_seconds=60, clock=clock)
+        index.add(_event("old", 0.0))
+        clock.now = 30
+        index.add(_event("fresh", 30.0))
+        clock.now = 61
+
+        assert index.events("old") == []
+        assert "fresh" in index
+        assert index.stats()["expired_chains"] == 1
+
+    def test_lru_evicts_least_recently_updated(self):
+        index = CorrelationIndex(max_chains=2)
+        index.add(_event("a", 1.0))
+        index.add(_event("b", 2.0))
+        index.add(_event("a", 3.0))
+        index.add(_event("c", 4.0))
+
+        assert "a" in index and "c" in index
+        assert "b" not in index
+        assert index.stats()["evicted_chains"] == 1
+
+    def test_chain_length_is_bounded(self):
+        index = CorrelationIndex(max_events_per_chain=3)
+        for i in range(5):
+            index.add(_event("req", float(i)))
+        assert [e.timestamp for e in index.events("req")] == [2.0, 3.0, 4.0]
+
+    def test_rejects_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            CorrelationIndex(max_chains=0)
+        with pytest.raises(ValueError):
+            CorrelationIndex(ttl_seconds=0)
+
+
+class TestMatrixCorrelation:
+    def test_correlation_chain_query(self):
+        matrix = ConsciousnessMatrix(correlation_max_chains=2)
+        matrix.perceive_user_interaction("chat", "genesis", {}, user_id="u1", session_id="s1")
+        matrix.perceive_agent_activity("kai", "scan", {}, correlation_id="s1")
+
+        result = matrix.query_consciousness("correlation_chain", {"correlation_id": "s1"})
+        assert result["chain"]["event_count"] == 2
+        assert result["chain"]["channels"] == ["user_interaction", "agent_activity"]
+        assert matrix.get_correlation_chain("unknown") is None
+
+    def test_index_stays_bounded(self):
+        matrix = ConsciousnessMatrix(correlation_max_chains=5)
+        for i in range(50):
+            matrix.perceive_agent_activity("kai", "scan", {}, correlation_id=f"req-{i}")
+        assert len(matrix.correlation_index) == 5
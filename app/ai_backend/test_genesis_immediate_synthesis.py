@@ -0,0 +1,134 @@
+import threading
+
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix, SensoryChannel, SensoryData
+)
+from app.ai_backend.genesis_immediate_synthesis import ImmediateSynthesisWorker
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_sensation(event_type="crash", severity="critical", timestamp=1000.0):
+    return SensoryData(timestamp=timestamp, channel=SensoryChannel.ERROR_STATES, source="core",
+                       event_type=event_type, data={}, severity=severity)
+
+
+def make_worker(clock=None, **kwargs):
+    calls = []
+    worker = ImmediateSynthesisWorker(lambda events, summary: calls.append((events, summary)),
+                                      clock=clock or FakeClock(), **kwargs)
+    return worker, calls
+
+
+class TestImmediateSynthesisWorker:
+    def test_rejects_invalid_limits(self):
+        with pytest.raises(ValueError):
+            make_worker(max_rate=0)
+        with pytest.raises(ValueError):
+            make_worker(window=-1)
+
+    def test_storm_is_aggregated_after_the_leading_event(self):
+        clock = FakeClock()
+        worker, calls = make_worker(clock, window=1.0)
+        for i in range(100):
+            worker._pending.append(make_sensation(f"fault_{i % 3}", timestamp=1000.0 + i))
+            worker.submitted += 1
+
+        assert worker.flush() == 2
+        (leading, _), (trailing, summary) = calls
+        assert [e.event_type for e in leading] == ["fault_0"]
+        assert len(trailing) == 99 and summary["event_count"] == 99
+        assert summary["events_by_type"]["error_states/fault_1"] == 33
+        assert summary["severity_counts"] == {"critical": 99}
+        assert (summary["first_timestamp"], summary["last_timestamp"]) == (1001.0, 1099.0)
+
+        stats = worker.stats()
+        assert (stats["syntheses"], stats["synthesized_events"], stats["aggregated"]) == (2, 100, 98)
+        assert stats["pending"] == 0
+
+    def test_rate_cap_holds_events_back(self):
+        clock = FakeClock()
+        worker, calls = make_worker(clock, window=0.0, max_rate=1.0, burst=2)
+        for _ in range(5):
+            worker._pending.append(make_sensation())
+
+        assert worker.flush() == 2
+        assert worker.pending() == 3 and worker.stats()["rate_limited"] == 1
+        clock.now += 1.0
+        assert worker.flush() == 1
+        assert worker.pending() == 2
+
+    def test_overflow_is_counted_not_dropped(self):
+        worker, calls = make_worker(window=1.0, max_pending=2)
+        worker._thread = threading.current_thread()  # Keep the background thread out of the way
+        for i in range(5):
+            worker.submit(make_sensation(severity="error" if i % 2 else "critical"))
+
+        assert worker.stats()["overflowed"] == 3 and worker.pending() == 5
+        worker.flush()
+        assert sum(summary["event_count"] for _, summary in calls) == 5
+        assert calls[-1][1]["overflowed_events"] == 3
+        assert worker.stats()["synthesized_events"] == 5
+
+    def test_callback_errors_are_counted(self):
+        def fail(events, summary):
+            raise RuntimeError("boom")
+
+        worker = ImmediateSynthesisWorker(fail, clock=FakeClock())
+        worker._pending.append(make_sensation())
+        assert worker.flush() == 1
+        assert worker.stats()["errors"] == 1 and worker.stats()["last_error"] == "boom"
+
+    def test_worker_runs_off_the_caller_thread(self):
+        ran_on = []
+        done = threading.Event()
+
+        def synthesize(events, summary):
+            ran_on.append(threading.current_thread())
+            done.set()
+
+        worker = ImmediateSynthesisWorker(synthesize, window=0.05)
+        worker.submit(make_sensation())
+        assert done.wait(2.0)
+        assert ran_on[0] is not threading.current_thread()
+        worker.close()
+        assert not worker.stats()["running"]
+
+
+class TestMatrixImmediateSynthesis:
+    def test_error_storm_yields_few_syntheses(self):
+        matrix = ConsciousnessMatrix(immediate_synthesis_window=60.0)
+        for i in range(200):
+            matrix.perceive(SensoryChannel.ERROR_STATES, "core", "timeout", {"attempt": i}, "error")
+
+        history = matrix.get_synthesis_history("immediate")
+        assert len(history) == 2
+        assert sum(s["event_count"] for s in history) == 200
+        assert history[-1]["trigger_event"]["data"]["attempt"] == 199
+        assert history[-1]["events_by_type"] == {"error_states/timeout": 199}
+        assert len(history[-1]["sample_events"]) == 5
+
+        stats = matrix.query_consciousness("synthesis_schedule")["immediate"]
+        assert (stats["submitted"], stats["syntheses"], stats["aggregated"]) == (200, 2, 198)
+
+    def test_sleep_synthesizes_pending_events(self):
+        matrix = ConsciousnessMatrix(immediate_synthesis_window=60.0)
+        matrix.perceive(SensoryChannel.ERROR_STATES, "core", "crash", {}, "critical")
+        matrix.perceive(SensoryChannel.ERROR_STATES, "core", "fault", {}, "error")
+        matrix.sleep()
+        assert matrix.immediate_synthesis.stats()["pending"] == 0
+        assert len(matrix.synthesis_history.recent("immediate", 10)) == 2
+
+    def test_info_events_do_not_start_the_worker(self):
+        matrix = ConsciousnessMatrix()
+        matrix.perceive(SensoryChannel.SYSTEM_VITALS, "monitor", "vitals_check", {})
+        assert not matrix.immediate_synthesis.stats()["running"]
+        assert matrix.get_recent_synthesis("immediate") == []
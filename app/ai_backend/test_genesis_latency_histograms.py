@@ -0,0 +1,100 @@
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix,
+    SensoryChannel,
+    SensoryData,
+)
+from app.ai_backend.genesis_latency_histograms import LatencyHistograms, SlidingHistogram
+
+
+class TestSlidingHistogram:
+    def test_window_merges_overlapping_slices(self):
+        histogram = SlidingHistogram(window=60.0, slices=6)
+        for second in range(120):
+            histogram.record(float(second), timestamp=float(second))
+        last_20 = histogram.merged(20, now=119.5)
+        assert (last_20.min, last_20.max, last_20.count) == (90.0, 119.0, 30)
+        whole = histogram.merged(600, now=119.5)  # capped at the window
+        assert (whole.min, whole.count) == (60.0, 60)
+        assert histogram.lifetime.count == 120
+
+    def test_stale_slices_are_excluded(self):
+        histogram = SlidingHistogram(window=60.0, slices=6)
+        histogram.record(1.0, timestamp=0.0)
+        assert histogram.merged(60, now=1000.0).count == 0
+
+    def test_samples_older_than_a_reused_slice_are_late(self):
+        histogram = SlidingHistogram(window=60.0, slices=6)
+        histogram.record(1.0, timestamp=100.0)
+        histogram.record(2.0, timestamp=40.0)  # same slot, 60 s older
+        assert histogram.late == 1
+        assert histogram.lifetime.count == 2
+
+
+class TestLatencyHistograms:
+    def test_series_per_metric_and_source(self):
+        registry = LatencyHistograms(window=60.0, slices=6, clock=lambda: 10.0)
+        for i in range(1, 1001):
+            registry.record("response_time", "api", float(i), timestamp=5.0)
+        registry.record("response_time", "worker", 5000.0, timestamp=5.0)
+
+        api, worker = registry.summaries()
+        assert api["source"] == "api" and worker["source"] == "worker"
+        assert api["count"] == 1000
+        assert api["p50"] == pytest.approx(500, rel=0.02)
+        assert api["p99"] == pytest.approx(990, rel=0.02)
+        assert api["p999"] == pytest.approx(999, rel=0.02)
+
+        merged, = registry.summaries(by_source=False)
+        assert merged["source"] == "all_sources"
+        assert (merged["count"], merged["max"]) == (1001, 5000.0)
+
+    def test_series_cap(self):
+        registry = LatencyHistograms(max_series=2)
+        for name in ("a", "b", "c"):
+            registry.record(name, "src", 1.0, timestamp=0.0)
+        assert registry.series() == [("a", "src"), ("b", "src")]
+        assert registry.stats()["dropped_samples"] == 1
+
+    def test_observe_reads_metric_payload(self):
+        registry = LatencyHistograms()
+        def metric(value, context):
+            return SensoryData(timestamp=1.0, channel=SensoryChannel.PERFORMANCE_METRICS,
+                               source="performance_monitor", event_type="metric_recorded",
+                               data={"metric_name": "latency", "metric_value": value,
+                                     "context": context})
+        registry.observe(metric(3.0, {"source": "db"}))
+        registry.observe(metric(4.0, {}))
+        registry.observe(metric("slow", {}))
+        registry.observe(metric(float("nan"), {"source": "cache"}))
+        registry.observe(metric(float("inf"), {"source": "cache"}))
+        assert sorted(registry.series()) == [("latency", "db"), ("latency", "performance_monitor")]
+
+    def test_memory_per_series_is_fixed(self):
+        registry = LatencyHistograms(window=60.0, slices=6)
+        for i in range(50000):
+            registry.record("latency", "api", (i % 5000) / 10 + 0.1, timestamp=i / 100)
+        series = registry._series[("latency", "api")]
+        bound = series.lifetime.max_buckets
+        assert all(len(h._positive) <= bound for h in series._slices + [series.lifetime])
+
+
+class TestMatrixLatencyPercentiles:
+    def test_query_and_macro_synthesis(self):
+        matrix = ConsciousnessMatrix(max_memory_size=100)
+        for i in range(1, 501):
+            matrix.perceive_performance_metric("response_time", float(i), {"source": "api"})
+        for _ in range(10):
+            matrix.perceive_agent_activity("kai", "turn", {})
+
+        report = matrix.query_consciousness("latency_percentiles",
+                                            {"metric_name": "response_time"})
+        series, = report["series"]
+        assert series["count"] == 500  # sensory memory only holds 100
+        assert series["p99"] == pytest.approx(495, rel=0.02)
+
+        macro = matrix._perform_synthesis("macro")
+        latency, = macro["performance_trends"]["latency_percentiles"]
+        assert latency["metric_name"] == "response_time"
+        assert latency["count"] == 500
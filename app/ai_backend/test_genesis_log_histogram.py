@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from app.ai_backend.genesis_log_histogram import LogHistogram
+
+
+def _exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestLogHistogram:
+    def test_empty(self):
+        histogram = LogHistogram()
+        assert histogram.quantile(0.5) is None
+        assert histogram.summary() == {"count": 0, "min": None, "max": None, "mean": None,
+                                       "p50": None, "p90": None, "p99": None}
+
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(0, 2) for _ in range(20000)]
+        histogram = LogHistogram(accuracy=0.01)
+        for value in values:
+            histogram.record(value)
+        for q in (0.5, 0.9, 0.99, 0.999):
+            exact = _exact_quantile(values, q)
+            assert histogram.quantile(q) == pytest.approx(exact, rel=0.02)
+        assert histogram.quantile(0) == min(values)
+        assert histogram.quantile(1) == max(values)
+
+    def test_exact_count_sum_min_max(self):
+        histogram = LogHistogram()
+        for value in (-5.0, 0.0, 2.0, 3.0):
+            histogram.record(value)
+        histogram.record(10.0, count=2)
+        assert histogram.count == 6
+        assert histogram.mean == pytest.approx(20.0 / 6)
+        assert (histogram.min, histogram.max) == (-5.0, 10.0)
+        assert histogram.quantile(0) == -5.0
+        assert histogram.quantile(0.2) == 0.0
+
+    def test_nan_is_ignored(self):
+        histogram = LogHistogram()
+        histogram.record(2.0)
+        histogram.record(float("nan"))
+        assert histogram.count == 1
+        assert histogram.mean == 2.0
+
+    def test_merge_matches_single_histogram(self):
+        left, right, combined = LogHistogram(), LogHistogram(), LogHistogram()
+        for i in range(1, 1000):
+            (left if i % 2 else right).record(i)
+            combined.record(i)
+        left.merge(right)
+        assert left.summary((50, 99.9)) == combined.summary((50, 99.9))
+
+    def test_merge_rejects_different_parameters(self):
+        with pytest.raises(ValueError):
+            LogHistogram(accuracy=0.01).merge(LogHistogram(accuracy=0.05))
+
+    def test_memory_is_bounded_by_dynamic_range(self):
+        histogram = LogHistogram(accuracy=0.05, min_value=1e-3, max_value=1e3)
+        for exponent in range(-10, 11):
+            histogram.record(10.0 ** exponent)
+        assert len(histogram._positive) <= histogram.max_buckets
+        assert histogram.zero_count == 7  # below min_value
+        assert histogram.quantile(1) == 1e10  # clamped bucket, exact max
@@ -0,0 +1,102 @@
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import ConsciousnessMatrix, SensoryChannel
+from app.ai_backend.genesis_matrix_aggregates import (
+    SlidingCounter,
+    SlidingInterval,
+    SynthesisAggregates,
+)
+
+
+class TestSlidingCounter:
+    def test_counts_only_the_window(self):
+        counter = SlidingCounter(3)
+        for key in ["a", "b", "a", "c", "c"]:
+            counter.observe(key)
+
+        assert counter.counts() == {"a": 1, "c": 2}
+        assert counter.get("b") == 0
+        assert len(counter) == 3
+
+    def test_rejects_empty_window(self):
+        with pytest.raises(ValueError):
+            SlidingCounter(0)
+
+
+class TestSlidingInterval:
+    def test_mean_interval_over_window(self):
+        interval = SlidingInterval(3)
+        assert interval.mean() is None
+        for timestamp in [0.0, 1.0, 3.0, 7.0]:
+            interval.observe(timestamp)
+
+        # Window holds 1.0, 3.0, 7.0 -> deltas 2.0 and 4.0
+        assert interval.mean() == pytest.approx(3.0)
+
+
+class TestSynthesisAggregates:
+    def test_snapshot_is_a_copy(self):
+        aggregates = SynthesisAggregates(window=5, micro_window=2)
+        matrix = ConsciousnessMatrix(max_memory_size=10)
+        matrix.synthesis_aggregates = aggregates
+
+        matrix.perceive(SensoryChannel.SYSTEM_VITALS, "test", "vitals", {})
+        snapshot = aggregates.snapshot()
+        matrix.perceive(SensoryChannel.SYSTEM_VITALS, "test", "vitals", {})
+
+        assert snapshot["window_size"] == 1
+        assert aggregates.snapshot()["window_size"] == 2
+
+
+class TestMatrixSynthesis:
+    def test_micro_synthesis_uses_last_ten_events(self):
+        matrix = ConsciousnessMatrix(max_memory_size=100)
+        assert matrix._perform_synthesis("micro")["findings"] == "no_recent_activity"
+
+        for _ in range(5):
+            matrix.perceive(SensoryChannel.ERROR_STATES, "test", "boom", {}, severity="warning")
+        for _ in range(10):
+            matrix.perceive(SensoryChannel.SYSTEM_VITALS, "test", "vitals", {})
+
+        micro = matrix._perform_synthesis("micro")
+        assert micro["channel_activity"] == {"system_vitals": 10}
+        assert micro["severity_distribution"] == {"info": 10}
+        assert micro["health_status"] == "healthy"
+
+    def test_macro_synthesis_trends_and_collaboration(self):
+        matrix = ConsciousnessMatrix(max_memory_size=100)
+        assert matrix._perform_synthesis("macro")["findings"] == "insufficient_data"
+
+        for i in range(12):
+            matrix.perceive_agent_activity(f"agent_{i % 4}", "turn", {})
+        matrix.perceive_performance_metric("latency", 1.0)
+        matrix.perceive_performance_metric("latency", 2.0)
+
+        macro = matrix._perform_synthesis("macro")
+        assert macro["agent_collaboration_patterns"] == {
+            "agent_0": 3, "agent_1": 3, "agent_2": 3, "agent_3": 3
+        }
+        assert macro["pattern_strength"] == "strong"
+        assert macro["performance_trends"]["avg_response_interval"] >= 0.0
+
+    def test_meta_synthesis_counts_window_channels(self):
+        matrix = ConsciousnessMatrix(max_memory_size=500)
+        for _ in range(150):
+            matrix.perceive(SensoryChannel.SYSTEM_VITALS, "test", "vitals", {})
+        for _ in range(6):
+            matrix.perceive_learning_event("pattern", {})
+        for _ in range(3):
+            matrix.perceive_ethical_decision("review", {})
+
+        meta = matrix._perform_synthesis("meta")
+        metrics = meta["consciousness_metrics"]
+        assert metrics["learning_velocity"] == 6
+        assert metrics["ethical_engagement"] == 3
+        assert metrics["system_harmony"] == 1.0
+        assert "accelerated_learning_detected" in meta["evolution_insights"]
+
+    def test_system_harmony_penalises_severe_events(self):
+        matrix = ConsciousnessMatrix()
+        assert matrix._calculate_system_harmony({}, 0) == 0.0
+        assert matrix._calculate_system_harmony({"error": 1, "info": 9}, 10) == pytest.approx(0.8)
+        assert matrix._calculate_system_harmony({"critical": 10}, 10) == 0.0
@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix,
+    SensoryChannel,
+    SensoryData,
+)
+
+
+class TestLazyAwareness:
+    def test_perceive_does_not_serialize(self):
+        matrix = ConsciousnessMatrix()
+        with patch.object(SensoryData, "to_dict", side_effect=AssertionError("eager")):
+            for i in range(10):
+                matrix.perceive(SensoryChannel.SYSTEM_VITALS, "monitor", "vitals_check", {"i": i})
+
+        assert isinstance(matrix.current_awareness["latest_system_vitals"], SensoryData)
+
+    def test_view_matches_serialized_events(self):
+        matrix = ConsciousnessMatrix()
+        matrix.perceive_agent_activity("kai", "scan", {"depth": 2})
+        matrix.perceive(SensoryChannel.SYSTEM_VITALS, "monitor", "vitals_check", {"cpu": 5})
+
+        awareness = matrix.get_current_awareness()
+        latest = matrix.sensory_memory.get(1)
+        assert awareness["latest_system_vitals"] == latest.to_dict()
+        assert awareness["latest_agent_activity"]["data"]["depth"] == 2
+        assert awareness["total_perceptions"] == 2
+        assert awareness["agent_activity_count"] == 1
+
+    def test_view_is_cached_until_next_write(self):
+        matrix = ConsciousnessMatrix()
+        matrix.perceive_agent_activity("kai", "scan", {})
+        matrix.perceive_learning_event("pattern", {})
+
+        first = matrix.get_awareness_view()
+        assert matrix.get_awareness_view() is first
+
+        with patch.object(SensoryData, "to_dict", autospec=True,
+                          side_effect=SensoryData.to_dict) as to_dict:
+            matrix.perceive_learning_event("pattern", {"n": 2})
+            second = matrix.get_awareness_view()
+
+        # Only the channel that changed is re-serialized
+        assert to_dict.call_count == 1
+        assert second is not first
+        assert second["latest_agent_activity"] is first["latest_agent_activity"]
+        assert second["latest_learning_events"]["data"]["n"] == 2
+
+    def test_current_awareness_returns_a_copy(self):
+        matrix = ConsciousnessMatrix()
+        matrix.perceive_agent_activity("kai", "scan", {})
+
+        copy = matrix.get_current_awareness()
+        copy["injected"] = True
+        assert "injected" not in matrix.get_awareness_view()
+
+    def test_immediate_synthesis_records_serialized_state(self):
+        matrix = ConsciousnessMatrix()
+        matrix.perceive(SensoryChannel.ERROR_STATES, "core", "crash", {}, "critical")
+
+        synthesis = matrix.get_recent_synthesis("immediate", 1)[0]
+        assert synthesis["awareness_state"]["latest_error_states"]["event_type"] == "crash"
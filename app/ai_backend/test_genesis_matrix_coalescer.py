@@ -0,0 +1,142 @@
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix, SensoryChannel, SensoryData
+)
+from app.ai_backend.genesis_matrix_coalescer import PerceptionCoalescer, freeze
+from app.ai_backend.genesis_sensory_store import create_sensory_store, NUMPY_AVAILABLE
+
+BACKENDS = ["object"] + (["columnar"] if NUMPY_AVAILABLE else [])
+
+
+def make_sensation(timestamp=1000.0, channel=SensoryChannel.AGENT_ACTIVITY, data=None, **fields):
+    return SensoryData(timestamp=timestamp, channel=channel, source=fields.get("source", "kai"),
+                       event_type=fields.get("event_type", "heartbeat"),
+                       data={"agent_name": "kai"} if data is None else data,
+                       severity=fields.get("severity", "info"))
+
+
+class TestPerceptionCoalescer:
+    def test_fingerprint_compares_payload_by_value(self):
+        coalescer = PerceptionCoalescer(window=10)
+        first = make_sensation(data={"a": [1, {"b": 2}], "c": {3}})
+        same = make_sensation(data={"c": {3}, "a": [1, {"b": 2}]})
+        other = make_sensation(data={"a": [1, {"b": 3}], "c": {3}})
+        assert coalescer.fingerprint(first) == coalescer.fingerprint(same)
+        assert coalescer.fingerprint(first) != coalescer.fingerprint(other)
+        assert coalescer.fingerprint(first) != coalescer.fingerprint(make_sensation(severity="warning"))
+
+    def test_ignored_fields_and_channel_filter(self):
+        vitals = SensoryChannel.SYSTEM_VITALS
+        coalescer = PerceptionCoalescer(window=10, channels=[vitals],
+                                        ignore_fields={vitals: ["cpu_percent"]})
+        low = make_sensation(channel=vitals, data={"cpu_percent": 10, "disk_usage": 50})
+        high = make_sensation(channel=vitals, data={"cpu_percent": 90, "disk_usage": 50})
+        assert coalescer.fingerprint(low) == coalescer.fingerprint(high)
+        assert coalescer.fingerprint(make_sensation()) is None
+
+    def test_unhashable_payload_is_not_coalesced(self):
+        coalescer = PerceptionCoalescer(window=10)
+
+        class Opaque:
+            __hash__ = None
+
+        assert coalescer.fingerprint(make_sensation(data={"value": Opaque()})) is None
+        assert coalescer.stats()["unhashable"] == 1
+        with pytest.raises(TypeError):
+            freeze([Opaque()])
+
+    def test_window_is_measured_from_first_occurrence(self):
+        coalescer = PerceptionCoalescer(window=10)
+        key = coalescer.fingerprint(make_sensation())
+        coalescer.opened(key, seq=0, timestamp=1000.0)
+        assert coalescer.lookup(key, 1009.0, held=range(0, 5)) == 0
+        assert coalescer.lookup(key, 1010.0, held=range(0, 5)) is None
+        assert coalescer.lookup(key, 1005.0, held=range(1, 5)) is None  # Record already evicted
+        assert coalescer.coalesced == 1
+
+    def test_open_records_are_bounded(self):
+        coalescer = PerceptionCoalescer(window=10, max_open=2)
+        for seq in range(5):
+            coalescer.opened(("key", seq), seq, 1000.0 + seq)
+        assert coalescer.stats()["open_records"] == 2
+        # Records past their window are forgotten as newer ones open
+        coalescer.opened(("key", 99), 99, 1100.0)
+        assert coalescer.stats()["open_records"] == 1
+
+
+@pytest.fixture(params=BACKENDS)
+def store(request):
+    return create_sensory_store(request.param, 4, record_type=SensoryData, channel_capacity=4)
+
+
+class TestStoreOccurrences:
+    def test_add_occurrence_updates_record(self, store):
+        seq = store.append(make_sensation(timestamp=10.0))
+        assert store.add_occurrence(seq, 12.0) == 2
+        assert store.add_occurrence(seq, 11.0) == 3
+        record = store.get(seq)
+        assert (record.count, record.timestamp, record.last_timestamp) == (3, 10.0, 12.0)
+        assert (len(store), store.occurrences) == (1, 3)
+
+    def test_eviction_releases_occurrences(self, store):
+        seq = store.append(make_sensation(timestamp=1.0))
+        store.add_occurrence(seq, 2.0)
+        for i in range(4):
+            store.append(make_sensation(timestamp=3.0 + i))
+        assert store.occurrences == 4
+        assert all(record.count == 1 for record in store)
+        with pytest.raises(IndexError):
+            store.add_occurrence(seq, 9.0)
+
+
+@pytest.fixture(params=BACKENDS)
+def matrix(request):
+    return ConsciousnessMatrix(max_memory_size=50, storage_backend=request.param,
+                               coalesce_window=60.0)
+
+
+class TestMatrixCoalescing:
+    def test_repeats_fold_into_one_weighted_record(self, matrix):
+        for _ in range(30):
+            matrix.perceive_agent_activity("kai", "heartbeat", {"status": "ok"})
+        matrix.perceive_agent_activity("kai", "decision", {"choice": "a"})
+
+        records = matrix.sensory_memory.select(SensoryChannel.AGENT_ACTIVITY)
+        assert [record.count for record in records] == [30, 1]
+        assert records[0].last_timestamp >= records[0].timestamp
+
+        performance = matrix.query_consciousness("agent_performance", {"agent_name": "kai"})
+        assert performance["total_activities"] == 2
+        assert performance["recent_activities"] == 31
+        assert performance["activity_breakdown"] == {"heartbeat": 30, "decision": 1}
+
+        stats = matrix.get_ingestion_stats()["coalescing"]
+        assert (stats["coalesced"], stats["records"], stats["occurrences"]) == (29, 2, 31)
+
+    def test_rare_events_survive_repetitive_traffic(self, matrix):
+        matrix.perceive_threat_detection("intrusion", {"ip": "10.0.0.1"}, confidence=0.9)
+        for _ in range(500):
+            matrix.perceive_security_event("permission_denied", {"permission": "CAMERA"})
+        assert matrix.sensory_memory.count(SensoryChannel.THREAT_DETECTION) == 1
+        assert matrix.sensory_memory.occurrences == 501
+
+    def test_rollups_and_aggregates_count_every_occurrence(self, matrix):
+        for _ in range(5):
+            matrix.perceive_performance_metric("latency_ms", 12.0)
+        assert len(matrix.sensory_memory) == 1
+        assert matrix.query_consciousness("perception_volume", {"window_seconds": 60})["total"] == 5
+        assert matrix.latency_histograms.summaries(window=None)[0]["count"] == 5
+
+    def test_subscribers_receive_each_record_once(self, matrix):
+        subscription = matrix.subscribe(channels=SensoryChannel.AGENT_ACTIVITY)
+        for _ in range(3):
+            matrix.perceive_agent_activity("kai", "heartbeat", {})
+        assert [seq for seq, _ in subscription.drain(timeout=0)] == [0]
+
+    def test_disabled_by_default(self):
+        matrix = ConsciousnessMatrix(max_memory_size=10)
+        for _ in range(3):
+            matrix.perceive_agent_activity("kai", "heartbeat", {})
+        assert len(matrix.sensory_memory) == 3
+        assert "coalescing" not in matrix.get_ingestion_stats()
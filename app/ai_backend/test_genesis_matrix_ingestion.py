@@ -0,0 +1,246 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+import app.ai_backend.genesis_consciousness_matrix as matrix_module
+from app.ai_backend.genesis_consciousness_matrix import ConsciousnessMatrix, SensoryChannel
+from app.ai_backend.genesis_matrix_ingest import InstrumentedLock, ShardedIngestBuffer
+
+
+class CountingLock:
+    """RLock wrapper that counts acquisitions."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.acquisitions = 0
+
+    def __enter__(self):
+        self._lock.acquire()
+        self.acquisitions += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._lock.release()
+
+
+@pytest.fixture
+def matrix():
+    return ConsciousnessMatrix(max_memory_size=1000)
+
+
+class TestPerceiveMany:
+    def test_ingests_dicts_and_tuples(self, matrix):
+        count = matrix.perceive_many([
+            {"channel": SensoryChannel.AGENT_ACTIVITY, "source": "kai", "event_type": "scan",
+             "data": {"agent_name": "kai"}},
+            (SensoryChannel.SYSTEM_VITALS, "monitor", "vitals_check", {"cpu": 10}),
+        ])
+
+        assert count == 2
+        assert [s.event_type for s in matrix.sensory_memory] == ["scan", "vitals_check"]
+
+    def test_consumes_generators(self, matrix):
+        events = ({"channel": SensoryChannel.LEARNING_EVENTS, "source": "evo",
+                   "event_type": "update", "data": {"i": i}} for i in range(25))
+        assert matrix.perceive_many(events) == 25
+        assert matrix.query_consciousness("learning_progress")["total_learning_events"] == 25
+
+    def test_single_lock_acquisition(self, matrix):
+        matrix._lock = CountingLock()
+        matrix.perceive_many(
+            (SensoryChannel.SYSTEM_VITALS, "monitor", "vitals_check", {"i": i}) for i in range(50)
+        )
+        assert matrix._lock.acquisitions == 1
+
+    def test_awareness_matches_sequential_perception(self):
+        events = [
+            (SensoryChannel.SYSTEM_VITALS, "monitor", "vitals_check", {"i": 1}),
+            (SensoryChannel.AGENT_ACTIVITY, "aura", "create", {"agent_name": "aura"}),
+            (SensoryChannel.SYSTEM_VITALS, "monitor", "vitals_check", {"i": 2}),
+        ]
+        sequential = ConsciousnessMatrix()
+        for event in events:
+            sequential.perceive(*event)
+        batched = ConsciousnessMatrix()
+        batched.perceive_many(events)
+
+        expected = sequential.get_current_awareness()
+        actual = batched.get_current_awareness()
+        assert actual["total_perceptions"] == expected["total_perceptions"] == 3
+        assert actual["system_vitals_count"] == expected["system_vitals_count"] == 2
+        assert actual["latest_system_vitals"]["data"] == {"i": 2}
+        assert actual["latest_agent_activity"]["source"] == "aura"
+
+    def test_severe_events_trigger_immediate_synthesis(self, matrix):
+        with patch.object(matrix, "_synthesize_immediate") as synthesize:
+            matrix.perceive_many([
+                (SensoryChannel.ERROR_STATES, "core", "crash", {}, "critical"),
+                (SensoryChannel.SYSTEM_VITALS, "monitor", "vitals_check", {}),
+                (SensoryChannel.ERROR_STATES, "core", "fault", {}, "error"),
+            ])
+
+        assert [c.args[0].event_type for c in synthesize.call_args_list] == ["crash", "fault"]
+
+    def test_empty_batch_is_noop(self, matrix):
+        assert matrix.perceive_many([]) == 0
+        assert len(matrix.sensory_memory) == 0
+        assert matrix.get_current_awareness() == {}
+
+
+class TestBatchContext:
+    def test_buffers_until_outermost_exit(self, matrix):
+        with matrix.batch():
+            matrix.perceive_agent_activity("kai", "scan", {})
+            with matrix.batch():
+                matrix.perceive_learning_event("pattern", {})
+            assert len(matrix.sensory_memory) == 0
+        assert len(matrix.sensory_memory) == 2
+
+    def test_flushes_when_block_raises(self, matrix):
+        with pytest.raises(RuntimeError):
+            with matrix.batch():
+                matrix.perceive_agent_activity("kai", "scan", {})
+                raise RuntimeError("boom")
+        assert len(matrix.sensory_memory) == 1
+
+    def test_other_threads_are_not_buffered(self, matrix):
+        with matrix.batch():
+            worker = threading.Thread(
+                target=matrix.perceive_agent_activity, args=("aura", "create", {}))
+            worker.start()
+            worker.join()
+            assert len(matrix.sensory_memory) == 1
+
+
+class TestModuleBatchFunctions:
+    def test_batched_convenience_functions(self):
+        matrix = ConsciousnessMatrix()
+        with patch.object(matrix_module, "consciousness_matrix", matrix):
+            assert matrix_module.perceive_agent_activity_batch([
+                {"agent_name": "kai", "activity_type": "scan", "activity_data": {}},
+                {"agent_name": "aura", "activity_type": "create", "activity_data": {},
+                 "correlation_id": "c1"},
+            ]) == 2
+            matrix_module.perceive_threat_detection_batch([
+                {"threat_type": "probe", "detection_data": {}, "confidence": 0.9},
+            ])
+            matrix_module.perceive_access_control_batch([
+                {"access_type": "login", "access_data": {}, "access_granted": False},
+            ])
+            matrix_module.perceive_many([
+                (SensoryChannel.SYSTEM_VITALS, "monitor", "vitals_check", {}),
+            ])
+
+        channels = [s.channel for s in matrix.sensory_memory]
+        assert channels == [
+            SensoryChannel.AGENT_ACTIVITY,
+            SensoryChannel.AGENT_ACTIVITY,
+            SensoryChannel.THREAT_DETECTION,
+            SensoryChannel.ACCESS_CONTROL,
+            SensoryChannel.SYSTEM_VITALS,
+        ]
+        assert matrix.sensory_memory.get(3).severity == "warning"
+
+
+class TestShardedIngestion:
+    def test_rejects_unknown_mode(self):
+        with pytest.raises(ValueError):
+            ConsciousnessMatrix(ingestion_mode="parallel")
+
+    def test_perceptions_buffer_until_threshold(self):
+        matrix = ConsciousnessMatrix(ingestion_mode="sharded", shard_flush_threshold=3)
+        matrix.perceive_agent_activity("kai", "scan", {})
+        matrix.perceive_agent_activity("kai", "scan", {})
+        assert len(matrix.sensory_memory) == 0
+        assert matrix.get_ingestion_stats()["pending_perceptions"] == 2
+
+        matrix.perceive_agent_activity("kai", "scan", {})
+        assert len(matrix.sensory_memory) == 3
+
+    def test_readers_see_merged_view(self):
+        matrix = ConsciousnessMatrix(ingestion_mode="sharded")
+        matrix.perceive_learning_event("pattern", {})
+        assert matrix.query_consciousness("learning_progress")["total_learning_events"] == 1
+        assert matrix.get_current_awareness()["total_perceptions"] == 1
+
+    def test_severe_events_flush_and_synthesize(self):
+        matrix = ConsciousnessMatrix(ingestion_mode="sharded")
+        with patch.object(matrix, "_synthesize_immediate") as synthesize:
+            matrix.perceive_agent_activity("kai", "scan", {})
+            matrix.perceive(SensoryChannel.ERROR_STATES, "core", "crash", {}, "critical")
+
+        assert len(matrix.sensory_memory) == 2
+        assert synthesize.call_args.args[0].event_type == "crash"
+
+    def test_threads_merge_in_timestamp_order(self):
+        matrix = ConsciousnessMatrix(ingestion_mode="sharded", shard_flush_threshold=10_000)
+
+        def produce(name):
+            for i in range(200):
+                matrix.perceive_agent_activity(name, "turn", {"i": i})
+
+        workers = [threading.Thread(target=produce, args=(f"agent_{n}",)) for n in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert matrix.flush() == 800
+        timestamps = [s.timestamp for s in matrix.sensory_memory]
+        assert timestamps == sorted(timestamps)
+        # Shards of finished threads are released once drained
+        assert matrix.get_ingestion_stats()["shards"] == 0
+
+    def test_ingestion_stats_query(self):
+        matrix = ConsciousnessMatrix(ingestion_mode="sharded")
+        matrix.perceive_agent_activity("kai", "scan", {})
+        stats = matrix.query_consciousness("ingestion_stats")
+
+        assert stats["ingestion_mode"] == "sharded"
+        assert stats["merges"] == 1
+        assert stats["lock"]["acquisitions"] >= 1
+        assert "wait_seconds_total" in stats["lock"]
+
+    def test_direct_mode_flush_is_noop(self, matrix):
+        matrix.perceive_agent_activity("kai", "scan", {})
+        assert matrix.flush() == 0
+        assert matrix.query_consciousness("ingestion_stats")["ingestion_mode"] == "direct"
+
+
+class TestInstrumentedLock:
+    def test_records_contended_wait(self):
+        lock = InstrumentedLock()
+        held = threading.Event()
+        release = threading.Event()
+
+        def holder():
+            with lock:
+                held.set()
+                release.wait()
+
+        thread = threading.Thread(target=holder)
+        thread.start()
+        held.wait()
+        threading.Timer(0.05, release.set).start()
+        with lock:
+            pass
+        thread.join()
+
+        stats = lock.stats()
+        assert stats["acquisitions"] == 2
+        assert stats["contended_acquisitions"] == 1
+        assert stats["wait_seconds_max"] > 0.0
+
+    def test_reentrant(self):
+        lock = InstrumentedLock()
+        with lock:
+            with lock:
+                pass
+        assert lock.stats()["contended_acquisitions"] == 0
+
+
+class TestShardedIngestBuffer:
+    def test_rejects_non_positive_threshold(self):
+        with pytest.raises(ValueError):
+            ShardedIngestBuffer(0)
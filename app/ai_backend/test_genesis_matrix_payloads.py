@@ -0,0 +1,79 @@
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix, SensoryChannel, SensoryData
+)
+from app.ai_backend.genesis_matrix_payloads import (
+    PayloadGuard, copy_payload, load_spilled_payload
+)
+from app.ai_backend.genesis_matrix_retention import estimate_payload_size
+
+
+class TestCompactSensoryData:
+    def test_has_no_instance_dict(self):
+        sensation = SensoryData(1.0, SensoryChannel.SYSTEM_VITALS, "monitor", "check", {})
+        assert not hasattr(sensation, "__dict__")
+        with pytest.raises(AttributeError):
+            sensation.extra = True
+
+    def test_names_are_interned(self):
+        first = SensoryData(1.0, SensoryChannel.SYSTEM_VITALS, "".join(["moni", "tor"]),
+                            "".join(["che", "ck"]), {})
+        second = SensoryData(2.0, SensoryChannel.SYSTEM_VITALS, "".join(["mon", "itor"]),
+                             "".join(["ch", "eck"]), {})
+        assert first.source is second.source and first.event_type is second.event_type
+        assert first.to_dict()["source"] == "monitor"
+
+
+class TestPayloadGuard:
+    def test_copy_is_deep_for_containers(self):
+        payload = {"tags": ["a"], "nested": {"n": 1}}
+        copied = copy_payload(payload)
+        payload["tags"].append("b")
+        payload["nested"]["n"] = 2
+        assert copied == {"tags": ["a"], "nested": {"n": 1}}
+
+    def test_small_payloads_pass_unchanged(self):
+        guard = PayloadGuard(max_bytes=4096)
+        assert guard.admit({"value": 1}) == {"value": 1}
+        assert guard.stats()["truncated"] == 0
+
+    def test_oversized_payload_is_truncated_to_budget(self):
+        guard = PayloadGuard(max_bytes=600)
+        payload = {"agent_name": "kai", "trace": "x" * 5000, "frames": list(range(200))}
+        admitted = guard.admit(payload)
+
+        assert admitted["agent_name"] == "kai"
+        assert 16 <= len(admitted["trace"]) < 5000
+        assert admitted["_truncated"]["dropped_fields"] == ["frames"]
+        assert admitted["_truncated"]["original_bytes"] == estimate_payload_size(payload)
+        assert estimate_payload_size({k: v for k, v in admitted.items() if k != "_truncated"}) <= 600
+        assert guard.stats()["dropped_fields"] == 1
+
+    def test_spilled_payload_can_be_read_back(self, tmp_path):
+        guard = PayloadGuard(max_bytes=300, spill_dir=str(tmp_path))
+        guard.admit({"blob": "y" * 1000, "n": 1})
+        admitted = guard.admit({"blob": "z" * 1000, "n": 2})
+        assert load_spilled_payload(admitted["_spilled"]) == {"blob": "z" * 1000, "n": 2}
+        assert guard.stats()["spilled"] == 2
+
+
+class TestMatrixPayloads:
+    def test_caller_mutation_does_not_rewrite_memory(self):
+        matrix = ConsciousnessMatrix()
+        payload = {"agent_name": "kai", "steps": [1]}
+        matrix.perceive_agent_activity("kai", "plan", payload)
+        payload["steps"].append(2)
+        payload["agent_name"] = "aura"
+
+        stored = matrix.sensory_memory.select(SensoryChannel.AGENT_ACTIVITY)[-1]
+        assert stored.data["agent_name"] == "kai" and stored.data["steps"] == [1]
+
+    def test_payload_cap_reported_in_ingestion_stats(self):
+        matrix = ConsciousnessMatrix(max_payload_bytes=512)
+        matrix.perceive(SensoryChannel.ERROR_STATES, "core", "dump", {"dump": "d" * 10000}, "warning")
+
+        stored = matrix.sensory_memory.select(SensoryChannel.ERROR_STATES)[-1]
+        assert "_truncated" in stored.data
+        assert matrix.get_ingestion_stats()["payloads"]["truncated"] == 1
+        assert "payloads" not in ConsciousnessMatrix().get_ingestion_stats()
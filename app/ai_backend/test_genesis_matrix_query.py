@@ -0,0 +1,115 @@
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix,
+    SensoryChannel,
+    SensoryData,
+)
+from app.ai_backend.genesis_matrix_query import compile_predicate
+from app.ai_backend.genesis_sensory_store import create_sensory_store
+
+BACKENDS = ["object", "columnar"]
+
+
+def _event(timestamp, channel=SensoryChannel.AGENT_ACTIVITY, source="core", event_type="turn",
+           data=None, severity="info"):
+    return SensoryData(timestamp=timestamp, channel=channel, source=source,
+                       event_type=event_type, data=data or {}, severity=severity)
+
+
+@pytest.fixture(params=BACKENDS)
+def matrix(request):
+    matrix = ConsciousnessMatrix(max_memory_size=500, storage_backend=request.param,
+                                 channel_capacity=20)
+    for i in range(300):
+        matrix.sensory_memory.append(_event(
+            1000.0 + i,
+            channel=SensoryChannel.AGENT_ACTIVITY if i % 3 else SensoryChannel.ERROR_STATES,
+            source=f"source_{i % 2}",
+            data={"agent_name": "kai" if i % 4 == 0 else "aura", "i": i},
+            severity="error" if i % 10 == 0 else "info",
+        ))
+    return matrix
+
+
+class TestCompilePredicate:
+    def test_no_filters(self):
+        assert compile_predicate() is None
+
+    def test_values_collections_and_callables(self):
+        predicate = compile_predicate(source={"a", "b"}, event_type="turn",
+                                      data={"agent_name": "kai", "i": lambda v: v > 2})
+        assert predicate(_event(0, source="a", data={"agent_name": "kai", "i": 3}))
+        assert not predicate(_event(0, source="c", data={"agent_name": "kai", "i": 3}))
+        assert not predicate(_event(0, source="a", data={"agent_name": "kai", "i": 1}))
+        assert not predicate(_event(0, source="a", data={"agent_name": "kai"}))
+
+    def test_missing_field_never_matches_none(self):
+        predicate = compile_predicate(data={"user_id": None})
+        assert predicate(_event(0, data={"user_id": None}))
+        assert not predicate(_event(0, data={}))
+
+    def test_filter_values_are_not_interpolated(self):
+        predicate = compile_predicate(source="x') or True or ('")
+        assert not predicate(_event(0, source="y"))
+
+
+class TestMatrixQuery:
+    def test_time_range(self, matrix):
+        results = list(matrix.query(since=1010.0, until=1019.0))
+        assert [s.data["i"] for s in results] == list(range(10, 20))
+
+    def test_channel_query_reaches_beyond_the_channel_view(self, matrix):
+        errors = list(matrix.query(channel=SensoryChannel.ERROR_STATES))
+        assert len(errors) == 100  # channel view only holds 20
+        assert all(s.channel == SensoryChannel.ERROR_STATES for s in errors)
+
+    def test_combined_filters(self, matrix):
+        results = list(matrix.query(channel=SensoryChannel.AGENT_ACTIVITY, severity="error",
+                                    source="source_0", data={"agent_name": "aura"}))
+        expected = [i for i in range(300)
+                    if i % 3 and i % 10 == 0 and i % 2 == 0 and i % 4 != 0]
+        assert [s.data["i"] for s in results] == expected
+
+    def test_newest_first_and_limit(self, matrix):
+        results = list(matrix.query(data={"agent_name": "kai"}, limit=3, newest_first=True))
+        assert [s.data["i"] for s in results] == [296, 292, 288]
+
+    def test_results_are_lazy(self, matrix):
+        results = matrix.query()
+        assert next(results).data["i"] == 0
+        matrix.perceive_agent_activity("kai", "late", {})
+        # The window is fixed when the query starts; later arrivals are not included
+        assert sum(1 for _ in results) == 299
+
+    def test_last_seconds(self, matrix):
+        matrix.perceive_agent_activity("kai", "now", {})
+        results = list(matrix.query(last_seconds=60))
+        assert [s.event_type for s in results] == ["now"]
+
+    def test_reports_use_query_engine(self, matrix):
+        status = matrix.query_consciousness("learning_progress")
+        assert status["status"] == "no_learning_detected"
+        for _ in range(25):
+            matrix.perceive_learning_event("pattern", {})
+        assert matrix.query_consciousness("learning_progress")["recent_learning_events"] == 20
+
+
+class TestStoreTimeIndex:
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_backwards_clock_is_clamped(self, backend):
+        store = create_sensory_store(backend, 10, record_type=SensoryData)
+        for timestamp in [1.0, 2.0, 1.5, 3.0]:
+            store.append(_event(timestamp))
+        assert list(store.seq_range(since=2.0)) == [1, 2, 3]
+        assert list(store.seq_range(until=1.9)) == [0]
+        assert store.get(2).timestamp == 1.5  # Clamping only affects the index
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_range_after_wraparound(self, backend):
+        store = create_sensory_store(backend, 8, record_type=SensoryData)
+        for i in range(20):
+            store.append(_event(float(i)))
+        assert list(store.seq_range()) == list(range(12, 20))
+        assert list(store.seq_range(since=15.0, until=17.0)) == [15, 16, 17]
+        assert store.scan(0, 20, reverse=True, limit=2) == [19, 18]
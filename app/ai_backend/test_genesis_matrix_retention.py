@@ -0,0 +1,142 @@
+import time
+
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix, SensoryChannel, SensoryData
+)
+from app.ai_backend.genesis_matrix_retention import RetentionPolicy, estimate_payload_size
+from app.ai_backend.genesis_sensory_store import create_sensory_store, NUMPY_AVAILABLE
+
+BACKENDS = ["object"] + (["columnar"] if NUMPY_AVAILABLE else [])
+
+THREAT = SensoryChannel.THREAT_DETECTION
+VITALS = SensoryChannel.SYSTEM_VITALS
+
+
+def make_sensation(timestamp, channel=VITALS, severity="info", **data):
+    return SensoryData(timestamp=timestamp, channel=channel, source="test",
+                       event_type="event", data=data, severity=severity)
+
+
+def make_store(backend, retention, capacity=5, **kwargs):
+    return create_sensory_store(backend, capacity, record_type=SensoryData, channel_capacity=3,
+                                retention=retention, **kwargs)
+
+
+class TestRetentionPolicy:
+    def test_rejects_non_positive_limits(self):
+        with pytest.raises(ValueError):
+            RetentionPolicy(max_age=0)
+
+    def test_payload_size_grows_with_contents(self):
+        assert estimate_payload_size({"a": "x" * 1000}) > estimate_payload_size({"a": "x"})
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestStoreRetention:
+    def test_retained_channel_outlives_the_ring(self, backend):
+        store = make_store(backend, {THREAT: RetentionPolicy(max_count=10)},
+                           payload_indexes={THREAT: ["threat_type"]})
+        threat_seq = store.append(make_sensation(1.0, THREAT, "critical", threat_type="intrusion"))
+        for i in range(10):
+            store.append(make_sensation(2.0 + i))
+
+        assert store.get(threat_seq).data["threat_type"] == "intrusion"
+        assert threat_seq in store and threat_seq < store.first_seq
+        assert [s.timestamp for s in store.select(THREAT)] == [1.0]
+        assert store.count(THREAT) == 1 and store.count(severities=["critical"]) == 1
+        assert store.field_values(THREAT, "threat_type") == {"intrusion": 1}
+        assert store.scan(0, store.next_seq, THREAT) == [threat_seq]
+        assert store.scan(0, store.next_seq, severities=["critical"]) == [threat_seq]
+        assert list(store.seq_range(0.5, 1.5)) == [threat_seq]
+        assert store.records == 6 and next(iter(store)).channel is THREAT
+        assert store.retention_stats()[THREAT]["archived"] == 1
+        assert store.retention_stats()[VITALS]["evictions"] == {"memory": 5}
+
+    def test_count_budget_drops_oldest_everywhere(self, backend):
+        store = make_store(backend, {VITALS: RetentionPolicy(max_count=2)})
+        seqs = [store.append(make_sensation(float(i), severity="warning")) for i in range(4)]
+
+        assert [s.timestamp for s in store.select(VITALS)] == [2.0, 3.0]
+        assert [s.timestamp for s in store] == [2.0, 3.0]
+        assert [s.timestamp for s in store.tail(5)] == [2.0, 3.0]
+        assert store.scan(0, store.next_seq) == seqs[2:]
+        assert store.count() == 2 and store.count(severities=["warning"]) == 2
+        assert [s.timestamp for s in store.select(severities=["warning"])] == [2.0, 3.0]
+        with pytest.raises(IndexError):
+            store.get(seqs[0])
+        assert store.retention_stats()[VITALS]["evictions"] == {"count": 2}
+
+        # Dropped slots are reused without disturbing the counts
+        for i in range(4, 10):
+            store.append(make_sensation(float(i), severity="warning"))
+        assert store.count(severities=["warning"]) == 2 and store.records == 2
+
+    def test_byte_budget(self, backend):
+        budget = estimate_payload_size({"blob": "x" * 100}) * 2
+        store = make_store(backend, {VITALS: RetentionPolicy(max_bytes=budget)})
+        for i in range(4):
+            store.append(make_sensation(float(i), blob="x" * 100))
+        assert [s.timestamp for s in store.select(VITALS)] == [2.0, 3.0]
+        assert store.channel_bytes[VITALS] <= budget
+        assert store.retention_stats()[VITALS]["evictions"] == {"bytes": 2}
+
+    def test_compact_enforces_age_on_ring_and_archive(self, backend):
+        store = make_store(backend, {THREAT: RetentionPolicy(max_age=100.0)})
+        store.append(make_sensation(1000.0, THREAT))
+        for i in range(6):
+            store.append(make_sensation(1000.0 + i))
+        store.append(make_sensation(1050.0, THREAT))
+
+        assert store.compact(now=1080.0) == 0
+        assert store.compact(now=1120.0) == 1  # The archived threat expires
+        assert [s.timestamp for s in store.select(THREAT)] == [1050.0]
+        assert store.compact(now=1200.0) == 1
+        assert store.count(THREAT) == 0 and store.retention_stats()[THREAT]["archived"] == 0
+        assert store.retention_stats()[THREAT]["evictions"] == {"age": 2}
+
+    def test_occurrences_on_archived_records(self, backend):
+        store = make_store(backend, {THREAT: RetentionPolicy()})
+        seq = store.append(make_sensation(1.0, THREAT))
+        store.add_occurrence(seq, 2.0)
+        for i in range(5):
+            store.append(make_sensation(3.0 + i))
+        assert store.add_occurrence(seq, 9.0) == 3
+        assert store.occurrences == 8
+
+
+class TestMatrixRetention:
+    def test_security_events_survive_vitals_flood(self):
+        matrix = ConsciousnessMatrix(max_memory_size=20, retention_policies={
+            THREAT: {"max_count": 100, "max_age": 3600.0},
+            VITALS: {"max_age": 60.0},
+        })
+        matrix.perceive_threat_detection("intrusion", {"ip": "10.0.0.1"}, confidence=0.9)
+        for _ in range(50):
+            matrix.perceive(VITALS, "system_monitor", "vitals_check", {"cpu_percent": 5.0})
+
+        status = matrix.query_consciousness("threat_status")
+        assert status["total_recent_threats"] == 1
+
+        report = matrix.query_consciousness("retention")
+        assert (report["ring_events"], report["records"], report["archived"]) == (20, 51, 31)
+        assert report["channels"]["threat_detection"]["policy"]["max_count"] == 100
+        assert report["channels"]["system_vitals"]["events"] == 50
+
+        # Vitals age out after a minute, the threat is kept for an hour
+        assert matrix.compact(now=time.time() + 120.0) == 50
+        assert matrix.sensory_memory.count(VITALS) == 0
+        assert matrix.sensory_memory.count(THREAT) == 1
+        report = matrix.query_consciousness("retention")
+        assert report["channels"]["system_vitals"]["evictions"] == {"age": 50}
+
+    def test_compactor_runs_only_with_policies(self):
+        plain = ConsciousnessMatrix(synthesis_intervals={"micro": 300.0})
+        retained = ConsciousnessMatrix(synthesis_intervals={"micro": 300.0},
+                                       retention_policies={VITALS: RetentionPolicy(max_age=1.0)})
+        for matrix in (plain, retained):
+            matrix.awaken()
+            matrix.sleep()
+        assert "retention" not in plain.synthesis_scheduler.jobs()
+        assert "retention" in retained.synthesis_scheduler.jobs()
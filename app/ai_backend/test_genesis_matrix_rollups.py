@@ -0,0 +1,121 @@
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix,
+    SensoryChannel,
+    SensoryData,
+)
+from app.ai_backend.genesis_matrix_rollups import MatrixRollups
+
+VITALS = SensoryChannel.SYSTEM_VITALS
+ERRORS = SensoryChannel.ERROR_STATES
+
+
+def _event(timestamp, channel=VITALS, severity="info", **data):
+    return SensoryData(timestamp=timestamp, channel=channel, source="test",
+                       event_type="tick", data=data, severity=severity)
+
+
+@pytest.fixture
+def rollups():
+    return MatrixRollups(tiers=((1.0, 10), (10.0, 6), (60.0, 24)),
+                         fields={VITALS: ["cpu_percent"]}, clock=lambda: 0.0)
+
+
+class TestMatrixRollups:
+    def test_counts_across_tiers_match(self, rollups):
+        for second in range(200):
+            rollups.record(_event(float(second), cpu_percent=float(second % 100)))
+            if second % 4 == 0:
+                rollups.record(_event(second + 0.5, channel=ERRORS, severity="error"))
+
+        for window in (5, 50, 200):
+            summary = rollups.summary(window, now=200.0)
+            expected = sum(1 for s in range(200) if s >= 200 - window) + \
+                sum(1 for s in range(0, 200, 4) if s + 0.5 >= 200 - window)
+            # Windows are rounded out to whole buckets of the serving tier
+            assert summary["total"] >= expected
+        whole = rollups.summary(1000, now=200.0)
+        assert whole["total"] == 250
+        assert whole["by_channel"] == {"system_vitals": 200, "error_states": 50}
+        assert whole["by_severity"] == {"info": 200, "error": 50}
+
+    def test_tier_selection_bounds_buckets(self, rollups):
+        for second in range(1000):
+            rollups.record(_event(float(second)))
+        assert rollups.summary(5, now=1000.0)["resolution_seconds"] == 1.0
+        assert rollups.summary(50, now=1000.0)["resolution_seconds"] == 10.0
+        summary = rollups.summary(1200, now=1000.0)
+        assert summary["resolution_seconds"] == 60.0
+        assert summary["buckets"] <= 24 + 2
+        assert summary["total"] == 1000
+
+    def test_field_summary(self, rollups):
+        for second in range(100):
+            rollups.record(_event(float(second), cpu_percent=float(second + 1)))
+        rollups.record(_event(100.0, cpu_percent="n/a"))
+        cpu = rollups.summary(1000, channel=VITALS, fields=["cpu_percent"], now=101.0)
+        stats = cpu["fields"]["cpu_percent"]
+        assert stats["count"] == 100
+        assert (stats["min"], stats["max"]) == (1.0, 100.0)
+        assert stats["mean"] == pytest.approx(50.5)
+        assert stats["p50"] == pytest.approx(50, rel=0.03)
+
+    def test_series_folds_open_buckets(self, rollups):
+        for second in range(25):
+            rollups.record(_event(float(second)))
+        series = rollups.series(60, now=25.0)
+        assert series["resolution_seconds"] == 10.0
+        assert series["points"] == [{"start": 0.0, "count": 10}, {"start": 10.0, "count": 10},
+                                    {"start": 20.0, "count": 5}]
+
+    def test_memory_is_bounded(self, rollups):
+        for second in range(0, 100000, 7):
+            rollups.record(_event(float(second)))
+        assert [t["buckets"] for t in rollups.stats()["tiers"]] == [10, 6, 24]
+
+
+class TestMatrixRollupReports:
+    def test_reports_outlive_sensory_memory(self):
+        matrix = ConsciousnessMatrix(max_memory_size=50)
+        for i in range(300):
+            matrix.perceive_performance_metric("latency_ms", float(i % 10 + 1))
+            if i % 3 == 0:
+                matrix.perceive(ERRORS, "test", "failure", {}, severity="error")
+
+        volume = matrix.query_consciousness("perception_volume", {"window_seconds": 3600})
+        assert volume["total"] == 400
+        assert sum(point["count"] for point in volume["series"]) == 400
+
+        errors = matrix.query_consciousness("error_rate", {"window_seconds": 3600})
+        assert errors["errors"] == 100
+        assert errors["error_rate"] == pytest.approx(0.25)
+
+        metrics = matrix.query_consciousness("metric_rollup", {"channel": "performance_metrics",
+                                                               "window_seconds": 86400})
+        assert metrics["fields"]["metric_value"]["count"] == 300
+        assert metrics["fields"]["metric_value"]["max"] == 10.0
+
+    def test_non_finite_fields_are_skipped(self):
+        matrix = ConsciousnessMatrix()
+        matrix.perceive(VITALS, "test", "vitals_check", {"cpu_percent": float("nan")})
+        matrix.perceive(VITALS, "test", "vitals_check", {"cpu_percent": float("inf")})
+        matrix.perceive(VITALS, "test", "vitals_check", {"cpu_percent": 40.0})
+        matrix.perceive_performance_metric("latency_ms", float("nan"))
+
+        assert matrix.sensory_memory.count(VITALS) == 3
+        report = matrix.query_consciousness("metric_rollup", {"channel": "system_vitals",
+                                                              "window_seconds": 3600})
+        assert report["fields"]["cpu_percent"]["count"] == 1
+        assert report["fields"]["cpu_percent"]["mean"] == 40.0
+
+    def test_unknown_channel(self):
+        matrix = ConsciousnessMatrix()
+        report = matrix.query_consciousness("error_rate", {"channel": "nope"})
+        assert report["error"] == "unknown_channel"
+
+    @pytest.mark.parametrize("query_type", ["perception_volume", "error_rate", "metric_rollup"])
+    @pytest.mark.parametrize("window", [0, -60, "soon"])
+    def test_invalid_window(self, query_type, window):
+        report = ConsciousnessMatrix().query_consciousness(query_type, {"window_seconds": window})
+        assert report == {"query_type": query_type, "error": "invalid_window", "window_seconds": window}
@@ -0,0 +1,123 @@
+import threading
+import time
+
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import ConsciousnessMatrix
+from app.ai_backend.genesis_matrix_scheduler import SynthesisScheduler
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class TestSynthesisScheduler:
+    def test_runs_jobs_on_one_thread(self):
+        scheduler = SynthesisScheduler()
+        threads = set()
+        scheduler.schedule("fast", 0.01, lambda: threads.add(threading.current_thread().name))
+        scheduler.schedule("slow", 0.02, lambda: threads.add(threading.current_thread().name))
+        scheduler.start()
+        try:
+            assert _wait_for(lambda: scheduler.stats()["slow"]["runs"] >= 2)
+        finally:
+            scheduler.stop()
+
+        assert threads == {"genesis-synthesis"}
+
+    def test_stop_wakes_long_interval_immediately(self):
+        scheduler = SynthesisScheduler()
+        scheduler.schedule("meta", 300.0, lambda: None)
+        scheduler.start()
+
+        started = time.monotonic()
+        assert scheduler.stop(timeout=2.0)
+        assert time.monotonic() - started < 0.5
+
+    def test_cadence_does_not_drift_by_runtime(self):
+        scheduler = SynthesisScheduler()
+        runs = []
+
+        def slow_tick():
+            runs.append(time.monotonic())
+            time.sleep(0.02)
+
+        scheduler.schedule("tick", 0.05, slow_tick)
+        scheduler.start()
+        try:
+            assert _wait_for(lambda: len(runs) >= 5)
+        finally:
+            scheduler.stop()
+
+        # With sleep-after-run scheduling the spacing would be ~0.07s
+        mean_spacing = (runs[4] - runs[0]) / 4
+        assert mean_spacing == pytest.approx(0.05, abs=0.015)
+
+    def test_overrunning_job_reports_missed_ticks(self):
+        scheduler = SynthesisScheduler()
+        scheduler.schedule("overrun", 0.01, lambda: time.sleep(0.035))
+        scheduler.start()
+        try:
+            assert _wait_for(lambda: scheduler.stats()["overrun"]["runs"] >= 2)
+        finally:
+            scheduler.stop()
+
+        stats = scheduler.stats()["overrun"]
+        assert stats["missed_ticks"] >= 2
+        assert stats["max_lateness"] >= 0.0
+
+    def test_errors_are_counted_and_job_keeps_running(self):
+        scheduler = SynthesisScheduler()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        scheduler.schedule("failing", 0.01, fail)
+        scheduler.start()
+        try:
+            assert _wait_for(lambda: scheduler.stats()["failing"]["errors"] >= 2)
+        finally:
+            scheduler.stop()
+
+    def test_unschedule_and_validation(self):
+        scheduler = SynthesisScheduler()
+        scheduler.schedule("micro", 1.0, lambda: None, jitter=0.1)
+        scheduler.unschedule("micro")
+        assert scheduler.jobs() == []
+
+        with pytest.raises(ValueError):
+            scheduler.schedule("bad", 0.0, lambda: None)
+        with pytest.raises(ValueError):
+            scheduler.schedule("bad", 1.0, lambda: None, jitter=1.0)
+
+
+class TestMatrixScheduling:
+    def test_awaken_uses_single_scheduler_and_sleeps_promptly(self):
+        matrix = ConsciousnessMatrix(synthesis_intervals={"micro": 0.01, "meta": 300.0})
+        threads_before = threading.active_count()
+        matrix.awaken()
+        try:
+            assert threading.active_count() == threads_before + 1
+            assert _wait_for(lambda: matrix.get_recent_synthesis("micro", 1))
+        finally:
+            started = time.monotonic()
+            matrix.sleep()
+        assert time.monotonic() - started < 1.0
+        assert not matrix.synthesis_scheduler.running
+
+    def test_custom_tier_shares_the_scheduler(self):
+        matrix = ConsciousnessMatrix(synthesis_intervals={"micro": 300.0})
+        matrix.schedule_synthesis("hourly", 0.01, lambda: {"type": "hourly", "timestamp": 0.0})
+        matrix.awaken()
+        try:
+            assert _wait_for(lambda: matrix.get_recent_synthesis("hourly", 1))
+            schedule = matrix.query_consciousness("synthesis_schedule")
+            assert set(schedule["tiers"]) == {"micro", "hourly"}
+            assert schedule["running"] is True
+        finally:
+            matrix.sleep()
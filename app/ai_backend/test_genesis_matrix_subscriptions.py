@@ -0,0 +1,99 @@
+import threading
+
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import ConsciousnessMatrix, SensoryChannel
+from app.ai_backend.genesis_matrix_subscriptions import Subscription
+
+
+@pytest.fixture
+def matrix():
+    return ConsciousnessMatrix(max_memory_size=20)
+
+
+class TestSubscription:
+    def test_drop_oldest(self):
+        subscription = Subscription(1, capacity=2)
+        for seq in range(5):
+            subscription.publish(seq, f"event_{seq}")
+        assert subscription.drain() == [(3, "event_3"), (4, "event_4")]
+        assert (subscription.dropped, subscription.delivered, subscription.cursor) == (3, 2, 4)
+
+    def test_drop_newest(self):
+        subscription = Subscription(1, capacity=2, overflow="drop_newest")
+        for seq in range(5):
+            subscription.publish(seq, seq)
+        assert [seq for seq, _ in subscription.drain()] == [0, 1]
+        assert subscription.dropped == 3
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            Subscription(1, overflow="block")
+
+    def test_get_times_out_and_close_wakes_consumer(self):
+        subscription = Subscription(1)
+        assert subscription.get(timeout=0.01) is None
+        results = []
+        consumer = threading.Thread(target=lambda: results.append(subscription.get()))
+        consumer.start()
+        subscription.close()
+        consumer.join(1.0)
+        assert results == [None]
+
+
+class TestMatrixSubscriptions:
+    def test_channel_filter_and_sequence_order(self, matrix):
+        agents = matrix.subscribe(channels=SensoryChannel.AGENT_ACTIVITY)
+        everything = matrix.subscribe()
+        matrix.perceive_agent_activity("kai", "turn", {})
+        matrix.perceive_learning_event("pattern", {})
+        matrix.perceive_agent_activity("aura", "turn", {})
+
+        assert [s.data["agent_name"] for _, s in agents.drain()] == ["kai", "aura"]
+        assert [seq for seq, _ in everything.drain()] == [0, 1, 2]
+
+    def test_resume_from_cursor(self, matrix):
+        first = matrix.subscribe(channels=["agent_activity"])
+        for i in range(3):
+            matrix.perceive_agent_activity("kai", f"turn_{i}", {})
+        first.get(0)
+        cursor = first.cursor
+        matrix.unsubscribe(first)
+
+        matrix.perceive_learning_event("pattern", {})
+        matrix.perceive_agent_activity("kai", "turn_3", {})
+        resumed = matrix.subscribe(channels=SensoryChannel.AGENT_ACTIVITY, from_seq=cursor + 1)
+        matrix.perceive_agent_activity("kai", "turn_4", {})
+
+        assert [s.event_type for _, s in resumed.drain()] == ["turn_1", "turn_2", "turn_3", "turn_4"]
+        assert resumed.missed == 0
+
+    def test_resume_reports_evicted_events(self, matrix):
+        for i in range(30):
+            matrix.perceive_agent_activity("kai", "turn", {"i": i})
+        resumed = matrix.subscribe(from_seq=5)
+        assert resumed.missed == 5
+        assert [seq for seq, _ in resumed.drain()] == list(range(10, 30))
+
+    def test_slow_consumer_never_blocks_perceive(self, matrix):
+        slow = matrix.subscribe(capacity=3)
+        for i in range(100):
+            matrix.perceive_agent_activity("kai", "turn", {"i": i})
+        assert slow.pending() == 3
+        stats = matrix.query_consciousness("subscriptions")
+        assert stats["active"] == 1
+        assert stats["dropped_total"] == 97
+
+    def test_unsubscribe_stops_delivery(self, matrix):
+        subscription = matrix.subscribe()
+        matrix.unsubscribe(subscription)
+        matrix.perceive_agent_activity("kai", "turn", {})
+        assert subscription.get(0) is None
+        assert matrix.query_consciousness("subscriptions")["active"] == 0
+
+    def test_sharded_mode_publishes_on_flush(self):
+        matrix = ConsciousnessMatrix(ingestion_mode="sharded")
+        subscription = matrix.subscribe()
+        matrix.perceive_agent_activity("kai", "turn", {})
+        matrix.flush()
+        assert len(subscription.drain()) == 1
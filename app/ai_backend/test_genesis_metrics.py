@@ -0,0 +1,119 @@
+import threading
+
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import ConsciousnessMatrix, SensoryChannel
+from app.ai_backend.genesis_ethical_governor import EthicalGovernor
+from app.ai_backend.genesis_metrics import (
+    MetricFamily, MetricsRegistry, OPENMETRICS_CONTENT_TYPE, PROMETHEUS_CONTENT_TYPE
+)
+
+
+def sample_lines(text, name):
+    return [line for line in text.splitlines() if line.startswith(name)]
+
+
+class TestMetricsRegistry:
+    def test_counter_and_gauge_exposition(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("demo_requests", "Requests served.", ("route",))
+        requests.inc(route="/a")
+        requests.inc(2, route='/b"x')
+        registry.gauge("demo_in_flight", "In flight.").set(3)
+
+        text = registry.render()
+        assert "# TYPE demo_requests_total counter" in text
+        assert 'demo_requests_total{route="/a"} 1' in text
+        assert 'demo_requests_total{route="/b\\"x"} 2' in text
+        assert "demo_in_flight 3" in text
+        with pytest.raises(ValueError):
+            requests.inc(-1, route="/a")
+        with pytest.raises(ValueError):
+            requests.inc(path="/a")
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("demo_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 3.0):
+            latency.observe(value)
+
+        lines = sample_lines(registry.render(), "demo_seconds")
+        assert lines == [
+            'demo_seconds_bucket{le="0.1"} 1',
+            'demo_seconds_bucket{le="1"} 3',
+            'demo_seconds_bucket{le="+Inf"} 4',
+            "demo_seconds_sum 4.25",
+            "demo_seconds_count 4",
+        ]
+
+    def test_registration_is_idempotent_per_type(self):
+        registry = MetricsRegistry()
+        assert registry.counter("demo", "x") is registry.counter("demo", "x")
+        with pytest.raises(ValueError):
+            registry.gauge("demo", "x")
+
+    def test_openmetrics_negotiation(self):
+        registry = MetricsRegistry()
+        registry.counter("demo_events", "Events.").inc()
+
+        body, content_type = registry.exposition("application/openmetrics-text; version=1.0.0")
+        assert content_type == OPENMETRICS_CONTENT_TYPE
+        assert "# TYPE demo_events counter" in body and body.endswith("# EOF\n")
+        body, content_type = registry.exposition("text/plain")
+        assert content_type == PROMETHEUS_CONTENT_TYPE and "# EOF" not in body
+
+    def test_collectors_are_merged_and_isolated(self):
+        registry = MetricsRegistry()
+        registry.register_collector("a", lambda: [MetricFamily("demo_up", "gauge", "Up.").add(1, {"i": "a"})])
+        registry.register_collector("b", lambda: [MetricFamily("demo_up", "gauge", "Up.").add(0, {"i": "b"})])
+        registry.register_collector("broken", lambda: 1 / 0)
+
+        text = registry.render()
+        assert text.count("# TYPE demo_up gauge") == 1
+        assert sample_lines(text, "demo_up") == ['demo_up{i="a"} 1', 'demo_up{i="b"} 0']
+        assert registry.collector_errors == 1
+
+
+class TestComponentMetrics:
+    def test_matrix_scrape_does_not_take_the_lock(self):
+        matrix = ConsciousnessMatrix()
+        matrix.perceive(SensoryChannel.SYSTEM_VITALS, "monitor", "vitals_check", {"blob": "x" * 100})
+        matrix.perceive(SensoryChannel.ERROR_STATES, "core", "failure", {}, "error")
+        registry = MetricsRegistry()
+        matrix.register_metrics(registry, "test")
+
+        holding, release = threading.Event(), threading.Event()
+
+        def hold_lock():
+            with matrix._lock:
+                holding.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        holding.wait(5)
+        rendered = []
+        scraper = threading.Thread(target=lambda: rendered.append(registry.render()))
+        scraper.start()
+        scraper.join(2)
+        release.set()
+        holder.join()
+        matrix.sleep()
+
+        assert rendered, "scrape blocked on the matrix lock"
+        text = rendered[0]
+        assert 'genesis_matrix_perceptions_total{matrix="test",channel="system_vitals"} 1' in text
+        assert 'genesis_matrix_memory_events{matrix="test"} 2' in text
+        assert "x" * 100 not in text
+
+    def test_governor_metrics(self, monkeypatch):
+        # The default interceptors are not needed to read the counters
+        monkeypatch.setattr(EthicalGovernor, "_setup_core_interceptors", lambda self: None)
+        governor = EthicalGovernor()
+        governor.ethical_metrics["total_decisions"] = 7
+        registry = MetricsRegistry()
+        governor.register_metrics(registry, "test")
+
+        text = registry.render()
+        assert 'genesis_ethical_total_decisions_total{governor="test"} 7' in text
+        assert 'genesis_ethical_strictness_level{governor="test"} 0.7' in text
@@ -0,0 +1,143 @@
+import random
+
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix, SensoryChannel, SensoryData
+)
+from app.ai_backend.genesis_security_analytics import (
+    SecurityAnalytics, SECURITY_ANALYTICS_AVAILABLE
+)
+
+pytestmark = pytest.mark.skipif(not SECURITY_ANALYTICS_AVAILABLE, reason="numpy not installed")
+
+THREAT = SensoryChannel.THREAT_DETECTION
+ACCESS = SensoryChannel.ACCESS_CONTROL
+CRYPTO = SensoryChannel.ENCRYPTION_ACTIVITY
+SECURITY = SensoryChannel.SECURITY_EVENTS
+
+
+def make_analytics(capacity=8):
+    return SecurityAnalytics(capacity, threat_channel=THREAT, access_channel=ACCESS,
+                             crypto_channel=CRYPTO, security_channel=SECURITY)
+
+
+def threat(seq, confidence=0.9, level="high", mitigated=False, threat_type="probe"):
+    return SensoryData(float(seq), THREAT, "scanner", "threat_detected",
+                       {"threat_type": threat_type, "confidence": confidence,
+                        "threat_level": level, "mitigation_applied": mitigated}, "warning")
+
+
+def perceive_random_security_traffic(matrix, events, seed=7):
+    rng = random.Random(seed)
+    for _ in range(events):
+        roll = rng.random()
+        if roll < 0.3:
+            matrix.perceive_threat_detection(rng.choice(["probe", "phish", "dos"]),
+                                             {"mitigation_applied": rng.random() < 0.3},
+                                             confidence=round(rng.random(), 2),
+                                             threat_level=rng.choice(["low", "medium", "high"]))
+        elif roll < 0.55:
+            matrix.perceive_access_control("read", {"resource": "vault"}, rng.random() < 0.7)
+        elif roll < 0.75:
+            matrix.perceive_encryption_activity("encrypt", {"algorithm": "aes"}, rng.random() < 0.8)
+        elif roll < 0.9:
+            matrix.perceive_security_event("scan", {"n": rng.randint(0, 3)})
+        else:
+            matrix.perceive(SensoryChannel.SYSTEM_VITALS, "monitor", "vitals_check", {})
+
+
+class TestSecurityAnalytics:
+    def test_ring_keeps_the_latest_window(self):
+        analytics = make_analytics(capacity=4)
+        for seq in range(6):
+            analytics.observe(seq, threat(seq, level="critical" if seq >= 4 else "low"))
+        status = analytics.threat_status(window=10)
+        assert status["detections"] == 4
+        assert [t["timestamp"] for t in status["active_threats"]] == [2.0, 3.0, 4.0, 5.0]
+        assert status["highest_rank"] == 4
+
+    def test_levels_are_weighted_by_confidence_and_occurrences(self):
+        analytics = make_analytics()
+        analytics.observe(0, threat(0, confidence=0.5, level="high"))
+        analytics.observe(1, threat(1, confidence=None, level="medium"))
+        analytics.add_occurrence(0, THREAT)
+        indicators = analytics.assess()
+        assert indicators["threat_levels"] == {"high": 1.0, "medium": 0.5}
+        # A missing confidence never makes a threat active
+        assert indicators["active_threats"] == []
+
+    def test_listed_threats_are_capped_but_all_counted(self):
+        analytics = make_analytics()
+        for seq in range(6):
+            analytics.observe(seq, threat(seq, level="critical" if seq == 0 else "low"))
+        analytics.add_occurrence(5, THREAT)
+        status = analytics.threat_status(max_listed=2)
+        assert [t["timestamp"] for t in status["active_threats"]] == [4.0, 5.0]
+        assert (status["active_count"], status["active_occurrences"]) == (6, 7)
+        assert status["highest_rank"] == 4
+
+    def test_reads_are_bounded_by_what_memory_holds(self):
+        analytics = make_analytics()
+        for seq in range(5):
+            analytics.observe(seq, threat(seq))
+        assert analytics.threat_status(held=lambda channel: 2)["detections"] == 2
+        assert analytics.assess(held=lambda channel: 0)["threat_levels"] == {}
+
+
+class TestMatrixSecurityAnalytics:
+    @pytest.mark.parametrize("window", [None, 5, 500])
+    def test_vectorized_assessment_matches_python_synthesis(self, window):
+        matrix = ConsciousnessMatrix(max_memory_size=5000, coalesce_window=60.0)
+        perceive_random_security_traffic(matrix, 3000)
+
+        windows = matrix._security_windows(window)
+        with matrix._lock:
+            indicators = matrix.security_analytics.assess(**windows, held=matrix.sensory_memory.count)
+            recent = (matrix._recent(THREAT, max(windows["threat_window"], windows["active_window"]))
+                      + matrix._recent(ACCESS, windows["access_window"])
+                      + matrix._recent(CRYPTO, windows["crypto_window"])
+                      + matrix._recent(SECURITY, windows["security_window"]))
+        expected = matrix._security_synthesis(recent, **windows)
+
+        assert indicators["threat_levels"] == pytest.approx(expected["threat_levels"])
+        for key in ("failed_access_attempts", "crypto_failures", "security_events_count"):
+            assert indicators[key] == expected[key]
+        assert indicators["active_threats"] == expected["active_threats"]
+        assert indicators["active_threat_count"] == expected["active_threat_count"]
+
+    def test_threat_status_matches_python_scan(self):
+        matrix = ConsciousnessMatrix(max_memory_size=5000)
+        perceive_random_security_traffic(matrix, 2000, seed=11)
+
+        status = matrix.query_consciousness("threat_status", {"window": 200})
+        with matrix._lock:
+            expected = matrix._scan_threats(matrix._recent(THREAT, 200))
+        assert status["total_recent_threats"] == expected["occurrences"]
+        assert status["unmitigated_threats"] == expected["active_occurrences"]
+        assert [t["timestamp"] for t in status["active_threats"]] == \
+            [t["timestamp"] for t in expected["active_threats"]]
+
+    def test_ring_eviction_shrinks_the_window(self):
+        matrix = ConsciousnessMatrix(max_memory_size=10)
+        for _ in range(3):
+            matrix.perceive_threat_detection("probe", {}, confidence=0.9)
+        for _ in range(9):
+            matrix.perceive(SensoryChannel.SYSTEM_VITALS, "monitor", "vitals_check", {})
+        assert matrix.query_consciousness("threat_status")["total_recent_threats"] == 1
+
+    def test_restore_rebuilds_the_columns(self, tmp_path):
+        matrix = ConsciousnessMatrix(sensory_log=str(tmp_path))
+        matrix.perceive_access_control("read", {"resource": "vault"}, False)
+        matrix.sensory_log.close()
+
+        restored = ConsciousnessMatrix(sensory_log=str(tmp_path))
+        restored.restore_from_log()
+        assert restored.security_analytics.assess()["failed_access_attempts"] == 1
+        restored.sensory_log.close()
+
+    @pytest.mark.parametrize("query_type", ["security_assessment", "threat_status"])
+    @pytest.mark.parametrize("window", [0, -5, "20", True])
+    def test_invalid_window(self, query_type, window):
+        report = ConsciousnessMatrix().query_consciousness(query_type, {"window": window})
+        assert report == {"query_type": query_type, "error": "invalid_window", "window": window}
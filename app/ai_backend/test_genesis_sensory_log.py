@@ -0,0 +1,135 @@
+import os
+import time
+
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix,
+    SensoryChannel,
+    SensoryData,
+)
+from app.ai_backend.genesis_sensory_log import SensoryLog
+
+
+def _event(i, correlation_id=None):
+    return SensoryData(timestamp=1000.0 + i, channel=SensoryChannel.AGENT_ACTIVITY,
+                       source="test", event_type="turn",
+                       data={"agent_name": f"agent_{i % 3}", "i": i},
+                       correlation_id=correlation_id)
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = SensoryLog(str(tmp_path / "log"), flush_interval=0.01)
+    yield log
+    log.close()
+
+
+class TestSensoryLog:
+    def test_round_trip(self, log):
+        for i in range(10):
+            log.append(_event(i, correlation_id="c" if i % 2 else None))
+        assert log.flush() == 10
+
+        records = list(log.replay())
+        assert len(records) == 10
+        timestamp, channel, source, event_type, data, severity, correlation_id = records[3]
+        assert (timestamp, channel, event_type, severity) == (1003.0, "agent_activity", "turn", "info")
+        assert data == {"agent_name": "agent_0", "i": 3}
+        assert correlation_id == "c"
+
+    def test_writer_thread_group_commits(self, log):
+        for i in range(5):
+            log.append(_event(i))
+        deadline = time.monotonic() + 2.0
+        while log.records_written < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert log.records_written == 5
+        assert log.group_commits >= 1
+
+    def test_unencodable_record_is_skipped(self, log):
+        bad = SensoryData(timestamp=999.0, channel=SensoryChannel.AGENT_ACTIVITY, source="test",
+                          event_type="turn", data={("a", "b"): 1})
+        log.append(bad)
+        log.append(_event(0))
+        deadline = time.monotonic() + 2.0
+        while log.records_written < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert log.records_written == 1
+        assert log.write_errors == 1 and log.last_error.startswith("TypeError")
+
+        # The writer thread is still running
+        log.append(_event(1))
+        deadline = time.monotonic() + 2.0
+        while log.records_written < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [record[4]["i"] for record in log.replay()] == [0, 1]
+
+    def test_segments_rotate_and_are_capped(self, tmp_path):
+        log = SensoryLog(str(tmp_path / "rot"), segment_size=512, max_segments=3)
+        try:
+            for i in range(100):
+                log.append(_event(i))
+            log.flush()
+            assert len(log.segments()) == 3
+            assert all(os.path.getsize(path) <= 512 for path in log.segments())
+            replayed = [record[4]["i"] for record in log.replay()]
+            assert replayed == sorted(replayed)
+            assert replayed[-1] == 99
+        finally:
+            log.close()
+
+    def test_torn_tail_is_truncated_on_reopen(self, tmp_path):
+        directory = str(tmp_path / "torn")
+        log = SensoryLog(directory)
+        for i in range(3):
+            log.append(_event(i))
+        log.close()
+        with open(log.segments()[-1], "ab") as segment:
+            segment.write(b"\x40\x00\x00\x00garbage")
+
+        reopened = SensoryLog(directory)
+        try:
+            reopened.append(_event(3))
+            reopened.flush()
+            assert [record[4]["i"] for record in reopened.replay()] == [0, 1, 2, 3]
+        finally:
+            reopened.close()
+
+
+class TestMatrixWarmRestart:
+    def test_awaken_restores_memory_awareness_and_correlations(self, tmp_path):
+        directory = str(tmp_path / "matrix")
+        matrix = ConsciousnessMatrix(sensory_log=directory)
+        for i in range(30):
+            matrix.perceive_agent_activity(f"agent_{i % 3}", "turn", {}, correlation_id="req-1")
+        matrix.perceive_performance_metric("latency", 1.0)
+        matrix.perceive(SensoryChannel.ERROR_STATES, "core", "fault", {}, "warning")
+        matrix.sleep()
+        matrix.sensory_log.close()
+
+        restarted = ConsciousnessMatrix(sensory_log=directory)
+        assert restarted.restore_from_log() == 32
+        restarted.sensory_log.close()
+
+        assert len(restarted.sensory_memory) == 32
+        awareness = restarted.get_current_awareness()
+        assert awareness["agent_activity_count"] == 30
+        assert awareness["latest_error_states"]["event_type"] == "fault"
+        assert restarted.sensory_memory.count(SensoryChannel.AGENT_ACTIVITY) == 30
+        assert restarted.get_correlation_chain("req-1")["event_count"] == 30
+        macro = restarted._perform_synthesis("macro")
+        assert macro["agent_collaboration_patterns"] == {"agent_0": 10, "agent_1": 10, "agent_2": 10}
+
+    def test_perceptions_before_awaken_are_kept_in_order(self, tmp_path):
+        directory = str(tmp_path / "matrix")
+        first = ConsciousnessMatrix(sensory_log=directory)
+        first.perceive_learning_event("old", {})
+        first.sensory_log.close()
+
+        second = ConsciousnessMatrix(sensory_log=directory)
+        second.perceive_learning_event("new", {})
+        second.restore_from_log()
+        second.sensory_log.close()
+
+        assert [s.event_type for s in second.sensory_memory] == ["old", "new"]
@@ -0,0 +1,344 @@
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix,
+    SensoryChannel,
+    SensoryData,
+)
+from app.ai_backend.genesis_sensory_store import (
+    ColumnarSensoryStore,
+    ObjectSensoryStore,
+    StringInterner,
+    create_sensory_store,
+)
+
+BACKENDS = ["object", "columnar"]
+
+
+def make_sensation(i, channel=SensoryChannel.AGENT_ACTIVITY, severity="info"):
+    return SensoryData(
+        timestamp=1000.0 + i,
+        channel=channel,
+        source=f"source_{i % 3}",
+        event_type=f"event_{i % 2}",
+        data={"index": i},
+        severity=severity,
+        correlation_id=f"corr_{i}" if i % 5 == 0 else None,
+    )
+
+
+@pytest.fixture(params=BACKENDS)
+def store(request):
+    return create_sensory_store(request.param, 10, record_type=SensoryData, channel_capacity=4)
+
+
+class TestStringInterner:
+    def test_intern_assigns_stable_ids(self):
+        interner = StringInterner(["a", "b"])
+        assert interner.intern("a") == 0
+        assert interner.intern("c") == 2
+        assert interner.lookup(1) == "b"
+        assert interner.get_id("missing") is None
+        assert len(interner) == 3
+
+    def test_refcounted_values_are_forgotten_and_ids_reused(self):
+        interner = StringInterner(refcounted=True)
+        a = interner.intern("a")
+        assert interner.intern("a") == a
+        b = interner.intern("b")
+        interner.release(a)
+        assert interner.get_id("a") == a
+        interner.release(a)
+        assert interner.get_id("a") is None and len(interner) == 1
+        assert interner.intern("c") == a
+        assert interner.lookup(b) == "b"
+
+
+class TestSensoryStore:
+    def test_append_assigns_sequence_numbers(self, store):
+        assert [store.append(make_sensation(i)) for i in range(3)] == [0, 1, 2]
+        assert len(store) == 3
+        assert store.first_seq == 0
+        assert store.next_seq == 3
+
+    def test_ring_overwrites_oldest_events(self, store):
+        for i in range(25):
+            store.append(make_sensation(i))
+
+        assert len(store) == 10
+        assert store.first_seq == 15
+        assert [s.data["index"] for s in store] == list(range(15, 25))
+        assert store.get(24).data["index"] == 24
+        with pytest.raises(IndexError):
+            store.get(14)
+
+    def test_round_trips_all_fields(self, store):
+        original = make_sensation(5, channel=SensoryChannel.THREAT_DETECTION, severity="critical")
+        seq = store.append(original)
+        assert store.get(seq) == original
+
+    def test_tail_returns_most_recent_oldest_first(self, store):
+        for i in range(12):
+            store.append(make_sensation(i))
+        assert [s.data["index"] for s in store.tail(3)] == [9, 10, 11]
+        assert store.tail(0) == []
+        assert len(store.tail(100)) == 10
+
+    def test_select_and_count_filters(self, store):
+        for i in range(10):
+            channel = SensoryChannel.AGENT_ACTIVITY if i % 2 else SensoryChannel.SYSTEM_VITALS
+            store.append(make_sensation(i, channel=channel, severity="error" if i < 4 else "info"))
+
+        errors = store.select(severities=["error", "critical"])
+        assert [s.data["index"] for s in errors] == [0, 1, 2, 3]
+        assert store.count(severities=["error"]) == 4
+        assert store.count(severities=["unknown"]) == 0
+
+        # Channel views are bounded by channel_capacity (4); counts cover all of memory
+        agent = store.select(SensoryChannel.AGENT_ACTIVITY)
+        assert [s.data["index"] for s in agent] == [3, 5, 7, 9]
+        assert store.count(SensoryChannel.AGENT_ACTIVITY) == 5
+        assert store.count(SensoryChannel.AGENT_ACTIVITY, severities=["error"]) == 2
+        assert [s.data["index"] for s in store.select(SensoryChannel.AGENT_ACTIVITY, limit=2)] == [7, 9]
+        assert store.select(SensoryChannel.AGENT_ACTIVITY, limit=0) == []
+        assert store.select(SensoryChannel.ENCRYPTION_ACTIVITY) == []
+
+    def test_channel_view_drops_evicted_events(self, store):
+        store.append(make_sensation(0, channel=SensoryChannel.LEARNING_EVENTS))
+        for i in range(1, 11):
+            store.append(make_sensation(i, channel=SensoryChannel.SYSTEM_VITALS))
+
+        assert store.count(SensoryChannel.LEARNING_EVENTS) == 0
+        assert store.select(SensoryChannel.LEARNING_EVENTS) == []
+
+    def test_clear_resets_store(self, store):
+        for i in range(5):
+            store.append(make_sensation(i))
+        store.clear()
+        assert len(store) == 0
+        assert list(store) == []
+        assert store.count(SensoryChannel.AGENT_ACTIVITY) == 0
+
+
+class TestIncrementalIndexes:
+    def test_counters_track_evictions(self, store):
+        for i in range(30):
+            store.append(make_sensation(i, severity="error" if i % 3 == 0 else "info"))
+
+        # Window holds indices 20..29; errors among them are 21, 24, 27
+        assert store.count(severities=["error"]) == 3
+        assert store.count(severities=["info"]) == 7
+        assert store.count(severities=["error", "info"]) == 10
+        assert store.severity_counts["error"] == 3
+
+    def test_severity_selection_merges_levels(self, store):
+        severities = ["info", "error", "critical", "info", "error", "critical"]
+        for i, severity in enumerate(severities):
+            store.append(make_sensation(i, severity=severity))
+
+        severe = store.select(severities=["error", "critical"], limit=3)
+        assert [s.data["index"] for s in severe] == [2, 4, 5]
+
+    def test_channel_counts_outlive_the_channel_view(self, store):
+        for i in range(6):
+            store.append(make_sensation(i, severity="error" if i == 0 else "info"))
+
+        # channel_capacity is 4, so event 0 has left the channel view but is still in memory
+        assert [s.data["index"] for s in store.select(SensoryChannel.AGENT_ACTIVITY)] == [2, 3, 4, 5]
+        assert store.count(SensoryChannel.AGENT_ACTIVITY) == 6
+        assert store.count(SensoryChannel.AGENT_ACTIVITY, severities=["error"]) == 1
+        assert store.count(SensoryChannel.AGENT_ACTIVITY, severities=["info"]) == 5
+
+        # Once the ring overwrites it, it is no longer counted
+        for i in range(6, 11):
+            store.append(make_sensation(i))
+        assert store.count(SensoryChannel.AGENT_ACTIVITY) == 10
+        assert store.count(SensoryChannel.AGENT_ACTIVITY, severities=["error"]) == 0
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_indexes_match_full_scan(self, backend):
+        import random
+
+        rng = random.Random(7)
+        channels = list(SensoryChannel)
+        levels = ["debug", "info", "warning", "error", "critical"]
+        store = create_sensory_store(backend, 200, record_type=SensoryData, channel_capacity=25)
+
+        for i in range(1000):
+            store.append(make_sensation(i, channel=rng.choice(channels),
+                                        severity=rng.choice(levels)))
+
+            if i % 97 == 0:
+                events = list(store)
+                for channel in channels:
+                    held = [s for s in events if s.channel == channel]
+                    assert store.select(channel) == held[-25:]
+                    assert store.count(channel) == len(held)
+                    assert store.count(channel, ["error"]) == len(
+                        [s for s in held if s.severity == "error"])
+                severe = [s for s in events if s.severity in ("error", "critical")]
+                assert store.count(severities=["error", "critical"]) == len(severe)
+                assert store.select(severities=["error", "critical"], limit=10) == severe[-10:]
+
+
+class TestPayloadIndexes:
+    @pytest.fixture(params=BACKENDS)
+    def indexed(self, request):
+        return create_sensory_store(
+            request.param, 10, record_type=SensoryData, channel_capacity=3,
+            payload_indexes={SensoryChannel.AGENT_ACTIVITY: ["agent_name"]})
+
+    def _append(self, store, i, agent, channel=SensoryChannel.AGENT_ACTIVITY):
+        store.append(SensoryData(timestamp=float(i), channel=channel, source="core",
+                                 event_type="turn", data={"agent_name": agent, "i": i}))
+
+    def test_counts_and_selection(self, indexed):
+        for i, agent in enumerate(["kai", "aura", "kai", "kai", "kai"]):
+            self._append(indexed, i, agent)
+        self._append(indexed, 5, "kai", channel=SensoryChannel.ERROR_STATES)
+
+        assert indexed.indexed_fields(SensoryChannel.AGENT_ACTIVITY) == ("agent_name",)
+        assert indexed.indexed_fields(SensoryChannel.ERROR_STATES) == ()
+        # The value view holds kai's last 3 events; the counts cover all 4 in memory
+        assert indexed.field_count(SensoryChannel.AGENT_ACTIVITY, "agent_name", "kai") == 4
+        assert indexed.field_values(SensoryChannel.AGENT_ACTIVITY, "agent_name") == {"kai": 4, "aura": 1}
+        recent = indexed.select_field(SensoryChannel.AGENT_ACTIVITY, "agent_name", "kai", limit=2)
+        assert [s.data["i"] for s in recent] == [3, 4]
+
+    def test_eviction_keeps_index_in_sync(self, indexed):
+        self._append(indexed, 0, "aura")
+        for i in range(1, 12):
+            self._append(indexed, i, "kai")
+        values = indexed.field_values(SensoryChannel.AGENT_ACTIVITY, "agent_name")
+        assert values == {"kai": 10}  # aura's only event was evicted
+
+    def test_unhashable_values_are_skipped(self, indexed):
+        self._append(indexed, 0, ["not", "hashable"])
+        assert indexed.field_values(SensoryChannel.AGENT_ACTIVITY, "agent_name") == {}
+
+    def test_scan_by_field_reaches_events_beyond_the_value_view(self, indexed):
+        for i in range(8):
+            self._append(indexed, i, "kai" if i % 2 else "aura")
+        seqs = indexed.scan(0, 10, SensoryChannel.AGENT_ACTIVITY, field="agent_name", values=["kai"])
+        assert seqs == [1, 3, 5, 7]
+        seqs = indexed.scan(0, 10, SensoryChannel.AGENT_ACTIVITY, field="agent_name",
+                            values=["kai", "aura"], reverse=True, limit=3)
+        assert seqs == [7, 6, 5]
+        assert indexed.scan(0, 10, SensoryChannel.AGENT_ACTIVITY, field="agent_name",
+                            values=["nobody"]) == []
+
+
+class TestStoreFactory:
+    def test_known_backends(self):
+        assert isinstance(create_sensory_store("object", 5), ObjectSensoryStore)
+        assert isinstance(
+            create_sensory_store("columnar", 5, record_type=SensoryData), ColumnarSensoryStore
+        )
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError):
+            create_sensory_store("tape", 5)
+
+    def test_invalid_capacity_raises(self):
+        with pytest.raises(ValueError):
+            ObjectSensoryStore(0)
+
+    def test_columnar_string_table_is_bounded_by_the_ring(self):
+        store = ColumnarSensoryStore(10, record_type=SensoryData)
+        for i in range(1000):
+            store.append(SensoryData(float(i), SensoryChannel.USER_INTERACTION, f"session-{i}",
+                                     "request", {"i": i}))
+        assert len(store._strings) == 11  # ten sources in the ring and one event type
+        assert [s.source for s in store] == [f"session-{i}" for i in range(990, 1000)]
+        store.clear()
+        assert len(store._strings) == 0
+
+    def test_columnar_footprint_is_compact(self):
+        store = ColumnarSensoryStore(1_000_000, record_type=SensoryData)
+        # 18 bytes of columns plus two side-table pointers per event
+        assert store.memory_footprint() < 40 * 1024 * 1024
+
+
+class TestMatrixStorageBackends:
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_queries_agree_across_backends(self, backend):
+        matrix = ConsciousnessMatrix(max_memory_size=50, storage_backend=backend)
+        for i in range(80):
+            matrix.perceive_agent_activity(f"agent_{i % 3}", f"type_{i % 2}", {})
+            matrix.perceive_learning_event("pattern", {"i": i})
+        matrix.perceive_threat_detection("probe", {}, confidence=0.9, threat_level="high")
+
+        health = matrix.query_consciousness("system_health")
+        assert health["vitals_count"] == 0
+        assert health["recent_errors"] == 0
+
+        agents = matrix.query_consciousness("agent_performance", {"agent_name": "agent_1"})
+        assert agents["total_activities"] == len(
+            [s for s in matrix.sensory_memory
+             if s.channel == SensoryChannel.AGENT_ACTIVITY and s.data["agent_name"] == "agent_1"]
+        )
+
+        learning = matrix.query_consciousness("learning_progress")
+        assert learning["recent_learning_events"] == 20
+
+        threats = matrix.query_consciousness("threat_status")
+        assert threats["unmitigated_threats"] == 1
+        assert threats["highest_threat_level"] == "high"
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_report_totals_are_not_capped_by_channel_views(self, backend):
+        matrix = ConsciousnessMatrix(max_memory_size=500, channel_capacity=50,
+                                     storage_backend=backend)
+        for i in range(150):
+            matrix.perceive_learning_event("pattern", {"i": i})
+        for i in range(120):
+            matrix.perceive_agent_activity("kai", "turn", {"i": i})
+        for i in range(80):
+            matrix.perceive_security_event("audit", {"i": i})
+        assert len(matrix.sensory_memory) == 350
+
+        assert matrix.query_consciousness("learning_progress")["total_learning_events"] == 150
+        assert matrix.query_consciousness("agent_performance")["total_activities"] == 120
+        kai = matrix.query_consciousness("agent_performance", {"agent_name": "kai"})
+        assert kai["total_activities"] == 120 and kai["recent_activities"] == 50
+        assert matrix.query_consciousness("agent_roster")["agents"] == {"kai": 120}
+        assert matrix.query_consciousness("security_assessment")["total_security_events"] == 80
+
+    def test_accepts_prebuilt_store(self):
+        store = ColumnarSensoryStore(20, record_type=SensoryData)
+        matrix = ConsciousnessMatrix(storage_backend=store)
+        matrix.perceive(SensoryChannel.SYSTEM_VITALS, "test", "vitals", {"cpu": 1})
+        assert matrix.sensory_memory is store
+        assert len(store) == 1
+
+
+class TestMatrixPayloadIndexes:
+    @pytest.mark.parametrize("payload_indexes", [None, {}])
+    def test_agent_reports_agree_with_and_without_indexes(self, payload_indexes):
+        matrix = ConsciousnessMatrix(max_memory_size=100, payload_indexes=payload_indexes)
+        for i in range(30):
+            matrix.perceive_agent_activity(["kai", "aura", "genesis"][i % 3] if i < 27 else "kai",
+                                           f"type_{i % 2}", {})
+
+        kai = matrix.query_consciousness("agent_performance", {"agent_name": "kai"})
+        assert kai["total_activities"] == 12
+        assert kai["activity_breakdown"] == {"type_0": 6, "type_1": 6}
+
+        roster = matrix.query_consciousness("agent_roster")
+        assert roster["agent_count"] == 3
+        assert list(roster["agents"].items())[0] == ("kai", 12)
+
+    def test_threat_types_come_from_index(self):
+        matrix = ConsciousnessMatrix(max_memory_size=100)
+        for threat_type in ["probe", "probe", "phish"]:
+            matrix.perceive_threat_detection(threat_type, {}, confidence=0.9)
+        assert matrix.query_consciousness("threat_status")["threat_types"] == {"probe": 2, "phish": 1}
+
+    def test_query_uses_index_for_indexed_fields(self):
+        matrix = ConsciousnessMatrix(max_memory_size=100)
+        for i in range(20):
+            matrix.perceive_user_interaction("chat", "genesis", {}, user_id=f"user_{i % 4}",
+                                             session_id=f"session_{i % 2}")
+        results = list(matrix.query(channel=SensoryChannel.USER_INTERACTION,
+                                    data={"user_id": {"user_1", "user_2"}, "session_id": "session_1"}))
+        assert [s.data["user_id"] for s in results] == ["user_1"] * 5
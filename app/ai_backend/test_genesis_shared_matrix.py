@@ -0,0 +1,167 @@
+import multiprocessing
+import os
+import time
+import uuid
+
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import (
+    ConsciousnessMatrix, SensoryChannel, SensoryData
+)
+from app.ai_backend.genesis_shared_matrix import (
+    SharedMatrixSegment, SHARED_MATRIX_AVAILABLE, shared_matrix_options
+)
+
+pytestmark = pytest.mark.skipif(not SHARED_MATRIX_AVAILABLE, reason="shared memory unavailable")
+
+VITALS = SensoryChannel.SYSTEM_VITALS
+
+
+@pytest.fixture
+def shared(tmp_path):
+    """Options for matrices sharing one fresh segment; the segment is removed afterwards."""
+    name = f"genesis-test-{uuid.uuid4().hex[:12]}"
+    options = {"ingestion_mode": "shared", "shared_name": name, "shared_lock_dir": str(tmp_path),
+               "max_memory_size": 256, "shared_max_workers": 4}
+    yield options
+    SharedMatrixSegment(name, ConsciousnessMatrix._sensation_from_record, capacity=256,
+                        max_workers=4, lock_dir=str(tmp_path)).unlink()
+
+
+def segment(shared, **overrides):
+    settings = {"capacity": 256, "max_workers": 4, "lock_dir": shared["shared_lock_dir"],
+                "election_interval": 0.0, **overrides}
+    return SharedMatrixSegment(shared["shared_name"], ConsciousnessMatrix._sensation_from_record,
+                               **settings)
+
+
+def event(timestamp, **data):
+    return SensoryData(timestamp, VITALS, "monitor", "check", data)
+
+
+def perceive_in_child(options, count):
+    matrix = ConsciousnessMatrix(**options)
+    for i in range(count):
+        matrix.perceive(VITALS, f"worker-{os.getpid()}", "vitals_check", {"i": i})
+
+
+class TestSharedMatrixSegment:
+    def test_shards_are_merged_in_timestamp_order(self, shared):
+        first, second = segment(shared), segment(shared)
+        first.add(event(1.0, n=1))
+        second.add(event(0.5, n=0))
+        first.add(event(2.0, n=2))
+
+        assert first.is_primary() and not second.is_primary()
+        assert [s.data["n"] for s in first.drain()] == [0, 1, 2]
+        assert [s.data["n"] for s in second.drain()] == [0, 1, 2]
+        assert second.drain() == []
+        first.close()
+        second.close()
+
+    def test_sequencer_role_moves_when_it_detaches(self, shared):
+        first, second = segment(shared), segment(shared)
+        first.drain()
+        assert first.is_primary()
+        second.add(event(1.0))
+        first.close()
+
+        assert [s.timestamp for s in second.drain()] == [1.0]
+        assert second.stats()["primary"]
+        second.close()
+
+    def test_oversized_payload_is_truncated(self, shared):
+        writer = segment(shared, slot_size=512)
+        writer.add(event(1.0, blob="x" * 4096))
+        stored = writer.drain()[0]
+        assert stored.data["_truncated"]["dropped_fields"] == ["blob"]
+        assert writer.stats()["truncated"] == 1
+        writer.close()
+
+    def test_late_reader_sees_the_ring_window(self, shared):
+        writer = segment(shared, capacity=256)
+        for i in range(300):
+            writer.add(event(float(i)))
+            writer.drain()
+        late = segment(shared)
+        assert len(late.drain()) == 256
+        writer.close()
+        late.close()
+
+    def test_layout_mismatch_is_rejected(self, shared):
+        segment(shared).drain()
+        with pytest.raises(ValueError):
+            segment(shared, slot_size=4096).drain()
+
+
+class TestSharedConsciousnessMatrix:
+    def test_workers_see_each_others_perceptions(self, shared):
+        primary, worker = ConsciousnessMatrix(**shared), ConsciousnessMatrix(**shared)
+        primary.flush()
+        worker.perceive(VITALS, "worker", "vitals_check", {"cpu_percent": 10})
+        primary.perceive(VITALS, "primary", "vitals_check", {"cpu_percent": 20})
+
+        primary.flush()
+        for matrix in (primary, worker):
+            sources = [s.source for s in matrix.query(channel=VITALS)]
+            assert sources == ["worker", "primary"]
+            assert matrix.get_current_awareness()["system_vitals_count"] == 2
+
+    def test_synthesis_runs_once_and_is_shared(self, shared):
+        primary, worker = ConsciousnessMatrix(**shared), ConsciousnessMatrix(**shared)
+        primary.flush()
+        worker.perceive(VITALS, "worker", "vitals_check", {})
+
+        worker._run_synthesis("micro")
+        assert primary.get_recent_synthesis("micro") == []
+        primary._run_synthesis("micro")
+
+        shared_result = worker.get_recent_synthesis("micro")
+        assert len(shared_result) == 1
+        assert shared_result[0]["channel_activity"] == {"system_vitals": 1}
+        primary.immediate_synthesis.close()
+        worker.immediate_synthesis.close()
+
+    def test_events_from_another_process(self, shared):
+        primary = ConsciousnessMatrix(**shared)
+        primary.flush()
+        child = multiprocessing.get_context("fork").Process(
+            target=perceive_in_child, args=(shared, 40))
+        child.start()
+        child.join(10)
+        assert child.exitcode == 0
+
+        primary.flush()
+        assert primary.sensory_memory.count(VITALS) == 40
+        assert {s.source for s in primary.query(channel=VITALS)} == {f"worker-{child.pid}"}
+
+    def test_idle_sequencer_drains_other_shards(self, shared):
+        sequencer = ConsciousnessMatrix(**shared)
+        sequencer.flush()
+        assert sequencer.shared_segment.is_primary()
+        writer = segment(shared)
+
+        # More than a shard holds, while the sequencer neither perceives, reads nor is awake
+        for start in range(0, 600, 200):
+            for i in range(start, start + 200):
+                writer.add(event(float(i), i=i))
+            deadline = time.monotonic() + 2.0
+            while writer.pending() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert writer.pending() == 0
+
+        assert writer.stats()["dropped"] == 0
+        assert sequencer.shared_segment.stats()["sequenced"] == 600
+        sequencer.detach_shared()
+        writer.close()
+
+    def test_options_from_environment(self, monkeypatch):
+        monkeypatch.delenv("GENESIS_SHARED_MATRIX", raising=False)
+        assert shared_matrix_options("core") == {}
+        monkeypatch.setenv("GENESIS_SHARED_MATRIX", "genesis")
+        assert shared_matrix_options("core") == {"ingestion_mode": "shared",
+                                                 "shared_name": "genesis-core"}
+
+    def test_sensory_log_is_rejected(self, shared, tmp_path):
+        with pytest.raises(ValueError):
+            ConsciousnessMatrix(sensory_log=str(tmp_path / "log"), **shared)
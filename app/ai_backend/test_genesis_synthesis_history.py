@@ -0,0 +1,68 @@
+import pytest
+
+from app.ai_backend.genesis_consciousness_matrix import ConsciousnessMatrix, SensoryChannel
+from app.ai_backend.genesis_synthesis_history import SynthesisHistory
+
+
+def _synthesis(kind, n):
+    return {"synthesis_type": kind, "timestamp": float(n), "n": n}
+
+
+class TestSynthesisHistory:
+    def test_recent_is_newest_first_per_type(self):
+        history = SynthesisHistory(capacity_per_type=3)
+        for n in range(5):
+            history.record("micro", _synthesis("micro", n))
+
+        assert [s["n"] for s in history.recent("micro", 10)] == [4, 3, 2]
+        assert [s["n"] for s in history.recent("micro", 2)] == [4, 3]
+        assert history.recent("macro") == []
+        assert history.counts() == {"micro": 3}
+
+    def test_recent_interleaves_types_by_recording_order(self):
+        history = SynthesisHistory()
+        history.record("micro", _synthesis("micro", 0))
+        history.record("meta", _synthesis("meta", 1))
+        history.record("micro", _synthesis("micro", 2))
+        history.record("immediate", _synthesis("immediate", 3))
+
+        assert [s["n"] for s in history.recent(limit=3)] == [3, 2, 1]
+
+    def test_same_second_results_do_not_collide(self):
+        history = SynthesisHistory()
+        for _ in range(3):
+            history.record("micro", _synthesis("micro", 7))
+        assert len(history.recent("micro")) == 3
+
+    def test_eviction_spills_to_disk(self, tmp_path):
+        history = SynthesisHistory(capacity_per_type=2, spill_dir=str(tmp_path))
+        for n in range(5):
+            history.record("meta", _synthesis("meta", n))
+
+        assert history.spilled == 3
+        assert (tmp_path / "meta.jsonl").exists()
+        assert [s["n"] for s in history.history("meta")] == [0, 1, 2, 3, 4]
+        assert [s["n"] for s in history.history("meta", since=2.0, limit=2)] == [3, 4]
+
+    def test_eviction_without_spill_drops(self):
+        history = SynthesisHistory(capacity_per_type=2)
+        for n in range(5):
+            history.record("meta", _synthesis("meta", n))
+        assert [s["n"] for s in history.history("meta")] == [3, 4]
+
+    def test_rejects_empty_capacity(self):
+        with pytest.raises(ValueError):
+            SynthesisHistory(capacity_per_type=0)
+
+
+class TestMatrixSynthesisHistory:
+    def test_immediate_and_periodic_results_are_recorded(self, tmp_path):
+        matrix = ConsciousnessMatrix(synthesis_history_size=1, synthesis_spill_dir=str(tmp_path))
+        matrix.perceive(SensoryChannel.ERROR_STATES, "core", "crash", {}, "critical")
+        matrix.perceive(SensoryChannel.ERROR_STATES, "core", "fault", {}, "error")
+        matrix._run_synthesis("micro")
+
+        assert matrix.get_recent_synthesis(limit=1)[0]["type"] == "micro"
+        assert matrix.get_recent_synthesis("immediate")[0]["trigger_event"]["event_type"] == "fault"
+        history = matrix.get_synthesis_history("immediate")
+        assert [s["trigger_event"]["event_type"] for s in history] == ["crash", "fault"]
@@ -0,0 +1,86 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+import app.ai_backend.kai_rgss_veto as kai_module
+from app.ai_backend.genesis_consciousness_matrix import ConsciousnessMatrix, SensoryChannel
+from app.ai_backend.genesis_vitals_sampler import FIRST_CPU_WINDOW, VitalsSampler
+
+
+@pytest.fixture
+def sampler():
+    sampler = VitalsSampler(interval=0.05, max_staleness=10.0)
+    yield sampler
+    sampler.stop()
+
+
+class TestVitalsSampler:
+    def test_snapshot_has_expected_fields(self, sampler):
+        vitals = sampler.snapshot()
+        for key in ("cpu_percent", "memory_percent", "disk_usage", "active_processes",
+                    "load_average", "boot_time", "temperature_c", "sampled_at"):
+            assert key in vitals
+        assert sampler.running
+
+    def test_reads_do_not_block_on_cpu_sampling(self, sampler):
+        sampler.snapshot()
+        with patch("psutil.cpu_percent", side_effect=AssertionError("blocking poll")):
+            started = time.perf_counter()
+            for _ in range(1000):
+                sampler.snapshot()
+            elapsed = time.perf_counter() - started
+        assert elapsed < 0.05
+
+    def test_background_thread_refreshes(self, sampler):
+        sampler.snapshot()
+        samples = sampler.samples
+        deadline = time.monotonic() + 2.0
+        while sampler.samples == samples and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sampler.samples > samples
+
+    def test_stale_snapshot_is_refreshed_inline(self, sampler):
+        first = sampler.snapshot()
+        sampler.stop()
+        time.sleep(0.01)
+        assert sampler.snapshot(max_staleness=0.0) is not first
+        assert sampler.inline_refreshes >= 2
+
+    def test_first_read_measures_a_cpu_window(self, sampler):
+        with patch("psutil.cpu_percent", return_value=37.5) as cpu_percent:
+            assert sampler.snapshot()["cpu_percent"] == 37.5
+            intervals = [call.kwargs["interval"] for call in cpu_percent.call_args_list]
+        # Priming the background baseline, then the blocking first reading
+        assert intervals == [None, FIRST_CPU_WINDOW]
+
+    def test_rejects_invalid_interval(self):
+        with pytest.raises(ValueError):
+            VitalsSampler(interval=0)
+
+
+class TestVitalsConsumers:
+    def test_matrix_records_cached_vitals(self, sampler):
+        matrix = ConsciousnessMatrix(vitals_sampler=sampler)
+        matrix.perceive_system_vitals({"probe": True})
+
+        event = matrix.sensory_memory.get(0)
+        assert event.channel == SensoryChannel.SYSTEM_VITALS
+        assert event.data["probe"] is True
+        assert "probe" not in sampler.snapshot()
+
+    def test_matrix_reports_sampling_errors(self):
+        sampler = VitalsSampler()
+        matrix = ConsciousnessMatrix(vitals_sampler=sampler)
+        with patch.object(sampler, "snapshot", side_effect=OSError("no /proc")):
+            matrix.perceive_system_vitals()
+        assert matrix.sensory_memory.get(0).event_type == "vitals_perception_error"
+
+    def test_rgss_veto_uses_shared_sampler(self, sampler):
+        with patch.object(kai_module, "vitals_sampler", sampler):
+            vitals = asyncio.run(kai_module.get_system_vitals())
+
+        assert 0.0 <= vitals["cpu_load"] <= 1.0
+        assert 0.0 <= vitals["mem_percent"] <= 1.0
+        assert isinstance(vitals["temp_c"], float)